@@ -25,6 +25,7 @@ load_dotenv(Path(__file__).resolve().parents[1] / ".env")
 
 # fmt: off
 from backend_client import AuthContext  # noqa: E402 — must load env before importing
+from cli_worker_pool import close_worker_pool  # noqa: E402
 from copilot import MODELS, RuntimeLlmConfig, create_agent  # noqa: E402
 from observability import (  # noqa: E402
     REQUEST_ID_HEADER,
@@ -119,6 +120,7 @@ async def lifespan(application: FastAPI):
     tracer_provider = configure_tracing(application)
     _enable_haystack_logging(enable_otel_tracing=tracer_provider is not None)
     yield
+    await close_worker_pool()
     shutdown_tracing(tracer_provider)
 
 
@@ -1,7 +1,7 @@
 """Backend API client for Senticor Copilot tool execution.
 
-Calls the backend's POST /items endpoint on behalf of the user,
-using a delegated JWT (Bearer token) for authentication.
+Calls the backend's POST /items (and POST /items/batch) endpoints on behalf
+of the user, using a delegated JWT (Bearer token) for authentication.
 """
 
 from __future__ import annotations
@@ -13,6 +13,8 @@ from datetime import UTC, datetime
 import httpx
 
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+# Matches the backend's default ITEMS_BATCH_MAX_ITEMS.
+BATCH_MAX_ITEMS = int(os.getenv("ITEMS_BATCH_MAX_ITEMS", "100"))
 
 
 def _additional_property_value(item_jsonld: dict, property_id: str):
@@ -205,6 +207,37 @@ class BackendClient:
             response.raise_for_status()
             return response.json()
 
+    async def create_items(
+        self,
+        jsonlds: list[dict],
+        auth: AuthContext,
+        source: str = "senticor-copilot",
+        idempotency_keys: list[str | None] | None = None,
+    ) -> list[dict]:
+        """POST /items/batch for several items; returns one result per item, in order.
+
+        Results follow the backend's partial-failure contract: each has
+        ``status`` (created/updated/unchanged/error), ``status_code`` and
+        either ``item`` or ``error``. Only a failed request raises.
+        """
+        keys = idempotency_keys or [None] * len(jsonlds)
+        entries = [
+            {"item": jsonld, "source": source, "idempotency_key": key}
+            for jsonld, key in zip(jsonlds, keys, strict=True)
+        ]
+        results: list[dict] = []
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            for offset in range(0, len(entries), BATCH_MAX_ITEMS):
+                response = await client.post(
+                    f"{self._base_url}/items/batch",
+                    json={"items": entries[offset : offset + BATCH_MAX_ITEMS]},
+                    headers=self._headers(auth),
+                )
+                response.raise_for_status()
+                for result in response.json()["results"]:
+                    results.append({**result, "index": offset + result["index"]})
+        return results
+
     async def get_item_content(
         self,
         item_id: str,
@@ -0,0 +1,285 @@
+"""Pool of long-lived copilot CLI worker processes.
+
+Spawning ``tsx cli/index.ts`` for every tool call pays Node/tsx start-up on
+each call. A worker (``<cli> --worker``) loads the CLI once and then runs
+commands read as newline-delimited JSON from stdin:
+
+    -> {"id": "...", "argv": [...], "env": {"COPILOT_TOKEN": "..."}}
+    <- {"id": "...", "exit_code": 0, "stdout": "...", "stderr": "..."}
+
+Auth travels with each request, so any worker can serve any user. A worker
+runs one request at a time and is replaced after ``max_requests`` requests,
+when it exits, and when a request times out.
+
+Configuration (environment):
+
+- ``COPILOT_CLI_WORKERS``: pool size; ``0`` (default) disables the pool and
+  every call spawns a one-shot CLI process.
+- ``COPILOT_CLI_WORKER_MAX_REQUESTS``: requests before a worker is recycled.
+- ``COPILOT_CLI_WORKER_TIMEOUT_SECONDS``: per-request timeout.
+- ``COPILOT_CLI_WORKER_STARTUP_TIMEOUT_SECONDS``: time to wait for a new
+  worker's ready line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+WORKER_FLAG = "--worker"
+
+# Only these reach the worker per request; everything else comes from the
+# worker's own environment.
+REQUEST_ENV_KEYS = ("COPILOT_TOKEN", "COPILOT_ORG_ID", "COPILOT_HOST")
+
+# CLI JSON envelopes arrive as a single line; asyncio's default 64 KiB line
+# limit is too small for large list outputs.
+_STREAM_LIMIT = 32 * 1024 * 1024
+
+# After a worker fails to start, use one-shot processes for this long before
+# trying again, instead of paying a failed spawn on every call.
+_STARTUP_RETRY_SECONDS = 60.0
+
+
+class CliWorkerUnavailable(RuntimeError):
+    """No worker could take the request; the command did not run."""
+
+
+class CliWorkerFailed(RuntimeError):
+    """A worker timed out or died while running a request."""
+
+    def __init__(self, detail: str, *, timed_out: bool = False) -> None:
+        super().__init__(detail)
+        self.timed_out = timed_out
+
+
+class CliWorker:
+    """One ``<cli> --worker`` process."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self._process = process
+        self.requests = 0
+
+    @classmethod
+    async def start(
+        cls,
+        command: list[str],
+        cwd: str,
+        env: dict[str, str],
+        *,
+        timeout: float,
+    ) -> CliWorker:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                WORKER_FLAG,
+                cwd=cwd,
+                env=env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                limit=_STREAM_LIMIT,
+            )
+        except OSError as exc:
+            raise CliWorkerUnavailable(f"copilot_cli worker could not be spawned: {exc}") from exc
+
+        worker = cls(process)
+        assert process.stdout is not None
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout)
+        except (TimeoutError, ValueError) as exc:
+            await worker.close()
+            raise CliWorkerUnavailable("copilot_cli worker did not become ready") from exc
+
+        try:
+            ready = json.loads(line)
+        except json.JSONDecodeError:
+            ready = None
+        if not isinstance(ready, dict) or ready.get("ready") is not True:
+            await worker.close()
+            raise CliWorkerUnavailable(f"copilot_cli worker did not become ready: {line[:200]!r}")
+        return worker
+
+    @property
+    def alive(self) -> bool:
+        return self._process.returncode is None
+
+    async def run(
+        self,
+        argv: list[str],
+        env: Mapping[str, str],
+        *,
+        timeout: float,
+    ) -> tuple[int, str, str]:
+        if not self.alive:
+            raise CliWorkerUnavailable("copilot_cli worker has exited")
+
+        request_id = uuid.uuid4().hex
+        request = {"id": request_id, "argv": argv, "env": dict(env)}
+        stdin = self._process.stdin
+        stdout = self._process.stdout
+        assert stdin is not None and stdout is not None
+
+        self.requests += 1
+        try:
+            stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            raise CliWorkerUnavailable("copilot_cli worker has exited") from exc
+
+        try:
+            line = await asyncio.wait_for(stdout.readline(), timeout)
+        except TimeoutError as exc:
+            raise CliWorkerFailed(
+                f"copilot_cli worker timed out after {timeout:g}s",
+                timed_out=True,
+            ) from exc
+        except ValueError as exc:
+            raise CliWorkerFailed("copilot_cli worker response exceeded the size limit") from exc
+        if not line:
+            raise CliWorkerFailed("copilot_cli worker exited while running the command")
+
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise CliWorkerFailed(f"copilot_cli worker sent invalid JSON: {line[:200]!r}") from exc
+        if not isinstance(response, dict) or response.get("id") != request_id:
+            raise CliWorkerFailed("copilot_cli worker response does not match the request")
+
+        exit_code = response.get("exit_code")
+        out = response.get("stdout")
+        err = response.get("stderr")
+        if not isinstance(exit_code, int) or not isinstance(out, str) or not isinstance(err, str):
+            raise CliWorkerFailed("copilot_cli worker response is malformed")
+        return exit_code, out, err
+
+    async def close(self) -> None:
+        if self._process.returncode is None:
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+        await self._process.wait()
+
+
+class CliWorkerPool:
+    """Up to ``size`` warm workers, started lazily and reused across calls."""
+
+    def __init__(
+        self,
+        command: list[str],
+        cwd: str,
+        *,
+        size: int,
+        max_requests: int,
+        request_timeout: float,
+        startup_timeout: float,
+    ) -> None:
+        self.command = list(command)
+        self.cwd = cwd
+        self._max_requests = max(1, max_requests)
+        self._request_timeout = request_timeout
+        self._startup_timeout = startup_timeout
+        self._slots = asyncio.Semaphore(max(1, size))
+        self._idle: list[CliWorker] = []
+        self._startup_failed_at: float | None = None
+        self._closed = False
+
+    def _worker_env(self) -> dict[str, str]:
+        return {key: value for key, value in os.environ.items() if key not in REQUEST_ENV_KEYS}
+
+    async def _checkout(self) -> CliWorker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            await worker.close()
+
+        if (
+            self._startup_failed_at is not None
+            and time.monotonic() - self._startup_failed_at < _STARTUP_RETRY_SECONDS
+        ):
+            raise CliWorkerUnavailable("copilot_cli worker start-up recently failed")
+        try:
+            worker = await CliWorker.start(
+                self.command,
+                self.cwd,
+                self._worker_env(),
+                timeout=self._startup_timeout,
+            )
+        except CliWorkerUnavailable as exc:
+            logger.warning("copilot_cli worker start-up failed: %s", exc)
+            self._startup_failed_at = time.monotonic()
+            raise
+        self._startup_failed_at = None
+        return worker
+
+    async def _checkin(self, worker: CliWorker) -> None:
+        if self._closed or not worker.alive or worker.requests >= self._max_requests:
+            await worker.close()
+        else:
+            self._idle.append(worker)
+
+    async def run(self, argv: list[str], env: Mapping[str, str]) -> tuple[int, str, str]:
+        """Run one CLI command on a warm worker.
+
+        Raises :class:`CliWorkerUnavailable` when no worker could take the
+        command (it did not run) and :class:`CliWorkerFailed` when it timed out
+        or the worker died mid-command.
+        """
+        if self._closed:
+            raise CliWorkerUnavailable("copilot_cli worker pool is closed")
+        async with self._slots:
+            worker = await self._checkout()
+            try:
+                result = await worker.run(argv, env, timeout=self._request_timeout)
+            except BaseException:
+                # A timed-out or cancelled worker may still be busy: never reuse it.
+                await worker.close()
+                raise
+            await self._checkin(worker)
+            return result
+
+    async def close(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for worker in idle:
+            await worker.close()
+
+
+_pool: CliWorkerPool | None = None
+
+
+def get_worker_pool(command: list[str], cwd: str) -> CliWorkerPool | None:
+    """Shared pool for ``command``, or ``None`` when the pool is disabled."""
+    global _pool
+    size = int(os.getenv("COPILOT_CLI_WORKERS", "0"))
+    if size <= 0:
+        return None
+    if _pool is None or _pool.command != command or _pool.cwd != cwd:
+        stale = _pool
+        _pool = CliWorkerPool(
+            command,
+            cwd,
+            size=size,
+            max_requests=int(os.getenv("COPILOT_CLI_WORKER_MAX_REQUESTS", "200")),
+            request_timeout=float(os.getenv("COPILOT_CLI_WORKER_TIMEOUT_SECONDS", "60")),
+            startup_timeout=float(os.getenv("COPILOT_CLI_WORKER_STARTUP_TIMEOUT_SECONDS", "20")),
+        )
+        if stale is not None:
+            asyncio.ensure_future(stale.close())
+    return _pool
+
+
+async def close_worker_pool() -> None:
+    """Stop all idle workers (application shutdown)."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,117 @@
+"""Compare copilot_cli tool latency: one-shot processes vs. warm workers.
+
+Runs the same CLI command ``--runs`` times through each path and prints
+p50/p95/max wall time. ``one-shot`` spawns a fresh CLI process per call (the
+fallback path); ``pool`` sends the command to a ``--worker`` process that is
+started once before timing begins.
+
+    cd agents
+    COPILOT_TOKEN=... uv run python scripts/benchmark_cli_workers.py \\
+        --runs 50 --argv "items list --json"
+
+Failed commands (e.g. no backend running) are timed as well and counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import shlex
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from cli_worker_pool import REQUEST_ENV_KEYS, CliWorkerPool  # noqa: E402
+from tool_executor import _resolve_cli_command, _spawn_cli_process  # noqa: E402
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _report(label: str, samples: list[float], failures: int) -> None:
+    print(
+        f"{label:<9} runs={len(samples):<4} failed={failures:<4} "
+        f"p50={_percentile(samples, 50) * 1000:8.1f}ms "
+        f"p95={_percentile(samples, 95) * 1000:8.1f}ms "
+        f"max={max(samples) * 1000:8.1f}ms "
+        f"mean={statistics.fmean(samples) * 1000:8.1f}ms"
+    )
+
+
+async def _bench_one_shot(
+    cli_base: list[str], cwd: str, argv: list[str], env: dict[str, str], runs: int
+) -> tuple[list[float], int]:
+    samples: list[float] = []
+    failures = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        return_code, _, _ = await _spawn_cli_process(cli_base, argv, cwd, env)
+        samples.append(time.perf_counter() - started)
+        failures += return_code != 0
+    return samples, failures
+
+
+async def _bench_pool(
+    cli_base: list[str], cwd: str, argv: list[str], env: dict[str, str], runs: int
+) -> tuple[list[float], int]:
+    pool = CliWorkerPool(
+        cli_base,
+        cwd,
+        size=1,
+        max_requests=runs + 1,
+        request_timeout=60.0,
+        startup_timeout=60.0,
+    )
+    request_env = {key: env[key] for key in REQUEST_ENV_KEYS if key in env}
+    samples: list[float] = []
+    failures = 0
+    try:
+        started = time.perf_counter()
+        await pool.run(argv, request_env)
+        warm_up_ms = (time.perf_counter() - started) * 1000
+        print(f"worker warm-up (start + first call): {warm_up_ms:.1f}ms")
+        for _ in range(runs):
+            started = time.perf_counter()
+            return_code, _, _ = await pool.run(argv, request_env)
+            samples.append(time.perf_counter() - started)
+            failures += return_code != 0
+    finally:
+        await pool.close()
+    return samples, failures
+
+
+async def _main(args: argparse.Namespace) -> None:
+    cli_base, cwd = _resolve_cli_command()
+    argv = shlex.split(args.argv)
+    env = os.environ.copy()
+    env.setdefault("COPILOT_HOST", os.getenv("BACKEND_URL", "http://localhost:8000"))
+
+    print(f"cli: {' '.join(cli_base)}  argv: {' '.join(argv)}")
+    one_shot = await _bench_one_shot(cli_base, cwd, argv, env, args.runs)
+    pooled = await _bench_pool(cli_base, cwd, argv, env, args.runs)
+    _report("one-shot", *one_shot)
+    _report("pool", *pooled)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30, help="Timed calls per mode.")
+    parser.add_argument(
+        "--argv",
+        default="auth status --json --non-interactive",
+        help="CLI arguments to run (shell-quoted).",
+    )
+    args = parser.parse_args()
+    args.runs = max(1, args.runs)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -144,6 +144,64 @@ class TestBackendClient:
         assert body["source"] == "ai-copilot"
 
 
+class TestCreateItems:
+    @pytest.mark.anyio
+    async def test_posts_one_batch_with_per_item_keys(self, auth_ctx):
+        resp = MagicMock(spec=httpx.Response)
+        resp.json.return_value = {
+            "results": [
+                {"index": 0, "status": "created", "status_code": 201},
+                {"index": 1, "status": "error", "status_code": 422},
+            ]
+        }
+        resp.raise_for_status = MagicMock()
+        mock_client = _make_mock_client(resp)
+        items = [{"@id": "urn:app:action:a"}, {"@id": "urn:app:action:b"}]
+
+        with patch("backend_client.httpx.AsyncClient", return_value=mock_client):
+            client = BackendClient(base_url="http://test:8000")
+            results = await client.create_items(items, auth_ctx, idempotency_keys=["k1", None])
+
+        mock_client.post.assert_called_once()
+        call = mock_client.post.call_args
+        assert call.args[0] == "http://test:8000/items/batch"
+        assert call.kwargs["json"] == {
+            "items": [
+                {"item": items[0], "source": "senticor-copilot", "idempotency_key": "k1"},
+                {"item": items[1], "source": "senticor-copilot", "idempotency_key": None},
+            ]
+        }
+        assert call.kwargs["headers"]["Authorization"] == "Bearer jwt-tok-abc123"
+        assert [r["status"] for r in results] == ["created", "error"]
+
+    @pytest.mark.anyio
+    async def test_splits_large_batches_and_keeps_global_indexes(self, auth_ctx):
+        def _respond(url, json, headers):
+            resp = MagicMock(spec=httpx.Response)
+            resp.json.return_value = {
+                "results": [
+                    {"index": i, "status": "created", "status_code": 201}
+                    for i in range(len(json["items"]))
+                ]
+            }
+            resp.raise_for_status = MagicMock()
+            return resp
+
+        mock_client = _make_mock_client(MagicMock())
+        mock_client.post.side_effect = _respond
+        items = [{"@id": f"urn:app:action:{n}"} for n in range(5)]
+
+        with (
+            patch("backend_client.BATCH_MAX_ITEMS", 2),
+            patch("backend_client.httpx.AsyncClient", return_value=mock_client),
+        ):
+            client = BackendClient(base_url="http://test:8000")
+            results = await client.create_items(items, auth_ctx)
+
+        assert mock_client.post.call_count == 3
+        assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+
+
 class TestListWorkspaceOverview:
     @pytest.mark.anyio
     async def test_parses_items_into_overview(self, auth_ctx):
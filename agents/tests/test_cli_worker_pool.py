@@ -0,0 +1,177 @@
+"""Tests for the warm copilot CLI worker pool."""
+
+from __future__ import annotations
+
+import json
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import cli_worker_pool
+from backend_client import AuthContext
+from cli_worker_pool import CliWorkerFailed, CliWorkerPool, CliWorkerUnavailable
+from tool_executor import CopilotCliError, ToolCallInput, execute_tool
+
+# Speaks the --worker protocol: echoes argv, env and its pid; "sleep" hangs,
+# "crash" exits mid-request.
+_FAKE_WORKER = """
+import json, os, sys, time
+
+assert sys.argv[-1] == "--worker"
+print(json.dumps({"ready": True, "pid": os.getpid()}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    argv = request["argv"]
+    if argv[:1] == ["sleep"]:
+        time.sleep(30)
+    if argv[:1] == ["crash"]:
+        sys.exit(1)
+    payload = {
+        "ok": True,
+        "data": {"argv": argv, "env": request["env"], "pid": os.getpid()},
+    }
+    response = {"id": request["id"], "exit_code": 0, "stdout": json.dumps(payload), "stderr": ""}
+    print(json.dumps(response), flush=True)
+"""
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(_FAKE_WORKER)
+    return [sys.executable, str(script)]
+
+
+def _pool(command, **overrides) -> CliWorkerPool:
+    options = {
+        "size": 1,
+        "max_requests": 100,
+        "request_timeout": 5.0,
+        "startup_timeout": 5.0,
+    }
+    options.update(overrides)
+    return CliWorkerPool(command, "/", **options)
+
+
+async def _run(pool: CliWorkerPool, argv: list[str], env: dict | None = None) -> dict:
+    exit_code, stdout, _ = await pool.run(argv, env or {})
+    assert exit_code == 0
+    return json.loads(stdout)["data"]
+
+
+@pytest.mark.anyio
+async def test_pool_reuses_worker_and_passes_request_env(worker_command):
+    pool = _pool(worker_command)
+    try:
+        first = await _run(pool, ["items", "list"], {"COPILOT_TOKEN": "t1"})
+        second = await _run(pool, ["projects", "list"], {"COPILOT_TOKEN": "t2"})
+    finally:
+        await pool.close()
+
+    assert first["pid"] == second["pid"]
+    assert first["argv"] == ["items", "list"]
+    assert first["env"] == {"COPILOT_TOKEN": "t1"}
+    assert second["env"] == {"COPILOT_TOKEN": "t2"}
+
+
+@pytest.mark.anyio
+async def test_pool_recycles_worker_after_max_requests(worker_command):
+    pool = _pool(worker_command, max_requests=2)
+    try:
+        pids = [(await _run(pool, ["items", "list"]))["pid"] for _ in range(3)]
+    finally:
+        await pool.close()
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]
+
+
+@pytest.mark.anyio
+async def test_pool_replaces_timed_out_and_crashed_workers(worker_command):
+    pool = _pool(worker_command, request_timeout=0.5)
+    try:
+        before = (await _run(pool, ["items", "list"]))["pid"]
+        with pytest.raises(CliWorkerFailed) as timed_out:
+            await pool.run(["sleep"], {})
+        assert timed_out.value.timed_out is True
+        with pytest.raises(CliWorkerFailed, match="exited"):
+            await pool.run(["crash"], {})
+        after = (await _run(pool, ["items", "list"]))["pid"]
+    finally:
+        await pool.close()
+
+    assert after != before
+
+
+@pytest.mark.anyio
+async def test_pool_unavailable_when_worker_mode_is_unsupported():
+    pool = _pool([sys.executable, "-c", "print('usage: project-cli')"])
+    with pytest.raises(CliWorkerUnavailable):
+        await pool.run(["items", "list"], {})
+    # Start-up is not retried on every call.
+    with pytest.raises(CliWorkerUnavailable, match="recently failed"):
+        await pool.run(["items", "list"], {})
+
+
+@pytest.mark.anyio
+async def test_execute_tool_uses_worker_pool(worker_command, monkeypatch):
+    monkeypatch.setenv("COPILOT_CLI_COMMAND", " ".join(worker_command))
+    monkeypatch.setenv("COPILOT_CLI_WORKERS", "1")
+    spawn = AsyncMock()
+    try:
+        with patch("tool_executor._spawn_cli_process", new=spawn):
+            result = await execute_tool(
+                ToolCallInput(name="copilot_cli", arguments={"argv": ["items", "list"]}),
+                conversation_id="conv-1",
+                auth=AuthContext(token="jwt-delegated-token", org_id="org-1"),
+            )
+    finally:
+        await cli_worker_pool.close_worker_pool()
+
+    assert result == []
+    spawn.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_execute_tool_falls_back_to_one_shot_process(monkeypatch):
+    monkeypatch.setenv("COPILOT_CLI_COMMAND", f"{sys.executable} -c pass")
+    monkeypatch.setenv("COPILOT_CLI_WORKERS", "1")
+    payload = {"schema_version": "copilot.v1", "ok": True, "data": {}, "meta": {}}
+    spawn = AsyncMock(return_value=(0, json.dumps(payload), ""))
+    try:
+        with patch("tool_executor._spawn_cli_process", new=spawn):
+            result = await execute_tool(
+                ToolCallInput(name="copilot_cli", arguments={"argv": ["items", "list"]}),
+                conversation_id="conv-1",
+                auth=AuthContext(token="jwt-delegated-token", org_id="org-1"),
+            )
+    finally:
+        await cli_worker_pool.close_worker_pool()
+
+    assert result == []
+    spawn.assert_awaited_once()
+    assert spawn.call_args.args[1][:2] == ["items", "list"]
+
+
+@pytest.mark.anyio
+async def test_execute_tool_does_not_rerun_timed_out_command(worker_command, monkeypatch):
+    monkeypatch.setenv("COPILOT_CLI_COMMAND", " ".join(worker_command))
+    monkeypatch.setenv("COPILOT_CLI_WORKERS", "1")
+    monkeypatch.setenv("COPILOT_CLI_WORKER_TIMEOUT_SECONDS", "0.5")
+    spawn = AsyncMock()
+    try:
+        with (
+            patch("tool_executor._spawn_cli_process", new=spawn),
+            pytest.raises(CopilotCliError) as exc_info,
+        ):
+            await execute_tool(
+                ToolCallInput(name="copilot_cli", arguments={"argv": ["sleep"]}),
+                conversation_id="conv-1",
+                auth=AuthContext(token="jwt-delegated-token", org_id="org-1"),
+            )
+    finally:
+        await cli_worker_pool.close_worker_pool()
+
+    assert exc_info.value.error_code == "CLI_TIMEOUT"
+    spawn.assert_not_awaited()
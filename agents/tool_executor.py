@@ -12,6 +12,12 @@ from typing import Any
 from pydantic import BaseModel
 
 from backend_client import AuthContext, CreatedItemRef
+from cli_worker_pool import (
+    REQUEST_ENV_KEYS,
+    CliWorkerFailed,
+    CliWorkerUnavailable,
+    get_worker_pool,
+)
 from intent_contract import compile_intent_to_argv
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -368,6 +374,36 @@ async def _run_cli_process(
     argv: list[str],
     cwd: str,
     env: dict[str, str],
+) -> tuple[int, str, str]:
+    """Run one CLI command on a warm worker, or in a one-shot process.
+
+    The one-shot spawn is used when the worker pool is disabled
+    (``COPILOT_CLI_WORKERS=0``) or no worker could take the command.
+    """
+    pool = get_worker_pool(cli_base, cwd)
+    if pool is not None:
+        request_env = {key: env[key] for key in REQUEST_ENV_KEYS if key in env}
+        try:
+            return await pool.run(argv, request_env)
+        except CliWorkerUnavailable:
+            pass
+        except CliWorkerFailed as exc:
+            # The command may have been applied already; do not run it again.
+            raise CopilotCliError(
+                return_code=-1,
+                command=" ".join(argv[:6]),
+                detail=str(exc),
+                error_code="CLI_TIMEOUT" if exc.timed_out else "CLI_WORKER_FAILED",
+            ) from exc
+
+    return await _spawn_cli_process(cli_base, argv, cwd, env)
+
+
+async def _spawn_cli_process(
+    cli_base: list[str],
+    argv: list[str],
+    cwd: str,
+    env: dict[str, str],
 ) -> tuple[int, str, str]:
     process = await asyncio.create_subprocess_exec(
         *cli_base,
@@ -701,7 +737,7 @@ async def execute_tool(
     auth: AuthContext,
     client: object | None = None,  # noqa: ARG001 - compatibility with existing call sites/tests
 ) -> list[CreatedItemRef]:
-    """Execute a single approved copilot_cli tool call via subprocess."""
+    """Execute a single approved copilot_cli tool call via the CLI."""
     del client
     commands = _normalize_commands(tool_call, conversation_id)
     cli_base, cwd = _resolve_cli_command()
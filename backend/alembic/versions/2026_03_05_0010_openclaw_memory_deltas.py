@@ -0,0 +1,49 @@
+"""Store older OpenClaw memory versions as deltas.
+
+Adds ``storage_kind``/``base_version``/``delta`` to ``openclaw_memory_versions``
+(content is only kept for full rows) and tracks ``next_version`` on heads so
+appends no longer aggregate ``MAX(version)``.
+
+Revision ID: 2026_03_05_0010
+Revises: 2026_03_04_0009
+Create Date: 2026-03-05 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_05_0010"
+down_revision = "2026_03_04_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE openclaw_memory_versions ALTER COLUMN content DROP NOT NULL;
+        ALTER TABLE openclaw_memory_versions
+          ADD COLUMN IF NOT EXISTS storage_kind TEXT NOT NULL DEFAULT 'full'
+          CHECK (storage_kind IN ('full', 'delta'));
+        ALTER TABLE openclaw_memory_versions ADD COLUMN IF NOT EXISTS base_version INTEGER;
+        ALTER TABLE openclaw_memory_versions ADD COLUMN IF NOT EXISTS delta BYTEA;
+
+        ALTER TABLE openclaw_memory_heads ADD COLUMN IF NOT EXISTS next_version INTEGER;
+        UPDATE openclaw_memory_heads h
+        SET next_version = sub.max_version + 1
+        FROM (
+          SELECT user_id, filename, MAX(version) AS max_version
+          FROM openclaw_memory_versions
+          GROUP BY user_id, filename
+        ) sub
+        WHERE sub.user_id = h.user_id
+          AND sub.filename = h.filename
+          AND h.next_version IS NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
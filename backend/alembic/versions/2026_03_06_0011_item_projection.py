@@ -0,0 +1,64 @@
+"""Add the item_projection table.
+
+Typed columns extracted from ``items.schema_jsonld`` (bucket, primary type,
+project refs, event start/end, source message ids, completion) with B-tree
+and GIN indexes. Rows are written by ``app.projection.items``;
+``app.db_init`` backfills existing items after upgrading, or run
+``python -m app.projection.rebuild``.
+
+Revision ID: 2026_03_06_0011
+Revises: 2026_03_05_0010
+Create Date: 2026-03-06 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_06_0011"
+down_revision = "2026_03_05_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS item_projection (
+          item_id            UUID PRIMARY KEY REFERENCES items(item_id) ON DELETE CASCADE,
+          org_id             UUID NOT NULL,
+          created_by_user_id UUID,
+          source             TEXT,
+          bucket             TEXT,
+          primary_type       TEXT,
+          project_refs       TEXT[] NOT NULL DEFAULT '{}',
+          start_time         TIMESTAMPTZ,
+          end_time           TIMESTAMPTZ,
+          source_message_ids TEXT[] NOT NULL DEFAULT '{}',
+          is_completed       BOOLEAN NOT NULL DEFAULT false,
+          archived_at        TIMESTAMPTZ,
+          item_created_at    TIMESTAMPTZ NOT NULL,
+          item_updated_at    TIMESTAMPTZ NOT NULL,
+          projected_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_item_projection_bucket
+          ON item_projection (org_id, bucket, item_created_at)
+          WHERE archived_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_item_projection_completed
+          ON item_projection (org_id, is_completed, item_created_at, item_id)
+          WHERE archived_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_item_projection_project_refs
+          ON item_projection USING gin (project_refs)
+          WHERE archived_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_item_projection_source_message_ids
+          ON item_projection USING gin (source_message_ids);
+        CREATE INDEX IF NOT EXISTS idx_item_projection_owner_source
+          ON item_projection (org_id, created_by_user_id, source, archived_at);
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
@@ -0,0 +1,49 @@
+"""Index calendar events by time range.
+
+Adds ``event_id`` and a stored ``event_range`` (``tstzrange`` over
+``start_time``/``end_time``) to ``item_projection`` with a GiST index on
+``(org_id, event_range)``, so calendar windows and free/busy lookups filter in
+the index. Existing rows get ``event_id`` from ``sourceMetadata.raw.eventId``.
+
+Revision ID: 2026_03_07_0012
+Revises: 2026_03_06_0011
+Create Date: 2026-03-07 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_07_0012"
+down_revision = "2026_03_06_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE EXTENSION IF NOT EXISTS btree_gist;
+        ALTER TABLE item_projection ADD COLUMN IF NOT EXISTS event_id TEXT;
+        ALTER TABLE item_projection ADD COLUMN IF NOT EXISTS event_range TSTZRANGE
+          GENERATED ALWAYS AS (
+            CASE WHEN start_time IS NOT NULL
+              THEN tstzrange(start_time, GREATEST(start_time, end_time), '[]')
+            END
+          ) STORED;
+        CREATE INDEX IF NOT EXISTS idx_item_projection_event_range
+          ON item_projection USING gist (org_id, event_range)
+          WHERE archived_at IS NULL AND event_range IS NOT NULL;
+
+        UPDATE item_projection p
+        SET event_id = NULLIF(i.schema_jsonld -> 'sourceMetadata' -> 'raw' ->> 'eventId', '')
+        FROM items i
+        WHERE i.item_id = p.item_id
+          AND jsonb_typeof(i.schema_jsonld -> 'sourceMetadata' -> 'raw' -> 'eventId') = 'string';
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
@@ -0,0 +1,35 @@
+"""Add a render cache key to files.
+
+``files.render_cache_key`` holds the content hash of the inputs a rendered
+PDF was produced from, so ``POST /files/render-pdf`` can return the existing
+file for identical inputs instead of rendering again.
+
+Revision ID: 2026_03_08_0013
+Revises: 2026_03_07_0012
+Create Date: 2026-03-08 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_08_0013"
+down_revision = "2026_03_07_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE files ADD COLUMN IF NOT EXISTS render_cache_key TEXT;
+        CREATE INDEX IF NOT EXISTS idx_files_render_cache_key
+          ON files (org_id, render_cache_key)
+          WHERE render_cache_key IS NOT NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
@@ -0,0 +1,56 @@
+"""Comment counter and keyset indexes for project actions.
+
+``project_action.comment_count`` is maintained by the comment write path, so
+action lists no longer count ``action_comment`` rows per action. The
+expression index matches the action list order
+(``COALESCE(due_at, 'infinity'), created_at, id``) for keyset pagination;
+``(action_id, id)`` on ``action_revision`` serves paginated history.
+
+Revision ID: 2026_03_09_0014
+Revises: 2026_03_08_0013
+Create Date: 2026-03-09 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_09_0014"
+down_revision = "2026_03_08_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE project_action
+          ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+
+        UPDATE project_action a
+        SET comment_count = c.comment_count
+        FROM (
+            SELECT action_id, count(*)::integer AS comment_count
+            FROM action_comment
+            GROUP BY action_id
+        ) c
+        WHERE c.action_id = a.id;
+
+        CREATE INDEX IF NOT EXISTS idx_project_action_keyset
+          ON project_action (
+            project_item_id,
+            (COALESCE(due_at, 'infinity'::timestamptz)),
+            created_at,
+            id
+          )
+          WHERE archived_at IS NULL;
+
+        CREATE INDEX IF NOT EXISTS idx_action_revision_action_id
+          ON action_revision (action_id, id);
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
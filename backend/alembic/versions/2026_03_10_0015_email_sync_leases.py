@@ -0,0 +1,41 @@
+"""Per-connection leases for the email sync executor.
+
+``email_connections.sync_lease_owner`` / ``sync_lease_expires_at`` mark the
+worker currently syncing a connection (and, after a failure, hold it back
+until the retry time). The partial index serves the executor's scan of
+pending ``email_sync_job`` outbox events grouped by connection.
+
+Revision ID: 2026_03_10_0015
+Revises: 2026_03_09_0014
+Create Date: 2026-03-10 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_10_0015"
+down_revision = "2026_03_09_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS sync_lease_owner TEXT;
+        ALTER TABLE email_connections
+          ADD COLUMN IF NOT EXISTS sync_lease_expires_at TIMESTAMPTZ;
+
+        CREATE INDEX IF NOT EXISTS idx_outbox_events_email_sync_pending
+          ON outbox_events ((payload->>'connection_id'), created_at)
+          WHERE event_type = 'email_sync_job'
+            AND processed_at IS NULL
+            AND dead_lettered_at IS NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
@@ -0,0 +1,43 @@
+"""Shared validation result cache.
+
+``validation_results`` holds item validation outcomes keyed by content hash
+and the versions of ``entities.ttl`` and ``business_rules.json``, shared by
+the API and worker processes behind their in-memory caches. ``created_at``
+serves the worker's trim to ``VALIDATION_CACHE_SHARED_MAX_ROWS``.
+
+Revision ID: 2026_03_11_0016
+Revises: 2026_03_10_0015
+Create Date: 2026-03-11 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_03_11_0016"
+down_revision = "2026_03_10_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS validation_results (
+          content_hash   TEXT NOT NULL,
+          shapes_version TEXT NOT NULL,
+          rules_version  TEXT NOT NULL,
+          issues         JSONB NOT NULL,
+          created_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+          PRIMARY KEY (content_hash, shapes_version, rules_version)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_validation_results_created_at
+          ON validation_results (created_at);
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Downgrade is not supported for this migration.")
@@ -0,0 +1,333 @@
+"""In-process cache for session and org-membership lookups.
+
+``get_current_user`` and ``get_current_org`` run on every authenticated
+request. Validated session rows and active memberships are cached for
+``AUTH_CACHE_TTL_SECONDS``; expiry and IP/user-agent binding are still checked
+against the cached row on every request.
+
+Writes that change what the cache holds call :func:`invalidate_session`,
+:func:`invalidate_user` or :func:`invalidate_memberships` with the writing
+cursor, and again without it once the transaction has committed. The first
+call queues a ``pg_notify`` that fires on commit, so the other API workers
+(subscribed through the notification hub) drop their entries; the second
+drops anything this worker re-read from the still-committed old row in the
+meantime. Every drop bumps a generation counter, and a row loaded before a
+drop is not put back afterwards (:func:`generation`).
+
+The cache is only used while this process's hub is LISTENing on
+:data:`AUTH_CACHE_NOTIFY_CHANNEL`; without it (hub disabled, not started, or
+reconnecting) every lookup goes to the database. After a reconnect the whole
+cache is cleared because invalidations may have been missed.
+
+``sessions.last_seen_at`` is not written per request any more: touches are
+coalesced per session and flushed in one statement every
+``AUTH_LAST_SEEN_FLUSH_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import UTC, datetime
+from typing import Any, Final
+
+from .config import settings
+from .db import db_conn
+from .metrics import (
+    APP_AUTH_CACHE_INVALIDATIONS_TOTAL,
+    APP_AUTH_CACHE_LOOKUPS_TOTAL,
+    APP_AUTH_LAST_SEEN_FLUSHED_TOTAL,
+)
+from .notification_hub import get_notification_hub
+from .observability import get_logger
+
+logger = get_logger("auth_cache")
+
+AUTH_CACHE_NOTIFY_CHANNEL: Final = "auth_cache_invalidation"
+_NOTIFY_SQL = "SELECT pg_notify(%s, %s)"
+
+_MISSING: Final = object()
+
+_generation_lock = threading.Lock()
+_generation = 0
+
+
+def generation() -> int:
+    """Invalidation counter; pass the value read before a DB load to ``put_*``."""
+    return _generation
+
+
+def _receives_invalidations() -> bool:
+    hub = get_notification_hub()
+    return hub is not None and hub.listening(AUTH_CACHE_NOTIFY_CHANNEL)
+
+
+def _enabled() -> bool:
+    return settings.auth_cache_ttl_seconds > 0 and _receives_invalidations()
+
+
+class _TTLCache:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        if not _enabled():
+            return _MISSING
+        ttl = settings.auth_cache_ttl_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] >= ttl:
+                del self._entries[key]
+                entry = None
+        result = "miss" if entry is None else "hit"
+        APP_AUTH_CACHE_LOOKUPS_TOTAL.labels(cache=self._name, result=result).inc()
+        return _MISSING if entry is None else entry[1]
+
+    def put(self, key: Hashable, value: Any, loaded_at: int | None) -> None:
+        if not _enabled():
+            return
+        with self._lock:
+            if loaded_at is not None and loaded_at != _generation:
+                # Invalidated while the row was being read; it may be stale.
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, settings.auth_cache_max_entries):
+                self._entries.popitem(last=False)
+
+    def update(self, key: Hashable, changes: dict[str, Any]) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1].update(changes)
+
+    def discard_where(self, predicate) -> None:  # noqa: ANN001
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# token digest -> session row (users JOIN sessions)
+_sessions = _TTLCache("session")
+# (user_id, org_id) -> active membership row
+_memberships = _TTLCache("membership")
+# user_id -> up to two active org ids, oldest first
+_default_orgs = _TTLCache("default_org")
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# -- sessions -----------------------------------------------------------------
+
+
+def get_session(token: str) -> dict | None:
+    row = _sessions.get(_token_key(token))
+    return None if row is _MISSING else dict(row)
+
+
+def put_session(token: str, row: dict, *, loaded_at: int | None = None) -> None:
+    _sessions.put(_token_key(token), dict(row), loaded_at)
+
+
+def update_session_context(token: str, changes: dict[str, Any]) -> None:
+    """Patch a cached session row, e.g. with the IP recorded on first use."""
+    _sessions.update(_token_key(token), changes)
+
+
+# -- memberships --------------------------------------------------------------
+
+
+def get_membership(user_id: str, org_id: str) -> dict | None:
+    row = _memberships.get((str(user_id), str(org_id)))
+    return None if row is _MISSING else dict(row)
+
+
+def put_membership(user_id: str, org_id: str, row: dict, *, loaded_at: int | None = None) -> None:
+    # Only active memberships are cached, so a grant is never hidden by a stale denial.
+    if row.get("status") == "active":
+        _memberships.put((str(user_id), str(org_id)), dict(row), loaded_at)
+
+
+def get_default_orgs(user_id: str) -> list[str] | None:
+    org_ids = _default_orgs.get(str(user_id))
+    return None if org_ids is _MISSING else list(org_ids)
+
+
+def put_default_orgs(user_id: str, org_ids: list[str], *, loaded_at: int | None = None) -> None:
+    if org_ids:
+        _default_orgs.put(str(user_id), list(org_ids), loaded_at)
+
+
+# -- invalidation -------------------------------------------------------------
+
+
+def _drop(kind: str, *, user_id: str | None = None, session_id: str | None = None) -> None:
+    global _generation
+    APP_AUTH_CACHE_INVALIDATIONS_TOTAL.labels(kind=kind).inc()
+    with _generation_lock:
+        _generation += 1
+    if kind == "session":
+        _sessions.discard_where(lambda _key, row: str(row.get("session_id")) == session_id)
+    elif kind == "user":
+        _sessions.discard_where(lambda _key, row: str(row.get("id")) == user_id)
+    elif kind == "membership":
+        _memberships.discard_where(lambda key, _row: key[0] == user_id)
+        _default_orgs.discard_where(lambda key, _row: key == user_id)
+    else:
+        clear()
+
+
+def _publish(cur, payload: dict[str, str]) -> None:  # noqa: ANN001
+    if cur is not None:
+        cur.execute(_NOTIFY_SQL, (AUTH_CACHE_NOTIFY_CHANNEL, json.dumps(payload)))
+
+
+def invalidate_session(session_id: str, *, cur=None) -> None:  # noqa: ANN001
+    """Forget one session (logout, revocation, token rotation).
+
+    Call with the writing ``cur`` inside the transaction and again without it
+    after commit.
+    """
+    _drop("session", session_id=str(session_id))
+    _publish(cur, {"kind": "session", "session_id": str(session_id)})
+
+
+def invalidate_user(user_id: str, *, cur=None) -> None:  # noqa: ANN001
+    """Forget every cached session of a user whose row changed."""
+    _drop("user", user_id=str(user_id))
+    _publish(cur, {"kind": "user", "user_id": str(user_id)})
+
+
+def invalidate_memberships(user_id: str, *, cur=None) -> None:  # noqa: ANN001
+    """Forget a user's memberships after a grant, role or status change."""
+    _drop("membership", user_id=str(user_id))
+    _publish(cur, {"kind": "membership", "user_id": str(user_id)})
+
+
+def handle_notify(payload: str | None) -> None:
+    """Apply an invalidation from another worker; ``None`` means resync."""
+    try:
+        parsed = json.loads(payload) if payload else None
+    except json.JSONDecodeError:
+        parsed = None
+    if not isinstance(parsed, dict):
+        _drop("all")
+        return
+    _drop(
+        str(parsed.get("kind")),
+        user_id=parsed.get("user_id"),
+        session_id=parsed.get("session_id"),
+    )
+
+
+def clear() -> None:
+    _sessions.clear()
+    _memberships.clear()
+    _default_orgs.clear()
+
+
+# -- last_seen_at coalescing --------------------------------------------------
+
+_FLUSH_SQL = """
+    UPDATE sessions AS s
+    SET last_seen_at = GREATEST(s.last_seen_at, t.last_seen_at),
+        ip_address = COALESCE(s.ip_address, t.ip_address),
+        user_agent = COALESCE(s.user_agent, t.user_agent)
+    FROM unnest(%s::uuid[], %s::timestamptz[], %s::text[], %s::text[])
+        AS t(session_id, last_seen_at, ip_address, user_agent)
+    WHERE s.id = t.session_id
+"""
+
+_touch_lock = threading.Lock()
+# session_id -> (last_seen_at, ip_address, user_agent)
+_pending_touches: dict[str, tuple[datetime, str | None, str | None]] = {}
+_flusher: threading.Thread | None = None
+_flusher_wakeup = threading.Event()
+
+
+def touch_session(
+    session_id: str,
+    *,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+) -> None:
+    """Record activity on a session; written by the next flush."""
+    now = datetime.now(UTC)
+    if settings.auth_last_seen_flush_seconds <= 0:
+        _write_touches({str(session_id): (now, ip_address, user_agent)})
+        return
+    with _touch_lock:
+        previous = _pending_touches.get(str(session_id))
+        if previous is not None:
+            ip_address = ip_address or previous[1]
+            user_agent = user_agent or previous[2]
+        _pending_touches[str(session_id)] = (now, ip_address, user_agent)
+    _ensure_flusher()
+
+
+def _write_touches(touches: dict[str, tuple[datetime, str | None, str | None]]) -> None:
+    if not touches:
+        return
+    ids = list(touches)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                _FLUSH_SQL,
+                (
+                    ids,
+                    [touches[sid][0] for sid in ids],
+                    [touches[sid][1] for sid in ids],
+                    [touches[sid][2] for sid in ids],
+                ),
+            )
+        conn.commit()
+    APP_AUTH_LAST_SEEN_FLUSHED_TOTAL.inc(len(ids))
+
+
+def flush_last_seen() -> int:
+    """Write all pending touches now; returns the number of sessions written."""
+    global _pending_touches
+    with _touch_lock:
+        touches, _pending_touches = _pending_touches, {}
+    try:
+        _write_touches(touches)
+    except Exception:  # noqa: BLE001
+        logger.warning("auth_cache.last_seen_flush_failed", sessions=len(touches), exc_info=True)
+        with _touch_lock:
+            # Keep newer touches that arrived meanwhile; retry the rest next time.
+            for session_id, touch in touches.items():
+                _pending_touches.setdefault(session_id, touch)
+        return 0
+    return len(touches)
+
+
+def _flush_loop() -> None:
+    while True:
+        _flusher_wakeup.wait(max(0.1, settings.auth_last_seen_flush_seconds))
+        _flusher_wakeup.clear()
+        flush_last_seen()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _touch_lock:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_flush_loop, name="last-seen-flusher", daemon=True)
+            _flusher.start()
@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import json
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Coroutine
 from contextlib import nullcontext
 
 import httpx
@@ -26,7 +26,7 @@ from ..container.memory_store import SOURCE_RUNTIME_SYNC, sync_workspace_memory_
 from ..db import db_conn
 from ..delegation import create_delegated_token
 from ..deps import get_current_org, get_current_user
-from ..observability import get_logger, request_context_headers, wrap_with_context
+from ..observability import get_logger, request_context_headers
 from ..routes.agent_settings import get_user_agent_backend, get_user_llm_config
 from .instrumentation import (
     ChatContext,
@@ -56,6 +56,7 @@ from .queries import (
 from .sse_translator import SseToNdjsonTranslator
 from .tool_executor import AuthContext as ToolAuthContext
 from .tool_executor import execute_tool as local_execute_tool
+from .upstream import get_client as get_upstream_client
 
 logger = get_logger(__name__)
 
@@ -174,20 +175,99 @@ def _build_agent_messages(history: list[dict]) -> list[dict]:
     return messages
 
 
-def _run_haystack_sync(
-    queue: asyncio.Queue,
+class _EventChannel:
+    """Bounded hand-off of NDJSON chunks from a background chat task to the response.
+
+    The producer awaits :meth:`send`, so once ``CHAT_STREAM_QUEUE_MAX_EVENTS``
+    chunks wait for a slow client it stops reading from the upstream. When the
+    client disconnects, further chunks are dropped instead, so the producer
+    still finishes the turn and persists the reply. A client that stays
+    connected but reads nothing for ``CHAT_STREAM_SEND_TIMEOUT_SECONDS`` is
+    treated as disconnected (its stream ends early), so it cannot pin an
+    upstream connection.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(
+            maxsize=max(1, settings.chat_stream_queue_max_events)
+        )
+        self._disconnected = False
+
+    async def _put(self, item: bytes | None) -> None:
+        if self._disconnected:
+            return
+        try:
+            await asyncio.wait_for(self._queue.put(item), settings.chat_stream_send_timeout_seconds)
+        except TimeoutError:
+            logger.info("chat.stream_stalled", queued=self._queue.qsize())
+            self._disconnect()
+            # End the stalled response in case the client resumes reading.
+            self._queue.put_nowait(None)
+
+    def _disconnect(self) -> None:
+        self._disconnected = True
+        # Unblock a producer waiting for room; later sends are dropped.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def send(self, chunk: bytes) -> None:
+        await self._put(chunk)
+
+    async def close(self) -> None:
+        """Mark the end of the stream; called by the producer when it is done."""
+        await self._put(None)
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        """Yield chunks until the producer closes the channel."""
+        try:
+            while (chunk := await self._queue.get()) is not None:
+                yield chunk
+        finally:
+            self._disconnect()
+
+
+_background_tasks: set[asyncio.Task] = set()
+# How long shutdown waits for running turns to finish and persist their reply.
+_SHUTDOWN_GRACE_SECONDS = 10.0
+
+
+def _start_background(coro: Coroutine[object, object, None]) -> None:
+    """Run a chat turn detached from the response, so client disconnects don't cancel it."""
+    task = asyncio.create_task(coro, context=contextvars.copy_context())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def stop_background_tasks(grace_seconds: float = _SHUTDOWN_GRACE_SECONDS) -> None:
+    """Let running turns finish for up to ``grace_seconds``, then cancel the rest.
+
+    Called from the API lifespan before the upstream clients are closed.
+    """
+    tasks = set(_background_tasks)
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=max(0.0, grace_seconds))
+    if pending:
+        logger.warning("chat.background_tasks_cancelled", count=len(pending))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _run_haystack(
+    channel: _EventChannel,
     agents_url: str,
     agent_payload: dict,
     conversation_id: str,
     request_id: str | None,
     ctx: ChatContext | None = None,
 ) -> None:
-    """Synchronous worker: stream from agents, enqueue events, persist.
+    """Background task: stream from agents, forward events, persist.
 
-    Runs in a thread via ``asyncio.to_thread`` so the event loop stays free
-    and client disconnects don't cancel the LLM call.
+    Runs as an ``asyncio.Task`` on the shared agents client, so client
+    disconnects don't cancel the LLM call; DB writes run in a worker thread.
     """
-    full_text = ""
+    text_parts: list[str] = []
     tool_calls: list[dict] | None = None
     tracker = FirstTokenTracker("haystack") if ctx else None
     status_updated_to_running = False
@@ -195,15 +275,14 @@ def _run_haystack_sync(
     try:
         with span_openrouter_request(ctx) if ctx else nullcontext():
             try:
-                with httpx.stream(
+                async with get_upstream_client("agents").stream(
                     "POST",
                     f"{agents_url}/chat/completions",
                     json=agent_payload,
                     headers=request_context_headers(),
-                    timeout=60.0,
                 ) as resp:
                     resp.raise_for_status()
-                    for line in resp.iter_lines():
+                    async for line in resp.aiter_lines():
                         if not line:
                             continue
                         try:
@@ -213,21 +292,24 @@ def _run_haystack_sync(
                                 if tracker:
                                     tracker.mark_first_token()
                                 if not status_updated_to_running and request_id:
-                                    _safe_update_request_status(request_id, "running")
+                                    await asyncio.to_thread(
+                                        _safe_update_request_status, request_id, "running"
+                                    )
                                     status_updated_to_running = True
-                                full_text += event.get("content", "")
+                                text_parts.append(event.get("content", ""))
                             elif etype == "tool_calls":
                                 tool_calls = event.get("toolCalls")
                             elif etype == "done":
-                                if not full_text and event.get("text"):
-                                    full_text = event["text"]
+                                if not text_parts and event.get("text"):
+                                    text_parts.append(event["text"])
                         except json.JSONDecodeError:
                             pass
-                        queue.put_nowait((line + "\n").encode())
+                        await channel.send((line + "\n").encode())
             except httpx.ConnectError as exc:
                 err = build_error_event("Agents service unreachable", ctx, exc)
-                queue.put_nowait(json.dumps(err).encode() + b"\n")
-                _safe_update_request_status(
+                await channel.send(json.dumps(err).encode() + b"\n")
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=str(exc)[:200],
@@ -236,8 +318,9 @@ def _run_haystack_sync(
                 return
             except httpx.TimeoutException as exc:
                 err = build_error_event("Agents service timeout", ctx, exc)
-                queue.put_nowait(json.dumps(err).encode() + b"\n")
-                _safe_update_request_status(
+                await channel.send(json.dumps(err).encode() + b"\n")
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=str(exc)[:200],
@@ -247,8 +330,9 @@ def _run_haystack_sync(
             except httpx.HTTPStatusError as exc:
                 detail = f"Agents service error: {exc.response.status_code}"
                 err = build_error_event(detail, ctx, exc)
-                queue.put_nowait(json.dumps(err).encode() + b"\n")
-                _safe_update_request_status(
+                await channel.send(json.dumps(err).encode() + b"\n")
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=detail,
@@ -259,7 +343,9 @@ def _run_haystack_sync(
         # Persist the assistant response after stream completes
         with span_persist_history(ctx) if ctx else nullcontext():
             try:
-                save_message(conversation_id, "assistant", full_text, tool_calls)
+                await asyncio.to_thread(
+                    save_message, conversation_id, "assistant", "".join(text_parts), tool_calls
+                )
                 if ctx:
                     record_persistence_outcome("history", True, ctx)
             except Exception as exc:
@@ -267,30 +353,20 @@ def _run_haystack_sync(
                 if ctx:
                     record_persistence_outcome("history", False, ctx, error=exc)
 
-        _safe_update_request_status(request_id, "completed")
+        await asyncio.to_thread(_safe_update_request_status, request_id, "completed")
     except Exception as exc:
         logger.exception("chat.haystack_background_failed")
-        _safe_update_request_status(
+        await asyncio.to_thread(
+            _safe_update_request_status,
             request_id,
             "failed",
             error_detail=str(exc)[:200],
             error_type="backend_error",
         )
         err = build_error_event("Stream failed", ctx, exc)
-        queue.put_nowait(json.dumps(err).encode() + b"\n")
+        await channel.send(json.dumps(err).encode() + b"\n")
     finally:
-        queue.put_nowait(None)  # sentinel
-
-
-async def _stream_from_queue(
-    queue: asyncio.Queue,
-) -> AsyncGenerator[bytes, None]:
-    """Read events from a background-task queue and yield as NDJSON bytes."""
-    while True:
-        item = await queue.get()
-        if item is None:
-            break
-        yield item
+        await channel.close()
 
 
 async def _accepted_then_stream(
@@ -414,7 +490,8 @@ async def _stream_openclaw_after_startup(
                     error_type="container_timeout",
                 )
             )
-            _safe_update_request_status(
+            await asyncio.to_thread(
+                _safe_update_request_status,
                 request_id,
                 "timed_out",
                 error_detail="Container startup timeout",
@@ -433,10 +510,9 @@ async def _stream_openclaw_after_startup(
                 "Bitte öffne die Einstellungen → Copilot-Einrichtung "
                 "und hinterlege einen API-Schlüssel."
             )
-            yield _encode_ndjson_event(
-                build_error_event(detail, ctx, error_type="client_error")
-            )
-            _safe_update_request_status(
+            yield _encode_ndjson_event(build_error_event(detail, ctx, error_type="client_error"))
+            await asyncio.to_thread(
+                _safe_update_request_status,
                 request_id,
                 "failed",
                 error_detail="Agent not configured",
@@ -469,7 +545,8 @@ async def _stream_openclaw_after_startup(
                 state_error=state_error,
             )
             yield _encode_ndjson_event(build_error_event(detail, ctx, exc, error_type=error_type))
-            _safe_update_request_status(
+            await asyncio.to_thread(
+                _safe_update_request_status,
                 request_id,
                 "failed",
                 error_detail=detail[:200],
@@ -485,11 +562,11 @@ async def _stream_openclaw_after_startup(
         }
     )
 
-    # Delegate to background task + queue for the actual LLM call
-    queue: asyncio.Queue = asyncio.Queue()
-    asyncio.create_task(
+    # Delegate to a background task + channel for the actual LLM call
+    channel = _EventChannel()
+    _start_background(
         _run_openclaw_background(
-            queue,
+            channel,
             container_url,
             container_token,
             messages,
@@ -498,15 +575,14 @@ async def _stream_openclaw_after_startup(
             org_id=org_id,
             request_id=request_id,
             ctx=ctx,
-        ),
-        context=contextvars.copy_context(),
+        )
     )
-    async for chunk in _stream_from_queue(queue):
+    async for chunk in channel.stream():
         yield chunk
 
 
 async def _run_openclaw_background(
-    queue: asyncio.Queue,
+    channel: _EventChannel,
     openclaw_url: str,
     openclaw_token: str,
     messages: list[dict],
@@ -516,10 +592,11 @@ async def _run_openclaw_background(
     request_id: str | None,
     ctx: ChatContext | None = None,
 ) -> None:
-    """Background task: stream SSE from OpenClaw, enqueue events, persist.
+    """Background task: stream SSE from OpenClaw, forward events, persist.
 
-    Runs as an ``asyncio.Task`` so client disconnects don't cancel
-    the LLM call or persistence.
+    Runs as an ``asyncio.Task`` on the shared OpenClaw client, so client
+    disconnects don't cancel the LLM call or persistence; DB and file writes
+    run in a worker thread.
     """
     try:
         # Write fresh delegated token for the skill to use.
@@ -530,20 +607,21 @@ async def _run_openclaw_background(
             scope="items:read items:write",
             ttl_seconds=300,
         )
-        write_token_file(user_id, delegated_token)
+        await asyncio.to_thread(write_token_file, user_id, delegated_token)
     except Exception as exc:
         logger.exception("chat.openclaw_init_failed", user_id=user_id)
         err = build_error_event(
             "OpenClaw session initialization failed. Please try again.", ctx, exc
         )
-        queue.put_nowait(_encode_ndjson_event(err))
-        _safe_update_request_status(
+        await channel.send(_encode_ndjson_event(err))
+        await asyncio.to_thread(
+            _safe_update_request_status,
             request_id,
             "failed",
             error_detail=str(exc)[:200],
             error_type="backend_error",
         )
-        queue.put_nowait(None)
+        await channel.close()
         return
 
     translator = SseToNdjsonTranslator()
@@ -564,31 +642,35 @@ async def _run_openclaw_background(
     try:
         async with span_openclaw_exec(ctx) if ctx else nullcontext():
             try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    async with client.stream(
-                        "POST",
-                        f"{openclaw_url}/v1/chat/completions",
-                        json=payload,
-                        headers=headers,
-                    ) as resp:
-                        resp.raise_for_status()
-                        async for line in resp.aiter_lines():
-                            if not line:
-                                continue
-                            ndjson_events = translator.feed(line)
-                            for event in ndjson_events:
-                                if event["type"] in ("text_delta", "done", "error"):
-                                    if event["type"] == "text_delta":
-                                        if tracker:
-                                            tracker.mark_first_token()
-                                        if not status_updated_to_running and request_id:
-                                            _safe_update_request_status(request_id, "running")
-                                            status_updated_to_running = True
-                                    queue.put_nowait((json.dumps(event) + "\n").encode())
+                async with get_upstream_client("openclaw").stream(
+                    "POST",
+                    f"{openclaw_url}/v1/chat/completions",
+                    json=payload,
+                    headers=headers,
+                ) as resp:
+                    if resp.is_error:
+                        await resp.aread()  # keep the body for the error detail below
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if not line:
+                            continue
+                        ndjson_events = translator.feed(line)
+                        for event in ndjson_events:
+                            if event["type"] in ("text_delta", "done", "error"):
+                                if event["type"] == "text_delta":
+                                    if tracker:
+                                        tracker.mark_first_token()
+                                    if not status_updated_to_running and request_id:
+                                        await asyncio.to_thread(
+                                            _safe_update_request_status, request_id, "running"
+                                        )
+                                        status_updated_to_running = True
+                                await channel.send((json.dumps(event) + "\n").encode())
             except httpx.ConnectError as exc:
                 err = build_error_event("OpenClaw service unreachable", ctx, exc)
-                queue.put_nowait(_encode_ndjson_event(err))
-                _safe_update_request_status(
+                await channel.send(_encode_ndjson_event(err))
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=str(exc)[:200],
@@ -597,8 +679,9 @@ async def _run_openclaw_background(
                 return
             except httpx.TimeoutException as exc:
                 err = build_error_event("OpenClaw service timeout", ctx, exc)
-                queue.put_nowait(_encode_ndjson_event(err))
-                _safe_update_request_status(
+                await channel.send(_encode_ndjson_event(err))
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=str(exc)[:200],
@@ -619,8 +702,9 @@ async def _run_openclaw_background(
                     pass
                 detail = body_detail or f"OpenClaw error: {exc.response.status_code}"
                 err = build_error_event(detail, ctx, exc)
-                queue.put_nowait(_encode_ndjson_event(err))
-                _safe_update_request_status(
+                await channel.send(_encode_ndjson_event(err))
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=detail[:200],
@@ -632,8 +716,9 @@ async def _run_openclaw_background(
                 err = build_error_event(
                     "OpenClaw response stream failed. Please try again.", ctx, exc
                 )
-                queue.put_nowait(_encode_ndjson_event(err))
-                _safe_update_request_status(
+                await channel.send(_encode_ndjson_event(err))
+                await asyncio.to_thread(
+                    _safe_update_request_status,
                     request_id,
                     "failed",
                     error_detail=str(exc)[:200],
@@ -654,8 +739,9 @@ async def _run_openclaw_background(
                 "Check your API key and credit balance in Settings → Agent Setup.",
                 ctx,
             )
-            queue.put_nowait(_encode_ndjson_event(err))
-            _safe_update_request_status(
+            await channel.send(_encode_ndjson_event(err))
+            await asyncio.to_thread(
+                _safe_update_request_status,
                 request_id,
                 "failed",
                 error_detail="empty response from OpenClaw",
@@ -666,7 +752,9 @@ async def _run_openclaw_background(
         # Persist assistant response (text only, no tool_calls)
         with span_persist_history(ctx) if ctx else nullcontext():
             try:
-                save_message(conversation_id, "assistant", translator.full_text)
+                await asyncio.to_thread(
+                    save_message, conversation_id, "assistant", translator.full_text
+                )
                 if ctx:
                     record_persistence_outcome("history", True, ctx)
             except Exception as exc:
@@ -680,8 +768,11 @@ async def _run_openclaw_background(
                     record_persistence_outcome("history", False, ctx, error=exc)
         with span_persist_openclaw_memory(ctx) if ctx else nullcontext():
             try:
-                sync_workspace_memory_to_db(
-                    user_id=user_id, org_id=org_id, source=SOURCE_RUNTIME_SYNC
+                await asyncio.to_thread(
+                    sync_workspace_memory_to_db,
+                    user_id=user_id,
+                    org_id=org_id,
+                    source=SOURCE_RUNTIME_SYNC,
                 )
                 if ctx:
                     record_persistence_outcome("openclaw_memory", True, ctx)
@@ -695,19 +786,20 @@ async def _run_openclaw_background(
                     record_persistence_outcome("openclaw_memory", False, ctx, error=exc)
 
         # Notify frontend that items may have changed
-        queue.put_nowait(_encode_ndjson_event({"type": "items_changed"}))
+        await channel.send(_encode_ndjson_event({"type": "items_changed"}))
 
-        _safe_update_request_status(request_id, "completed")
+        await asyncio.to_thread(_safe_update_request_status, request_id, "completed")
     except Exception as exc:
         logger.exception("chat.openclaw_background_failed")
-        _safe_update_request_status(
+        await asyncio.to_thread(
+            _safe_update_request_status,
             request_id,
             "failed",
             error_detail=str(exc)[:200],
             error_type="backend_error",
         )
     finally:
-        queue.put_nowait(None)  # sentinel
+        await channel.close()
 
 
 # ---------------------------------------------------------------------------
@@ -779,9 +871,7 @@ def _handle_chat_completions(
             error_type="backend_error",
             detail=detail,
         )
-        err = json.dumps(
-            build_error_event(detail, ctx, error_type="backend_error")
-        )
+        err = json.dumps(build_error_event(detail, ctx, error_type="backend_error"))
 
         async def _db_error_stream() -> AsyncGenerator[bytes, None]:
             yield (err + "\n").encode()
@@ -889,14 +979,13 @@ def _handle_chat_completions(
                 media_type="application/x-ndjson",
             )
 
-        # Direct OpenClaw path: background task + queue
-        queue: asyncio.Queue = asyncio.Queue()
-
+        # Direct OpenClaw path: background task + channel
         async def _openclaw_stream() -> AsyncGenerator[bytes, None]:
             yield _encode_ndjson_event({"type": "accepted", "requestId": ctx.request_id})
-            asyncio.create_task(
+            channel = _EventChannel()
+            _start_background(
                 _run_openclaw_background(
-                    queue,
+                    channel,
                     container_url,
                     container_token,
                     messages,
@@ -905,10 +994,9 @@ def _handle_chat_completions(
                     org_id=org_id,
                     request_id=ctx.request_id,
                     ctx=ctx,
-                ),
-                context=contextvars.copy_context(),
+                )
             )
-            async for chunk in _stream_from_queue(queue):
+            async for chunk in channel.stream():
                 yield chunk
 
         return StreamingResponse(
@@ -1031,27 +1119,21 @@ def _handle_chat_completions(
             "apiKey": llm_config.api_key,
         }
 
-    # Haystack path: background thread + queue
-    haystack_queue: asyncio.Queue = asyncio.Queue()
-
+    # Haystack path: background task + channel
     async def _haystack_stream() -> AsyncGenerator[bytes, None]:
         yield _encode_ndjson_event({"type": "accepted", "requestId": ctx.request_id})
-        agents_url = settings.agents_url or ""
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(
-            None,
-            wrap_with_context(
-                lambda: _run_haystack_sync(
-                    haystack_queue,
-                    agents_url,
-                    agent_payload,
-                    conversation_id,
-                    ctx.request_id,
-                    ctx,
-                )
-            ),
+        channel = _EventChannel()
+        _start_background(
+            _run_haystack(
+                channel,
+                settings.agents_url or "",
+                agent_payload,
+                conversation_id,
+                ctx.request_id,
+                ctx,
+            )
         )
-        async for chunk in _stream_from_queue(haystack_queue):
+        async for chunk in channel.stream():
             yield chunk
 
     return StreamingResponse(
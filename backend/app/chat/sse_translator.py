@@ -17,18 +17,23 @@ class _ToolCallAccumulator:
 
     id: str = ""
     name: str = ""
-    arguments: str = ""
+    argument_parts: list[str] = field(default_factory=list)
 
 
 @dataclass
 class SseToNdjsonTranslator:
     """Stateful translator: feed SSE lines, get NDJSON dicts back."""
 
-    full_text: str = ""
     tool_calls: list[dict] | None = None
     had_error: bool = False
+    _text_parts: list[str] = field(default_factory=list)
     _tool_accumulators: dict[int, _ToolCallAccumulator] = field(default_factory=dict)
 
+    @property
+    def full_text(self) -> str:
+        """Text of all ``text_delta`` events so far."""
+        return "".join(self._text_parts)
+
     def feed(self, line: str) -> list[dict]:
         """Process one SSE line, return zero or more NDJSON event dicts."""
         line = line.strip()
@@ -66,7 +71,7 @@ class SseToNdjsonTranslator:
         # Text content
         content = delta.get("content")
         if content:
-            self.full_text += content
+            self._text_parts.append(content)
             events.append({"type": "text_delta", "content": content})
 
         # Tool call fragments
@@ -84,7 +89,7 @@ class SseToNdjsonTranslator:
                 if "name" in func:
                     acc.name = func["name"]
                 if "arguments" in func:
-                    acc.arguments += func["arguments"]
+                    acc.argument_parts.append(func["arguments"])
 
         # Emit assembled tool_calls on finish
         if finish_reason in ("tool_calls", "stop") and self._tool_accumulators:
@@ -92,7 +97,7 @@ class SseToNdjsonTranslator:
             for _idx in sorted(self._tool_accumulators):
                 acc = self._tool_accumulators[_idx]
                 try:
-                    args = json.loads(acc.arguments)
+                    args = json.loads("".join(acc.argument_parts))
                 except json.JSONDecodeError:
                     args = {}
                 assembled.append({"name": acc.name, "arguments": args})
@@ -0,0 +1,60 @@
+"""Pooled HTTP clients for the chat upstreams.
+
+Chat turns stream from the agents service (Haystack) or a user's OpenClaw
+container through one keep-alive ``httpx.AsyncClient`` per upstream and
+event loop, instead of a client (and TCP/TLS handshake) per turn. Each pool
+holds up to ``CHAT_UPSTREAM_MAX_CONNECTIONS`` connections; turns beyond that
+wait for a free connection and fail with a timeout after the upstream's read
+timeout. OpenClaw containers are separate hosts, so they share one pool with
+per-host keep-alive connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Literal
+
+import httpx
+
+from ..config import settings
+
+Upstream = Literal["agents", "openclaw"]
+
+# Seconds without a streamed line before a turn is given up.
+_READ_TIMEOUTS: dict[Upstream, float] = {"agents": 60.0, "openclaw": 120.0}
+
+_clients: dict[Upstream, httpx.AsyncClient] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client(upstream: Upstream) -> httpx.AsyncClient:
+    """Return the pooled client for ``upstream`` bound to the running event loop."""
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        # Connections belong to the loop that opened them (new worker or test loop).
+        _clients.clear()
+        _clients_loop = loop
+    client = _clients.get(upstream)
+    if client is None:
+        connections = max(1, settings.chat_upstream_max_connections)
+        client = httpx.AsyncClient(
+            timeout=_READ_TIMEOUTS[upstream],
+            limits=httpx.Limits(
+                max_connections=connections,
+                max_keepalive_connections=connections,
+            ),
+        )
+        _clients[upstream] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close the pooled clients; called from the API lifespan."""
+    global _clients_loop
+    clients = list(_clients.values())
+    loop, _clients_loop = _clients_loop, None
+    _clients.clear()
+    if loop is asyncio.get_running_loop():
+        for client in clients:
+            await client.aclose()
@@ -68,6 +68,16 @@ def _get_samesite_env(name: str, default: CookieSameSite) -> CookieSameSite:
     return cast(CookieSameSite, value)
 
 
+ShaclEngine = Literal["compiled", "pyshacl"]
+
+
+def _get_shacl_engine_env(name: str, default: ShaclEngine) -> ShaclEngine:
+    value = (_get_env(name, default) or default).strip().lower()
+    if value not in {"compiled", "pyshacl"}:
+        return default
+    return cast(ShaclEngine, value)
+
+
 @dataclass(frozen=True)
 class Settings:
     database_url: str
@@ -86,6 +96,9 @@ class Settings:
     session_bind_user_agent: bool
     session_roll_ip_on_refresh: bool
     session_roll_user_agent_on_refresh: bool
+    auth_cache_ttl_seconds: float
+    auth_cache_max_entries: int
+    auth_last_seen_flush_seconds: float
     trust_proxy_headers: bool
     csrf_enabled: bool
     csrf_cookie_name: str
@@ -94,12 +107,29 @@ class Settings:
     csrf_cookie_samesite: CookieSameSite
     csrf_cookie_domain: str | None
     csrf_cookie_path: str
+    db_pool_enabled: bool
+    db_pool_min_size: int
+    db_pool_max_size: int
+    db_pool_timeout_seconds: float
+    db_pool_max_lifetime_seconds: float
+    db_pool_max_idle_seconds: float
+    db_pool_check_connections: bool
+    db_async_pool_min_size: int
+    db_async_pool_max_size: int
+    notification_hub_enabled: bool
+    notification_hub_queue_size: int
     meili_url: str | None
     meili_api_key: str | None
     meili_index_items: str
     meili_index_files: str
     meili_index_files_enabled: bool
     meili_timeout_seconds: float
+    meili_max_connections: int
+    meili_max_keepalive_connections: int
+    meili_keepalive_expiry_seconds: float
+    meili_http2: bool
+    meili_circuit_failure_threshold: int
+    meili_circuit_reset_seconds: float
     meili_batch_size: int
     meili_document_max_chars: int
     meili_file_text_max_bytes: int
@@ -107,13 +137,28 @@ class Settings:
     storage_backend: str
     file_storage_path: Path
     upload_chunk_size: int
+    pdf_render_workers: int
+    pdf_render_max_queue: int
+    pdf_render_max_tasks_per_worker: int
+    pdf_render_timeout_seconds: float
     import_job_queue_timeout_seconds: int
+    import_batch_size: int
+    items_batch_max_items: int
+    shacl_engine: ShaclEngine
+    validation_cache_max_entries: int
+    validation_cache_shared_max_rows: int
     outbox_worker_poll_seconds: float
     outbox_worker_listen_notify: bool
     outbox_worker_notify_fallback_seconds: float
     outbox_notify_channel: str
     outbox_max_attempts: int
+    outbox_worker_batched_projection: bool
+    outbox_worker_consumers: int
     push_worker_poll_seconds: float
+    push_worker_concurrency: int
+    push_worker_per_host_concurrency: int
+    push_worker_max_retries: int
+    push_worker_backoff_seconds: float
     worker_health_port: int
     push_worker_health_port: int
     worker_health_staleness_multiplier: float
@@ -130,6 +175,9 @@ class Settings:
     # Agents service (Copilot agent)
     agents_url: str | None
     agent_require_user_api_key: bool
+    chat_upstream_max_connections: int
+    chat_stream_queue_max_events: int
+    chat_stream_send_timeout_seconds: float
     # Agent backend default
     default_agent_backend: str
     # OpenClaw (alternative agent backend)
@@ -159,6 +207,8 @@ class Settings:
     openclaw_k8s_cpu_limit: str
     openclaw_k8s_memory_limit: str
     openclaw_k8s_max_concurrent_pods: int
+    openclaw_memory_snapshot_interval: int
+    openclaw_memory_retain_versions: int
     # Email integration (Gmail OAuth)
     encryption_key: str | None
     gmail_client_id: str
@@ -180,6 +230,19 @@ class Settings:
     gmail_watch_renew_buffer_hours: int
     gmail_watch_worker_poll_seconds: float
     gmail_watch_worker_health_port: int
+    # Gmail sync fetch pipeline
+    gmail_fetch_concurrency: int
+    gmail_sync_insert_batch_size: int
+    # Email sync executor (projection worker)
+    email_sync_concurrency: int
+    email_sync_lease_seconds: float
+    email_sync_poll_seconds: float
+    email_sync_retry_seconds: float
+    # Shared Google API client (Gmail, Calendar, OAuth)
+    google_api_timeout_seconds: float
+    google_api_max_connections: int
+    google_api_http2: bool
+    google_token_cache_margin_seconds: float
 
     @property
     def gmail_watch_configured(self) -> bool:
@@ -256,6 +319,9 @@ def load_settings() -> Settings:
             "SESSION_ROLL_UA_ON_REFRESH",
             True,
         ),
+        auth_cache_ttl_seconds=float(_get_env("AUTH_CACHE_TTL_SECONDS", "30") or "30"),
+        auth_cache_max_entries=int(_get_env("AUTH_CACHE_MAX_ENTRIES", "10000") or "10000"),
+        auth_last_seen_flush_seconds=float(_get_env("AUTH_LAST_SEEN_FLUSH_SECONDS", "30") or "30"),
         trust_proxy_headers=_get_bool_env("TRUST_PROXY_HEADERS", False),
         csrf_enabled=_get_bool_env("CSRF_ENABLED", False),
         csrf_cookie_name=_get_env("CSRF_COOKIE_NAME", "project_csrf") or "project_csrf",
@@ -264,12 +330,37 @@ def load_settings() -> Settings:
         csrf_cookie_samesite=_get_samesite_env("CSRF_COOKIE_SAMESITE", "lax"),
         csrf_cookie_domain=_get_env("CSRF_COOKIE_DOMAIN"),
         csrf_cookie_path=_get_env("CSRF_COOKIE_PATH", "/") or "/",
+        db_pool_enabled=_get_bool_env("DB_POOL_ENABLED", False),
+        db_pool_min_size=int(_get_env("DB_POOL_MIN_SIZE", "2") or "2"),
+        db_pool_max_size=int(_get_env("DB_POOL_MAX_SIZE", "10") or "10"),
+        db_pool_timeout_seconds=float(_get_env("DB_POOL_TIMEOUT_SECONDS", "10.0") or "10.0"),
+        db_pool_max_lifetime_seconds=float(
+            _get_env("DB_POOL_MAX_LIFETIME_SECONDS", "1800.0") or "1800.0"
+        ),
+        db_pool_max_idle_seconds=float(_get_env("DB_POOL_MAX_IDLE_SECONDS", "300.0") or "300.0"),
+        db_pool_check_connections=_get_bool_env("DB_POOL_CHECK_CONNECTIONS", True),
+        db_async_pool_min_size=int(_get_env("DB_ASYNC_POOL_MIN_SIZE", "1") or "1"),
+        db_async_pool_max_size=int(_get_env("DB_ASYNC_POOL_MAX_SIZE", "5") or "5"),
+        notification_hub_enabled=_get_bool_env("NOTIFICATION_HUB_ENABLED", True),
+        notification_hub_queue_size=int(_get_env("NOTIFICATION_HUB_QUEUE_SIZE", "256") or "256"),
         meili_url=_get_env("MEILI_URL"),
         meili_api_key=_get_secret("MEILI_API_KEY"),
         meili_index_items=_get_env("MEILI_INDEX_ITEMS", "items") or "items",
         meili_index_files=_get_env("MEILI_INDEX_FILES", "files") or "files",
         meili_index_files_enabled=_get_bool_env("MEILI_INDEX_FILES_ENABLED", False),
         meili_timeout_seconds=float(_get_env("MEILI_TIMEOUT_SECONDS", "5") or "5"),
+        meili_max_connections=int(_get_env("MEILI_MAX_CONNECTIONS", "20") or "20"),
+        meili_max_keepalive_connections=int(
+            _get_env("MEILI_MAX_KEEPALIVE_CONNECTIONS", "10") or "10"
+        ),
+        meili_keepalive_expiry_seconds=float(
+            _get_env("MEILI_KEEPALIVE_EXPIRY_SECONDS", "30") or "30"
+        ),
+        meili_http2=_get_bool_env("MEILI_HTTP2", True),
+        meili_circuit_failure_threshold=int(
+            _get_env("MEILI_CIRCUIT_FAILURE_THRESHOLD", "5") or "5"
+        ),
+        meili_circuit_reset_seconds=float(_get_env("MEILI_CIRCUIT_RESET_SECONDS", "30") or "30"),
         meili_batch_size=int(_get_env("MEILI_BATCH_SIZE", "500") or "500"),
         meili_document_max_chars=int(_get_env("MEILI_DOCUMENT_MAX_CHARS", "100000") or "100000"),
         meili_file_text_max_bytes=int(
@@ -281,9 +372,24 @@ def load_settings() -> Settings:
             _get_env("FILE_STORAGE_PATH", str(ROOT_DIR / "storage")) or str(ROOT_DIR / "storage")
         ),
         upload_chunk_size=int(_get_env("UPLOAD_CHUNK_SIZE", "5242880") or "5242880"),
+        pdf_render_workers=int(_get_env("PDF_RENDER_WORKERS", "2") or "2"),
+        pdf_render_max_queue=int(_get_env("PDF_RENDER_MAX_QUEUE", "32") or "32"),
+        pdf_render_max_tasks_per_worker=int(
+            _get_env("PDF_RENDER_MAX_TASKS_PER_WORKER", "200") or "200"
+        ),
+        pdf_render_timeout_seconds=float(_get_env("PDF_RENDER_TIMEOUT_SECONDS", "60") or "60"),
         import_job_queue_timeout_seconds=int(
             _get_env("IMPORT_JOB_QUEUE_TIMEOUT_SECONDS", "300") or "300"
         ),
+        import_batch_size=int(_get_env("IMPORT_BATCH_SIZE", "500") or "500"),
+        items_batch_max_items=int(_get_env("ITEMS_BATCH_MAX_ITEMS", "100") or "100"),
+        shacl_engine=_get_shacl_engine_env("SHACL_ENGINE", "compiled"),
+        validation_cache_max_entries=int(
+            _get_env("VALIDATION_CACHE_MAX_ENTRIES", "10000") or "10000"
+        ),
+        validation_cache_shared_max_rows=int(
+            _get_env("VALIDATION_CACHE_SHARED_MAX_ROWS", "500000") or "500000"
+        ),
         outbox_worker_poll_seconds=float(_get_env("OUTBOX_WORKER_POLL_SECONDS", "1.0") or "1.0"),
         outbox_worker_listen_notify=_get_bool_env("OUTBOX_WORKER_LISTEN_NOTIFY", True),
         outbox_worker_notify_fallback_seconds=float(
@@ -291,7 +397,15 @@ def load_settings() -> Settings:
         ),
         outbox_notify_channel=_get_env("OUTBOX_NOTIFY_CHANNEL", "outbox_events") or "outbox_events",
         outbox_max_attempts=int(_get_env("OUTBOX_MAX_ATTEMPTS", "5") or "5"),
+        outbox_worker_batched_projection=_get_bool_env("OUTBOX_WORKER_BATCHED_PROJECTION", True),
+        outbox_worker_consumers=int(_get_env("OUTBOX_WORKER_CONSUMERS", "1") or "1"),
         push_worker_poll_seconds=float(_get_env("PUSH_WORKER_POLL_SECONDS", "1.0") or "1.0"),
+        push_worker_concurrency=int(_get_env("PUSH_WORKER_CONCURRENCY", "16") or "16"),
+        push_worker_per_host_concurrency=int(
+            _get_env("PUSH_WORKER_PER_HOST_CONCURRENCY", "4") or "4"
+        ),
+        push_worker_max_retries=int(_get_env("PUSH_WORKER_MAX_RETRIES", "3") or "3"),
+        push_worker_backoff_seconds=float(_get_env("PUSH_WORKER_BACKOFF_SECONDS", "1.0") or "1.0"),
         worker_health_port=int(_get_env("WORKER_HEALTH_PORT", "9090") or "9090"),
         push_worker_health_port=int(_get_env("PUSH_WORKER_HEALTH_PORT", "9091") or "9091"),
         worker_health_staleness_multiplier=float(
@@ -333,6 +447,13 @@ def load_settings() -> Settings:
         ],
         agents_url=_get_env("AGENTS_URL"),
         agent_require_user_api_key=_get_bool_env("AGENT_REQUIRE_USER_API_KEY", False),
+        chat_upstream_max_connections=int(
+            _get_env("CHAT_UPSTREAM_MAX_CONNECTIONS", "256") or "256"
+        ),
+        chat_stream_queue_max_events=int(_get_env("CHAT_STREAM_QUEUE_MAX_EVENTS", "256") or "256"),
+        chat_stream_send_timeout_seconds=float(
+            _get_env("CHAT_STREAM_SEND_TIMEOUT_SECONDS", "30") or "30"
+        ),
         default_agent_backend=_get_env("DEFAULT_AGENT_BACKEND", "openclaw") or "openclaw",
         openclaw_url=_get_env("OPENCLAW_URL"),
         openclaw_token=_get_secret("OPENCLAW_GATEWAY_TOKEN"),
@@ -381,6 +502,12 @@ def load_settings() -> Settings:
         openclaw_k8s_max_concurrent_pods=int(
             _get_env("OPENCLAW_K8S_MAX_CONCURRENT_PODS", "8") or "8"
         ),
+        openclaw_memory_snapshot_interval=int(
+            _get_env("OPENCLAW_MEMORY_SNAPSHOT_INTERVAL", "20") or "20"
+        ),
+        openclaw_memory_retain_versions=int(
+            _get_env("OPENCLAW_MEMORY_RETAIN_VERSIONS", "0") or "0"
+        ),
         delegation_jwt_secret=(
             _get_secret("DELEGATION_JWT_SECRET") or _get_secret("JWT_SECRET") or ""
         ),
@@ -424,6 +551,18 @@ def load_settings() -> Settings:
         gmail_watch_worker_health_port=int(
             _get_env("GMAIL_WATCH_WORKER_HEALTH_PORT", "9092") or "9092"
         ),
+        gmail_fetch_concurrency=int(_get_env("GMAIL_FETCH_CONCURRENCY", "8") or "8"),
+        gmail_sync_insert_batch_size=int(_get_env("GMAIL_SYNC_INSERT_BATCH_SIZE", "100") or "100"),
+        email_sync_concurrency=int(_get_env("EMAIL_SYNC_CONCURRENCY", "4") or "4"),
+        email_sync_lease_seconds=float(_get_env("EMAIL_SYNC_LEASE_SECONDS", "600") or "600"),
+        email_sync_poll_seconds=float(_get_env("EMAIL_SYNC_POLL_SECONDS", "2.0") or "2.0"),
+        email_sync_retry_seconds=float(_get_env("EMAIL_SYNC_RETRY_SECONDS", "60") or "60"),
+        google_api_timeout_seconds=float(_get_env("GOOGLE_API_TIMEOUT_SECONDS", "30") or "30"),
+        google_api_max_connections=int(_get_env("GOOGLE_API_MAX_CONNECTIONS", "32") or "32"),
+        google_api_http2=_get_bool_env("GOOGLE_API_HTTP2", True),
+        google_token_cache_margin_seconds=float(
+            _get_env("GOOGLE_TOKEN_CACHE_MARGIN_SECONDS", "300") or "300"
+        ),
     )
 
 
@@ -2,12 +2,19 @@
 
 Keeps durable versions of key workspace markdown files in Postgres and
 restores missing files when a workspace is re-created.
+
+The head version of each file is stored in full. Older versions are
+rewritten as compressed line deltas against the next newer version, except
+every ``OPENCLAW_MEMORY_SNAPSHOT_INTERVAL``-th version, which stays full so
+rebuilding any version walks a bounded chain.
 """
 
 from __future__ import annotations
 
+import difflib
 import hashlib
 import json
+import zlib
 from pathlib import Path
 from typing import NamedTuple
 
@@ -115,6 +122,76 @@ def _current_head(cur, user_id: str, filename: str):  # noqa: ANN001
     return cur.fetchone()
 
 
+def _encode_delta(base: str, target: str) -> bytes:
+    """Encode ``target`` as line ops against ``base`` (zlib-compressed JSON).
+
+    Ops are either ``[start, end]`` (copy ``base`` lines) or a string literal.
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    ops: list[list[int] | str] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(target_lines[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode("utf-8"))
+
+
+def _apply_delta(base: str, delta: bytes) -> str:
+    base_lines = base.splitlines(keepends=True)
+    parts: list[str] = []
+    for op in json.loads(zlib.decompress(delta)):
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.append("".join(base_lines[op[0] : op[1]]))
+    return "".join(parts)
+
+
+def _is_snapshot_version(version: int) -> bool:
+    interval = settings.openclaw_memory_snapshot_interval
+    return interval > 0 and version % interval == 0
+
+
+def _store_as_delta(  # noqa: PLR0913
+    cur,  # noqa: ANN001
+    *,
+    user_id: str,
+    filename: str,
+    version: int,
+    content: str,
+    base_version: int,
+    base_content: str,
+) -> bool:
+    """Replace a full version row by a delta against a newer version.
+
+    Deltas point at newer versions, so the head stays a plain full row and
+    pruning old versions never breaks a chain. Snapshot versions, and rows
+    whose delta would not be smaller, stay full.
+    """
+    if _is_snapshot_version(version):
+        return False
+    delta = _encode_delta(base_content, content)
+    if len(delta) >= len(content.encode("utf-8")):
+        return False
+    cur.execute(
+        """
+        UPDATE openclaw_memory_versions
+        SET storage_kind = 'delta',
+            base_version = %s,
+            delta = %s,
+            content = NULL
+        WHERE user_id = %s
+          AND filename = %s
+          AND version = %s
+        """,
+        (base_version, delta, user_id, filename, version),
+    )
+    return True
+
+
 def _append_version(  # noqa: PLR0913
     cur,  # noqa: ANN001
     *,
@@ -128,10 +205,15 @@ def _append_version(  # noqa: PLR0913
 
     cur.execute(
         """
-        SELECT current_sha256
-        FROM openclaw_memory_heads
-        WHERE user_id = %s
-          AND filename = %s
+        SELECT h.current_version, h.current_sha256, h.next_version, v.content
+        FROM openclaw_memory_heads h
+        LEFT JOIN openclaw_memory_versions v
+          ON v.user_id = h.user_id
+         AND v.filename = h.filename
+         AND v.version = h.current_version
+        WHERE h.user_id = %s
+          AND h.filename = %s
+        FOR UPDATE OF h
         """,
         (user_id, filename),
     )
@@ -139,17 +221,21 @@ def _append_version(  # noqa: PLR0913
     if head and head.get("current_sha256") == content_sha:
         return False
 
-    cur.execute(
-        """
-        SELECT COALESCE(MAX(version), 0) AS max_version
-        FROM openclaw_memory_versions
-        WHERE user_id = %s
-          AND filename = %s
-        """,
-        (user_id, filename),
-    )
-    row = cur.fetchone()
-    next_version = int(row["max_version"]) + 1
+    if head and head.get("next_version"):
+        next_version = int(head["next_version"])
+    else:
+        # Heads written before next_version existed (or no head yet).
+        cur.execute(
+            """
+            SELECT COALESCE(MAX(version), 0) AS max_version
+            FROM openclaw_memory_versions
+            WHERE user_id = %s
+              AND filename = %s
+            """,
+            (user_id, filename),
+        )
+        row = cur.fetchone()
+        next_version = int(row["max_version"]) + 1
 
     cur.execute(
         """
@@ -163,20 +249,204 @@ def _append_version(  # noqa: PLR0913
     cur.execute(
         """
         INSERT INTO openclaw_memory_heads (
-          user_id, filename, current_version, current_sha256
+          user_id, filename, current_version, current_sha256, next_version
         )
-        VALUES (%s, %s, %s, %s)
+        VALUES (%s, %s, %s, %s, %s)
         ON CONFLICT (user_id, filename)
         DO UPDATE SET
           current_version = EXCLUDED.current_version,
           current_sha256 = EXCLUDED.current_sha256,
+          next_version = EXCLUDED.next_version,
           updated_at = now()
         """,
-        (user_id, filename, next_version, content_sha),
+        (user_id, filename, next_version, content_sha, next_version + 1),
     )
+
+    if head and head.get("content") is not None:
+        _store_as_delta(
+            cur,
+            user_id=user_id,
+            filename=filename,
+            version=int(head["current_version"]),
+            content=str(head["content"]),
+            base_version=next_version,
+            base_content=content,
+        )
     return True
 
 
+def _rebuild_version(cur, user_id: str, filename: str, version: int) -> str | None:  # noqa: ANN001
+    cur.execute(
+        """
+        SELECT version, storage_kind, content, base_version, delta
+        FROM openclaw_memory_versions
+        WHERE user_id = %s
+          AND filename = %s
+          AND version >= %s
+          AND version <= (
+            SELECT MIN(version)
+            FROM openclaw_memory_versions
+            WHERE user_id = %s
+              AND filename = %s
+              AND version >= %s
+              AND storage_kind = 'full'
+          )
+        ORDER BY version DESC
+        """,
+        (user_id, filename, version, user_id, filename, version),
+    )
+    rows = {int(row["version"]): row for row in cur.fetchall()}
+    row = rows.get(version)
+    if row is None:
+        return None
+
+    # Walk the base_version chain up to the nearest full row, then apply back down.
+    chain = [row]
+    while chain[-1]["storage_kind"] != "full":
+        base = rows.get(int(chain[-1]["base_version"]))
+        if base is None:
+            logger.warning(
+                "memory.rebuild.broken_chain",
+                user_id=user_id,
+                db_filename=filename,
+                version=version,
+            )
+            return None
+        chain.append(base)
+
+    content = str(chain.pop()["content"])
+    while chain:
+        content = _apply_delta(content, bytes(chain.pop()["delta"]))
+    return content
+
+
+def load_memory_version(user_id: str, filename: str, version: int) -> str | None:
+    """Return the content of any stored version, rebuilding it from deltas."""
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            return _rebuild_version(cur, user_id, filename, version)
+
+
+def _compact_file(cur, user_id: str, filename: str) -> int:  # noqa: ANN001
+    cur.execute(
+        """
+        SELECT v.version, v.storage_kind, v.content, v.base_version, v.delta
+        FROM openclaw_memory_versions v
+        JOIN openclaw_memory_heads h
+          ON h.user_id = v.user_id
+         AND h.filename = v.filename
+        WHERE v.user_id = %s
+          AND v.filename = %s
+          AND v.version <= h.current_version
+        ORDER BY v.version DESC
+        FOR UPDATE OF v
+        """,
+        (user_id, filename),
+    )
+    rows = cur.fetchall()
+    contents: dict[int, str] = {}
+    compacted = 0
+    newer_version: int | None = None
+    for row in rows:
+        version = int(row["version"])
+        if row["storage_kind"] == "full":
+            content = str(row["content"])
+            if newer_version is not None and _store_as_delta(
+                cur,
+                user_id=user_id,
+                filename=filename,
+                version=version,
+                content=content,
+                base_version=newer_version,
+                base_content=contents[newer_version],
+            ):
+                compacted += 1
+        else:
+            base = contents.get(int(row["base_version"]))
+            if base is None:
+                break
+            content = _apply_delta(base, bytes(row["delta"]))
+        contents[version] = content
+        newer_version = version
+    return compacted
+
+
+# Last (user_id, filename) checked by compact_memory_versions. Files whose full
+# rows don't shrink as deltas stay candidates, so each run resumes after the
+# previous page instead of re-checking the same files and starving the rest.
+_compact_cursor: tuple[str, str] | None = None
+
+
+def compact_memory_versions(
+    *,
+    retain_versions: int | None = None,
+    max_files: int = 100,
+) -> dict[str, int]:
+    """Delta-encode leftover full versions and prune versions past retention.
+
+    Full rows predate delta storage or were written by a crashed append;
+    ``retain_versions`` (default ``OPENCLAW_MEMORY_RETAIN_VERSIONS``, 0 keeps
+    everything) counts back from each head. Candidate files are paged in
+    (user_id, filename) order across runs, wrapping around after the last one.
+    """
+    global _compact_cursor
+    retain = (
+        settings.openclaw_memory_retain_versions if retain_versions is None else retain_versions
+    )
+    interval = settings.openclaw_memory_snapshot_interval
+    after_user, after_file = _compact_cursor or (None, None)
+    compacted = 0
+    pruned = 0
+
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT DISTINCT v.user_id, v.filename
+                FROM openclaw_memory_versions v
+                JOIN openclaw_memory_heads h
+                  ON h.user_id = v.user_id
+                 AND h.filename = v.filename
+                WHERE v.storage_kind = 'full'
+                  AND v.version < h.current_version
+                  AND (%s <= 0 OR v.version %% %s <> 0)
+                  AND (%s::uuid IS NULL OR (v.user_id, v.filename) > (%s::uuid, %s))
+                ORDER BY v.user_id, v.filename
+                LIMIT %s
+                """,
+                (interval, max(interval, 1), after_user, after_user, after_file, max_files),
+            )
+            candidates = cur.fetchall()
+            for candidate in candidates:
+                compacted += _compact_file(
+                    cur, str(candidate["user_id"]), str(candidate["filename"])
+                )
+
+            if retain > 0:
+                cur.execute(
+                    """
+                    DELETE FROM openclaw_memory_versions v
+                    USING openclaw_memory_heads h
+                    WHERE h.user_id = v.user_id
+                      AND h.filename = v.filename
+                      AND v.version <= h.current_version - %s
+                    """,
+                    (retain,),
+                )
+                pruned = cur.rowcount
+        conn.commit()
+
+    if len(candidates) < max_files:
+        _compact_cursor = None
+    else:
+        last = candidates[-1]
+        _compact_cursor = (str(last["user_id"]), str(last["filename"]))
+
+    if compacted or pruned:
+        logger.info("memory.compact.done", compacted=compacted, pruned=pruned)
+    return {"compacted": compacted, "pruned": pruned}
+
+
 def _resolve_disk_path(user_id: str, state_file: ManagedStateFile) -> Path:
     if state_file.scope == SCOPE_WORKSPACE:
         return _workspace_dir(user_id) / state_file.disk_relative_path
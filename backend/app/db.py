@@ -1,12 +1,16 @@
+import atexit
 import os
+import threading
 import time
 import uuid
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
 import psycopg
+from prometheus_client import Counter, Gauge, Histogram
 from psycopg.rows import dict_row
 from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
 
 from .config import settings
 from .observability import get_logger, get_request_context
@@ -20,6 +24,46 @@ _LOG_DB_QUERIES = os.environ.get("LOG_DB_QUERIES", "1").lower() not in {
     "no",
 }
 
+SYNC_POOL_NAME = "sync"
+ASYNC_POOL_NAME = "async"
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting to acquire a pooled database connection.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+DB_POOL_TIMEOUTS_TOTAL = Counter(
+    "db_pool_timeouts_total",
+    "Total pooled connection requests that timed out waiting for a connection.",
+    ["pool"],
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Current number of connections managed by the pool (in use + idle).",
+    ["pool"],
+)
+
+DB_POOL_AVAILABLE = Gauge(
+    "db_pool_available",
+    "Current number of idle connections ready in the pool.",
+    ["pool"],
+)
+
+DB_POOL_REQUESTS_WAITING = Gauge(
+    "db_pool_requests_waiting",
+    "Current number of callers queued waiting for a pooled connection.",
+    ["pool"],
+)
+
+DB_POOL_SATURATION_RATIO = Gauge(
+    "db_pool_saturation_ratio",
+    "Connections in use divided by the configured pool max size.",
+    ["pool"],
+)
+
 
 def _sql_preview(query: object) -> str:
     statement = " ".join(str(query).split())
@@ -28,9 +72,48 @@ def _sql_preview(query: object) -> str:
     return f"{statement[:_SQL_PREVIEW_CHARS]}..."
 
 
+def _log_query_failed(
+    event: str,
+    *,
+    db_call_id: str,
+    statement: str,
+    started: float,
+    exc: Exception,
+) -> None:
+    context = get_request_context()
+    logger.exception(
+        event,
+        trail_id=context.get("trail_id"),
+        db_call_id=db_call_id,
+        statement=statement,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        error=str(exc),
+    )
+
+
+def _log_query_done(
+    event: str,
+    *,
+    db_call_id: str,
+    statement: str,
+    started: float,
+    rowcount: int,
+) -> None:
+    if not _LOG_DB_QUERIES:
+        return
+    context = get_request_context()
+    logger.info(
+        event,
+        trail_id=context.get("trail_id"),
+        db_call_id=db_call_id,
+        statement=statement,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        rowcount=rowcount,
+    )
+
+
 class InstrumentedCursor(psycopg.Cursor):
     def execute(self, query, params=None, *, prepare=None, binary=None):
-        context = get_request_context()
         db_call_id = str(uuid.uuid4())
         statement = _sql_preview(query)
         started = time.monotonic()
@@ -42,63 +125,279 @@ class InstrumentedCursor(psycopg.Cursor):
                 binary=binary,
             )
         except Exception as exc:  # noqa: BLE001
-            logger.exception(
+            _log_query_failed(
                 "db.query.failed",
-                trail_id=context.get("trail_id"),
                 db_call_id=db_call_id,
                 statement=statement,
-                duration_ms=int((time.monotonic() - started) * 1000),
-                error=str(exc),
+                started=started,
+                exc=exc,
             )
             raise
-        if _LOG_DB_QUERIES:
-            logger.info(
-                "db.query",
-                trail_id=context.get("trail_id"),
-                db_call_id=db_call_id,
-                statement=statement,
-                duration_ms=int((time.monotonic() - started) * 1000),
-                rowcount=self.rowcount,
-            )
+        _log_query_done(
+            "db.query",
+            db_call_id=db_call_id,
+            statement=statement,
+            started=started,
+            rowcount=self.rowcount,
+        )
         return result
 
     def executemany(self, query, params_seq, *, returning=False):
-        context = get_request_context()
         db_call_id = str(uuid.uuid4())
         statement = _sql_preview(query)
         started = time.monotonic()
         try:
             result = super().executemany(query, params_seq, returning=returning)
         except Exception as exc:  # noqa: BLE001
-            logger.exception(
+            _log_query_failed(
                 "db.executemany.failed",
-                trail_id=context.get("trail_id"),
                 db_call_id=db_call_id,
                 statement=statement,
-                duration_ms=int((time.monotonic() - started) * 1000),
-                error=str(exc),
+                started=started,
+                exc=exc,
             )
             raise
-        if _LOG_DB_QUERIES:
-            logger.info(
-                "db.executemany",
-                trail_id=context.get("trail_id"),
+        _log_query_done(
+            "db.executemany",
+            db_call_id=db_call_id,
+            statement=statement,
+            started=started,
+            rowcount=self.rowcount,
+        )
+        return result
+
+
+class AsyncInstrumentedCursor(psycopg.AsyncCursor):
+    async def execute(self, query, params=None, *, prepare=None, binary=None):
+        db_call_id = str(uuid.uuid4())
+        statement = _sql_preview(query)
+        started = time.monotonic()
+        try:
+            result = await super().execute(
+                query,
+                params=params,
+                prepare=prepare,
+                binary=binary,
+            )
+        except Exception as exc:  # noqa: BLE001
+            _log_query_failed(
+                "db.query.failed",
                 db_call_id=db_call_id,
                 statement=statement,
-                duration_ms=int((time.monotonic() - started) * 1000),
-                rowcount=self.rowcount,
+                started=started,
+                exc=exc,
             )
+            raise
+        _log_query_done(
+            "db.query",
+            db_call_id=db_call_id,
+            statement=statement,
+            started=started,
+            rowcount=self.rowcount,
+        )
         return result
 
 
+# ---------------------------------------------------------------------------
+# Connection pools
+# ---------------------------------------------------------------------------
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+_async_pool: AsyncConnectionPool | None = None
+
+
+def _reset_pooled_connection(conn: psycopg.Connection) -> None:
+    # Callers may flip autocommit (e.g. imports); never hand that to the next user.
+    if conn.autocommit:
+        conn.autocommit = False
+    conn.row_factory = dict_row
+
+
+async def _reset_pooled_async_connection(conn: psycopg.AsyncConnection) -> None:
+    if conn.autocommit:
+        await conn.set_autocommit(False)
+    conn.row_factory = dict_row
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide sync pool, opening it on first use."""
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                settings.database_url,
+                kwargs={"row_factory": dict_row, "cursor_factory": InstrumentedCursor},
+                min_size=settings.db_pool_min_size,
+                max_size=max(settings.db_pool_min_size, settings.db_pool_max_size),
+                timeout=settings.db_pool_timeout_seconds,
+                max_lifetime=settings.db_pool_max_lifetime_seconds,
+                max_idle=settings.db_pool_max_idle_seconds,
+                check=(
+                    ConnectionPool.check_connection if settings.db_pool_check_connections else None
+                ),
+                reset=_reset_pooled_connection,
+                name=SYNC_POOL_NAME,
+                open=True,
+            )
+            logger.info(
+                "db.pool.opened",
+                pool=SYNC_POOL_NAME,
+                min_size=_pool.min_size,
+                max_size=_pool.max_size,
+            )
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+        logger.info("db.pool.closed", pool=SYNC_POOL_NAME)
+
+
+async def open_async_pool() -> AsyncConnectionPool | None:
+    """Open the async pool on the running event loop (call from app lifespan)."""
+    global _async_pool
+    if not settings.db_pool_enabled:
+        return None
+    if _async_pool is None:
+        pool = AsyncConnectionPool(
+            settings.database_url,
+            kwargs={"row_factory": dict_row, "cursor_factory": AsyncInstrumentedCursor},
+            min_size=settings.db_async_pool_min_size,
+            max_size=max(settings.db_async_pool_min_size, settings.db_async_pool_max_size),
+            timeout=settings.db_pool_timeout_seconds,
+            max_lifetime=settings.db_pool_max_lifetime_seconds,
+            max_idle=settings.db_pool_max_idle_seconds,
+            check=(
+                AsyncConnectionPool.check_connection if settings.db_pool_check_connections else None
+            ),
+            reset=_reset_pooled_async_connection,
+            name=ASYNC_POOL_NAME,
+            open=False,
+        )
+        await pool.open()
+        _async_pool = pool
+        logger.info(
+            "db.pool.opened",
+            pool=ASYNC_POOL_NAME,
+            min_size=pool.min_size,
+            max_size=pool.max_size,
+        )
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    global _async_pool
+    pool, _async_pool = _async_pool, None
+    if pool is not None:
+        await pool.close()
+        logger.info("db.pool.closed", pool=ASYNC_POOL_NAME)
+
+
+def _observe_pool_wait(pool_name: str, started: float) -> None:
+    DB_POOL_WAIT_SECONDS.labels(pool=pool_name).observe(max(0.0, time.monotonic() - started))
+
+
+def _record_pool_stats(pool_name: str, pool: ConnectionPool | AsyncConnectionPool) -> None:
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    DB_POOL_SIZE.labels(pool=pool_name).set(float(size))
+    DB_POOL_AVAILABLE.labels(pool=pool_name).set(float(available))
+    DB_POOL_REQUESTS_WAITING.labels(pool=pool_name).set(float(stats.get("requests_waiting", 0)))
+    in_use = max(0, size - available)
+    DB_POOL_SATURATION_RATIO.labels(pool=pool_name).set(in_use / max(1, pool.max_size))
+
+
+def refresh_pool_metrics() -> None:
+    """Publish saturation gauges for the pools opened in this process."""
+    if _pool is not None:
+        _record_pool_stats(SYNC_POOL_NAME, _pool)
+    if _async_pool is not None:
+        _record_pool_stats(ASYNC_POOL_NAME, _async_pool)
+
+
 @contextmanager
 def db_conn():
-    with psycopg.connect(
-        settings.database_url,
-        row_factory=dict_row,
-        cursor_factory=InstrumentedCursor,
-    ) as conn:
-        yield conn
+    if not settings.db_pool_enabled:
+        with psycopg.connect(
+            settings.database_url,
+            row_factory=dict_row,
+            cursor_factory=InstrumentedCursor,
+        ) as conn:
+            yield conn
+        return
+
+    pool = get_pool()
+    started = time.monotonic()
+    try:
+        conn = pool.getconn()
+    except PoolTimeout:
+        DB_POOL_TIMEOUTS_TOTAL.labels(pool=SYNC_POOL_NAME).inc()
+        logger.warning("db.pool.timeout", pool=SYNC_POOL_NAME, timeout=pool.timeout)
+        raise
+    _observe_pool_wait(SYNC_POOL_NAME, started)
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.putconn(conn)
+
+
+@contextmanager
+def unit_of_work():
+    """Yield one cursor whose writes commit together when the block exits.
+
+    Request handlers pass this cursor (``cur=``) to the outbox, search-job and
+    idempotency helpers so a write and its side records commit or roll back
+    as one transaction on one connection. Any exception, including
+    ``HTTPException``, rolls the whole unit back.
+    """
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            yield cur
+        conn.commit()
+
+
+@asynccontextmanager
+async def async_db_conn():
+    """Async twin of :func:`db_conn` for SSE and other event-loop code paths.
+
+    Uses the async pool once :func:`open_async_pool` ran on the current loop,
+    otherwise opens a dedicated ``psycopg.AsyncConnection``.
+    """
+    pool = _async_pool
+    if pool is None:
+        async with await psycopg.AsyncConnection.connect(
+            settings.database_url,
+            row_factory=dict_row,
+            cursor_factory=AsyncInstrumentedCursor,
+        ) as conn:
+            yield conn
+        return
+
+    started = time.monotonic()
+    try:
+        conn = await pool.getconn()
+    except PoolTimeout:
+        DB_POOL_TIMEOUTS_TOTAL.labels(pool=ASYNC_POOL_NAME).inc()
+        logger.warning("db.pool.timeout", pool=ASYNC_POOL_NAME, timeout=pool.timeout)
+        raise
+    _observe_pool_wait(ASYNC_POOL_NAME, started)
+    try:
+        async with conn:
+            yield conn
+    finally:
+        await pool.putconn(conn)
+
+
+atexit.register(close_pool)
 
 
 def run_sql_file(path: Path) -> None:
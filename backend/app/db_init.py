@@ -20,10 +20,19 @@ def _run_migrations() -> None:
     upgrade(config, "head")
 
 
+def _backfill_projections() -> None:
+    # Items written before item_projection existed (or while it was being
+    # rebuilt) get their rows here; a no-op once every item is projected.
+    from .projection.rebuild import rebuild_item_projection
+
+    rebuild_item_projection(missing_only=True)
+
+
 def main() -> None:
     for attempt in range(MAX_RETRIES):
         try:
             _run_migrations()
+            _backfill_projections()
             return
         except (psycopg.OperationalError, SAOperationalError):
             if attempt == MAX_RETRIES - 1:
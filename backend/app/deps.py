@@ -3,6 +3,7 @@ from datetime import UTC, datetime
 import jwt
 from fastapi import Cookie, Depends, Header, HTTPException, Request, status
 
+from . import auth_cache
 from .config import settings
 from .db import db_conn
 from .delegation import verify_delegated_token
@@ -81,23 +82,7 @@ def _authenticate_via_delegated_jwt(token: str, request: Request) -> dict:
     }
 
 
-def get_current_user(
-    request: Request,
-    authorization: str | None = Header(default=None),
-    session_token: str | None = Cookie(
-        default=None,
-        alias=settings.session_cookie_name,
-    ),
-):
-    # Path 1: Delegated JWT (agent-to-backend calls)
-    bearer_token = _extract_bearer_token(authorization)
-    if bearer_token:
-        return _authenticate_via_delegated_jwt(bearer_token, request)
-
-    # Path 2: Session cookie (browser requests)
-    if session_token is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
-
+def _load_session(session_token: str) -> dict | None:
     with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
@@ -119,7 +104,75 @@ def get_current_user(
                 """,
                 (session_token,),
             )
-            row = cur.fetchone()
+            return cur.fetchone()
+
+
+def _load_default_orgs(user_id: str) -> list[str]:
+    org_ids = auth_cache.get_default_orgs(user_id)
+    if org_ids is not None:
+        return org_ids
+    loaded_at = auth_cache.generation()
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT org_id
+                FROM org_memberships
+                WHERE user_id = %s AND status = 'active'
+                ORDER BY created_at ASC
+                LIMIT 2
+                """,
+                (user_id,),
+            )
+            org_ids = [str(row["org_id"]) for row in cur.fetchall()]
+    auth_cache.put_default_orgs(user_id, org_ids, loaded_at=loaded_at)
+    return org_ids
+
+
+def _load_membership(user_id: str, org_id: str) -> dict | None:
+    membership = auth_cache.get_membership(user_id, org_id)
+    if membership is not None:
+        return membership
+    loaded_at = auth_cache.generation()
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT org_id, role, status
+                FROM org_memberships
+                WHERE org_id = %s AND user_id = %s
+                """,
+                (org_id, user_id),
+            )
+            membership = cur.fetchone()
+    if membership is not None:
+        auth_cache.put_membership(user_id, org_id, membership, loaded_at=loaded_at)
+    return membership
+
+
+def get_current_user(
+    request: Request,
+    authorization: str | None = Header(default=None),
+    session_token: str | None = Cookie(
+        default=None,
+        alias=settings.session_cookie_name,
+    ),
+):
+    # Path 1: Delegated JWT (agent-to-backend calls)
+    bearer_token = _extract_bearer_token(authorization)
+    if bearer_token:
+        return _authenticate_via_delegated_jwt(bearer_token, request)
+
+    # Path 2: Session cookie (browser requests)
+    if session_token is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+
+    row = auth_cache.get_session(session_token)
+    if row is None:
+        loaded_at = auth_cache.generation()
+        row = _load_session(session_token)
+        if row is not None:
+            auth_cache.put_session(session_token, row, loaded_at=loaded_at)
 
     if row is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid session")
@@ -155,31 +208,19 @@ def get_current_user(
         session_id=session_id,
     )
 
-    updates: dict[str, object] = {"last_seen_at": datetime.now(UTC)}
+    context: dict[str, str] = {}
     if not row.get("ip_address") and client_ip:
-        updates["ip_address"] = client_ip
+        context["ip_address"] = client_ip
     if not row.get("user_agent") and user_agent:
-        updates["user_agent"] = user_agent
-
-    if updates:
-        with db_conn() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    UPDATE sessions
-                    SET last_seen_at = %s,
-                        ip_address = COALESCE(%s, ip_address),
-                        user_agent = COALESCE(%s, user_agent)
-                    WHERE id = %s
-                    """,
-                    (
-                        updates["last_seen_at"],
-                        updates.get("ip_address"),
-                        updates.get("user_agent"),
-                        row["session_id"],
-                    ),
-                )
-            conn.commit()
+        context["user_agent"] = user_agent
+    if context:
+        # Bind the cached row right away; the database catches up on flush.
+        auth_cache.update_session_context(session_token, context)
+    auth_cache.touch_session(
+        session_id,
+        ip_address=context.get("ip_address"),
+        user_agent=context.get("user_agent"),
+    )
 
     return row
 
@@ -195,39 +236,17 @@ def get_current_org(
         resolved_org_id = org_header or current_user.get("default_org_id")
 
     if not resolved_org_id:
-        with db_conn() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT org_id
-                    FROM org_memberships
-                    WHERE user_id = %s AND status = 'active'
-                    ORDER BY created_at ASC
-                    LIMIT 2
-                    """,
-                    (current_user["id"],),
-                )
-                rows = cur.fetchall()
-        if not rows:
+        org_ids = _load_default_orgs(str(current_user["id"]))
+        if not org_ids:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No org membership")
-        if len(rows) > 1:
+        if len(org_ids) > 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="X-Org-Id required for users with multiple orgs",
             )
-        resolved_org_id = rows[0]["org_id"]
+        resolved_org_id = org_ids[0]
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT org_id, role, status
-                FROM org_memberships
-                WHERE org_id = %s AND user_id = %s
-                """,
-                (resolved_org_id, current_user["id"]),
-            )
-            membership = cur.fetchone()
+    membership = _load_membership(str(current_user["id"]), str(resolved_org_id))
 
     if membership is None or membership.get("status") != "active":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Org access denied")
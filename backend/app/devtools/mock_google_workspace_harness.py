@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import base64
 import copy
 import socket
@@ -61,6 +62,9 @@ class _MockWorkspaceState:
     calendar_created_events: list[dict[str, Any]] = field(default_factory=list)
     calendar_updated_events: list[dict[str, Any]] = field(default_factory=list)
     calendar_deleted_events: list[dict[str, Any]] = field(default_factory=list)
+    # Added to every Google API response (not the /__ control routes) to
+    # approximate real round-trip times in benchmarks.
+    latency_seconds: float = 0.0
 
 
 class SeedGmailMessageRequest(BaseModel):
@@ -88,6 +92,12 @@ class SeedCalendarEventsRequest(BaseModel):
 def _build_app(state: _MockWorkspaceState, lock: threading.Lock) -> FastAPI:
     app = FastAPI(title="Mock Google Workspace Harness")
 
+    @app.middleware("http")
+    async def simulate_latency(request: Request, call_next):
+        if state.latency_seconds > 0 and not request.url.path.startswith("/__"):
+            await asyncio.sleep(state.latency_seconds)
+        return await call_next(request)
+
     @app.get("/__health")
     async def health() -> dict[str, str]:
         return {"status": "ok"}
@@ -229,30 +239,52 @@ def _build_app(state: _MockWorkspaceState, lock: threading.Lock) -> FastAPI:
                 raise HTTPException(status_code=404, detail="Message not found")
             return copy.deepcopy(message)
 
+    def _modify_labels(
+        message: dict[str, Any],
+        add_labels: list[str],
+        remove_labels: list[str],
+    ) -> None:
+        labels = list(message.get("labelIds") or [])
+        for label in add_labels:
+            if label not in labels:
+                labels.append(label)
+        for label in remove_labels:
+            if label in labels:
+                labels.remove(label)
+        message["labelIds"] = labels
+        state.gmail_modify_calls.append(
+            {
+                "message_id": message["id"],
+                "add_label_ids": list(add_labels),
+                "remove_label_ids": list(remove_labels),
+                "label_ids_after": list(labels),
+            }
+        )
+
+    @app.post("/gmail/v1/users/me/messages/batchModify", status_code=204)
+    async def gmail_messages_batch_modify(request: Request) -> None:
+        payload = await request.json()
+        with lock:
+            for message_id in payload.get("ids") or []:
+                message = state.gmail_messages.get(message_id)
+                if message is not None:
+                    _modify_labels(
+                        message,
+                        payload.get("addLabelIds") or [],
+                        payload.get("removeLabelIds") or [],
+                    )
+
     @app.post("/gmail/v1/users/me/messages/{message_id}/modify")
     async def gmail_message_modify(message_id: str, request: Request) -> dict[str, Any]:
         payload = await request.json()
-        add_labels = payload.get("addLabelIds") or []
-        remove_labels = payload.get("removeLabelIds") or []
         with lock:
             message = state.gmail_messages.get(message_id)
             if message is None:
                 raise HTTPException(status_code=404, detail="Message not found")
-            labels = list(message.get("labelIds") or [])
-            for label in add_labels:
-                if label not in labels:
-                    labels.append(label)
-            for label in remove_labels:
-                if label in labels:
-                    labels.remove(label)
-            message["labelIds"] = labels
-            state.gmail_modify_calls.append(
-                {
-                    "message_id": message_id,
-                    "add_label_ids": list(add_labels),
-                    "remove_label_ids": list(remove_labels),
-                    "label_ids_after": list(labels),
-                }
+            _modify_labels(
+                message,
+                payload.get("addLabelIds") or [],
+                payload.get("removeLabelIds") or [],
             )
             return copy.deepcopy(message)
 
@@ -434,6 +466,10 @@ class MockGoogleWorkspaceHarness:
         with self._lock:
             return copy.deepcopy(self._state.calendar_deleted_events)
 
+    def set_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._state.latency_seconds = max(0.0, seconds)
+
     def stop(self) -> None:
         self._server.should_exit = True
         self._thread.join(timeout=5)
@@ -7,10 +7,16 @@ Two pipelines:
 WeasyPrint requires system libraries (pango, cairo, gobject). The imports are
 deferred so the backend can start even when these libraries are missing —
 only the render endpoint will fail.
+
+The base/font CSS and the WeasyPrint ``FontConfiguration`` are built once per
+process; :func:`warm_up` does that ahead of the first render in the render
+pool's worker processes (see :mod:`app.pdf_render`).
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 from importlib import import_module
 from pathlib import Path
@@ -32,11 +38,13 @@ _jinja_env = Environment(
 )
 
 
+@functools.cache
 def _load_base_css() -> str:
     """Load the base CSS reset/print foundations."""
     return (_TEMPLATES_DIR / "base.css").read_text(encoding="utf-8")
 
 
+@functools.cache
 def _build_font_face_css() -> str:
     """Generate @font-face rules for self-hosted fonts."""
     rules: list[str] = []
@@ -63,6 +71,55 @@ def _build_font_face_css() -> str:
     return "\n\n".join(rules)
 
 
+def _combined_css() -> str:
+    """Font declarations + base reset, shared by both pipelines."""
+    return f"{_build_font_face_css()}\n\n{_load_base_css()}"
+
+
+# Reused for every render in this process. WeasyPrint is not thread-safe, so
+# renders run one at a time per process (see app.pdf_render).
+@functools.cache
+def _font_configuration() -> Any:
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+
+def _write_pdf(html_content: str, combined_css: str, custom_css: str) -> bytes:
+    from weasyprint import CSS, HTML
+
+    font_config = _font_configuration()
+    html = HTML(string=html_content)
+    css = CSS(string=combined_css + "\n" + custom_css, font_config=font_config)
+    return html.write_pdf(stylesheets=[css], font_config=font_config)
+
+
+@functools.cache
+def template_fingerprint() -> str:
+    """Hash of the bundled templates and base CSS.
+
+    Part of render cache keys, so a deploy that changes a template does not
+    serve PDFs rendered with the old one.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(_TEMPLATES_DIR.glob("*.j2")) + [_TEMPLATES_DIR / "base.css"]:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def warm_up() -> None:
+    """Load templates, CSS and fonts so the first render does not pay for it."""
+    _combined_css()
+    _jinja_env.get_template("base.html.j2")
+    _jinja_env.get_template("markdown.html.j2")
+    try:
+        _font_configuration()
+    except (ImportError, OSError) as exc:
+        # Native libraries missing: renders will fail with the real error.
+        logger.warning("WeasyPrint unavailable during warm-up: %s", exc)
+
+
 def render_cv_to_pdf(cv: dict, custom_css: str) -> bytes:
     """Render structured CV data to a PDF.
 
@@ -73,11 +130,8 @@ def render_cv_to_pdf(cv: dict, custom_css: str) -> bytes:
     Returns:
         PDF file contents as bytes.
     """
-    base_css = _load_base_css()
-    font_css = _build_font_face_css()
-
     # Combine: font declarations + base reset + agent styling
-    combined_css = f"{font_css}\n\n{base_css}"
+    combined_css = _combined_css()
 
     template = _jinja_env.get_template("base.html.j2")
     # nosemgrep: python.flask.security.xss.audit.direct-use-of-jinja2.direct-use-of-jinja2
@@ -85,14 +139,7 @@ def render_cv_to_pdf(cv: dict, custom_css: str) -> bytes:
     # pre-validated CV data; autoescape=True on the Jinja2 env.
     html_content = template.render(cv=cv, base_css=combined_css, custom_css=custom_css)
 
-    from weasyprint import CSS, HTML
-    from weasyprint.text.fonts import FontConfiguration
-
-    font_config = FontConfiguration()
-    html = HTML(string=html_content)
-    css = CSS(string=combined_css + "\n" + custom_css, font_config=font_config)
-
-    pdf_bytes = html.write_pdf(stylesheets=[css], font_config=font_config)
+    pdf_bytes = _write_pdf(html_content, combined_css, custom_css)
     logger.info("Rendered CV PDF (%d bytes) for %s", len(pdf_bytes), cv.get("name", "unknown"))
     return pdf_bytes
 
@@ -114,9 +161,7 @@ def render_markdown_to_pdf(markdown_text: str, custom_css: str) -> bytes:
         extensions=["tables", "fenced_code", "toc"],
     )
 
-    base_css = _load_base_css()
-    font_css = _build_font_face_css()
-    combined_css = f"{font_css}\n\n{base_css}"
+    combined_css = _combined_css()
 
     template = _jinja_env.get_template("markdown.html.j2")
     # nosemgrep: python.flask.security.xss.audit.direct-use-of-jinja2.direct-use-of-jinja2
@@ -128,13 +173,6 @@ def render_markdown_to_pdf(markdown_text: str, custom_css: str) -> bytes:
         custom_css=custom_css,
     )
 
-    from weasyprint import CSS, HTML
-    from weasyprint.text.fonts import FontConfiguration
-
-    font_config = FontConfiguration()
-    html = HTML(string=html_content)
-    css = CSS(string=combined_css + "\n" + custom_css, font_config=font_config)
-
-    pdf_bytes = html.write_pdf(stylesheets=[css], font_config=font_config)
+    pdf_bytes = _write_pdf(html_content, combined_css, custom_css)
     logger.info("Rendered markdown PDF (%d bytes)", len(pdf_bytes))
     return pdf_bytes
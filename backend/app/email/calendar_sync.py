@@ -17,6 +17,7 @@ from ..imports.shared import (
     _hash_payload,
     _pv,
 )
+from ..projection.items import refresh_item_projection
 from . import google_calendar_api
 from .gmail_oauth import get_valid_gmail_token
 
@@ -264,6 +265,7 @@ def _upsert_event_item(
             )
             inserted = cur.fetchone()
             if inserted:
+                refresh_item_projection(cur, [inserted["item_id"]])
                 conn.commit()
                 return True
 
@@ -276,9 +278,11 @@ def _upsert_event_item(
                     archived_at = NULL,
                     updated_at = %s
                 WHERE org_id = %s AND canonical_id = %s
+                RETURNING item_id
                 """,
                 (jsonb(entity), content_hash, now, org_id, canonical_id),
             )
+            refresh_item_projection(cur, [row["item_id"] for row in cur.fetchall()])
         conn.commit()
     return False
 
@@ -304,6 +308,8 @@ def _archive_event_item(*, org_id: str, calendar_id: str, event_id: str) -> bool
                 (now, now, org_id, calendar_id, event_id),
             )
             row = cur.fetchone()
+            if row:
+                refresh_item_projection(cur, [row["item_id"]])
         conn.commit()
     return bool(row)
 
@@ -1,29 +1,79 @@
-"""Gmail REST API v1 client — thin httpx wrappers.
+"""Gmail REST API v1 client — thin wrappers over the shared Google client.
 
-Uses the same pattern as gmail_oauth.py: direct httpx calls with Bearer token auth.
-No google-api-python-client dependency.
+Bearer-token calls on :mod:`app.email.google_client` (pooled keep-alive
+connections, per-endpoint metrics, coalesced GETs). No
+google-api-python-client dependency.
+
+Bulk sync calls (:func:`messages_get`, :func:`messages_batch_modify`) back off
+on Gmail quota errors (429, 403 rate-limit reasons, 5xx), honouring
+``Retry-After``.
 """
 
 from __future__ import annotations
 
 import base64
+import itertools
 import logging
 import os
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import httpx
 
+from ..config import settings
+from . import google_client
+
 logger = logging.getLogger(__name__)
 
 GMAIL_API_BASE = os.getenv(
     "GMAIL_API_BASE",
     "https://gmail.googleapis.com/gmail/v1/users/me",
 )
-_TIMEOUT = 30
+
+# messages.batchModify accepts at most 1000 ids per call.
+BATCH_MODIFY_MAX_IDS = 1000
+
+
+def _request(
+    method: str,
+    url: str,
+    access_token: str,
+    *,
+    endpoint: str,
+    retry: bool = False,
+    **kwargs: Any,
+) -> httpx.Response:
+    response = google_client.request(
+        method,
+        url,
+        endpoint=endpoint,
+        access_token=access_token,
+        retry=retry,
+        **kwargs,
+    )
+    response.raise_for_status()
+    return response
 
 
-def _headers(access_token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {access_token}"}
+def _get(
+    url: str,
+    access_token: str,
+    *,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    retry: bool = False,
+) -> httpx.Response:
+    response = google_client.get(
+        url,
+        endpoint=endpoint,
+        access_token=access_token,
+        params=params,
+        retry=retry,
+    )
+    response.raise_for_status()
+    return response
 
 
 def watch(access_token: str, topic_name: str) -> dict[str, Any]:
@@ -32,26 +82,27 @@ def watch(access_token: str, topic_name: str) -> dict[str, Any]:
     Returns {"historyId": "...", "expiration": "..."} where expiration is
     epoch milliseconds (string). Google guarantees at most 7-day expiry.
     """
-    response = httpx.post(
+    response = _request(
+        "POST",
         f"{GMAIL_API_BASE}/watch",
-        headers=_headers(access_token),
+        access_token,
+        endpoint="gmail.watch",
         json={
             "topicName": topic_name,
             "labelIds": ["INBOX"],
         },
-        timeout=_TIMEOUT,
     )
-    response.raise_for_status()
     result: dict[str, Any] = response.json()
     return result
 
 
 def stop_watch(access_token: str) -> None:
     """Stop push notifications for the user's mailbox."""
-    response = httpx.post(
+    response = google_client.request(
+        "POST",
         f"{GMAIL_API_BASE}/stop",
-        headers=_headers(access_token),
-        timeout=_TIMEOUT,
+        endpoint="gmail.stop",
+        access_token=access_token,
     )
     # 404 means no active watch — not an error
     if response.status_code == 404:
@@ -94,13 +145,13 @@ def history_list(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = _get(
             f"{GMAIL_API_BASE}/history",
-            headers=_headers(access_token),
+            access_token,
+            endpoint="gmail.history.list",
             params=params,
-            timeout=_TIMEOUT,
+            retry=True,
         )
-        response.raise_for_status()
         data: dict[str, Any] = response.json()
 
         all_history.extend(data.get("history", []))
@@ -123,17 +174,91 @@ def message_get(
 
     fmt: "full" (default), "metadata", "minimal", or "raw".
     """
-    response = httpx.get(
+    response = _get(
         f"{GMAIL_API_BASE}/messages/{message_id}",
-        headers=_headers(access_token),
+        access_token,
+        endpoint="gmail.messages.get",
         params={"format": fmt},
-        timeout=_TIMEOUT,
     )
-    response.raise_for_status()
     result: dict[str, Any] = response.json()
     return result
 
 
+def messages_get(
+    access_token: str,
+    message_ids: Sequence[str],
+    *,
+    fmt: str = "full",
+    concurrency: int | None = None,
+) -> Iterator[tuple[str, dict[str, Any] | Exception]]:
+    """Fetch many messages concurrently, yielding ``(id, message)`` in input order.
+
+    At most ``concurrency`` requests run at once (default
+    ``GMAIL_FETCH_CONCURRENCY``) and a few more are queued behind them, so the
+    caller processes early messages while later ones download. A message that
+    could not be fetched is yielded with its exception instead of raising.
+    """
+    if not message_ids:
+        return
+    workers = max(1, concurrency or settings.gmail_fetch_concurrency)
+    pending_ids = iter(message_ids)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gmail-fetch")
+
+    def _submit(message_id: str) -> tuple[str, Future[httpx.Response]]:
+        future = pool.submit(
+            _get,
+            f"{GMAIL_API_BASE}/messages/{message_id}",
+            access_token,
+            endpoint="gmail.messages.get",
+            params={"format": fmt},
+            retry=True,
+        )
+        return message_id, future
+
+    try:
+        window = deque(
+            _submit(message_id) for message_id in itertools.islice(pending_ids, 2 * workers)
+        )
+        while window:
+            message_id, future = window.popleft()
+            next_id = next(pending_ids, None)
+            if next_id is not None:
+                window.append(_submit(next_id))
+            try:
+                result: dict[str, Any] = future.result().json()
+            except Exception as exc:  # noqa: BLE001
+                yield message_id, exc
+            else:
+                yield message_id, result
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def messages_batch_modify(
+    access_token: str,
+    message_ids: Sequence[str],
+    *,
+    add_label_ids: list[str] | None = None,
+    remove_label_ids: list[str] | None = None,
+) -> None:
+    """Modify labels on many messages with ``messages.batchModify``."""
+    ids = list(message_ids)
+    for start in range(0, len(ids), BATCH_MODIFY_MAX_IDS):
+        body: dict[str, Any] = {"ids": ids[start : start + BATCH_MODIFY_MAX_IDS]}
+        if add_label_ids:
+            body["addLabelIds"] = add_label_ids
+        if remove_label_ids:
+            body["removeLabelIds"] = remove_label_ids
+        _request(
+            "POST",
+            f"{GMAIL_API_BASE}/messages/batchModify",
+            access_token,
+            endpoint="gmail.messages.batchModify",
+            retry=True,
+            json=body,
+        )
+
+
 def message_modify(
     access_token: str,
     message_id: str,
@@ -148,13 +273,13 @@ def message_modify(
     if remove_label_ids:
         body["removeLabelIds"] = remove_label_ids
 
-    response = httpx.post(
+    response = _request(
+        "POST",
         f"{GMAIL_API_BASE}/messages/{message_id}/modify",
-        headers=_headers(access_token),
+        access_token,
+        endpoint="gmail.messages.modify",
         json=body,
-        timeout=_TIMEOUT,
     )
-    response.raise_for_status()
     result: dict[str, Any] = response.json()
     return result
 
@@ -182,13 +307,13 @@ def messages_list(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = _get(
             f"{GMAIL_API_BASE}/messages",
-            headers=_headers(access_token),
+            access_token,
+            endpoint="gmail.messages.list",
             params=params,
-            timeout=_TIMEOUT,
+            retry=True,
         )
-        response.raise_for_status()
         data: dict[str, Any] = response.json()
 
         messages = data.get("messages", [])
@@ -225,12 +350,12 @@ def send_reply(
     if thread_id:
         payload["threadId"] = thread_id
 
-    response = httpx.post(
+    response = _request(
+        "POST",
         f"{GMAIL_API_BASE}/messages/send",
-        headers=_headers(access_token),
+        access_token,
+        endpoint="gmail.messages.send",
         json=payload,
-        timeout=_TIMEOUT,
     )
-    response.raise_for_status()
     result: dict[str, Any] = response.json()
     return result
@@ -14,6 +14,7 @@ import httpx
 
 from app.config import settings
 from app.db import db_conn
+from app.email import google_client
 from app.email.crypto import CryptoService
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,9 @@ def exchange_gmail_code(code: str) -> dict[str, Any]:
         "redirect_uri": settings.gmail_redirect_uri,
         "grant_type": "authorization_code",
     }
-    response = httpx.post(GOOGLE_TOKEN_URL, data=payload, timeout=30)
+    response = google_client.request(
+        "POST", GOOGLE_TOKEN_URL, endpoint="oauth.token.exchange", data=payload
+    )
     if response.status_code != 200:
         logger.error(
             "Google token exchange returned %d",
@@ -63,10 +66,10 @@ def exchange_gmail_code(code: str) -> dict[str, Any]:
 
 def get_gmail_user_email(access_token: str) -> str:
     """Get the email address associated with the Gmail account."""
-    response = httpx.get(
+    response = google_client.get(
         GOOGLE_GMAIL_PROFILE_URL,
-        headers={"Authorization": f"Bearer {access_token}"},
-        timeout=30,
+        endpoint="gmail.profile",
+        access_token=access_token,
     )
     response.raise_for_status()
     data: dict[str, Any] = response.json()
@@ -80,6 +83,11 @@ def refresh_gmail_token(connection_id: str, org_id: str) -> str:
     Updates the connection row in DB with new access token and expiry.
     Returns the new (decrypted) access token.
     """
+    access_token, _expires_at = _refresh_gmail_token(connection_id, org_id)
+    return access_token
+
+
+def _refresh_gmail_token(connection_id: str, org_id: str) -> tuple[str, datetime | None]:
     crypto = CryptoService()
 
     with db_conn() as conn:
@@ -105,7 +113,9 @@ def refresh_gmail_token(connection_id: str, org_id: str) -> str:
         "refresh_token": refresh_token,
         "grant_type": "refresh_token",
     }
-    response = httpx.post(GOOGLE_TOKEN_URL, data=payload, timeout=30)
+    response = google_client.request(
+        "POST", GOOGLE_TOKEN_URL, endpoint="oauth.token.refresh", data=payload
+    )
     response.raise_for_status()
 
     data: dict[str, Any] = response.json()
@@ -138,28 +148,43 @@ def refresh_gmail_token(connection_id: str, org_id: str) -> str:
         conn.commit()
 
     logger.info("Refreshed Gmail token for connection %s", connection_id)
-    return access_token
+    return access_token, expires_at
 
 
 def get_valid_gmail_token(connection_row: dict, org_id: str) -> str:
-    """Get a valid access token, refreshing if within 5-min expiry buffer."""
-    crypto = CryptoService()
+    """Get a valid access token, refreshing if within 5-min expiry buffer.
 
+    Tokens are served from the in-process cache while they are valid. The
+    cache key includes the row's stored ciphertext, so a token rewritten by
+    another process (refresh, reconnect) is never shadowed by an older one;
+    a refresh is cached under the key of the row it replaced, so concurrent
+    callers holding that row share it instead of refreshing again.
+    """
     encrypted = connection_row.get("encrypted_access_token")
     if not encrypted:
         raise ValueError("Connection has no access token")
 
-    now = datetime.now(UTC)
-    buffer = timedelta(minutes=5)
-    expires_at = connection_row.get("token_expires_at")
+    connection_id = str(connection_row["connection_id"])
+    cache_key = google_client.token_cache_key(connection_id, encrypted)
+    cached = google_client.token_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if expires_at and expires_at > now + buffer:
-        return crypto.decrypt(encrypted)
+    with google_client.token_cache.refresh_lock(connection_id):
+        cached = google_client.token_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    return refresh_gmail_token(
-        str(connection_row["connection_id"]),
-        org_id,
-    )
+        now = datetime.now(UTC)
+        buffer = timedelta(minutes=5)
+        expires_at = connection_row.get("token_expires_at")
+
+        if expires_at and expires_at > now + buffer:
+            access_token = CryptoService().decrypt(encrypted)
+        else:
+            access_token, expires_at = _refresh_gmail_token(connection_id, org_id)
+        google_client.token_cache.put(cache_key, access_token, expires_at)
+        return access_token
 
 
 def revoke_google_token(token: str) -> None:
@@ -169,8 +194,10 @@ def revoke_google_token(token: str) -> None:
     but **not** raised so that the disconnect flow remains resilient.
     """
     try:
-        response = httpx.post(
+        response = google_client.request(
+            "POST",
             GOOGLE_REVOKE_URL,
+            endpoint="oauth.revoke",
             params={"token": token},
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=10,
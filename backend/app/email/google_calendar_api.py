@@ -1,4 +1,4 @@
-"""Google Calendar REST API v3 client — thin httpx wrappers."""
+"""Google Calendar REST API v3 client — thin wrappers over the shared Google client."""
 
 from __future__ import annotations
 
@@ -6,17 +6,12 @@ import os
 from typing import Any
 from urllib.parse import quote
 
-import httpx
+from . import google_client
 
 GCAL_API_BASE = os.getenv(
     "GCAL_API_BASE",
     "https://www.googleapis.com/calendar/v3",
 )
-_TIMEOUT = 30
-
-
-def _headers(access_token: str) -> dict[str, str]:
-    return {"Authorization": f"Bearer {access_token}"}
 
 
 def calendar_list(
@@ -33,11 +28,11 @@ def calendar_list(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = google_client.get(
             f"{GCAL_API_BASE}/users/me/calendarList",
-            headers=_headers(access_token),
+            endpoint="calendar.calendarList.list",
+            access_token=access_token,
             params=params,
-            timeout=_TIMEOUT,
         )
         response.raise_for_status()
         payload: dict[str, Any] = response.json()
@@ -85,11 +80,11 @@ def events_list(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = google_client.get(
             f"{GCAL_API_BASE}/calendars/{encoded_calendar_id}/events",
-            headers=_headers(access_token),
+            endpoint="calendar.events.list",
+            access_token=access_token,
             params=params,
-            timeout=_TIMEOUT,
         )
         response.raise_for_status()
         payload: dict[str, Any] = response.json()
@@ -111,11 +106,12 @@ def update_event(
 ) -> dict[str, Any]:
     encoded_calendar_id = quote(calendar_id, safe="")
     encoded_event_id = quote(event_id, safe="")
-    response = httpx.patch(
+    response = google_client.request(
+        "PATCH",
         f"{GCAL_API_BASE}/calendars/{encoded_calendar_id}/events/{encoded_event_id}",
-        headers=_headers(access_token),
+        endpoint="calendar.events.patch",
+        access_token=access_token,
         json=body,
-        timeout=_TIMEOUT,
     )
     response.raise_for_status()
     result: dict[str, Any] = response.json()
@@ -130,10 +126,10 @@ def get_event(
 ) -> dict[str, Any]:
     encoded_calendar_id = quote(calendar_id, safe="")
     encoded_event_id = quote(event_id, safe="")
-    response = httpx.get(
+    response = google_client.get(
         f"{GCAL_API_BASE}/calendars/{encoded_calendar_id}/events/{encoded_event_id}",
-        headers=_headers(access_token),
-        timeout=_TIMEOUT,
+        endpoint="calendar.events.get",
+        access_token=access_token,
     )
     response.raise_for_status()
     result: dict[str, Any] = response.json()
@@ -147,11 +143,12 @@ def create_event(
     calendar_id: str = "primary",
 ) -> dict[str, Any]:
     encoded_calendar_id = quote(calendar_id, safe="")
-    response = httpx.post(
+    response = google_client.request(
+        "POST",
         f"{GCAL_API_BASE}/calendars/{encoded_calendar_id}/events",
-        headers=_headers(access_token),
+        endpoint="calendar.events.insert",
+        access_token=access_token,
         json=body,
-        timeout=_TIMEOUT,
     )
     response.raise_for_status()
     result: dict[str, Any] = response.json()
@@ -166,9 +163,10 @@ def delete_event(
 ) -> None:
     encoded_calendar_id = quote(calendar_id, safe="")
     encoded_event_id = quote(event_id, safe="")
-    response = httpx.delete(
+    response = google_client.request(
+        "DELETE",
         f"{GCAL_API_BASE}/calendars/{encoded_calendar_id}/events/{encoded_event_id}",
-        headers=_headers(access_token),
-        timeout=_TIMEOUT,
+        endpoint="calendar.events.delete",
+        access_token=access_token,
     )
     response.raise_for_status()
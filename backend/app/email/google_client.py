@@ -0,0 +1,268 @@
+"""Shared HTTP client layer for Google APIs (Gmail, Calendar, OAuth).
+
+All Google calls go through one keep-alive ``httpx.Client`` per process
+(connections are pooled per host; HTTP/2 when the optional ``h2`` package is
+installed and ``GOOGLE_API_HTTP2`` is on). On top of it:
+
+- :func:`request` records ``app_google_api_request_duration_seconds`` and
+  ``app_google_api_quota_errors_total`` per endpoint label and, with
+  ``retry=True``, backs off on quota and transient server errors, honouring
+  ``Retry-After``.
+- :func:`get` coalesces identical concurrent GETs (same URL, params and
+  token) into one request whose response every caller receives.
+- :data:`token_cache` keeps access tokens per connection, encrypted with a
+  process-local key, until ``GOOGLE_TOKEN_CACHE_MARGIN_SECONDS`` before they
+  expire, so syncs and calendar calls skip the DB decrypt and concurrent
+  refreshes of one connection collapse into one (see
+  :func:`app.email.gmail_oauth.get_valid_gmail_token`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+from cryptography.fernet import Fernet
+
+from ..config import settings
+from ..metrics import (
+    APP_GOOGLE_API_COALESCED_TOTAL,
+    APP_GOOGLE_API_QUOTA_ERRORS_TOTAL,
+    APP_GOOGLE_API_REQUEST_DURATION_SECONDS,
+    APP_GOOGLE_TOKEN_CACHE_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 32.0
+
+_client_lock = threading.Lock()
+_shared_client: httpx.Client | None = None
+_shared_client_pid: int | None = None
+
+_inflight_lock = threading.Lock()
+_inflight: dict[tuple[Any, ...], Future[httpx.Response]] = {}
+
+
+def _client() -> httpx.Client:
+    """Return this process's pooled client (re-created after a fork)."""
+    global _shared_client, _shared_client_pid
+    client = _shared_client
+    if client is not None and _shared_client_pid == os.getpid():
+        return client
+    with _client_lock:
+        if _shared_client is None or _shared_client_pid != os.getpid():
+            # Bulk Gmail fetches run GMAIL_FETCH_CONCURRENCY requests at once.
+            connections = max(
+                1, settings.google_api_max_connections, settings.gmail_fetch_concurrency
+            )
+            _shared_client = httpx.Client(
+                timeout=settings.google_api_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+                http2=settings.google_api_http2 and importlib.util.find_spec("h2") is not None,
+            )
+            _shared_client_pid = os.getpid()
+        return _shared_client
+
+
+def close_client() -> None:
+    """Close the pooled client (application or worker shutdown)."""
+    global _shared_client, _shared_client_pid
+    with _client_lock:
+        client, _shared_client, _shared_client_pid = _shared_client, None, None
+    if client is not None:
+        client.close()
+
+
+def is_quota_error(response: httpx.Response) -> bool:
+    """Whether ``response`` is a rate-limit or transient error worth retrying."""
+    if response.status_code in _RETRY_STATUSES:
+        return True
+    if response.status_code != 403:
+        return False
+    try:
+        errors = response.json().get("error", {}).get("errors", [])
+    except (ValueError, AttributeError):
+        return False
+    return any(
+        isinstance(error, dict) and error.get("reason") in _RATE_LIMIT_REASONS for error in errors
+    )
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), _BACKOFF_MAX_SECONDS)
+    return min(_BACKOFF_BASE_SECONDS * 2**attempt, _BACKOFF_MAX_SECONDS)
+
+
+def _outcome(response: httpx.Response, quota: bool) -> str:
+    if quota and response.status_code < 500:
+        return "quota"
+    if response.status_code >= 500:
+        return "server_error"
+    return "client_error" if response.status_code >= 400 else "ok"
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    endpoint: str,
+    access_token: str | None = None,
+    retry: bool = False,
+    headers: Mapping[str, str] | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send one request on the shared client and record its metrics.
+
+    ``endpoint`` is a fixed label such as ``gmail.messages.get`` (never a URL).
+    The response is returned as-is; callers decide whether to
+    ``raise_for_status()``.
+    """
+    request_headers = dict(headers or {})
+    if access_token:
+        request_headers["Authorization"] = f"Bearer {access_token}"
+    client = _client()
+    attempts = _MAX_ATTEMPTS if retry else 1
+    for attempt in range(attempts):
+        started = time.perf_counter()
+        try:
+            response = client.request(method, url, headers=request_headers, **kwargs)
+        except httpx.TransportError:
+            APP_GOOGLE_API_REQUEST_DURATION_SECONDS.labels(
+                endpoint=endpoint, outcome="transport_error"
+            ).observe(time.perf_counter() - started)
+            raise
+        quota = is_quota_error(response)
+        APP_GOOGLE_API_REQUEST_DURATION_SECONDS.labels(
+            endpoint=endpoint, outcome=_outcome(response, quota)
+        ).observe(time.perf_counter() - started)
+        if quota and response.status_code in (403, 429):
+            APP_GOOGLE_API_QUOTA_ERRORS_TOTAL.labels(endpoint=endpoint).inc()
+        if not quota or attempt == attempts - 1:
+            break
+        delay = _retry_delay(response, attempt)
+        logger.info(
+            "Google %s returned %d, retrying in %.1fs",
+            endpoint,
+            response.status_code,
+            delay,
+        )
+        time.sleep(delay)
+    return response
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def get(
+    url: str,
+    *,
+    endpoint: str,
+    access_token: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    retry: bool = False,
+) -> httpx.Response:
+    """GET through :func:`request`, sharing one in-flight request per identical call."""
+    token_key = hashlib.sha256(access_token.encode()).hexdigest() if access_token else None
+    key = (url, _freeze(params or {}), token_key)
+    with _inflight_lock:
+        shared = _inflight.get(key)
+        if shared is None:
+            future: Future[httpx.Response] = Future()
+            _inflight[key] = future
+    if shared is not None:
+        APP_GOOGLE_API_COALESCED_TOTAL.labels(endpoint=endpoint).inc()
+        return shared.result()
+
+    try:
+        response = request(
+            "GET",
+            url,
+            endpoint=endpoint,
+            access_token=access_token,
+            retry=retry,
+            params=params,
+        )
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def token_cache_key(connection_id: str, stored_ciphertext: str) -> str:
+    """Cache key for a connection row's token, changing whenever the row's token does."""
+    fingerprint = hashlib.sha256(stored_ciphertext.encode()).hexdigest()[:16]
+    return f"{connection_id}:{fingerprint}"
+
+
+class TokenCache:
+    """Access tokens by :func:`token_cache_key`, Fernet-encrypted with a per-process key."""
+
+    def __init__(self) -> None:
+        self._fernet = Fernet(Fernet.generate_key())
+        self._entries: dict[str, tuple[bytes, datetime]] = {}
+        self._refresh_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        margin = timedelta(seconds=settings.google_token_cache_margin_seconds)
+        if entry is None or entry[1] <= datetime.now(UTC) + margin:
+            APP_GOOGLE_TOKEN_CACHE_TOTAL.labels(result="miss").inc()
+            return None
+        APP_GOOGLE_TOKEN_CACHE_TOTAL.labels(result="hit").inc()
+        return self._fernet.decrypt(entry[0]).decode()
+
+    def put(self, key: str, access_token: str, expires_at: datetime | None) -> None:
+        """Cache ``access_token``; tokens without a known expiry are not cached."""
+        if expires_at is None:
+            return
+        encrypted = self._fernet.encrypt(access_token.encode())
+        now = datetime.now(UTC)
+        with self._lock:
+            # Keys of replaced tokens are never looked up again; drop them
+            # once they expire.
+            for stale in [k for k, (_, expiry) in self._entries.items() if expiry <= now]:
+                del self._entries[stale]
+            self._entries[key] = (encrypted, expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def refresh_lock(self, connection_id: str) -> threading.Lock:
+        """Lock serialising token refreshes of one connection."""
+        with self._lock:
+            return self._refresh_locks.setdefault(connection_id, threading.Lock())
+
+
+token_cache = TokenCache()
@@ -10,6 +10,7 @@ from uuid import UUID
 
 from ..db import db_conn, jsonb
 from ..notifications import create_notification_event
+from ..projection.calendar import list_busy_intervals
 from .cel_rules import evaluate_rule
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,8 @@ _SCHEDULE_KEYWORDS = (
 )
 _URGENT_KEYWORDS = ("urgent", "asap", "today", "heute", "now", "sofort")
 _URGENT_WINDOW = timedelta(hours=4)
+_FREE_BUSY_HORIZON = timedelta(days=14)
+_DEFAULT_EVENT_DURATION = timedelta(minutes=30)
 
 
 @dataclass
@@ -112,25 +115,13 @@ def _round_up_to_quarter(value: datetime) -> datetime:
 
 def _next_available_slot(
     *,
-    calendar_items: list[dict[str, Any]],
+    busy_intervals: list[tuple[datetime, datetime]],
     duration_minutes: int,
 ) -> tuple[datetime, datetime]:
     now = datetime.now(UTC)
     cursor = _round_up_to_quarter(now)
     duration = timedelta(minutes=max(duration_minutes, 1))
 
-    busy_intervals: list[tuple[datetime, datetime]] = []
-    for calendar_item in calendar_items:
-        start_dt = _calendar_start(calendar_item)
-        if start_dt is None:
-            continue
-        end_dt = _calendar_end(calendar_item) or (start_dt + timedelta(minutes=30))
-        if end_dt <= now:
-            continue
-        busy_intervals.append((start_dt, end_dt))
-
-    busy_intervals.sort(key=lambda interval: interval[0])
-
     for start_dt, end_dt in busy_intervals:
         if end_dt <= cursor:
             continue
@@ -188,6 +179,19 @@ def _list_recent_email_items(
             return cur.fetchall()
 
 
+def _list_busy_intervals(*, org_id: str) -> list[tuple[datetime, datetime]]:
+    now = datetime.now(UTC)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            return list_busy_intervals(
+                cur,
+                org_id=org_id,
+                range_start=now,
+                range_end=now + _FREE_BUSY_HORIZON,
+                default_duration=_DEFAULT_EVENT_DURATION,
+            )
+
+
 def _list_recent_calendar_items(*, org_id: str, limit: int = 120) -> list[dict[str, Any]]:
     safe_limit = min(max(limit, 1), 500)
     with db_conn() as conn:
@@ -324,13 +328,13 @@ def _build_personal_payload(email_item: dict[str, Any]) -> dict[str, Any]:
 
 def _build_schedule_payload(
     email_item: dict[str, Any],
-    calendar_items: list[dict[str, Any]],
+    busy_intervals: list[tuple[datetime, datetime]],
 ) -> dict[str, Any]:
     email_schema = email_item.get("schema_jsonld") or {}
     email_raw = (email_schema.get("sourceMetadata") or {}).get("raw") or {}
     text = _email_text(email_item)
     start_dt, end_dt = _next_available_slot(
-        calendar_items=calendar_items,
+        busy_intervals=busy_intervals,
         duration_minutes=15,
     )
     has_urgent_keyword = _has_any_keyword(text, _URGENT_KEYWORDS)
@@ -375,6 +379,7 @@ def _evaluate_email_candidate(
     *,
     email_item: dict[str, Any],
     calendar_items: list[dict[str, Any]],
+    busy_intervals: list[tuple[datetime, datetime]],
 ) -> tuple[str, dict[str, Any]] | None:
     text = _email_text(email_item)
     calendar_item = _choose_calendar_item_for_email(
@@ -408,7 +413,7 @@ def _evaluate_email_candidate(
     ):
         return "Proposal.PersonalRequest", _build_schedule_payload(
             email_item,
-            calendar_items,
+            busy_intervals,
         )
 
     has_pickup_keyword = _has_any_keyword(text, _PICKUP_KEYWORDS)
@@ -539,11 +544,16 @@ def generate_proposals_for_items(
         return []
 
     calendar_items = _list_recent_calendar_items(org_id=org_id)
+    busy_intervals = _list_busy_intervals(org_id=org_id)
     created_or_existing_ids: list[str] = []
     inserted_ids: set[str] = set()
 
     for email_item in email_items:
-        evaluated = _evaluate_email_candidate(email_item=email_item, calendar_items=calendar_items)
+        evaluated = _evaluate_email_candidate(
+            email_item=email_item,
+            calendar_items=calendar_items,
+            busy_intervals=busy_intervals,
+        )
         if not evaluated:
             continue
         proposal_type, payload = evaluated
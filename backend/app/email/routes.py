@@ -29,6 +29,7 @@ from app.email.gmail_oauth import (
     revoke_google_token,
 )
 from app.email.sync import register_watch, run_email_sync, stop_watch_for_connection
+from app.projection.items import refresh_item_projection
 
 from . import gmail_api, google_calendar_api
 from .proposals import generate_proposals_for_items
@@ -289,9 +290,11 @@ def _archive_deselected_calendar_items(*, org_id: str, deselected_calendar_ids:
                         schema_jsonld -> 'sourceMetadata' -> 'raw' ->> 'calendarId',
                         'primary'
                       ) = ANY(%s)
+                RETURNING item_id
                 """,
                 (now, now, org_id, deselected_calendar_ids),
             )
+            refresh_item_projection(cur, [row["item_id"] for row in cur.fetchall()])
         conn.commit()
 
 
@@ -15,7 +15,8 @@ import httpx
 from ..config import settings
 from ..db import db_conn, jsonb
 from ..imports.shared import _hash_payload
-from ..outbox import enqueue_event
+from ..outbox import enqueue_event, enqueue_events
+from ..projection.items import refresh_item_projection
 from . import gmail_api
 from .calendar_sync import run_calendar_sync
 from .cel_rules import evaluate_rule
@@ -29,6 +30,12 @@ from .transform import EmailMessage, build_email_item
 
 logger = logging.getLogger(__name__)
 
+# ``trigger`` of an email_sync_job request; the sync executor runs push
+# requests (Gmail watch notifications) before scheduled ones.
+SYNC_TRIGGER_PUSH = "push"
+SYNC_TRIGGER_INTERVAL = "interval"
+SYNC_TRIGGER_STARTUP = "startup"
+
 
 @dataclass
 class SyncResult:
@@ -401,10 +408,44 @@ def run_email_sync(
         created_item_ids: list[str] = []
         result.synced = len(new_message_ids)
 
+        # Fetches are pipelined (bounded concurrency, keep-alive client) and
+        # items are written in multi-row batches of GMAIL_SYNC_INSERT_BATCH_SIZE.
+        batch: list[_PendingEmailItem] = []
+        batch_size = max(1, settings.gmail_sync_insert_batch_size)
+
+        def _flush(conn) -> None:
+            pending, batch[:] = list(batch), []
+            try:
+                created = _insert_email_items(conn, pending, org_id=org_id, user_id=user_id)
+            except Exception:
+                logger.warning(
+                    "Failed to insert %d Gmail messages for connection %s",
+                    len(pending),
+                    connection_id,
+                    exc_info=True,
+                )
+                result.errors += len(pending)
+                return
+            for item in pending:
+                item_id = created.get(item.canonical_id)
+                if item_id is None:
+                    result.skipped += 1
+                    continue
+                result.created += 1
+                created_item_ids.append(item_id)
+                gmail_msg_ids_for_mark_read.append(item.gmail_id)
+
         with db_conn() as conn:
-            for msg_id in new_message_ids:
+            for msg_id, gmail_msg in gmail_api.messages_get(access_token, new_message_ids):
+                if isinstance(gmail_msg, Exception):
+                    logger.warning(
+                        "Failed to fetch email msg_id=%s",
+                        msg_id,
+                        exc_info=gmail_msg,
+                    )
+                    result.errors += 1
+                    continue
                 try:
-                    gmail_msg = gmail_api.message_get(access_token, msg_id)
                     label_ids = gmail_msg.get("labelIds") or []
                     should_import = evaluate_rule(
                         "sync.gmail.message.importable",
@@ -434,85 +475,34 @@ def run_email_sync(
                         raw["threadId"] = str(thread_id)
                     source_meta["raw"] = raw
                     entity["sourceMetadata"] = source_meta
-
-                    content_hash = _hash_payload(entity)
-
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            INSERT INTO items (
-                                org_id, created_by_user_id, canonical_id,
-                                schema_jsonld, source, content_hash,
-                                created_at, updated_at
-                            )
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (org_id, canonical_id) DO NOTHING
-                            RETURNING item_id
-                            """,
-                            (
-                                org_id,
-                                user_id,
-                                canonical_id,
-                                jsonb(entity),
-                                "gmail",
-                                content_hash,
-                                datetime.now(UTC),
-                                datetime.now(UTC),
-                            ),
-                        )
-                        row = cur.fetchone()
-
-                    if row:
-                        result.created += 1
-                        created_item_ids.append(str(row["item_id"]))
-                        gmail_msg_ids_for_mark_read.append(msg_id)
-                    else:
-                        result.skipped += 1
-
                 except Exception:
-                    logger.warning("Failed to upsert email msg_id=%s", msg_id, exc_info=True)
+                    logger.warning("Failed to transform email msg_id=%s", msg_id, exc_info=True)
                     result.errors += 1
+                    continue
+
+                batch.append(_PendingEmailItem(msg_id, canonical_id, entity))
+                if len(batch) >= batch_size:
+                    _flush(conn)
 
+            if batch:
+                _flush(conn)
             conn.commit()
 
         # 5b. Archive TAY items whose Gmail messages were archived
         if archived_gmail_ids:
-            now = datetime.now(UTC)
-            with db_conn() as conn:
-                for gmail_id in archived_gmail_ids:
-                    try:
-                        with conn.cursor() as cur:
-                            cur.execute(
-                                """
-                                UPDATE items
-                                SET archived_at = %s, updated_at = %s
-                                WHERE org_id = %s
-                                  AND created_by_user_id = %s
-                                  AND source = 'gmail'
-                                  AND archived_at IS NULL
-                                  AND schema_jsonld -> 'sourceMetadata'
-                                      -> 'raw' ->> 'gmailMessageId' = %s
-                                RETURNING item_id
-                                """,
-                                (now, now, org_id, user_id, gmail_id),
-                            )
-                            row = cur.fetchone()
-                        if row:
-                            result.archived += 1
-                            enqueue_event(
-                                "item_archived",
-                                {
-                                    "item_id": str(row["item_id"]),
-                                    "org_id": org_id,
-                                },
-                            )
-                    except Exception:
-                        logger.warning(
-                            "Failed to archive TAY item for gmail_id=%s",
-                            gmail_id,
-                            exc_info=True,
-                        )
-                conn.commit()
+            try:
+                result.archived += _archive_gmail_items(
+                    _ARCHIVE_BY_GMAIL_IDS_SQL,
+                    org_id=org_id,
+                    user_id=user_id,
+                    gmail_ids=archived_gmail_ids,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to archive TAY items for %d archived Gmail messages",
+                    len(archived_gmail_ids),
+                    exc_info=True,
+                )
 
         # 6. Update sync state with new history ID
         if new_history_id:
@@ -520,19 +510,18 @@ def run_email_sync(
 
         # 7. Mark read in Gmail if configured
         if connection["sync_mark_read"] and gmail_msg_ids_for_mark_read:
-            for gm_id in gmail_msg_ids_for_mark_read:
-                try:
-                    gmail_api.message_modify(
-                        access_token,
-                        gm_id,
-                        remove_label_ids=["UNREAD"],
-                    )
-                except Exception:
-                    logger.warning(
-                        "Failed to mark email %s as read",
-                        gm_id,
-                        exc_info=True,
-                    )
+            try:
+                gmail_api.messages_batch_modify(
+                    access_token,
+                    gmail_msg_ids_for_mark_read,
+                    remove_label_ids=["UNREAD"],
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to mark %d emails as read",
+                    len(gmail_msg_ids_for_mark_read),
+                    exc_info=True,
+                )
 
         # 8. Update connection success
         _update_connection_success(connection_id, org_id, result.synced)
@@ -570,6 +559,59 @@ def run_email_sync(
     return result
 
 
+@dataclass
+class _PendingEmailItem:
+    gmail_id: str
+    canonical_id: str
+    entity: dict
+
+
+_INSERT_EMAIL_ITEMS_SQL = """
+INSERT INTO items (
+    org_id, created_by_user_id, canonical_id,
+    schema_jsonld, source, content_hash,
+    created_at, updated_at
+)
+SELECT %s, %s, t.canonical_id, t.schema_jsonld, 'gmail', t.content_hash, %s, %s
+FROM unnest(%s::text[], %s::jsonb[], %s::text[]) AS t(canonical_id, schema_jsonld, content_hash)
+ON CONFLICT (org_id, canonical_id) DO NOTHING
+RETURNING item_id, canonical_id
+"""
+
+
+def _insert_email_items(
+    conn,
+    items: list[_PendingEmailItem],
+    *,
+    org_id: str,
+    user_id: str,
+) -> dict[str, str]:
+    """Insert one batch of email items in a savepoint.
+
+    Returns ``{canonical_id: item_id}`` for the rows that were created;
+    existing items are left untouched. A failing batch rolls back to the
+    savepoint so earlier batches still commit.
+    """
+    now = datetime.now(UTC)
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(
+            _INSERT_EMAIL_ITEMS_SQL,
+            (
+                org_id,
+                user_id,
+                now,
+                now,
+                [item.canonical_id for item in items],
+                [jsonb(item.entity) for item in items],
+                [_hash_payload(item.entity) for item in items],
+            ),
+        )
+        rows = cur.fetchall()
+        if rows:
+            refresh_item_projection(cur, [row["item_id"] for row in rows])
+    return {str(row["canonical_id"]): str(row["item_id"]) for row in rows}
+
+
 # ---------------------------------------------------------------------------
 # Reconciliation
 # ---------------------------------------------------------------------------
@@ -581,9 +623,8 @@ def _list_active_gmail_ids(*, org_id: str, user_id: str) -> set[str]:
         with conn.cursor() as cur:
             cur.execute(
                 """
-                SELECT schema_jsonld -> 'sourceMetadata'
-                         -> 'raw' ->> 'gmailMessageId' AS gmail_id
-                FROM items
+                SELECT gmail_id
+                FROM item_projection, unnest(source_message_ids) AS gmail_id
                 WHERE org_id = %s
                   AND created_by_user_id = %s
                   AND source = 'gmail'
@@ -606,9 +647,8 @@ def _list_archived_gmail_ids(*, org_id: str, user_id: str) -> set[str]:
         with conn.cursor() as cur:
             cur.execute(
                 """
-                SELECT schema_jsonld -> 'sourceMetadata'
-                         -> 'raw' ->> 'gmailMessageId' AS gmail_id
-                FROM items
+                SELECT gmail_id
+                FROM item_projection, unnest(source_message_ids) AS gmail_id
                 WHERE org_id = %s
                   AND created_by_user_id = %s
                   AND source = 'gmail'
@@ -625,68 +665,97 @@ def _list_archived_gmail_ids(*, org_id: str, user_id: str) -> set[str]:
     }
 
 
-def _reconcile_archived(
-    org_id: str,
-    user_id: str,
-    inbox_gmail_ids: set[str],
-) -> int:
-    """Archive TAY items whose Gmail messages are no longer in the inbox.
+# Both statements archive the owner's active Gmail items and return the
+# archived ids in one round trip.
+# Matching by Gmail id uses the GIN index on item_projection.source_message_ids;
+# the inbox comparison is a hash anti-join against the unnested snapshot.
+_ARCHIVE_NOT_IN_INBOX_SQL = """
+WITH inbox AS (
+    SELECT DISTINCT gmail_id FROM unnest(%(gmail_ids)s::text[]) AS gmail_id
+),
+stale AS (
+    SELECT DISTINCT p.item_id
+    FROM item_projection p
+    CROSS JOIN LATERAL unnest(p.source_message_ids) AS m(gmail_id)
+    WHERE p.org_id = %(org_id)s
+      AND p.created_by_user_id = %(user_id)s
+      AND p.source = 'gmail'
+      AND p.archived_at IS NULL
+      AND NOT EXISTS (SELECT 1 FROM inbox WHERE inbox.gmail_id = m.gmail_id)
+),
+archived AS (
+    UPDATE items i
+    SET archived_at = %(now)s, updated_at = %(now)s
+    FROM stale
+    WHERE i.item_id = stale.item_id AND i.archived_at IS NULL
+    RETURNING i.item_id
+)
+SELECT item_id FROM archived
+"""
 
-    Called during full-sync fallback when we have the complete set of
-    current Gmail inbox message IDs.  Any active (non-archived) TAY item
-    with source='gmail' whose gmailMessageId is NOT in that set gets
-    archived.
+_ARCHIVE_BY_GMAIL_IDS_SQL = """
+WITH archived AS (
+    UPDATE items i
+    SET archived_at = %(now)s, updated_at = %(now)s
+    FROM item_projection p
+    WHERE p.item_id = i.item_id
+      AND p.org_id = %(org_id)s
+      AND p.created_by_user_id = %(user_id)s
+      AND p.source = 'gmail'
+      AND p.archived_at IS NULL
+      AND p.source_message_ids && %(gmail_ids)s::text[]
+      AND i.archived_at IS NULL
+    RETURNING i.item_id
+)
+SELECT item_id FROM archived
+"""
 
-    Returns the number of items archived.
-    """
-    now = datetime.now(UTC)
-    archived_count = 0
 
+def _archive_gmail_items(query: str, *, org_id: str, user_id: str, gmail_ids: list[str]) -> int:
+    """Run one of the set-based archive statements and enqueue item_archived events."""
+    now = datetime.now(UTC)
     with db_conn() as conn:
-        # Fetch active gmail items for this org
         with conn.cursor() as cur:
             cur.execute(
-                """
-                SELECT item_id,
-                       schema_jsonld -> 'sourceMetadata'
-                           -> 'raw' ->> 'gmailMessageId' AS gmail_id
-                FROM items
-                WHERE org_id = %s
-                  AND created_by_user_id = %s
-                  AND source = 'gmail'
-                  AND archived_at IS NULL
-                """,
-                (org_id, user_id),
+                query,
+                {
+                    "org_id": org_id,
+                    "user_id": user_id,
+                    "gmail_ids": gmail_ids,
+                    "now": now,
+                },
             )
-            active_items = cur.fetchall()
-
-        for item in active_items:
-            gmail_id = item.get("gmail_id")
-            if not gmail_id or gmail_id in inbox_gmail_ids:
-                continue
-            # This item's email is no longer in Gmail inbox → archive
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    UPDATE items
-                    SET archived_at = %s, updated_at = %s
-                    WHERE item_id = %s AND archived_at IS NULL
-                    RETURNING item_id
-                    """,
-                    (now, now, item["item_id"]),
-                )
-                row = cur.fetchone()
-            if row:
-                archived_count += 1
-                enqueue_event(
+            item_ids = [row["item_id"] for row in cur.fetchall()]
+            if item_ids:
+                refresh_item_projection(cur, item_ids)
+                enqueue_events(
                     "item_archived",
-                    {
-                        "item_id": str(row["item_id"]),
-                        "org_id": org_id,
-                    },
+                    [{"item_id": str(item_id), "org_id": org_id} for item_id in item_ids],
+                    cur=cur,
                 )
         conn.commit()
+    return len(item_ids)
+
 
+def _reconcile_archived(
+    org_id: str,
+    user_id: str,
+    inbox_gmail_ids: set[str],
+) -> int:
+    """Archive TAY items whose Gmail messages are no longer in the inbox.
+
+    Called with the complete set of current Gmail inbox message IDs. Every
+    active TAY item with source='gmail' that references a gmailMessageId
+    outside that set is archived by a single statement.
+
+    Returns the number of items archived.
+    """
+    archived_count = _archive_gmail_items(
+        _ARCHIVE_NOT_IN_INBOX_SQL,
+        org_id=org_id,
+        user_id=user_id,
+        gmail_ids=sorted(inbox_gmail_ids),
+    )
     if archived_count:
         logger.info(
             "Reconciliation archived %d stale TAY items for org=%s",
@@ -910,6 +979,7 @@ def enqueue_all_active_syncs() -> int:
                 "connection_id": str(row["connection_id"]),
                 "org_id": str(row["org_id"]),
                 "user_id": str(row["user_id"]),
+                "trigger": SYNC_TRIGGER_STARTUP,
             },
         )
         count += 1
@@ -955,6 +1025,7 @@ def enqueue_due_syncs() -> int:
                 "connection_id": str(row["connection_id"]),
                 "org_id": str(row["org_id"]),
                 "user_id": str(row["user_id"]),
+                "trigger": SYNC_TRIGGER_INTERVAL,
             },
         )
         count += 1
@@ -0,0 +1,376 @@
+"""Email sync executor — runs ``email_sync_job`` requests off the outbox loop.
+
+``email_sync_job`` outbox events are still how syncs are requested (interval
+scheduler, worker start-up, Gmail push notifications), but the projection
+worker no longer runs them inline. This executor runs them on a bounded
+thread pool inside the worker process:
+
+- **Leases.** A connection is claimed by setting
+  ``email_connections.sync_lease_owner``/``sync_lease_expires_at``, so at most
+  one worker process syncs a connection at a time. Leases of running syncs
+  are extended while they run; a failed sync leaves the lease in place until
+  ``EMAIL_SYNC_RETRY_SECONDS`` have passed, which is the retry backoff.
+- **Coalescing.** All pending requests of a connection are settled by one
+  run; requests that arrive while it runs trigger another run.
+- **Priority and fairness.** Connections with a push-triggered request go
+  first; within that, each org's oldest request is served before any org's
+  second, so one tenant with many mailboxes cannot starve the others.
+- **Metrics.** ``worker_email_sync_lag_seconds{trigger}`` (oldest pending
+  request to start of its sync), ``worker_email_sync_duration_seconds`` and
+  ``worker_email_sync_active``.
+
+``EMAIL_SYNC_CONCURRENCY=0`` disables the executor; the outbox loop then
+runs sync jobs inline as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from ..config import settings
+from ..db import db_conn
+from ..worker_health import (
+    WORKER_EMAIL_SYNC_ACTIVE,
+    WORKER_EMAIL_SYNC_DURATION_SECONDS,
+    WORKER_EMAIL_SYNC_LAG_SECONDS,
+)
+from .sync import SYNC_TRIGGER_PUSH, run_email_sync
+
+logger = logging.getLogger(__name__)
+
+EMAIL_SYNC_EVENT_TYPE = "email_sync_job"
+
+# How often requests for inactive or deleted connections are dead-lettered.
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Rank pending connections (push first, then round-robin across orgs by their
+# oldest request) and lease the top ones. The lease condition is repeated in
+# the UPDATE so concurrent claimers cannot both win a connection.
+_CLAIM_SQL = """
+WITH pending AS (
+    SELECT
+        e.payload->>'connection_id' AS connection_id,
+        min(e.created_at) AS requested_at,
+        bool_or(e.payload->>'trigger' = %(push)s) AS push
+    FROM outbox_events e
+    WHERE e.event_type = 'email_sync_job'
+      AND e.processed_at IS NULL
+      AND e.dead_lettered_at IS NULL
+    GROUP BY 1
+),
+ranked AS (
+    SELECT
+        c.connection_id,
+        p.requested_at,
+        p.push,
+        row_number() OVER (
+            PARTITION BY c.org_id ORDER BY p.push DESC, p.requested_at
+        ) AS org_rank
+    FROM pending p
+    JOIN email_connections c ON c.connection_id::text = p.connection_id
+    WHERE c.is_active = true
+      AND (c.sync_lease_expires_at IS NULL OR c.sync_lease_expires_at < now())
+      AND NOT (c.connection_id = ANY(%(running)s::uuid[]))
+),
+chosen AS (
+    SELECT
+        connection_id,
+        requested_at,
+        push,
+        row_number() OVER (ORDER BY push DESC, org_rank, requested_at) AS dispatch_rank
+    FROM ranked
+    ORDER BY dispatch_rank
+    LIMIT %(limit)s
+)
+UPDATE email_connections c
+SET sync_lease_owner = %(owner)s,
+    sync_lease_expires_at = now() + make_interval(secs => %(lease_seconds)s)
+FROM chosen
+WHERE c.connection_id = chosen.connection_id
+  AND (c.sync_lease_expires_at IS NULL OR c.sync_lease_expires_at < now())
+RETURNING
+    c.connection_id,
+    c.org_id,
+    c.user_id,
+    chosen.requested_at,
+    chosen.push,
+    chosen.dispatch_rank,
+    now() AS claimed_at
+"""
+
+_SETTLE_SQL = """
+UPDATE outbox_events e
+SET processed_at = now()
+WHERE e.event_type = 'email_sync_job'
+  AND e.processed_at IS NULL
+  AND e.dead_lettered_at IS NULL
+  AND e.payload->>'connection_id' = %s
+  AND e.created_at <= %s
+"""
+
+_FAIL_SQL = """
+UPDATE outbox_events e
+SET attempts = e.attempts + 1,
+    last_error = %s,
+    dead_lettered_at = CASE WHEN e.attempts + 1 >= %s THEN now() END
+WHERE e.event_type = 'email_sync_job'
+  AND e.processed_at IS NULL
+  AND e.dead_lettered_at IS NULL
+  AND e.payload->>'connection_id' = %s
+  AND e.created_at <= %s
+"""
+
+_RELEASE_SQL = """
+UPDATE email_connections
+SET sync_lease_owner = NULL,
+    sync_lease_expires_at = CASE
+        WHEN %s > 0 THEN now() + make_interval(secs => %s)
+    END
+WHERE connection_id = %s AND sync_lease_owner = %s
+"""
+
+_EXTEND_SQL = """
+UPDATE email_connections
+SET sync_lease_expires_at = now() + make_interval(secs => %s)
+WHERE sync_lease_owner = %s AND connection_id = ANY(%s::uuid[])
+"""
+
+_SWEEP_SQL = """
+UPDATE outbox_events e
+SET dead_lettered_at = now(),
+    last_error = 'Active connection not found'
+WHERE e.event_type = 'email_sync_job'
+  AND e.processed_at IS NULL
+  AND e.dead_lettered_at IS NULL
+  AND NOT EXISTS (
+      SELECT 1
+      FROM email_connections c
+      WHERE c.connection_id::text = e.payload->>'connection_id'
+        AND c.is_active = true
+  )
+"""
+
+
+@dataclass(frozen=True)
+class SyncClaim:
+    """One leased connection and the requests its sync settles."""
+
+    connection_id: str
+    org_id: str
+    user_id: str
+    requested_at: datetime
+    claimed_at: datetime
+    trigger: str
+
+
+def claim_connections(
+    owner: str, limit: int, *, running: list[str] | None = None
+) -> list[SyncClaim]:
+    """Lease up to ``limit`` connections with pending sync requests."""
+    if limit <= 0:
+        return []
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                _CLAIM_SQL,
+                {
+                    "push": SYNC_TRIGGER_PUSH,
+                    "running": running or [],
+                    "limit": limit,
+                    "owner": owner,
+                    "lease_seconds": settings.email_sync_lease_seconds,
+                },
+            )
+            rows = cur.fetchall()
+        conn.commit()
+    # RETURNING order is unspecified; dispatch in ranking order.
+    rows.sort(key=lambda row: row["dispatch_rank"])
+    return [
+        SyncClaim(
+            connection_id=str(row["connection_id"]),
+            org_id=str(row["org_id"]),
+            user_id=str(row["user_id"]),
+            requested_at=row["requested_at"],
+            claimed_at=row["claimed_at"],
+            trigger=SYNC_TRIGGER_PUSH if row["push"] else "scheduled",
+        )
+        for row in rows
+    ]
+
+
+def settle_claim(claim: SyncClaim, owner: str, error: str | None = None) -> None:
+    """Record a claim's outcome on its requests and release the lease.
+
+    On failure the lease is kept for ``EMAIL_SYNC_RETRY_SECONDS`` so the
+    connection is retried after a backoff instead of on the next poll.
+    """
+    retry_seconds = settings.email_sync_retry_seconds if error is not None else 0.0
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            if error is None:
+                cur.execute(_SETTLE_SQL, (claim.connection_id, claim.claimed_at))
+            else:
+                cur.execute(
+                    _FAIL_SQL,
+                    (
+                        error[:500],
+                        settings.outbox_max_attempts,
+                        claim.connection_id,
+                        claim.claimed_at,
+                    ),
+                )
+            cur.execute(
+                _RELEASE_SQL,
+                (retry_seconds, retry_seconds, claim.connection_id, owner),
+            )
+        conn.commit()
+
+
+def extend_leases(owner: str, connection_ids: list[str]) -> None:
+    if not connection_ids:
+        return
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_EXTEND_SQL, (settings.email_sync_lease_seconds, owner, connection_ids))
+        conn.commit()
+
+
+def dead_letter_orphaned_requests() -> int:
+    """Dead-letter sync requests whose connection is gone or inactive."""
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_SWEEP_SQL)
+            count = cur.rowcount
+        conn.commit()
+    return max(0, count)
+
+
+class EmailSyncExecutor:
+    """Dispatcher thread plus a pool of ``concurrency`` sync threads."""
+
+    def __init__(self, *, concurrency: int, worker_name: str = "projection-worker") -> None:
+        self.concurrency = max(1, concurrency)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._worker_name = worker_name
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="email-sync",
+        )
+        self._running: dict[str, SyncClaim] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_sweep = 0.0
+        self._last_extend = 0.0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._dispatch_loop,
+            name="email-sync-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            "email_sync_executor.started owner=%s concurrency=%d",
+            self.owner,
+            self.concurrency,
+        )
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def running(self) -> list[str]:
+        with self._lock:
+            return list(self._running)
+
+    def dispatch_once(self) -> int:
+        """Claim connections for the free slots and submit their syncs."""
+        now = time.monotonic()
+        if now - self._last_sweep >= _SWEEP_INTERVAL_SECONDS:
+            self._last_sweep = now
+            orphaned = dead_letter_orphaned_requests()
+            if orphaned:
+                logger.warning("email_sync_executor.orphaned_requests count=%d", orphaned)
+        if now - self._last_extend >= settings.email_sync_lease_seconds / 3:
+            self._last_extend = now
+            extend_leases(self.owner, self.running())
+
+        running = self.running()
+        claims = claim_connections(
+            self.owner,
+            self.concurrency - len(running),
+            running=running,
+        )
+        for claim in claims:
+            with self._lock:
+                self._running[claim.connection_id] = claim
+            self._pool.submit(self._run_claim, claim)
+        return len(claims)
+
+    def _run_claim(self, claim: SyncClaim) -> None:
+        lag = max(0.0, (claim.claimed_at - claim.requested_at).total_seconds())
+        WORKER_EMAIL_SYNC_LAG_SECONDS.labels(
+            worker=self._worker_name, trigger=claim.trigger
+        ).observe(lag)
+        WORKER_EMAIL_SYNC_ACTIVE.labels(worker=self._worker_name).inc()
+        started = time.monotonic()
+        error: str | None = None
+        try:
+            result = run_email_sync(
+                connection_id=claim.connection_id,
+                org_id=claim.org_id,
+                user_id=claim.user_id,
+            )
+            logger.info(
+                "email_sync.completed connection=%s trigger=%s lag=%.1fs synced=%d created=%d",
+                claim.connection_id,
+                claim.trigger,
+                lag,
+                result.synced,
+                result.created,
+            )
+        except Exception as exc:  # noqa: BLE001
+            error = str(exc) or exc.__class__.__name__
+            logger.warning(
+                "email_sync.failed connection=%s trigger=%s",
+                claim.connection_id,
+                claim.trigger,
+                exc_info=True,
+            )
+        finally:
+            WORKER_EMAIL_SYNC_ACTIVE.labels(worker=self._worker_name).dec()
+            WORKER_EMAIL_SYNC_DURATION_SECONDS.labels(
+                worker=self._worker_name,
+                outcome="error" if error is not None else "ok",
+            ).observe(time.monotonic() - started)
+            try:
+                settle_claim(claim, self.owner, error)
+            except Exception:  # noqa: BLE001
+                # The lease expires on its own; the requests stay pending.
+                logger.warning(
+                    "email_sync_executor.settle_failed connection=%s",
+                    claim.connection_id,
+                    exc_info=True,
+                )
+            with self._lock:
+                self._running.pop(claim.connection_id, None)
+
+    def _dispatch_loop(self) -> None:
+        poll = max(0.1, settings.email_sync_poll_seconds)
+        while not self._stop.is_set():
+            try:
+                self.dispatch_once()
+            except Exception:  # noqa: BLE001
+                logger.warning("email_sync_executor.dispatch_failed", exc_info=True)
+            self._stop.wait(poll)
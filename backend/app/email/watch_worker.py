@@ -34,7 +34,7 @@ from ..worker_health import (
     start_health_server,
 )
 from .pubsub import PubSubClient, PubSubMessage
-from .sync import register_watch
+from .sync import SYNC_TRIGGER_PUSH, register_watch
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +108,7 @@ def process_notifications(client: PubSubClient) -> int:
                     "connection_id": str(connection["connection_id"]),
                     "org_id": str(connection["org_id"]),
                     "user_id": str(connection["user_id"]),
+                    "trigger": SYNC_TRIGGER_PUSH,
                 },
             )
             enqueued += 1
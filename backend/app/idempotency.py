@@ -15,18 +15,33 @@ def compute_request_hash(method: str, path: str, payload: Any | None) -> str:
     return hashlib.sha256(raw).hexdigest()
 
 
-def get_idempotent_response(org_id: str, key: str, request_hash: str) -> dict | None:
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT request_hash, response_json, status_code
-                FROM idempotency_keys
-                WHERE org_id = %s AND key = %s
-                """,
-                (org_id, key),
-            )
-            row = cur.fetchone()
+_SELECT_SQL = """
+SELECT request_hash, response_json, status_code
+FROM idempotency_keys
+WHERE org_id = %s AND key = %s
+"""
+_INSERT_SQL = """
+INSERT INTO idempotency_keys (org_id, key, request_hash, response_json, status_code)
+VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (org_id, key) DO NOTHING
+"""
+
+
+def get_idempotent_response(
+    org_id: str,
+    key: str,
+    request_hash: str,
+    *,
+    cur=None,  # noqa: ANN001
+) -> dict | None:
+    if cur is not None:
+        cur.execute(_SELECT_SQL, (org_id, key))
+        row = cur.fetchone()
+    else:
+        with db_conn() as conn:
+            with conn.cursor() as c:
+                c.execute(_SELECT_SQL, (org_id, key))
+                row = c.fetchone()
 
     if row is None:
         return None
@@ -46,15 +61,57 @@ def store_idempotent_response(
     request_hash: str,
     response_json: dict,
     status_code: int,
+    *,
+    cur=None,  # noqa: ANN001
 ) -> None:
+    params = (org_id, key, request_hash, jsonb(response_json), status_code)
+    if cur is not None:
+        cur.execute(_INSERT_SQL, params)
+        return
     with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO idempotency_keys (org_id, key, request_hash, response_json, status_code)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (org_id, key) DO NOTHING
-                """,
-                (org_id, key, request_hash, jsonb(response_json), status_code),
-            )
+        with conn.cursor() as c:
+            c.execute(_INSERT_SQL, params)
         conn.commit()
+
+
+def get_idempotent_responses(org_id: str, keys: list[str], *, cur) -> dict[str, dict]:  # noqa: ANN001
+    """Stored rows for several keys in one query, by key (misses are absent)."""
+    if not keys:
+        return {}
+    cur.execute(
+        """
+        SELECT key, request_hash, response_json, status_code
+        FROM idempotency_keys
+        WHERE org_id = %s AND key = ANY(%s)
+        """,
+        (org_id, keys),
+    )
+    return {row["key"]: row for row in cur.fetchall()}
+
+
+def store_idempotent_responses(
+    org_id: str,
+    records: list[tuple[str, str, dict, int]],
+    *,
+    cur,  # noqa: ANN001
+) -> None:
+    """Insert ``(key, request_hash, response_json, status_code)`` records in one statement."""
+    if not records:
+        return
+    keys, hashes, responses, status_codes = zip(*records, strict=True)
+    cur.execute(
+        """
+        INSERT INTO idempotency_keys (org_id, key, request_hash, response_json, status_code)
+        SELECT %s, t.key, t.request_hash, t.response_json, t.status_code
+        FROM unnest(%s::text[], %s::text[], %s::jsonb[], %s::int[])
+            AS t(key, request_hash, response_json, status_code)
+        ON CONFLICT (org_id, key) DO NOTHING
+        """,
+        (
+            org_id,
+            list(keys),
+            list(hashes),
+            [jsonb(response) for response in responses],
+            list(status_codes),
+        ),
+    )
@@ -0,0 +1,254 @@
+"""Set-based write path shared by the native and Nirvana importers.
+
+Importers turn each source record into an :class:`ImportRecord`,
+:data:`SKIPPED` or the exception that made it invalid. :func:`run_bulk_import`
+stages records in batches and writes each batch with one ``INSERT ... SELECT
+FROM unnest(...)`` upsert plus one outbox insert and the matching
+``item_projection`` rows, committed together.
+
+Outcomes are applied in source order after each batch, so ``ImportSummary``
+counts and the ``on_progress(processed, totals)`` call sequence match the
+former row-by-row importers.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Final
+
+from ..config import settings
+from ..db import db_conn, jsonb
+from ..models import ImportSummary
+from ..outbox import enqueue_events
+from ..projection.items import refresh_item_projection
+from .shared import _hash_payload
+
+SKIPPED: Final = object()
+
+_UPSERT_COLUMNS_SQL = """
+    INSERT INTO items (
+        org_id,
+        created_by_user_id,
+        canonical_id,
+        schema_jsonld,
+        source,
+        content_hash,
+        created_at,
+        updated_at
+    )
+    SELECT %s, %s, t.canonical_id, t.schema_jsonld, t.source, t.content_hash,
+           t.created_at, t.updated_at
+    FROM unnest(
+        %s::text[], %s::jsonb[], %s::text[], %s::text[], %s::timestamptz[], %s::timestamptz[]
+    ) AS t(canonical_id, schema_jsonld, source, content_hash, created_at, updated_at)
+"""
+
+_UPSERT_UPDATE_SQL = (
+    _UPSERT_COLUMNS_SQL
+    + """
+    ON CONFLICT (org_id, canonical_id) DO UPDATE
+    SET schema_jsonld = EXCLUDED.schema_jsonld,
+        source = EXCLUDED.source,
+        content_hash = EXCLUDED.content_hash,
+        updated_at = EXCLUDED.updated_at
+    WHERE items.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING item_id, canonical_id, (xmax = 0) AS inserted
+"""
+)
+
+_UPSERT_INSERT_ONLY_SQL = (
+    _UPSERT_COLUMNS_SQL
+    + """
+    ON CONFLICT (org_id, canonical_id) DO NOTHING
+    RETURNING item_id, canonical_id, TRUE AS inserted
+"""
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    canonical_id: str
+    jsonld: dict
+    source: str
+    bucket: str
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+ImportEntry = ImportRecord | Exception | object
+
+
+@dataclass
+class _Pending:
+    index: int
+    entry: ImportEntry
+    outcome: str | None = None
+
+
+class _BulkImportRun:
+    def __init__(
+        self,
+        *,
+        org_id: str,
+        user_id: str,
+        dry_run: bool,
+        update_existing: bool,
+        emit_events: bool,
+        on_progress: Callable[[int, dict[str, int]], None] | None,
+    ) -> None:
+        self.org_id = org_id
+        self.user_id = user_id
+        self.dry_run = dry_run
+        self.update_existing = update_existing
+        self.emit_events = emit_events
+        self.on_progress = on_progress
+        self.totals: Counter[str] = Counter()
+        self.bucket_counts: Counter[str] = Counter()
+        self.completed_counts: Counter[str] = Counter()
+        self.sample_errors: list[str] = []
+
+    def _resolve_dry_run(self, cur, staged: list[_Pending]) -> None:  # noqa: ANN001
+        cur.execute(
+            """
+            SELECT canonical_id
+            FROM items
+            WHERE org_id = %s AND canonical_id = ANY(%s::text[])
+            """,
+            (self.org_id, [p.entry.canonical_id for p in staged]),
+        )
+        existing = {row["canonical_id"] for row in cur.fetchall()}
+        for pending in staged:
+            exists = pending.entry.canonical_id in existing
+            if exists and not self.update_existing:
+                pending.outcome = "skipped"
+            else:
+                pending.outcome = "updated" if exists else "created"
+
+    def _resolve_write(self, cur, staged: list[_Pending]) -> None:  # noqa: ANN001
+        records = [p.entry for p in staged]
+        cur.execute(
+            _UPSERT_UPDATE_SQL if self.update_existing else _UPSERT_INSERT_ONLY_SQL,
+            (
+                self.org_id,
+                self.user_id,
+                [r.canonical_id for r in records],
+                [jsonb(r.jsonld) for r in records],
+                [r.source for r in records],
+                [_hash_payload(r.jsonld) for r in records],
+                [r.created_at for r in records],
+                [r.updated_at for r in records],
+            ),
+        )
+        written = {row["canonical_id"]: row for row in cur.fetchall()}
+        miss_outcome = "unchanged" if self.update_existing else "skipped"
+        for pending in staged:
+            row = written.get(pending.entry.canonical_id)
+            if row is None:
+                pending.outcome = miss_outcome
+            else:
+                pending.outcome = "created" if row["inserted"] else "updated"
+
+        refresh_item_projection(cur, [row["item_id"] for row in written.values()])
+        if self.emit_events and written:
+            enqueue_events(
+                "item_upserted",
+                [
+                    {"item_id": str(written[r.canonical_id]["item_id"]), "org_id": self.org_id}
+                    for r in records
+                    if r.canonical_id in written
+                ],
+                cur=cur,
+            )
+
+    def _apply(self, pending: _Pending) -> None:
+        entry = pending.entry
+        if entry is SKIPPED:
+            self.totals["skipped"] += 1
+        elif isinstance(entry, Exception):
+            self.totals["errors"] += 1
+            if len(self.sample_errors) < 5:
+                self.sample_errors.append(f"item[{pending.index}] {entry}")
+        else:
+            assert pending.outcome is not None
+            self.totals[pending.outcome] += 1
+            if pending.outcome in {"created", "updated"}:
+                self.bucket_counts[entry.bucket] += 1
+                if entry.completed:
+                    self.completed_counts[entry.bucket] += 1
+        if self.on_progress:
+            self.on_progress(pending.index + 1, dict(self.totals))
+
+    def flush(self, conn, pending: list[_Pending]) -> None:  # noqa: ANN001
+        staged = [p for p in pending if isinstance(p.entry, ImportRecord)]
+        if staged:
+            with conn.cursor() as cur:
+                if self.dry_run:
+                    self._resolve_dry_run(cur, staged)
+                else:
+                    self._resolve_write(cur, staged)
+            if not self.dry_run:
+                conn.commit()
+        for item in pending:
+            self._apply(item)
+        pending.clear()
+
+
+def run_bulk_import(
+    entries: Iterable[ImportEntry],
+    *,
+    total: int | None,
+    org_id: str,
+    user_id: str,
+    dry_run: bool,
+    update_existing: bool,
+    emit_events: bool,
+    on_progress: Callable[[int, dict[str, int]], None] | None = None,
+    batch_size: int | None = None,
+) -> ImportSummary:
+    """Write prepared import entries in set-based batches.
+
+    A batch is flushed when it reaches ``batch_size`` records or when a
+    canonical id repeats, since one upsert statement cannot touch the same row
+    twice and the later record must see the earlier one. Only the current
+    batch is held in memory, so *entries* may be a lazy iterator; pass
+    ``total=None`` to report the number of entries consumed.
+    """
+    size = max(1, batch_size or settings.import_batch_size)
+    run = _BulkImportRun(
+        org_id=org_id,
+        user_id=user_id,
+        dry_run=dry_run,
+        update_existing=update_existing,
+        emit_events=emit_events,
+        on_progress=on_progress,
+    )
+
+    consumed = 0
+    with db_conn() as conn:
+        pending: list[_Pending] = []
+        staged_ids: set[str] = set()
+        for index, entry in enumerate(entries):
+            consumed = index + 1
+            if isinstance(entry, ImportRecord):
+                if entry.canonical_id in staged_ids or len(staged_ids) >= size:
+                    run.flush(conn, pending)
+                    staged_ids.clear()
+                staged_ids.add(entry.canonical_id)
+            pending.append(_Pending(index, entry))
+        run.flush(conn, pending)
+
+    return ImportSummary(
+        total=consumed if total is None else total,
+        created=run.totals["created"],
+        updated=run.totals["updated"],
+        unchanged=run.totals["unchanged"],
+        skipped=run.totals["skipped"],
+        errors=run.totals["errors"],
+        bucket_counts=dict(run.bucket_counts),
+        completed_counts=dict(run.completed_counts),
+        sample_errors=run.sample_errors,
+    )
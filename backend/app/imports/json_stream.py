@@ -0,0 +1,291 @@
+"""Incremental reader for JSON import files.
+
+Uploaded exports are either a top-level array of items or an object that
+wraps the array in ``items``, ``data`` or ``export``. :func:`scan_import_file`
+makes one validating pass that matches the grammar with regexes and counts
+items without building them. :class:`ImportFileItems` then re-reads the file
+and yields one decoded item at a time, so memory is bounded by the largest
+single item rather than by the export; a value longer than
+``_MAX_VALUE_CHARS`` is rejected instead of being buffered to EOF.
+
+Values are decoded with :meth:`json.JSONDecoder.raw_decode` over a sliding
+text buffer; only the array/object punctuation between values is handled
+here.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from ..storage import StorageBackend
+
+WRAPPER_KEYS = ("items", "data", "export")
+
+_CHUNK_CHARS = 1 << 16
+_MAX_VALUE_CHARS = 64 << 20
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+_WS = r"[ \t\n\r]*"
+_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_SCALAR = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null|NaN|-?Infinity"
+_PRIMITIVE = rf"(?:{_STRING}|{_SCALAR})"
+
+_PRIMITIVE_TOKEN = re.compile(rf"{_WS}{_PRIMITIVE}")
+
+
+def _segment(close: str, open_: str) -> re.Pattern[str]:
+    # Either the rest of the container up to its closing bracket, or the run up
+    # to the opening bracket of the next nested value.
+    return re.compile(rf"(?:{close})|(?:{open_})")
+
+
+_MEMBER = rf"{_WS}{_STRING}{_WS}:{_WS}{_PRIMITIVE}"
+_NESTED_KEY = rf"{_WS}{_STRING}{_WS}:{_WS}[\[{{]"
+_ELEMENT = rf"{_WS}{_PRIMITIVE}"
+
+# Flat runs between brackets, keyed by (closing bracket, resuming after a nested value).
+_SEGMENTS = {
+    ("}", False): _segment(
+        rf"(?:{_MEMBER}(?:{_WS},{_MEMBER})*)?{_WS}\}}",
+        rf"(?:{_MEMBER}{_WS},)*{_NESTED_KEY}",
+    ),
+    ("}", True): _segment(
+        rf"(?:{_WS},{_MEMBER})*{_WS}\}}",
+        rf"(?:{_WS},{_MEMBER})*{_WS},{_NESTED_KEY}",
+    ),
+    ("]", False): _segment(
+        rf"(?:{_ELEMENT}(?:{_WS},{_ELEMENT})*)?{_WS}\]",
+        rf"(?:{_ELEMENT}{_WS},)*{_WS}[\[{{]",
+    ),
+    ("]", True): _segment(
+        rf"(?:{_WS},{_ELEMENT})*{_WS}\]",
+        rf"(?:{_WS},{_ELEMENT})*{_WS},{_WS}[\[{{]",
+    ),
+}
+
+
+class ImportFileFormatError(ValueError):
+    """The file is valid JSON but does not contain an item array."""
+
+
+class _Reader:
+    def __init__(self, fh: TextIO) -> None:
+        self._fh = fh
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_chars: int = _CHUNK_CHARS) -> bool:
+        if self._eof:
+            return False
+        if len(self._buf) - self._pos >= _MAX_VALUE_CHARS:
+            raise json.JSONDecodeError(
+                f"Value longer than {_MAX_VALUE_CHARS} characters", self._buf, self._pos
+            )
+        chunk = self._fh.read(max(min_chars, _CHUNK_CHARS))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return None
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        if self.peek() is None:
+            raise json.JSONDecodeError("Expecting value", self._buf, self._pos)
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Probably a value cut by the chunk boundary: read at least as
+                # much again, so very large items cost O(n) and not O(n^2).
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+            # A number or literal that ends exactly at the buffer edge may continue.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _match(self, pattern: re.Pattern[str]) -> re.Match[str]:
+        while True:
+            match = pattern.match(self._buf, self._pos)
+            if match is not None:
+                return match
+            # Probably cut by the chunk boundary; _fill() caps how far this goes.
+            if not self._fill(len(self._buf) - self._pos):
+                raise json.JSONDecodeError("Expecting value", self._buf, self._pos)
+
+    def skip(self) -> None:
+        """Consume one value, checking its grammar without building it.
+
+        Runs of members and elements without nested containers are matched by
+        one regex each, so only brackets are handled in Python.
+        """
+        if self.peek() not in ("[", "{"):
+            match = self._match(_PRIMITIVE_TOKEN)
+            # A number or literal that ends exactly at the buffer edge may continue.
+            while match.end() == len(self._buf) and self._fill():
+                match = self._match(_PRIMITIVE_TOKEN)
+            self._pos = match.end()
+            return
+        closers = ["]" if self._buf[self._pos] == "[" else "}"]
+        self._pos += 1
+        after_value = False
+        while closers:
+            pattern = _SEGMENTS[closers[-1], after_value]
+            match = pattern.match(self._buf, self._pos) or self._match(pattern)
+            self._pos = end = match.end()
+            bracket = self._buf[end - 1]
+            if bracket in "]}":
+                closers.pop()
+                after_value = True
+            else:
+                closers.append("]" if bracket == "[" else "}")
+                after_value = False
+
+    def array(self, *, decode: bool = True) -> Iterator[Any]:
+        """Yield the array's elements, or ``None`` per element when not ``decode``."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            if decode:
+                yield self.value()
+            else:
+                self.skip()
+                yield None
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def members(self) -> Iterator[str]:
+        """Yield top-level object keys; the caller must consume each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def expect_end(self) -> None:
+        if self.peek() is not None:
+            raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+
+
+@dataclass(frozen=True)
+class ImportFileScan:
+    count: int
+    # Position of the wrapper member among the top-level keys; None for a bare array.
+    member_index: int | None = None
+
+
+def _open_text(storage: StorageBackend, key: str) -> TextIO:
+    return io.TextIOWrapper(storage.open(key), encoding="utf-8")
+
+
+def scan_import_file(storage: StorageBackend, key: str) -> ImportFileScan:
+    """Validate the file and count its items without keeping them.
+
+    Wrapper selection matches ``data.get("items") or data.get("data") or
+    data.get("export")``: the first of those keys with a truthy value wins.
+    Raises :class:`json.JSONDecodeError` for malformed JSON and
+    :class:`ImportFileFormatError` when no item array is found.
+    """
+    with _open_text(storage, key) as fh:
+        reader = _Reader(fh)
+        first = reader.peek()
+        if first == "[":
+            count = sum(1 for _ in reader.array(decode=False))
+            reader.expect_end()
+            return ImportFileScan(count=count)
+        if first != "{":
+            reader.value()
+            reader.expect_end()
+            raise ImportFileFormatError("JSON export must be a list of items")
+
+        # key -> (member index, is_list, truthy, count); later duplicates win like json.loads.
+        candidates: dict[str, tuple[int, bool, bool, int]] = {}
+        for index, member in enumerate(reader.members()):
+            if member not in WRAPPER_KEYS:
+                reader.skip()
+            elif reader.peek() == "[":
+                count = sum(1 for _ in reader.array(decode=False))
+                candidates[member] = (index, True, count > 0, count)
+            else:
+                candidates[member] = (index, False, bool(reader.value()), 0)
+        reader.expect_end()
+
+    for member in WRAPPER_KEYS:
+        if member in candidates and candidates[member][2]:
+            index, is_list, _, count = candidates[member]
+            if not is_list:
+                break
+            return ImportFileScan(count=count, member_index=index)
+    raise ImportFileFormatError("JSON export must be a list of items")
+
+
+class ImportFileItems:
+    """Re-iterable, lazily decoded view of the items of a scanned import file.
+
+    ``len()`` comes from the scan; every iteration re-opens the file.
+    """
+
+    def __init__(self, storage: StorageBackend, key: str, scan: ImportFileScan) -> None:
+        self._storage = storage
+        self._key = key
+        self._scan = scan
+
+    def __len__(self) -> int:
+        return self._scan.count
+
+    def __iter__(self) -> Iterator[Any]:
+        with _open_text(self._storage, self._key) as fh:
+            reader = _Reader(fh)
+            if self._scan.member_index is None:
+                yield from reader.array()
+                return
+            for index, _member in enumerate(reader.members()):
+                if index == self._scan.member_index:
+                    yield from reader.array()
+                    return
+                reader.skip()
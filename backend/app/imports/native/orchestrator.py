@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sized
 from datetime import UTC, datetime
 
 from fastapi import HTTPException, status
 
-from ...db import db_conn, jsonb
 from ...models import ImportSummary
-from ...outbox import enqueue_event
-from ..shared import _hash_payload
+from ..bulk import SKIPPED, ImportEntry, ImportRecord, run_bulk_import
 
 
 def _extract_bucket(jsonld: dict) -> str:
@@ -39,7 +36,7 @@ def _parse_iso(value: str | None) -> datetime | None:
 
 
 def run_native_import(
-    items: list[dict],
+    items: Iterable[dict],
     *,
     org_id: str,
     user_id: str,
@@ -54,185 +51,52 @@ def run_native_import(
 
     Each element is an ``ItemResponse`` dict with ``item`` (or legacy
     ``thing``) containing fully-formed JSON-LD.  No transformation is
-    needed -- the payload is upserted directly.
+    needed -- the payload is upserted directly in batches via
+    :func:`~app.imports.bulk.run_bulk_import`. *items* may be a lazily
+    parsed upload (:class:`~app.imports.json_stream.ImportFileItems`).
     """
-    if not isinstance(items, list):
+    if isinstance(items, str | bytes | dict) or not isinstance(items, Iterable):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="items must be a list",
         )
 
-    totals: Counter[str] = Counter()
-    bucket_counts: Counter[str] = Counter()
-    completed_counts: Counter[str] = Counter()
-    sample_errors: list[str] = []
-
-    with db_conn() as conn:
-        if not dry_run:
-            conn.autocommit = True
-        with conn.cursor() as cur:
-            for index, record in enumerate(items):
-                try:
-                    canonical_id = record.get("canonical_id")
-                    if not canonical_id:
-                        raise ValueError("missing canonical_id")  # noqa: TRY301
-
-                    # Backward compat: new exports use "item", old exports use "thing"
-                    jsonld = record.get("item") or record.get("thing")
-                    if not jsonld or not isinstance(jsonld, dict):
-                        raise ValueError("missing item/thing JSON-LD payload")  # noqa: TRY301
-
-                    bucket = _extract_bucket(jsonld)
-                    completed = _is_completed(jsonld)
-
-                    if completed and not include_completed:
-                        totals["skipped"] += 1
-                        if on_progress:
-                            on_progress(index + 1, dict(totals))
-                        continue
-
-                    content_hash = _hash_payload(jsonld)
-                    item_source = record.get("source", source)
-                    created_dt = _parse_iso(record.get("created_at")) or datetime.now(UTC)
-                    updated_dt = _parse_iso(record.get("updated_at")) or datetime.now(UTC)
-
-                except Exception as exc:  # noqa: BLE001
-                    totals["errors"] += 1
-                    if len(sample_errors) < 5:
-                        sample_errors.append(f"item[{index}] {exc}")
-                    if on_progress:
-                        on_progress(index + 1, dict(totals))
+    def _entries() -> Iterator[ImportEntry]:
+        for record in items:
+            try:
+                canonical_id = record.get("canonical_id")
+                if not canonical_id:
+                    raise ValueError("missing canonical_id")  # noqa: TRY301
+
+                # Backward compat: new exports use "item", old exports use "thing"
+                jsonld = record.get("item") or record.get("thing")
+                if not jsonld or not isinstance(jsonld, dict):
+                    raise ValueError("missing item/thing JSON-LD payload")  # noqa: TRY301
+
+                completed = _is_completed(jsonld)
+                if completed and not include_completed:
+                    yield SKIPPED
                     continue
 
-                if dry_run:
-                    cur.execute(
-                        """
-                        SELECT 1
-                        FROM items
-                        WHERE org_id = %s AND canonical_id = %s
-                        """,
-                        (org_id, canonical_id),
-                    )
-                    exists = cur.fetchone() is not None
-                    if exists and not update_existing:
-                        totals["skipped"] += 1
-                        if on_progress:
-                            on_progress(index + 1, dict(totals))
-                        continue
-                    if exists:
-                        totals["updated"] += 1
-                    else:
-                        totals["created"] += 1
-                    bucket_counts[bucket] += 1
-                    if completed:
-                        completed_counts[bucket] += 1
-                    if on_progress:
-                        on_progress(index + 1, dict(totals))
-                    continue
-
-                if update_existing:
-                    cur.execute(
-                        """
-                        INSERT INTO items (
-                            org_id,
-                            created_by_user_id,
-                            canonical_id,
-                            schema_jsonld,
-                            source,
-                            content_hash,
-                            created_at,
-                            updated_at
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (org_id, canonical_id) DO UPDATE
-                        SET schema_jsonld = EXCLUDED.schema_jsonld,
-                            source = EXCLUDED.source,
-                            content_hash = EXCLUDED.content_hash,
-                            updated_at = EXCLUDED.updated_at
-                        WHERE items.content_hash IS DISTINCT FROM EXCLUDED.content_hash
-                        RETURNING item_id, (xmax = 0) AS inserted
-                        """,
-                        (
-                            org_id,
-                            user_id,
-                            canonical_id,
-                            jsonb(jsonld),
-                            item_source,
-                            content_hash,
-                            created_dt,
-                            updated_dt,
-                        ),
-                    )
-                    row = cur.fetchone()
-                    if row is None:
-                        totals["unchanged"] += 1
-                        if on_progress:
-                            on_progress(index + 1, dict(totals))
-                        continue
-                    inserted = bool(row.get("inserted"))
-                    if inserted:
-                        totals["created"] += 1
-                    else:
-                        totals["updated"] += 1
-                    bucket_counts[bucket] += 1
-                    if completed:
-                        completed_counts[bucket] += 1
-                else:
-                    cur.execute(
-                        """
-                        INSERT INTO items (
-                            org_id,
-                            created_by_user_id,
-                            canonical_id,
-                            schema_jsonld,
-                            source,
-                            content_hash,
-                            created_at,
-                            updated_at
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (org_id, canonical_id) DO NOTHING
-                        RETURNING item_id
-                        """,
-                        (
-                            org_id,
-                            user_id,
-                            canonical_id,
-                            jsonb(jsonld),
-                            item_source,
-                            content_hash,
-                            created_dt,
-                            updated_dt,
-                        ),
-                    )
-                    row = cur.fetchone()
-                    if row is None:
-                        totals["skipped"] += 1
-                        if on_progress:
-                            on_progress(index + 1, dict(totals))
-                        continue
-                    totals["created"] += 1
-                    bucket_counts[bucket] += 1
-                    if completed:
-                        completed_counts[bucket] += 1
-
-                if emit_events and row:
-                    enqueue_event(
-                        "item_upserted",
-                        {"item_id": str(row["item_id"]), "org_id": org_id},
-                    )
-
-                if on_progress:
-                    on_progress(index + 1, dict(totals))
-
-    return ImportSummary(
-        total=len(items),
-        created=totals["created"],
-        updated=totals["updated"],
-        unchanged=totals["unchanged"],
-        skipped=totals["skipped"],
-        errors=totals["errors"],
-        bucket_counts=dict(bucket_counts),
-        completed_counts=dict(completed_counts),
-        sample_errors=sample_errors,
+                yield ImportRecord(
+                    canonical_id=canonical_id,
+                    jsonld=jsonld,
+                    source=record.get("source", source),
+                    bucket=_extract_bucket(jsonld),
+                    completed=completed,
+                    created_at=_parse_iso(record.get("created_at")) or datetime.now(UTC),
+                    updated_at=_parse_iso(record.get("updated_at")) or datetime.now(UTC),
+                )
+            except Exception as exc:  # noqa: BLE001
+                yield exc
+
+    return run_bulk_import(
+        _entries(),
+        total=len(items) if isinstance(items, Sized) else None,
+        org_id=org_id,
+        user_id=user_id,
+        dry_run=dry_run,
+        update_existing=update_existing,
+        emit_events=emit_events,
+        on_progress=on_progress,
     )
@@ -12,6 +12,7 @@ from ..db import db_conn, jsonb
 from ..models import ImportJobResponse
 from ..observability import get_logger
 from ..storage import get_storage
+from .json_stream import ImportFileFormatError, ImportFileItems, scan_import_file
 
 logger = get_logger("imports")
 
@@ -112,33 +113,39 @@ def _build_base_entity(
     return entity
 
 
-def _load_items_from_file(file_row: dict) -> list[dict]:
+def _load_items_from_file(file_row: dict) -> ImportFileItems:
+    """Validate an uploaded export and return a lazily parsed view of its items.
+
+    The file is scanned once up front so invalid files fail before any write
+    and ``len()`` gives the progress total; items are decoded on iteration.
+    """
     storage = get_storage()
     storage_key = file_row.get("storage_path") or ""
     if not storage.exists(storage_key):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
     try:
-        raw = storage.read_text(storage_key, encoding="utf-8")
-    except Exception as exc:  # noqa: BLE001
+        scan = scan_import_file(storage, storage_key)
+    except ImportFileFormatError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="JSON export must be a list of items",
+        ) from exc
+    except UnicodeDecodeError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Unable to read file",
         ) from exc
-    try:
-        data = json.loads(raw)
-    except Exception as exc:  # noqa: BLE001
+    except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid JSON file",
         ) from exc
-    if isinstance(data, dict):
-        data = data.get("items") or data.get("data") or data.get("export")
-    if not isinstance(data, list):
+    except Exception as exc:  # noqa: BLE001
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="JSON export must be a list of items",
-        )
-    return data
+            detail="Unable to read file",
+        ) from exc
+    return ImportFileItems(storage, storage_key, scan)
 
 
 def _get_file_row(file_id: str, org_id: str) -> dict:
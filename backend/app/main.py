@@ -15,12 +15,17 @@ from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse, Response
 from slowapi.errors import RateLimitExceeded
 
+from .auth_cache import AUTH_CACHE_NOTIFY_CHANNEL, flush_last_seen
+from .auth_cache import handle_notify as handle_auth_cache_notify
 from .chat import router as chat_router
+from .chat.routes import stop_background_tasks as stop_chat_background_tasks
+from .chat.upstream import close_clients as close_chat_upstream_clients
 from .config import settings
 from .csrf import should_validate_csrf, validate_csrf_request
-from .db import db_conn
+from .db import close_async_pool, close_pool, db_conn, open_async_pool, refresh_pool_metrics
 from .deps import ORG_ID_HEADER
 from .email import routes as email_routes
+from .email.google_client import close_client as close_google_client
 from .metrics import (
     dec_in_flight_requests,
     inc_in_flight_requests,
@@ -29,6 +34,12 @@ from .metrics import (
     observe_http_request,
     refresh_queue_metrics,
 )
+from .notification_hub import (
+    refresh_notification_hub_metrics,
+    register_channel_handler,
+    start_notification_hub,
+    stop_notification_hub,
+)
 from .observability import (
     REQUEST_ID_HEADER,
     TRAIL_ID_HEADER,
@@ -41,6 +52,7 @@ from .observability import (
     generate_trail_id,
     get_logger,
 )
+from .pdf_render import shutdown_render_pool
 from .rate_limit import limiter
 from .routes import (
     agent_settings,
@@ -58,6 +70,7 @@ from .routes import (
     schemas,
     search,
 )
+from .search.meili import close_clients as close_meili_clients
 from .tracing import configure_tracing, shutdown_tracing
 
 configure_logging()
@@ -136,9 +149,22 @@ async def lifespan(application: FastAPI):
         port=port,
     )
     tracer_provider = configure_tracing(application)
+    await open_async_pool()
+    register_channel_handler(AUTH_CACHE_NOTIFY_CHANNEL, handle_auth_cache_notify)
+    await start_notification_hub()
     try:
         yield
     finally:
+        await stop_notification_hub()
+        flush_last_seen()
+        await close_meili_clients()
+        # Chat turns stream through the pooled clients; finish or cancel them first.
+        await stop_chat_background_tasks()
+        await close_chat_upstream_clients()
+        close_google_client()
+        shutdown_render_pool()
+        await close_async_pool()
+        close_pool()
         shutdown_tracing(tracer_provider)
         logger.info(
             "app.shutdown",
@@ -559,6 +585,8 @@ def health_check():
 @app.get("/metrics", include_in_schema=False)
 def prometheus_metrics():
     refresh_queue_metrics()
+    refresh_pool_metrics()
+    refresh_notification_hub_metrics()
     return Response(content=metrics_payload(), media_type=metrics_content_type())
 
 
@@ -64,6 +64,116 @@ APP_QUEUE_DEAD_LETTERED = Gauge(
     ["queue"],
 )
 
+APP_NOTIFICATION_HUB_SUBSCRIBERS = Gauge(
+    "app_notification_hub_subscribers",
+    "Notification SSE streams currently subscribed to this worker's hub.",
+)
+
+APP_NOTIFICATION_HUB_QUEUE_DEPTH = Gauge(
+    "app_notification_hub_queue_depth",
+    "Notification events buffered in subscriber queues, not yet sent to clients.",
+)
+
+APP_NOTIFICATION_HUB_CONNECTED = Gauge(
+    "app_notification_hub_connected",
+    "Whether the hub's LISTEN connection is established (1) or not (0).",
+)
+
+APP_NOTIFICATION_HUB_EVICTIONS_TOTAL = Counter(
+    "app_notification_hub_evictions_total",
+    "Notification subscribers dropped from the hub, by reason.",
+    ["reason"],
+)
+
+APP_MEILI_REQUEST_DURATION_SECONDS = Histogram(
+    "app_meili_request_duration_seconds",
+    "Meilisearch request latency by endpoint and outcome.",
+    ["endpoint", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+APP_MEILI_CIRCUIT_OPEN = Gauge(
+    "app_meili_circuit_open",
+    "Whether the Meilisearch circuit breaker is open (1) or closed (0).",
+)
+
+APP_MEILI_REJECTED_TOTAL = Counter(
+    "app_meili_rejected_total",
+    "Meilisearch calls rejected without a request because the circuit was open.",
+)
+
+APP_AUTH_CACHE_LOOKUPS_TOTAL = Counter(
+    "app_auth_cache_lookups_total",
+    "Session and org-membership cache lookups, by cache and hit/miss.",
+    ["cache", "result"],
+)
+
+APP_AUTH_CACHE_INVALIDATIONS_TOTAL = Counter(
+    "app_auth_cache_invalidations_total",
+    "Auth cache invalidations applied in this process, by kind.",
+    ["kind"],
+)
+
+APP_AUTH_LAST_SEEN_FLUSHED_TOTAL = Counter(
+    "app_auth_last_seen_flushed_total",
+    "Sessions whose coalesced last_seen_at was written to the database.",
+)
+
+APP_VALIDATION_CACHE_LOOKUPS_TOTAL = Counter(
+    "app_validation_cache_lookups_total",
+    "Memoized item validation and CEL rule lookups, by cache and hit/miss.",
+    ["cache", "result"],
+)
+
+APP_VALIDATION_CACHE_INVALIDATIONS_TOTAL = Counter(
+    "app_validation_cache_invalidations_total",
+    "Validation caches emptied because entities.ttl or business_rules.json changed.",
+    ["source"],
+)
+
+APP_PDF_RENDER_QUEUE_DEPTH = Gauge(
+    "app_pdf_render_queue_depth",
+    "PDF renders submitted to the render pool and not yet finished.",
+)
+
+APP_PDF_RENDER_DURATION_SECONDS = Histogram(
+    "app_pdf_render_duration_seconds",
+    "PDF render time including pool queueing, by template and outcome.",
+    ["template", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+APP_PDF_RENDER_CACHE_TOTAL = Counter(
+    "app_pdf_render_cache_total",
+    "PDF render requests answered from an existing file (hit) or rendered (miss).",
+    ["result"],
+)
+
+APP_GOOGLE_API_REQUEST_DURATION_SECONDS = Histogram(
+    "app_google_api_request_duration_seconds",
+    "Google API request latency (Gmail, Calendar, OAuth) by endpoint and outcome.",
+    ["endpoint", "outcome"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+APP_GOOGLE_API_QUOTA_ERRORS_TOTAL = Counter(
+    "app_google_api_quota_errors_total",
+    "Google API responses signalling quota or rate limits (429, 403 rate-limit reasons).",
+    ["endpoint"],
+)
+
+APP_GOOGLE_API_COALESCED_TOTAL = Counter(
+    "app_google_api_coalesced_total",
+    "GET requests answered by an identical request already in flight.",
+    ["endpoint"],
+)
+
+APP_GOOGLE_TOKEN_CACHE_TOTAL = Counter(
+    "app_google_token_cache_total",
+    "Google access token lookups served from the in-memory cache (hit) or not (miss).",
+    ["result"],
+)
+
 # ---------------------------------------------------------------------------
 # Business metrics
 # ---------------------------------------------------------------------------
@@ -542,6 +542,34 @@ class ItemResponse(BaseModel):
     updated_at: str
 
 
+class ItemBatchEntry(ItemCreateRequest):
+    idempotency_key: str | None = Field(
+        default=None,
+        description="Per-item idempotency key for safe retries of this entry.",
+    )
+
+
+class ItemBatchRequest(BaseModel):
+    items: list[ItemBatchEntry] = Field(
+        ...,
+        min_length=1,
+        description="Items to create or replace, at most ITEMS_BATCH_MAX_ITEMS.",
+    )
+
+
+class ItemBatchResult(BaseModel):
+    index: int = Field(..., description="Position of the entry in the request.")
+    canonical_id: str | None = None
+    status: Literal["created", "updated", "unchanged", "error"]
+    status_code: int = Field(..., description="HTTP status the entry would get on its own.")
+    item: ItemResponse | None = None
+    error: dict[str, Any] | None = None
+
+
+class ItemBatchResponse(BaseModel):
+    results: list[ItemBatchResult]
+
+
 class AssertionCreateRequest(BaseModel):
     item_id: str
     assertion_type: str
@@ -0,0 +1,307 @@
+"""Process-wide LISTEN/NOTIFY fan-out for notification SSE streams.
+
+One listener connection per API worker receives ``notification_events``
+NOTIFY payloads and demultiplexes them by ``(org_id, user_id)`` into bounded
+in-memory queues, one per connected SSE stream.
+
+Queue items are either a serialized notification event (when the NOTIFY
+payload carried one) or :data:`RESYNC`, which tells the stream to replay
+from its cursor via :func:`list_notification_events_async`. RESYNC is sent
+after the listener reconnects (NOTIFYs may have been missed) and for
+payloads that did not fit the inline event.
+
+A subscriber whose queue is full is evicted: it is dropped from the fan-out
+and its stream ends, so the client reconnects with its ``Last-Event-ID``
+cursor instead of the worker buffering without bound.
+
+Other in-process consumers can share the connection by registering a
+channel handler with :func:`register_channel_handler` before the hub starts.
+Handlers get each payload, and ``None`` after a reconnect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+import psycopg
+from psycopg import sql
+
+from .config import settings
+from .metrics import (
+    APP_NOTIFICATION_HUB_CONNECTED,
+    APP_NOTIFICATION_HUB_EVICTIONS_TOTAL,
+    APP_NOTIFICATION_HUB_QUEUE_DEPTH,
+    APP_NOTIFICATION_HUB_SUBSCRIBERS,
+)
+from .notifications import NOTIFICATION_NOTIFY_CHANNEL
+from .observability import get_logger
+
+logger = get_logger("notification_hub")
+
+RESYNC: Final = object()
+
+_RECONNECT_BACKOFF_SECONDS = (0.5, 1.0, 2.0, 5.0, 10.0)
+
+ScopeKey = tuple[str, str]
+ChannelHandler = Callable[[str | None], None]
+
+
+@dataclass(eq=False)
+class Subscription:
+    org_id: str
+    user_id: str
+    queue: asyncio.Queue[Any]
+    evicted: bool = False
+    closed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def key(self) -> ScopeKey:
+        return (self.org_id, self.user_id)
+
+    async def get(self, timeout: float) -> Any | None:
+        """Return the next queued item, or ``None`` on timeout or eviction."""
+        if not self.queue.empty():
+            return self.queue.get_nowait()
+        if self.evicted:
+            return None
+        getter = asyncio.ensure_future(self.queue.get())
+        closer = asyncio.ensure_future(self.closed.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {getter, closer},
+                timeout=max(0.0, timeout),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            closer.cancel()
+            if not getter.done():
+                getter.cancel()
+        if getter in done and not getter.cancelled():
+            return getter.result()
+        return None
+
+
+class NotificationHub:
+    def __init__(
+        self,
+        *,
+        queue_size: int,
+        channel_handlers: dict[str, ChannelHandler] | None = None,
+    ) -> None:
+        self._queue_size = max(1, queue_size)
+        self._channel_handlers = dict(channel_handlers or {})
+        self._subscribers: dict[ScopeKey, set[Subscription]] = defaultdict(set)
+        self._task: asyncio.Task[None] | None = None
+        self._connected = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def listening(self, channel: str) -> bool:
+        """Whether NOTIFYs on a registered extra *channel* are being delivered now."""
+        return self._connected and channel in self._channel_handlers
+
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def queue_depth(self) -> int:
+        return sum(sub.queue.qsize() for subs in self._subscribers.values() for sub in subs)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="notification-hub-listener")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._set_connected(False)
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                self._evict(sub, reason="shutdown")
+
+    # -- subscriptions -----------------------------------------------------
+
+    def subscribe(self, *, org_id: str, user_id: str) -> Subscription:
+        sub = Subscription(
+            org_id=org_id,
+            user_id=user_id,
+            queue=asyncio.Queue(maxsize=self._queue_size),
+        )
+        self._subscribers[sub.key].add(sub)
+        APP_NOTIFICATION_HUB_SUBSCRIBERS.set(float(self.subscriber_count()))
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.key)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                self._subscribers.pop(sub.key, None)
+        APP_NOTIFICATION_HUB_SUBSCRIBERS.set(float(self.subscriber_count()))
+
+    def _evict(self, sub: Subscription, *, reason: str) -> None:
+        sub.evicted = True
+        sub.closed.set()
+        self.unsubscribe(sub)
+        if reason != "shutdown":
+            APP_NOTIFICATION_HUB_EVICTIONS_TOTAL.labels(reason=reason).inc()
+            logger.info(
+                "notification_hub.subscriber_evicted",
+                reason=reason,
+                queue_size=self._queue_size,
+            )
+
+    def _offer(self, sub: Subscription, item: Any) -> None:
+        try:
+            sub.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._evict(sub, reason="slow_consumer")
+
+    # -- dispatch ----------------------------------------------------------
+
+    def dispatch(self, payload: str | None) -> int:
+        """Route one NOTIFY payload to matching subscribers; return the fan-out count."""
+        try:
+            parsed = json.loads(payload) if payload else None
+        except json.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            # Unscoped payload: every stream has to re-check its own cursor.
+            return self.broadcast_resync()
+
+        key = (str(parsed.get("org_id")), str(parsed.get("user_id")))
+        subs = self._subscribers.get(key)
+        if not subs:
+            return 0
+        event = parsed.get("event")
+        item = event if isinstance(event, dict) else RESYNC
+        targets = list(subs)
+        for sub in targets:
+            self._offer(sub, item)
+        return len(targets)
+
+    def broadcast_resync(self) -> int:
+        targets = [sub for subs in self._subscribers.values() for sub in subs]
+        for sub in targets:
+            self._offer(sub, RESYNC)
+        return len(targets)
+
+    # -- listener ----------------------------------------------------------
+
+    def _set_connected(self, value: bool) -> None:
+        self._connected = value
+        APP_NOTIFICATION_HUB_CONNECTED.set(1.0 if value else 0.0)
+
+    async def _listen_once(self) -> None:
+        channel = NOTIFICATION_NOTIFY_CHANNEL
+        async with await psycopg.AsyncConnection.connect(
+            settings.database_url,
+            autocommit=True,
+        ) as conn:
+            async with conn.cursor() as cur:
+                for name in (channel, *self._channel_handlers):
+                    # nosemgrep: sqlalchemy-execute-raw-query
+                    await cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(name)))
+            self._set_connected(True)
+            logger.info(
+                "notification_hub.listen_ready",
+                channel=channel,
+                extra_channels=sorted(self._channel_handlers),
+            )
+            # Anything committed while we were disconnected was not delivered.
+            self.broadcast_resync()
+            for name in self._channel_handlers:
+                self._call_handler(name, None)
+            async for notification in conn.notifies():
+                if notification.channel == channel:
+                    self.dispatch(notification.payload)
+                else:
+                    self._call_handler(notification.channel, notification.payload)
+
+    def _call_handler(self, channel: str, payload: str | None) -> None:
+        handler = self._channel_handlers.get(channel)
+        if handler is None:
+            return
+        try:
+            handler(payload)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "notification_hub.channel_handler_failed",
+                channel=channel,
+                exc_info=True,
+            )
+
+    async def _run(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self._listen_once()
+                attempt = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("notification_hub.listen_failed", attempt=attempt, exc_info=True)
+            self._set_connected(False)
+            delay = _RECONNECT_BACKOFF_SECONDS[min(attempt, len(_RECONNECT_BACKOFF_SECONDS) - 1)]
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+_hub: NotificationHub | None = None
+_channel_handlers: dict[str, ChannelHandler] = {}
+
+
+def register_channel_handler(channel: str, handler: ChannelHandler) -> None:
+    """Also LISTEN on *channel* and pass its payloads to *handler* (call before start)."""
+    _channel_handlers[channel] = handler
+
+
+def get_notification_hub() -> NotificationHub | None:
+    """Return the running hub of this process, if the API lifespan started one."""
+    if _hub is None or not _hub.running:
+        return None
+    return _hub
+
+
+async def start_notification_hub() -> NotificationHub | None:
+    global _hub
+    if not settings.notification_hub_enabled:
+        return None
+    if _hub is None:
+        _hub = NotificationHub(
+            queue_size=settings.notification_hub_queue_size,
+            channel_handlers=_channel_handlers,
+        )
+    _hub.start()
+    return _hub
+
+
+async def stop_notification_hub() -> None:
+    global _hub
+    hub, _hub = _hub, None
+    if hub is not None:
+        await hub.stop()
+
+
+def refresh_notification_hub_metrics() -> None:
+    hub = _hub
+    APP_NOTIFICATION_HUB_SUBSCRIBERS.set(float(hub.subscriber_count() if hub else 0))
+    APP_NOTIFICATION_HUB_QUEUE_DEPTH.set(float(hub.queue_depth() if hub else 0))
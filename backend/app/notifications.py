@@ -13,11 +13,13 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from .db import db_conn, jsonb
+from .db import async_db_conn, db_conn, jsonb
 from .push_events import enqueue_push_payload
 
 NOTIFICATION_NOTIFY_CHANNEL = "notification_events"
 _NOTIFICATION_NOTIFY_SQL = "SELECT pg_notify(%s, %s)"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+_NOTIFY_PAYLOAD_MAX_BYTES = 7500
 
 
 def _serialize_event_row(row: dict[str, Any]) -> dict[str, Any]:
@@ -44,6 +46,23 @@ def _serialize_event_row(row: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _notify_payload(*, org_id: str, user_id: str, event: dict[str, Any]) -> str:
+    """Build the NOTIFY payload, inlining the event when it fits.
+
+    Listeners can then fan the event out without reading it back; oversized
+    events are announced by id only and subscribers replay from their cursor.
+    """
+    envelope: dict[str, Any] = {
+        "org_id": org_id,
+        "user_id": user_id,
+        "event_id": event["event_id"],
+    }
+    inlined = json.dumps({**envelope, "event": event}, separators=(",", ":"), default=str)
+    if len(inlined.encode("utf-8")) <= _NOTIFY_PAYLOAD_MAX_BYTES:
+        return inlined
+    return json.dumps(envelope, separators=(",", ":"))
+
+
 def create_notification_event(
     *,
     org_id: str,
@@ -77,13 +96,10 @@ def create_notification_event(
             )
             row = cur.fetchone()
             if row is not None:
-                notify_payload = json.dumps(
-                    {
-                        "org_id": org_id,
-                        "user_id": user_id,
-                        "event_id": str(row["event_id"]),
-                    },
-                    separators=(",", ":"),
+                notify_payload = _notify_payload(
+                    org_id=org_id,
+                    user_id=user_id,
+                    event=_serialize_event_row(row),
                 )
                 cur.execute(
                     _NOTIFICATION_NOTIFY_SQL,
@@ -109,6 +125,38 @@ def create_notification_event(
     return event
 
 
+_LIST_EVENTS_SQL = """
+    SELECT *
+    FROM notification_events
+    WHERE org_id = %s AND user_id = %s
+    ORDER BY created_at ASC
+    LIMIT %s
+"""
+
+_LIST_EVENTS_SINCE_SQL = """
+    SELECT *
+    FROM notification_events
+    WHERE org_id = %s
+      AND user_id = %s
+      AND created_at > %s
+    ORDER BY created_at ASC
+    LIMIT %s
+"""
+
+
+def _list_events_query(
+    *,
+    org_id: str,
+    user_id: str,
+    since: datetime | None,
+    limit: int,
+) -> tuple[str, tuple[Any, ...]]:
+    safe_limit = min(max(limit, 1), 500)
+    if since is None:
+        return _LIST_EVENTS_SQL, (org_id, user_id, safe_limit)
+    return _LIST_EVENTS_SINCE_SQL, (org_id, user_id, since, safe_limit)
+
+
 def list_notification_events(
     *,
     org_id: str,
@@ -116,38 +164,30 @@ def list_notification_events(
     since: datetime | None = None,
     limit: int = 50,
 ) -> list[dict[str, Any]]:
-    safe_limit = min(max(limit, 1), 500)
-
+    query, params = _list_events_query(org_id=org_id, user_id=user_id, since=since, limit=limit)
     with db_conn() as conn:
         with conn.cursor() as cur:
-            if since is None:
-                cur.execute(
-                    """
-                    SELECT *
-                    FROM notification_events
-                    WHERE org_id = %s AND user_id = %s
-                    ORDER BY created_at ASC
-                    LIMIT %s
-                    """,
-                    (org_id, user_id, safe_limit),
-                )
-            else:
-                cur.execute(
-                    """
-                    SELECT *
-                    FROM notification_events
-                    WHERE org_id = %s
-                      AND user_id = %s
-                      AND created_at > %s
-                    ORDER BY created_at ASC
-                    LIMIT %s
-                    """,
-                    (org_id, user_id, since, safe_limit),
-                )
+            cur.execute(query, params)
             rows = cur.fetchall()
     return [_serialize_event_row(row) for row in rows]
 
 
+async def list_notification_events_async(
+    *,
+    org_id: str,
+    user_id: str,
+    since: datetime | None = None,
+    limit: int = 50,
+) -> list[dict[str, Any]]:
+    """Event-loop variant of :func:`list_notification_events` for SSE streams."""
+    query, params = _list_events_query(org_id=org_id, user_id=user_id, since=since, limit=limit)
+    async with async_db_conn() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(query, params)
+            rows = await cur.fetchall()
+    return [_serialize_event_row(row) for row in rows]
+
+
 def parse_notification_cursor(cursor: str | None) -> datetime | None:
     if not cursor:
         return None
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from .db import jsonb
+from .projection.items import refresh_item_projection
 
 
 def create_org_knowledge_documents(
@@ -44,6 +45,7 @@ def create_org_knowledge_documents(
         if row is None:
             raise RuntimeError("Failed to create org knowledge document")
         doc_ids[doc_type] = row["item_id"]
+    refresh_item_projection(cur, doc_ids.values())
 
     cur.execute(
         """
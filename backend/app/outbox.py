@@ -8,16 +8,26 @@ _INSERT_SQL = """
 INSERT INTO outbox_events (event_type, payload, created_at)
 VALUES (%s, %s, %s)
 """
+_INSERT_MANY_SQL = """
+INSERT INTO outbox_events (event_type, payload, created_at)
+SELECT %s, payload, %s
+FROM unnest(%s::jsonb[]) WITH ORDINALITY AS t(payload, ord)
+ORDER BY ord
+"""
 _NOTIFY_SQL = "SELECT pg_notify(%s, %s)"
 OUTBOX_NOTIFY_CHANNEL = "outbox_events"
 
 
-def enqueue_event(event_type: str, payload: dict, *, cur=None) -> None:
+def _enrich(payload: dict) -> dict:
     context = get_request_context()
     enriched = dict(payload)
     if context.get("request_id") or context.get("user_id"):
         enriched["_context"] = {key: value for key, value in context.items() if value is not None}
-    params = (event_type, jsonb(enriched), datetime.now(UTC))
+    return enriched
+
+
+def enqueue_event(event_type: str, payload: dict, *, cur=None) -> None:
+    params = (event_type, jsonb(_enrich(payload)), datetime.now(UTC))
     if cur is not None:
         cur.execute(_INSERT_SQL, params)
         cur.execute(_NOTIFY_SQL, (settings.outbox_notify_channel, event_type))
@@ -27,3 +37,17 @@ def enqueue_event(event_type: str, payload: dict, *, cur=None) -> None:
                 c.execute(_INSERT_SQL, params)
                 c.execute(_NOTIFY_SQL, (settings.outbox_notify_channel, event_type))
             conn.commit()
+
+
+def enqueue_events(event_type: str, payloads: list[dict], *, cur) -> None:
+    """Insert one outbox row per payload with a single statement and one NOTIFY.
+
+    Runs on the caller's cursor so the rows commit with the caller's writes.
+    """
+    if not payloads:
+        return
+    cur.execute(
+        _INSERT_MANY_SQL,
+        (event_type, datetime.now(UTC), [jsonb(_enrich(payload)) for payload in payloads]),
+    )
+    cur.execute(_NOTIFY_SQL, (settings.outbox_notify_channel, event_type))
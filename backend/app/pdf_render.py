@@ -0,0 +1,184 @@
+"""PDF render pool with a content-addressed result cache.
+
+WeasyPrint renders are CPU-bound and can take seconds for a long CV, so they
+run in a bounded process pool instead of on the API's threadpool. Worker
+processes are warmed up once (templates, base CSS, font configuration) and
+replaced after ``PDF_RENDER_MAX_TASKS_PER_WORKER`` renders. At most
+``PDF_RENDER_MAX_QUEUE`` renders may be pending per API process; beyond that
+:func:`render_pdf` raises :class:`RenderQueueFull`.
+
+Identical inputs are not rendered twice: :func:`render_cache_key` hashes the
+template, the input payload, the CSS and the bundled templates, and the
+``files`` row of an earlier render with that key is reused. Concurrent
+requests for the same key share one render.
+
+``PDF_RENDER_WORKERS=0`` renders on a single in-process thread instead (dev,
+tests, or hosts where spawning processes is not wanted).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Literal
+
+from . import document_renderer
+from .config import settings
+from .metrics import (
+    APP_PDF_RENDER_CACHE_TOTAL,
+    APP_PDF_RENDER_DURATION_SECONDS,
+    APP_PDF_RENDER_QUEUE_DEPTH,
+)
+from .observability import get_logger
+
+logger = get_logger("pdf-render")
+
+RenderTemplate = Literal["cv", "markdown"]
+
+# Bump when the render pipeline changes in a way the template fingerprint
+# does not capture (e.g. WeasyPrint options).
+_CACHE_KEY_VERSION = 1
+
+
+class RenderQueueFull(RuntimeError):
+    """Too many renders are pending in this process."""
+
+
+_executor: Executor | None = None
+# Renders submitted to the executor and not finished yet. A render that timed
+# out keeps running in its worker, so it is released by the executor future,
+# not by the request that gave up on it.
+_pending = 0
+_pending_lock = threading.Lock()
+_inflight: dict[str, asyncio.Future[bytes]] = {}
+
+
+def render_cache_key(template: RenderTemplate, payload: Any, css: str) -> str:
+    """Content hash of one render's inputs."""
+    material = json.dumps(
+        {
+            "version": _CACHE_KEY_VERSION,
+            "templates": document_renderer.template_fingerprint(),
+            "template": template,
+            "payload": payload,
+            "css": css,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if settings.pdf_render_workers > 0:
+            # spawn: forking a process that runs an event loop and DB pools
+            # is unsafe, and max_tasks_per_child requires it anyway.
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.pdf_render_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=document_renderer.warm_up,
+                max_tasks_per_child=max(1, settings.pdf_render_max_tasks_per_worker),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+    return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_sync(template: RenderTemplate, payload: Any, css: str) -> bytes:
+    if template == "markdown":
+        return document_renderer.render_markdown_to_pdf(payload, css)
+    return document_renderer.render_cv_to_pdf(payload, css)
+
+
+def _release(_future: Future[bytes] | None = None) -> None:
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+        APP_PDF_RENDER_QUEUE_DEPTH.set(_pending)
+
+
+async def _render(template: RenderTemplate, payload: Any, css: str) -> bytes:
+    global _pending
+    with _pending_lock:
+        full = _pending >= settings.pdf_render_max_queue
+        if not full:
+            _pending += 1
+            APP_PDF_RENDER_QUEUE_DEPTH.set(_pending)
+    if full:
+        APP_PDF_RENDER_DURATION_SECONDS.labels(template=template, outcome="rejected").observe(0)
+        raise RenderQueueFull("Too many PDF renders in progress")
+
+    started = time.monotonic()
+    outcome = "error"
+    try:
+        try:
+            future = _get_executor().submit(_render_sync, template, payload, css)
+        except BaseException:
+            _release()
+            raise
+        future.add_done_callback(_release)
+        pdf_bytes = await asyncio.wait_for(
+            asyncio.wrap_future(future), settings.pdf_render_timeout_seconds
+        )
+        outcome = "ok"
+        return pdf_bytes
+    except TimeoutError:
+        outcome = "timeout"
+        raise
+    except BrokenProcessPool:
+        # A worker died (e.g. a native crash in pango); start a fresh pool.
+        logger.warning("pdf_render.pool_broken")
+        _reset_executor()
+        raise
+    finally:
+        APP_PDF_RENDER_DURATION_SECONDS.labels(template=template, outcome=outcome).observe(
+            time.monotonic() - started
+        )
+
+
+async def render_pdf(
+    template: RenderTemplate,
+    payload: Any,
+    css: str,
+    *,
+    cache_key: str | None = None,
+) -> bytes:
+    """Render ``payload`` (CV dict or markdown text) to PDF off the event loop.
+
+    Concurrent calls with the same ``cache_key`` share one render.
+    """
+    key = cache_key or render_cache_key(template, payload, css)
+    shared = _inflight.get(key)
+    if shared is not None:
+        return await asyncio.shield(shared)
+
+    task = asyncio.ensure_future(_render(template, payload, css))
+    _inflight[key] = task
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    APP_PDF_RENDER_CACHE_TOTAL.labels(result="hit" if hit else "miss").inc()
+
+
+def shutdown_render_pool() -> None:
+    """Stop the render workers (application shutdown)."""
+    _reset_executor()
@@ -0,0 +1,131 @@
+"""Calendar queries over ``item_projection``.
+
+``event_range`` is a stored ``tstzrange`` over ``start_time``/``end_time``
+with a GiST index, so date windows are answered by the index instead of
+loading every calendar item and filtering in Python. An event overlaps a
+window when any part of ``[start, end]`` falls inside it; events without an
+end are a single instant.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from psycopg import sql
+
+_RANGE_FILTER = sql.SQL("AND p.event_range && tstzrange(%s, %s, '[]')")
+
+# Duplicates of one provider event (e.g. the "primary" and the e-mail address
+# calendar alias) share event_id; DISTINCT ON keeps the earliest row.
+_EVENTS_SQL = sql.SQL(
+    """
+    WITH events AS (
+        SELECT DISTINCT ON (COALESCE(p.event_id, p.item_id::text))
+            p.item_id,
+            p.start_time,
+            COALESCE(p.start_time, '-infinity') AS sort_start
+        FROM item_projection p
+        WHERE p.org_id = %s
+          AND p.bucket = 'calendar'
+          AND p.archived_at IS NULL
+          {range}
+        ORDER BY
+            COALESCE(p.event_id, p.item_id::text),
+            sort_start,
+            p.item_updated_at,
+            p.item_id
+    )
+    SELECT
+        i.item_id,
+        i.canonical_id,
+        i.source,
+        i.schema_jsonld,
+        i.content_hash,
+        i.updated_at,
+        e.start_time
+    FROM events e
+    JOIN items i ON i.item_id = e.item_id
+    {after}
+    ORDER BY e.sort_start, e.item_id
+    LIMIT %s
+    """
+)
+
+_AFTER_FILTER = sql.SQL(
+    "WHERE (e.sort_start, e.item_id) > (COALESCE(%s::timestamptz, '-infinity'), %s::uuid)"
+)
+
+_BUSY_SQL = sql.SQL(
+    """
+    SELECT DISTINCT ON (COALESCE(p.event_id, p.item_id::text))
+        p.start_time,
+        p.end_time
+    FROM item_projection p
+    WHERE p.org_id = %s
+      AND p.archived_at IS NULL
+      AND (p.bucket = 'calendar' OR p.source = 'google_calendar')
+      {range}
+    ORDER BY COALESCE(p.event_id, p.item_id::text), p.start_time
+    """
+)
+
+# (start_time or None, item_id) of the last event of the previous page.
+EventCursor = tuple[datetime | None, str]
+
+
+def list_calendar_events(
+    cur,  # noqa: ANN001
+    *,
+    org_id: str,
+    range_start: datetime | None = None,
+    range_end: datetime | None = None,
+    after: EventCursor | None = None,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Calendar-bucket items ordered by start, one per provider event.
+
+    With ``range_start``/``range_end`` only events overlapping that window
+    are returned (events without a start are then excluded); ``after``
+    continues a previous page.
+    """
+    params: list[Any] = [org_id]
+    range_clause = sql.SQL("")
+    if range_start is not None or range_end is not None:
+        range_clause = _RANGE_FILTER
+        params.extend((range_start, range_end))
+    after_clause = sql.SQL("")
+    if after is not None:
+        after_clause = _AFTER_FILTER
+        params.extend(after)
+    params.append(limit)
+    cur.execute(_EVENTS_SQL.format(range=range_clause, after=after_clause), params)
+    return cur.fetchall()
+
+
+def list_busy_intervals(
+    cur,  # noqa: ANN001
+    *,
+    org_id: str,
+    range_start: datetime,
+    range_end: datetime,
+    default_duration: timedelta,
+) -> list[tuple[datetime, datetime]]:
+    """Busy ``(start, end)`` intervals overlapping the window, sorted by start.
+
+    Events without an end count as ``default_duration`` long.
+    """
+    # Widen the window so an end-less event that started just before
+    # range_start (and is still running) is included.
+    cur.execute(
+        _BUSY_SQL.format(range=_RANGE_FILTER),
+        (org_id, range_start - default_duration, range_end),
+    )
+    intervals: list[tuple[datetime, datetime]] = []
+    for row in cur.fetchall():
+        start = row["start_time"]
+        end = row["end_time"] or start + default_duration
+        if end > range_start:
+            intervals.append((start, end))
+    intervals.sort(key=lambda interval: interval[0])
+    return intervals
@@ -0,0 +1,222 @@
+"""Typed, indexed projection of ``items.schema_jsonld``.
+
+Hot read paths filter items by bucket, project reference, event time, Gmail
+message id and completion state. Digging those out of JSON-LD on every
+query (``jsonb_array_elements`` over ``additionalProperty``, ``@>``
+containment) does not use indexes well, so :func:`project_item` extracts
+them once into ``item_projection`` where they have B-tree/GIN indexes.
+
+:func:`refresh_item_projection` re-derives rows from the current ``items``
+rows. Item writes call it inside their own transaction so reads see their
+writes; the outbox worker calls it again for every ``item_upserted`` /
+``item_archived`` event, which also repairs rows for writes made outside the
+API. ``python -m app.projection.rebuild`` rebuilds the table from scratch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+_SELECT_ITEMS_SQL = """
+    SELECT
+        item_id,
+        org_id,
+        created_by_user_id,
+        source,
+        schema_jsonld,
+        created_at,
+        updated_at,
+        archived_at
+    FROM items
+    WHERE item_id = ANY(%s::uuid[])
+"""
+
+# The updated_at guard keeps a refresh that read an older item version (e.g.
+# the worker racing an API write) from overwriting a newer projection.
+_UPSERT_SQL = """
+    INSERT INTO item_projection (
+        item_id,
+        org_id,
+        created_by_user_id,
+        source,
+        bucket,
+        primary_type,
+        project_refs,
+        start_time,
+        end_time,
+        source_message_ids,
+        event_id,
+        is_completed,
+        archived_at,
+        item_created_at,
+        item_updated_at
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (item_id) DO UPDATE SET
+        org_id = EXCLUDED.org_id,
+        created_by_user_id = EXCLUDED.created_by_user_id,
+        source = EXCLUDED.source,
+        bucket = EXCLUDED.bucket,
+        primary_type = EXCLUDED.primary_type,
+        project_refs = EXCLUDED.project_refs,
+        start_time = EXCLUDED.start_time,
+        end_time = EXCLUDED.end_time,
+        source_message_ids = EXCLUDED.source_message_ids,
+        event_id = EXCLUDED.event_id,
+        is_completed = EXCLUDED.is_completed,
+        archived_at = EXCLUDED.archived_at,
+        item_created_at = EXCLUDED.item_created_at,
+        item_updated_at = EXCLUDED.item_updated_at,
+        projected_at = now()
+    WHERE item_projection.item_updated_at <= EXCLUDED.item_updated_at
+"""
+
+
+@dataclass(frozen=True)
+class ItemProjection:
+    item_id: str
+    org_id: str
+    created_by_user_id: str | None
+    source: str | None
+    bucket: str | None
+    primary_type: str | None
+    project_refs: list[str]
+    start_time: datetime | None
+    end_time: datetime | None
+    source_message_ids: list[str]
+    event_id: str | None
+    is_completed: bool
+    archived_at: datetime | None
+    item_created_at: datetime
+    item_updated_at: datetime
+
+    def as_params(self) -> tuple:
+        return (
+            self.item_id,
+            self.org_id,
+            self.created_by_user_id,
+            self.source,
+            self.bucket,
+            self.primary_type,
+            self.project_refs,
+            self.start_time,
+            self.end_time,
+            self.source_message_ids,
+            self.event_id,
+            self.is_completed,
+            self.archived_at,
+            self.item_created_at,
+            self.item_updated_at,
+        )
+
+
+def _property_values(jsonld: dict, property_id: str) -> list[Any]:
+    props = jsonld.get("additionalProperty")
+    if not isinstance(props, list):
+        return []
+    return [
+        pv.get("value")
+        for pv in props
+        if isinstance(pv, dict) and pv.get("propertyID") == property_id
+    ]
+
+
+def _primary_type(jsonld: dict) -> str | None:
+    value = jsonld.get("@type")
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value if isinstance(value, str) else None
+
+
+def _project_refs(jsonld: dict) -> list[str]:
+    # Mirrors ``schema_jsonld @> {"additionalProperty": [{"propertyID":
+    # "app:projectRefs", "value": [ref]}]}``: refs from every matching entry.
+    refs: list[str] = []
+    for value in _property_values(jsonld, "app:projectRefs"):
+        values = value if isinstance(value, list) else [value]
+        for ref in values:
+            if isinstance(ref, str) and ref not in refs:
+                refs.append(ref)
+    return refs
+
+
+def parse_event_time(value: Any) -> datetime | None:
+    """Parse an ISO date/datetime; naive values are taken as UTC."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _source_raw(jsonld: dict) -> dict:
+    metadata = jsonld.get("sourceMetadata")
+    raw = metadata.get("raw") if isinstance(metadata, dict) else None
+    return raw if isinstance(raw, dict) else {}
+
+
+def _source_message_ids(jsonld: dict) -> list[str]:
+    gmail_id = _source_raw(jsonld).get("gmailMessageId")
+    if isinstance(gmail_id, str) and gmail_id.strip():
+        return [gmail_id]
+    return []
+
+
+def _event_id(jsonld: dict) -> str | None:
+    event_id = _source_raw(jsonld).get("eventId")
+    return event_id if isinstance(event_id, str) and event_id else None
+
+
+def project_item(row: dict[str, Any]) -> ItemProjection:
+    """Derive the projection of one ``items`` row."""
+    jsonld = row.get("schema_jsonld") or {}
+    buckets = _property_values(jsonld, "app:bucket")
+    bucket = buckets[0] if buckets else None
+    start = jsonld.get("startDate") or jsonld.get("startTime")
+    created_by = row.get("created_by_user_id")
+    return ItemProjection(
+        item_id=str(row["item_id"]),
+        org_id=str(row["org_id"]),
+        created_by_user_id=str(created_by) if created_by else None,
+        source=row.get("source"),
+        bucket=bucket if isinstance(bucket, str) else None,
+        primary_type=_primary_type(jsonld),
+        project_refs=_project_refs(jsonld),
+        start_time=parse_event_time(start),
+        end_time=parse_event_time(jsonld.get("endDate")),
+        source_message_ids=_source_message_ids(jsonld),
+        event_id=_event_id(jsonld),
+        # Same rule as the former ``schema_jsonld->>'endTime' IS NOT NULL``.
+        is_completed=jsonld.get("endTime") is not None,
+        archived_at=row.get("archived_at"),
+        item_created_at=row["created_at"],
+        item_updated_at=row["updated_at"],
+    )
+
+
+def upsert_projections(cur, rows: Iterable[dict[str, Any]]) -> int:  # noqa: ANN001
+    """Write projections for already loaded ``items`` rows."""
+    params = [project_item(row).as_params() for row in rows]
+    if params:
+        cur.executemany(_UPSERT_SQL, params)
+    return len(params)
+
+
+def refresh_item_projection(cur, item_ids: Iterable[Any]) -> int:  # noqa: ANN001
+    """Re-derive the projection of ``item_ids`` from their current rows.
+
+    Runs on the caller's cursor, so the projection commits (or rolls back)
+    together with the item write. Ids without an ``items`` row are ignored.
+    """
+    ids = list(dict.fromkeys(str(item_id) for item_id in item_ids if item_id))
+    if not ids:
+        return 0
+    cur.execute(_SELECT_ITEMS_SQL, (ids,))
+    return upsert_projections(cur, cur.fetchall())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+
+from psycopg import sql
+
+from ..db import db_conn
+from ..observability import configure_logging, get_logger
+from .items import upsert_projections
+
+logger = get_logger("item-projection-rebuild")
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def rebuild_item_projection(
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    org_id: str | None = None,
+    missing_only: bool = False,
+) -> int:
+    """Re-derive ``item_projection`` rows in keyset-ordered batches.
+
+    Each batch commits on its own, so a rebuild of a large table neither holds
+    one long transaction nor starts over after an interruption when run with
+    ``missing_only``. Returns the number of rows written.
+    """
+    conditions = [sql.SQL("i.item_id > %s")]
+    params: list = []
+    if org_id:
+        conditions.append(sql.SQL("i.org_id = %s"))
+        params.append(org_id)
+    if missing_only:
+        conditions.append(
+            sql.SQL("NOT EXISTS (SELECT 1 FROM item_projection p WHERE p.item_id = i.item_id)")
+        )
+    query = sql.SQL(
+        """
+        SELECT
+            i.item_id,
+            i.org_id,
+            i.created_by_user_id,
+            i.source,
+            i.schema_jsonld,
+            i.created_at,
+            i.updated_at,
+            i.archived_at
+        FROM items i
+        WHERE {where}
+        ORDER BY i.item_id
+        LIMIT %s
+        """
+    ).format(where=sql.SQL(" AND ").join(conditions))
+
+    total = 0
+    last_id = "00000000-0000-0000-0000-000000000000"
+    with db_conn() as conn:
+        while True:
+            with conn.cursor() as cur:
+                cur.execute(query, (last_id, *params, batch_size))
+                rows = cur.fetchall()
+                if not rows:
+                    break
+                total += upsert_projections(cur, rows)
+            conn.commit()
+            last_id = str(rows[-1]["item_id"])
+            logger.info("item_projection.rebuild_batch", count=len(rows), total=total)
+    return total
+
+
+def main() -> None:
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Rebuild the item_projection table.")
+    parser.add_argument("--org-id", help="Only rebuild items of this organization.")
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="Only project items that have no projection row yet.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Items per batch.",
+    )
+    args = parser.parse_args()
+    total = rebuild_item_projection(
+        batch_size=max(1, args.batch_size),
+        org_id=args.org_id,
+        missing_only=args.missing_only,
+    )
+    logger.info("item_projection.rebuild_done", total=total)
+
+
+if __name__ == "__main__":
+    main()
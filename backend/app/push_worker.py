@@ -1,7 +1,12 @@
 import argparse
 import json
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from urllib.parse import urlsplit
 
 from pywebpush import WebPushException, webpush
 
@@ -12,6 +17,10 @@ from .worker_health import (
     WORKER_BATCH_DURATION_SECONDS,
     WORKER_BATCHES_TOTAL,
     WORKER_EVENTS_TOTAL,
+    WORKER_PUSH_RETRIES_TOTAL,
+    WORKER_PUSH_SEND_DURATION_SECONDS,
+    WORKER_PUSH_SENDS_TOTAL,
+    WORKER_PUSH_THROUGHPUT,
     WorkerHealthState,
     start_health_server,
 )
@@ -29,10 +38,247 @@ def _send(subscription: dict, payload: dict) -> None:
     )
 
 
-def process_batch(limit: int = 10) -> int:
+_EXPIRED_STATUS_CODES = frozenset({404, 410})
+_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _is_retryable(status_code: int | None) -> bool:
+    return status_code == 429 or (status_code is not None and 500 <= status_code < 600)
+
+
+def _retry_after_seconds(exc: WebPushException, attempt: int) -> float:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return min(_MAX_BACKOFF_SECONDS, max(0.0, float(headers["Retry-After"])))
+    except (KeyError, TypeError, ValueError):
+        pass
+    return min(_MAX_BACKOFF_SECONDS, settings.push_worker_backoff_seconds * (2**attempt))
+
+
+def _endpoint_host(endpoint: str | None) -> str:
+    return urlsplit(endpoint or "").hostname or "unknown"
+
+
+@dataclass(frozen=True)
+class PushDelivery:
+    push_id: str
+    subscription_id: str
+    endpoint: str
+    subscription: dict
+    payload: dict
+
+
+@dataclass
+class DeliveryResult:
+    delivery: PushDelivery
+    outcome: str  # "sent" | "expired" | "failed"
+    error: str | None = None
+
+
+@dataclass
+class _QueuedSend:
+    delivery: PushDelivery
+    future: Future
+    started: float
+    attempt: int = 0
+
+
+class PushDeliveryEngine:
+    """Fan out web-push sends over a bounded thread pool.
+
+    Push services (FCM, Mozilla autopush, APNs web push, ...) rate-limit per
+    sender, so concurrency is also capped per endpoint host. Each host has its
+    own queue drained by at most ``per_host_limit`` lanes; a lane sends one
+    delivery per pool task and then goes back to the end of the pool queue, so
+    a broadcast dominated by one host never holds every thread. A 429/5xx from
+    a host pauses that host's lanes for the ``Retry-After`` delay (or an
+    exponential backoff) before the send is retried; the pause is a timer, not
+    a sleeping pool thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        per_host_limit: int,
+        max_retries: int,
+        worker_name: str = "push-worker",
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="push-send",
+        )
+        self._per_host_limit = max(1, per_host_limit)
+        self._max_retries = max(0, max_retries)
+        self._worker_name = worker_name
+        self._lock = threading.Lock()
+        self._host_queues: dict[str, deque[_QueuedSend]] = {}
+        self._host_lanes: dict[str, int] = {}
+        self._host_paused_until: dict[str, float] = {}
+
+    def _enqueue(self, host: str, queued: _QueuedSend, *, retry: bool = False) -> None:
+        with self._lock:
+            queue = self._host_queues.setdefault(host, deque())
+            if retry:
+                queue.appendleft(queued)
+                return
+            queue.append(queued)
+            lanes = self._host_lanes.get(host, 0)
+            if lanes >= self._per_host_limit:
+                return
+            self._host_lanes[host] = lanes + 1
+        self._schedule_lane(host)
+
+    def _schedule_lane(self, host: str) -> None:
+        with self._lock:
+            delay = self._host_paused_until.get(host, 0.0) - time.monotonic()
+        if delay > 0:
+            timer = threading.Timer(delay, self._executor.submit, (self._run_lane, host))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._executor.submit(self._run_lane, host)
+
+    def _run_lane(self, host: str) -> None:
+        with self._lock:
+            if self._host_paused_until.get(host, 0.0) > time.monotonic():
+                queued = None
+            else:
+                queue = self._host_queues.get(host)
+                if not queue:
+                    self._host_lanes[host] -= 1
+                    if not self._host_lanes[host]:
+                        del self._host_lanes[host]
+                        self._host_queues.pop(host, None)
+                    return
+                queued = queue.popleft()
+        if queued is not None:
+            try:
+                self._attempt(host, queued)
+            except BaseException as exc:  # noqa: BLE001
+                queued.future.set_exception(exc)
+        self._schedule_lane(host)
+
+    def _pause_host(self, host: str, seconds: float) -> None:
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._host_paused_until.get(host, 0.0):
+                self._host_paused_until[host] = until
+
+    def _attempt(self, host: str, queued: _QueuedSend) -> None:
+        delivery = queued.delivery
+        try:
+            _send(delivery.subscription, delivery.payload)
+            result = DeliveryResult(delivery, "sent")
+        except WebPushException as exc:
+            status_code = getattr(exc.response, "status_code", None)
+            if status_code in _EXPIRED_STATUS_CODES:
+                result = DeliveryResult(delivery, "expired")
+            elif _is_retryable(status_code) and queued.attempt < self._max_retries:
+                delay = _retry_after_seconds(exc, queued.attempt)
+                self._pause_host(host, delay)
+                WORKER_PUSH_RETRIES_TOTAL.labels(
+                    worker=self._worker_name,
+                    status_code=str(status_code),
+                ).inc()
+                logger.info(
+                    "push_worker.send_backoff",
+                    host=host,
+                    status_code=status_code,
+                    attempt=queued.attempt + 1,
+                    delay_seconds=round(delay, 2),
+                )
+                queued.attempt += 1
+                self._enqueue(host, queued, retry=True)
+                return
+            else:
+                logger.warning(
+                    "push_worker.send_failed",
+                    error=str(exc),
+                    status_code=status_code,
+                    host=host,
+                )
+                result = DeliveryResult(delivery, "failed", str(exc)[:500])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("push_worker.send_failed", error=str(exc), host=host)
+            result = DeliveryResult(delivery, "failed", str(exc)[:500])
+
+        WORKER_PUSH_SEND_DURATION_SECONDS.labels(
+            worker=self._worker_name,
+            outcome=result.outcome,
+        ).observe(time.monotonic() - queued.started)
+        WORKER_PUSH_SENDS_TOTAL.labels(worker=self._worker_name, outcome=result.outcome).inc()
+        queued.future.set_result(result)
+
+    def deliver_all(self, deliveries: list[PushDelivery]) -> list[DeliveryResult]:
+        if not deliveries:
+            return []
+        started = time.monotonic()
+        futures: list[Future] = []
+        for delivery in deliveries:
+            future: Future = Future()
+            futures.append(future)
+            self._enqueue(_endpoint_host(delivery.endpoint), _QueuedSend(delivery, future, started))
+        results = [future.result() for future in futures]
+        elapsed = time.monotonic() - started
+        if elapsed > 0:
+            WORKER_PUSH_THROUGHPUT.labels(worker=self._worker_name).observe(
+                len(deliveries) / elapsed
+            )
+        return results
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_engine: PushDeliveryEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_delivery_engine(max_workers: int | None = None) -> PushDeliveryEngine:
+    """Return the process-wide engine; ``max_workers`` only applies on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = PushDeliveryEngine(
+                max_workers=max_workers or settings.push_worker_concurrency,
+                per_host_limit=settings.push_worker_per_host_concurrency,
+                max_retries=settings.push_worker_max_retries,
+            )
+        return _engine
+
+
+def _load_subscriptions(cur, outbox: list[dict]) -> dict[str | None, list[dict]]:
+    """Return subscriptions keyed by target user id (``None`` = broadcast)."""
+    by_target: dict[str | None, list[dict]] = {}
+    user_ids = sorted({str(e["target_user_id"]) for e in outbox if e["target_user_id"]})
+    if user_ids:
+        cur.execute(
+            """
+            SELECT subscription_id, user_id, endpoint, payload
+            FROM push_subscriptions
+            WHERE user_id = ANY(%s::uuid[])
+            """,
+            (user_ids,),
+        )
+        for sub in cur.fetchall():
+            by_target.setdefault(str(sub["user_id"]), []).append(sub)
+    if any(not e["target_user_id"] for e in outbox):
+        cur.execute(
+            """
+            SELECT subscription_id, user_id, endpoint, payload
+            FROM push_subscriptions
+            """,
+        )
+        by_target[None] = cur.fetchall()
+    return by_target
+
+
+def process_batch(limit: int = 10, engine: PushDeliveryEngine | None = None) -> int:
     if not settings.vapid_private_key:
         return 0
 
+    engine = engine or get_delivery_engine()
     processed = 0
     with db_conn() as conn:
         with conn.cursor() as cur:
@@ -53,104 +299,99 @@ def process_batch(limit: int = 10) -> int:
             return 0
         logger.info("push_worker.batch_fetched", fetched=len(outbox), limit=limit)
 
+        started_at = time.monotonic()
+        with conn.cursor() as cur:
+            subs_by_target = _load_subscriptions(cur, outbox)
+
+        deliveries: list[PushDelivery] = []
         for entry in outbox:
-            push_id = entry["push_id"]
             target_user_id = entry["target_user_id"]
-            payload = entry["payload"]
-            started_at = time.monotonic()
             logger.info(
                 "push_worker.event_start",
-                push_id=str(push_id),
+                push_id=str(entry["push_id"]),
                 target_user_id=str(target_user_id) if target_user_id else None,
             )
-
-            try:
-                with conn.cursor() as cur:
-                    if target_user_id:
-                        cur.execute(
-                            """
-                            SELECT subscription_id, endpoint, payload
-                            FROM push_subscriptions
-                            WHERE user_id = %s
-                            """,
-                            (target_user_id,),
-                        )
-                    else:
-                        cur.execute(
-                            """
-                            SELECT subscription_id, endpoint, payload
-                            FROM push_subscriptions
-                            """,
-                        )
-                    subs = cur.fetchall()
-
-                for sub in subs:
-                    try:
-                        _send(sub["payload"], payload)
-                        with conn.cursor() as cur:
-                            cur.execute(
-                                """
-                                UPDATE push_subscriptions
-                                SET last_used_at = %s
-                                WHERE subscription_id = %s
-                                """,
-                                (datetime.now(UTC), sub["subscription_id"]),
-                            )
-                    except WebPushException as exc:
-                        status_code = getattr(exc.response, "status_code", None)
-                        logger.warning(
-                            "push_worker.send_failed",
-                            error=str(exc),
-                            status_code=status_code,
-                        )
-                        if status_code in {404, 410}:
-                            with conn.cursor() as cur:
-                                cur.execute(
-                                    "DELETE FROM push_subscriptions WHERE subscription_id = %s",
-                                    (sub["subscription_id"],),
-                                )
-                        else:
-                            raise
-
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        UPDATE push_outbox
-                        SET processed_at = %s
-                        WHERE push_id = %s
-                        """,
-                        (datetime.now(UTC), push_id),
+            target_key = str(target_user_id) if target_user_id else None
+            for sub in subs_by_target.get(target_key, []):
+                deliveries.append(
+                    PushDelivery(
+                        push_id=str(entry["push_id"]),
+                        subscription_id=str(sub["subscription_id"]),
+                        endpoint=sub["endpoint"],
+                        subscription=sub["payload"],
+                        payload=entry["payload"],
                     )
-                processed += 1
-                logger.info(
-                    "push_worker.event_processed",
-                    push_id=str(push_id),
-                    duration_ms=int((time.monotonic() - started_at) * 1000),
                 )
-            except Exception as exc:  # noqa: BLE001
-                logger.exception(
-                    "push_worker.process_failed",
-                    push_id=str(push_id),
+
+        results = engine.deliver_all(deliveries)
+
+        sent_ids = sorted({r.delivery.subscription_id for r in results if r.outcome == "sent"})
+        expired_ids = sorted(
+            {r.delivery.subscription_id for r in results if r.outcome == "expired"}
+        )
+        errors: dict[str, str] = {}
+        for result in results:
+            if result.outcome == "failed":
+                errors.setdefault(result.delivery.push_id, result.error or "send failed")
+
+        now = datetime.now(UTC)
+        with conn.cursor() as cur:
+            if sent_ids:
+                cur.execute(
+                    """
+                    UPDATE push_subscriptions
+                    SET last_used_at = %s
+                    WHERE subscription_id = ANY(%s::uuid[])
+                    """,
+                    (now, sent_ids),
                 )
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        UPDATE push_outbox
-                        SET attempts = attempts + 1, last_error = %s
-                        WHERE push_id = %s
-                        """,
-                        (str(exc)[:500], push_id),
-                    )
-                logger.error(
-                    "push_worker.event_failed",
-                    push_id=str(push_id),
-                    duration_ms=int((time.monotonic() - started_at) * 1000),
-                    error=str(exc)[:500],
+            if expired_ids:
+                cur.execute(
+                    "DELETE FROM push_subscriptions WHERE subscription_id = ANY(%s::uuid[])",
+                    (expired_ids,),
                 )
+                logger.info("push_worker.subscriptions_expired", count=len(expired_ids))
 
+            done_ids = [str(e["push_id"]) for e in outbox if str(e["push_id"]) not in errors]
+            if done_ids:
+                cur.execute(
+                    """
+                    UPDATE push_outbox
+                    SET processed_at = %s
+                    WHERE push_id = ANY(%s::uuid[])
+                    """,
+                    (now, done_ids),
+                )
+            for push_id, error in errors.items():
+                cur.execute(
+                    """
+                    UPDATE push_outbox
+                    SET attempts = attempts + 1, last_error = %s
+                    WHERE push_id = %s
+                    """,
+                    (error, push_id),
+                )
         conn.commit()
 
-    logger.info("push_worker.batch_done", fetched=len(outbox), processed=processed, limit=limit)
+        duration_ms = int((time.monotonic() - started_at) * 1000)
+        for push_id in done_ids:
+            logger.info("push_worker.event_processed", push_id=push_id, duration_ms=duration_ms)
+        for push_id, error in errors.items():
+            logger.error(
+                "push_worker.event_failed",
+                push_id=push_id,
+                duration_ms=duration_ms,
+                error=error,
+            )
+        processed = len(done_ids)
+
+    logger.info(
+        "push_worker.batch_done",
+        fetched=len(outbox),
+        processed=processed,
+        sends=len(deliveries),
+        limit=limit,
+    )
     return processed
 
 
@@ -167,6 +408,12 @@ def _parse_args() -> argparse.Namespace:
         default=10,
         help="Number of push outbox events to process per batch.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.push_worker_concurrency,
+        help="Maximum number of concurrent web-push sends.",
+    )
     parser.add_argument(
         "--interval",
         type=float,
@@ -180,6 +427,7 @@ def main() -> None:
     args = _parse_args()
     batch_size = max(1, args.batch_size)
     interval = max(0.1, float(args.interval))
+    get_delivery_engine(max_workers=max(1, args.concurrency))
 
     if not args.loop:
         count = process_batch(limit=batch_size)
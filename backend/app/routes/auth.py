@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response, status
 
+from ..auth_cache import invalidate_session, invalidate_user
 from ..config import settings
 from ..csrf import clear_csrf_cookie, issue_csrf_token
 from ..db import db_conn
@@ -277,10 +278,15 @@ def logout(
         with db_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    "UPDATE sessions SET revoked_at = %s WHERE token = %s",
+                    "UPDATE sessions SET revoked_at = %s WHERE token = %s RETURNING id",
                     (utc_now(), session_token),
                 )
+                revoked = cur.fetchone()
+                if revoked is not None:
+                    invalidate_session(revoked["id"], cur=cur)
             conn.commit()
+        if revoked is not None:
+            invalidate_session(revoked["id"])
 
     response.delete_cookie(
         settings.session_cookie_name,
@@ -390,7 +396,9 @@ def refresh_session(request: Request, response: Response):
                     row["session_id"],
                 ),
             )
+            invalidate_session(row["session_id"], cur=cur)
         conn.commit()
+    invalidate_session(row["session_id"])
 
     response.set_cookie(
         key=settings.session_cookie_name,
@@ -473,7 +481,9 @@ def acknowledge_disclaimer(current_user=Depends(get_current_user)):
                 (utc_now(), current_user["id"]),
             )
             user = cur.fetchone()
+            invalidate_user(current_user["id"], cur=cur)
         conn.commit()
+    invalidate_user(current_user["id"])
 
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import base64
 import copy
 import uuid
 from datetime import UTC, datetime
 from typing import Annotated, Any, Literal
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -22,6 +23,9 @@ from ..idempotency import (
     store_idempotent_response,
 )
 from ..imports.shared import _hash_payload
+from ..projection.calendar import EventCursor
+from ..projection.calendar import list_calendar_events as list_projected_calendar_events
+from ..projection.items import refresh_item_projection
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
@@ -210,6 +214,22 @@ def _parse_iso(value: str | None) -> datetime | None:
     return parsed.astimezone(UTC)
 
 
+def _encode_event_cursor(start_time: datetime | None, item_id: str) -> str:
+    payload = f"{start_time.isoformat() if start_time else ''}|{item_id}"
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
+
+
+def _decode_event_cursor(cursor: str) -> EventCursor:
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+        start_raw, item_id = decoded.split("|", 1)
+        start_time = datetime.fromisoformat(start_raw) if start_raw else None
+        uuid.UUID(item_id)
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    return start_time, item_id
+
+
 def _normalize_event_time_value(value: str | None) -> str | None:
     if not isinstance(value, str):
         return None
@@ -299,6 +319,8 @@ def _update_item_schema(
                 (jsonb(schema_jsonld), content_hash, org_id, canonical_id),
             )
             row = cur.fetchone()
+            if row is not None:
+                refresh_item_projection(cur, [row["item_id"]])
         conn.commit()
     if row is None:
         raise HTTPException(status_code=404, detail="Calendar event not found")
@@ -320,9 +342,11 @@ def _archive_item(
                 WHERE org_id = %s
                   AND canonical_id = %s
                   AND archived_at IS NULL
+                RETURNING item_id
                 """,
                 (org_id, canonical_id),
             )
+            refresh_item_projection(cur, [row["item_id"] for row in cur.fetchall()])
         conn.commit()
 
 
@@ -407,67 +431,43 @@ def _apply_google_rsvp(
     summary="List calendar events for Project calendar view",
 )
 def list_calendar_events(
+    response: Response,
     date_from: str | None = Query(default=None),
     date_to: str | None = Query(default=None),
     limit: int = Query(default=300, ge=1, le=2000),
+    cursor: str | None = Query(
+        default=None,
+        description="Continue after the page that returned this X-Next-Cursor value.",
+    ),
     current_user=Depends(get_current_user),
     org=Depends(get_current_org),
 ):
     org_id = org["org_id"]
     user_id = str(current_user["id"])
-
-    start_filter = _parse_iso(date_from)
-    end_filter = _parse_iso(date_to)
+    after = _decode_event_cursor(cursor) if cursor else None
 
     roles, _connection = _load_access_roles(org_id=org_id, user_id=user_id)
 
+    # Range filter, ordering, keyset pagination and the event_id dedup (the
+    # same Google event can exist under "primary" and the e-mail address
+    # calendar alias) all run in SQL; see app.projection.calendar.
     with db_conn() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT item_id, canonical_id, source, schema_jsonld, content_hash, updated_at
-                FROM items
-                WHERE org_id = %s
-                  AND archived_at IS NULL
-                  AND EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements(
-                        COALESCE(schema_jsonld -> 'additionalProperty', '[]'::jsonb)
-                    ) AS prop
-                    WHERE prop ->> 'propertyID' = 'app:bucket'
-                      AND prop ->> 'value' = 'calendar'
-                  )
-                ORDER BY created_at ASC
-                LIMIT %s
-                """,
-                (org_id, limit),
+            rows = list_projected_calendar_events(
+                cur,
+                org_id=org_id,
+                range_start=_parse_iso(date_from),
+                range_end=_parse_iso(date_to),
+                after=after,
+                limit=limit,
             )
-            rows = cur.fetchall()
 
-    events: list[CalendarEventResponse] = []
-    for row in rows:
-        event = _to_event_response(row, access_roles=roles)
-        start_dt = _parse_iso(event.start_date)
-        if start_filter and (start_dt is None or start_dt < start_filter):
-            continue
-        if end_filter and (start_dt is None or start_dt > end_filter):
-            continue
-        events.append(event)
-
-    events.sort(key=lambda ev: (ev.start_date or "", ev.updated_at, ev.canonical_id))
-
-    # Deduplicate by event_id — the same Google Calendar event can exist under
-    # different canonical IDs when the calendar_id alias differs (e.g. "primary"
-    # vs the actual email address).  Keep the first (earliest) occurrence.
-    seen_event_ids: set[str] = set()
-    deduped: list[CalendarEventResponse] = []
-    for ev in events:
-        if ev.event_id:
-            if ev.event_id in seen_event_ids:
-                continue
-            seen_event_ids.add(ev.event_id)
-        deduped.append(ev)
-    return deduped
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = _encode_event_cursor(
+            last["start_time"], str(last["item_id"])
+        )
+    return [_to_event_response(row, access_roles=roles) for row in rows]
 
 
 @router.post(
@@ -549,6 +549,7 @@ def create_calendar_event(
                 ),
             )
             row = cur.fetchone()
+            refresh_item_projection(cur, [row["item_id"]])
         conn.commit()
 
     response = _to_event_response(row, access_roles={})
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import base64
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from psycopg import sql
 from pydantic import BaseModel, Field
 
+from ..auth_cache import invalidate_memberships
 from ..db import db_conn, jsonb
 from ..deps import get_current_org, get_current_user
 
@@ -20,6 +22,8 @@ CANONICAL_STATUS_LABELS: dict[str, str] = {
 DEFAULT_STATUS = "PotentialActionStatus"
 DEFAULT_DONE_STATUSES = ["CompletedActionStatus"]
 DEFAULT_BLOCKED_STATUSES = ["FailedActionStatus"]
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
 
 class WorkflowTransitionModel(BaseModel):
@@ -115,6 +119,8 @@ class ProjectActionDetailResponse(ProjectActionResponse):
 class ProjectActionHistoryResponse(BaseModel):
     transitions: list[ActionTransitionEventResponse] = Field(default_factory=list)
     revisions: list[ActionRevisionResponse] = Field(default_factory=list)
+    transitions_next_cursor: int | None = None
+    revisions_next_cursor: int | None = None
 
 
 class ProjectActionCreateRequest(BaseModel):
@@ -250,6 +256,29 @@ def _serialize_transition_row(row: dict[str, Any]) -> ActionTransitionEventRespo
     )
 
 
+def _encode_action_cursor(due_at: datetime | None, created_at: datetime, action_id: str) -> str:
+    payload = f"{due_at.isoformat() if due_at else ''}|{created_at.isoformat()}|{action_id}"
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
+
+
+def _decode_action_cursor(cursor: str) -> tuple[datetime | None, datetime, str]:
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+        due_raw, created_raw, action_id = decoded.split("|", 2)
+        due_at = datetime.fromisoformat(due_raw) if due_raw else None
+        created_at = datetime.fromisoformat(created_raw)
+        uuid.UUID(action_id)
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    return due_at, created_at, action_id
+
+
+def _next_history_cursor(rows: list[dict[str, Any]], limit: int | None) -> int | None:
+    if limit is None or len(rows) < limit:
+        return None
+    return int(rows[-1]["id"])
+
+
 def _serialize_action_row(row: dict[str, Any], project_id: str) -> ProjectActionResponse:
     tags = row["tags"] if isinstance(row.get("tags"), list) else []
     attributes = row["attributes"] if isinstance(row.get("attributes"), dict) else {}
@@ -500,15 +529,9 @@ def _load_action_or_404(
         SELECT
             a.*,
             p.status AS projected_status,
-            p.last_event_id,
-            COALESCE(comment_counts.comment_count, 0) AS comment_count
+            p.last_event_id
         FROM project_action a
         LEFT JOIN action_state_projection p ON p.action_id = a.id
-        LEFT JOIN LATERAL (
-            SELECT count(*)::integer AS comment_count
-            FROM action_comment c
-            WHERE c.action_id = a.id
-        ) AS comment_counts ON TRUE
         WHERE a.org_id = %s
           AND a.project_item_id = %s
           AND a.id::text = %s
@@ -709,6 +732,7 @@ def add_project_member(
                 """,
                 (org_id, invited["id"]),
             )
+            invalidate_memberships(invited["id"], cur=cur)
 
             cur.execute(
                 """
@@ -725,6 +749,7 @@ def add_project_member(
             )
             row = cur.fetchone()
         conn.commit()
+    invalidate_memberships(invited["id"])
 
     if row is None:
         raise HTTPException(
@@ -804,17 +829,31 @@ def remove_project_member(
     summary="List actions for a project",
 )
 def list_project_actions(
+    response: Response,
     project_id: str,
     status_filter: list[str] | None = Query(default=None, alias="status"),
     tag: str | None = Query(default=None),
     owner_user_id: str | None = Query(default=None),
     due_before: datetime | None = Query(default=None),
     due_after: datetime | None = Query(default=None),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size. Without limit and cursor all actions are returned.",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Continue after the page that returned this X-Next-Cursor value.",
+    ),
     current_org=Depends(get_current_org),
     current_user=Depends(get_current_user),
 ):
     org_id = current_org["org_id"]
     user_id = str(current_user["id"])
+    after = _decode_action_cursor(cursor) if cursor else None
+    if after is not None and limit is None:
+        limit = DEFAULT_PAGE_SIZE
 
     statuses = [
         _normalize_status(value, set(CANONICAL_STATUS_LABELS.keys()))
@@ -858,29 +897,44 @@ def list_project_actions(
                 where_clauses.append(sql.SQL("a.due_at >= %s"))
                 params.append(due_after)
 
+            if after is not None:
+                where_clauses.append(
+                    sql.SQL(
+                        "(COALESCE(a.due_at, 'infinity'::timestamptz), a.created_at, a.id)"
+                        " > (COALESCE(%s::timestamptz, 'infinity'::timestamptz), %s, %s::uuid)"
+                    )
+                )
+                params.extend(after)
+
+            limit_clause = sql.SQL("")
+            if limit is not None:
+                limit_clause = sql.SQL("LIMIT %s")
+                params.append(limit)
+
             where_composed = sql.SQL(" AND ").join(where_clauses)
+            # Order matches idx_project_action_keyset; undated actions sort last.
             # nosemgrep: sqlalchemy-execute-raw-query
             cur.execute(
                 sql.SQL("""
                 SELECT
                     a.*,
                     p.status AS projected_status,
-                    p.last_event_id,
-                    COALESCE(comment_counts.comment_count, 0) AS comment_count
+                    p.last_event_id
                 FROM project_action a
                 LEFT JOIN action_state_projection p ON p.action_id = a.id
-                LEFT JOIN LATERAL (
-                    SELECT count(*)::integer AS comment_count
-                    FROM action_comment c
-                    WHERE c.action_id = a.id
-                ) AS comment_counts ON TRUE
                 WHERE {where}
-                ORDER BY a.due_at ASC NULLS LAST, a.created_at ASC
-                """).format(where=where_composed),
+                ORDER BY COALESCE(a.due_at, 'infinity'::timestamptz), a.created_at, a.id
+                {limit}
+                """).format(where=where_composed, limit=limit_clause),
                 tuple(params),
             )
             rows = cur.fetchall()
 
+    if limit is not None and len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = _encode_action_cursor(
+            last["due_at"], last["created_at"], str(last["id"])
+        )
     return [_serialize_action_row(row, project["canonical_id"]) for row in rows]
 
 
@@ -1382,6 +1436,10 @@ def add_action_comment(
                 (action["id"], current_user["id"], parent_comment_id, body),
             )
             created = cur.fetchone()
+            cur.execute(
+                "UPDATE project_action SET comment_count = comment_count + 1 WHERE id = %s",
+                (action["id"],),
+            )
         conn.commit()
 
     if created is None:
@@ -1461,6 +1519,14 @@ def get_project_action_detail(
 def list_project_action_history(
     project_id: str,
     action_id: str,
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size per list. Without limit and cursors the full history is returned.",
+    ),
+    transitions_cursor: int | None = Query(default=None, ge=0),
+    revisions_cursor: int | None = Query(default=None, ge=0),
     current_org=Depends(get_current_org),
     current_user=Depends(get_current_user),
 ):
@@ -1483,6 +1549,8 @@ def list_project_action_history(
                 action_id=action_id,
             )
 
+            # Both lists page independently by id; id order is insertion order.
+            # NULL limit = no limit, which keeps the unpaged response unchanged.
             cur.execute(
                 """
                 SELECT
@@ -1496,10 +1564,11 @@ def list_project_action_history(
                     payload,
                     correlation_id
                 FROM action_transition_event
-                WHERE action_id = %s
+                WHERE action_id = %s AND id > %s
                 ORDER BY id ASC
+                LIMIT %s
                 """,
-                (action["id"],),
+                (action["id"], transitions_cursor or 0, limit),
             )
             transition_rows = cur.fetchall()
 
@@ -1507,14 +1576,17 @@ def list_project_action_history(
                 """
                 SELECT id, action_id, actor_id, diff, created_at
                 FROM action_revision
-                WHERE action_id = %s
+                WHERE action_id = %s AND id > %s
                 ORDER BY id ASC
+                LIMIT %s
                 """,
-                (action["id"],),
+                (action["id"], revisions_cursor or 0, limit),
             )
             revision_rows = cur.fetchall()
 
     return ProjectActionHistoryResponse(
         transitions=[_serialize_transition_row(row) for row in transition_rows],
         revisions=[_serialize_revision_row(row) for row in revision_rows],
+        transitions_next_cursor=_next_history_cursor(transition_rows, limit),
+        revisions_next_cursor=_next_history_cursor(revision_rows, limit),
     )
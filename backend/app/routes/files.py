@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 from datetime import UTC, datetime, timedelta
 
@@ -5,8 +6,9 @@ import psycopg
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 
+from .. import pdf_render
 from ..config import settings
-from ..db import db_conn
+from ..db import async_db_conn, db_conn
 from ..deps import get_current_org, get_current_user
 from ..file_validator import validate_file_size
 from ..idempotency import (
@@ -783,21 +785,47 @@ def get_file_index_status(
     return JSONResponse(content=payload)
 
 
+def _render_pdf_response(row: dict) -> RenderPdfResponse:
+    file_id = str(row["file_id"])
+    return RenderPdfResponse(
+        file_id=file_id,
+        original_name=row["original_name"],
+        size_bytes=int(row["size_bytes"]),
+        download_url=f"/files/{file_id}",
+    )
+
+
+async def _find_rendered_file(org_id: str, cache_key: str, filename: str) -> dict | None:
+    async with async_db_conn() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT file_id, original_name, size_bytes, storage_path
+                FROM files
+                WHERE org_id = %s
+                  AND render_cache_key = %s
+                  AND original_name = %s
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (org_id, cache_key, filename),
+            )
+            return await cur.fetchone()
+
+
 @router.post(
     "/render-pdf",
     response_model=RenderPdfResponse,
     summary="Render structured CV data to PDF",
     description="Accepts structured CV data + custom CSS, renders to PDF via WeasyPrint, "
-    "and stores the file.",
+    "and stores the file. Identical inputs return the previously rendered file.",
     status_code=status.HTTP_201_CREATED,
 )
-def render_pdf(
+async def render_pdf(
     payload: RenderPdfRequest,
     current_user=Depends(get_current_user),
     current_org=Depends(get_current_org),
 ):
-    from ..document_renderer import render_cv_to_pdf, render_markdown_to_pdf
-
     if not payload.cv and not payload.markdown:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -805,17 +833,39 @@ def render_pdf(
         )
 
     org_id = current_org["org_id"]
+    template: pdf_render.RenderTemplate
     if payload.markdown:
-        pdf_bytes = render_markdown_to_pdf(payload.markdown, payload.css)
+        template, source = "markdown", payload.markdown
     else:
         assert payload.cv is not None  # guarded by the check above
-        pdf_bytes = render_cv_to_pdf(payload.cv, payload.css)
-    digest = hashlib.sha256(pdf_bytes).hexdigest()
+        template, source = "cv", payload.cv
+    cache_key = pdf_render.render_cache_key(template, source, payload.css)
     storage = get_storage()
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
+    cached = await _find_rendered_file(org_id, cache_key, payload.filename)
+    if cached is not None and await asyncio.to_thread(storage.exists, cached["storage_path"]):
+        pdf_render.record_cache_lookup(hit=True)
+        return _render_pdf_response(cached)
+    pdf_render.record_cache_lookup(hit=False)
+
+    try:
+        pdf_bytes = await pdf_render.render_pdf(template, source, payload.css, cache_key=cache_key)
+    except pdf_render.RenderQueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many PDF renders in progress, retry shortly.",
+            headers={"Retry-After": "5"},
+        ) from exc
+    except TimeoutError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="PDF render timed out.",
+        ) from exc
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+
+    async with async_db_conn() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
                 """
                 INSERT INTO files (
                     org_id,
@@ -824,10 +874,11 @@ def render_pdf(
                     content_type,
                     size_bytes,
                     sha256,
-                    storage_path
+                    storage_path,
+                    render_cache_key
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                RETURNING file_id, created_at
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING file_id, original_name, size_bytes
                 """,
                 (
                     org_id,
@@ -837,23 +888,19 @@ def render_pdf(
                     len(pdf_bytes),
                     digest,
                     "",  # placeholder — updated after we know file_id
+                    cache_key,
                 ),
             )
-            file_row = cur.fetchone()
+            file_row = await cur.fetchone()
             file_id = str(file_row["file_id"])
 
             storage_path = f"files/{file_id}"
-            cur.execute(
+            await cur.execute(
                 "UPDATE files SET storage_path = %s WHERE file_id = %s",
                 (storage_path, file_id),
             )
-        conn.commit()
+        await conn.commit()
 
-    storage.write(storage_path, pdf_bytes)
+    await asyncio.to_thread(storage.write, storage_path, pdf_bytes)
 
-    return RenderPdfResponse(
-        file_id=file_id,
-        original_name=payload.filename,
-        size_bytes=len(pdf_bytes),
-        download_url=f"/files/{file_id}",
-    )
+    return _render_pdf_response(file_row)
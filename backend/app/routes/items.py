@@ -1,25 +1,33 @@
 import base64
 import hashlib
 import json
-from collections.abc import Iterator
+import zlib
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse, StreamingResponse
 from psycopg import sql
 
-from ..db import db_conn, jsonb
+from ..config import settings
+from ..db import db_conn, jsonb, unit_of_work
 from ..deps import get_current_org, get_current_user
 from ..idempotency import (
     compute_request_hash,
     get_idempotent_response,
+    get_idempotent_responses,
     store_idempotent_response,
+    store_idempotent_responses,
 )
 from ..metrics import APP_ITEMS_ARCHIVED_TOTAL, APP_ITEMS_CREATED_TOTAL, APP_ITEMS_UPDATED_TOTAL
 from ..models import (
     ACTION_SUBTYPES,
     FileAppendContentRequest,
     FilePatchContentRequest,
+    ItemBatchRequest,
+    ItemBatchResponse,
+    ItemBatchResult,
     ItemContentResponse,
     ItemCreateRequest,
     ItemPatchRequest,
@@ -27,11 +35,18 @@ from ..models import (
     SearchIndexStatusResponse,
     SyncResponse,
 )
-from ..outbox import enqueue_event
-from ..search.jobs import enqueue_job, get_job, serialize_job
+from ..outbox import enqueue_event, enqueue_events
+from ..projection.items import refresh_item_projection
+from ..search.jobs import enqueue_job, enqueue_jobs, get_job, serialize_job
 from ..storage import get_storage
 from ..text_extractor import extract_file_text
-from ..validation import raise_if_invalid, validate_item_create, validate_item_update
+from ..validation import (
+    raise_if_invalid,
+    validate_item_create,
+    validate_item_transition,
+    validate_item_update,
+    validate_items_create,
+)
 
 router = APIRouter(
     prefix="/items",
@@ -230,16 +245,56 @@ def _get_additional_property(item: dict, property_id: str):
     return None
 
 
-def _stream_export_json(rows) -> Iterator[bytes]:
+EXPORT_FETCH_SIZE = 500
+
+
+def _export_record(row) -> bytes:
+    payload = _dump_response_model(_build_item_response(row))
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _stream_export_json(batches: Iterable[list]) -> Iterator[bytes]:
     yield b"["
-    for index, row in enumerate(rows):
-        if index:
-            yield b",\n"
-        payload = _dump_response_model(_build_item_response(row))
-        yield json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    first = True
+    for batch in batches:
+        records = b",\n".join(_export_record(row) for row in batch)
+        if not records:
+            continue
+        yield records if first else b",\n" + records
+        first = False
     yield b"]"
 
 
+def _stream_export_ndjson(batches: Iterable[list]) -> Iterator[bytes]:
+    for batch in batches:
+        if batch:
+            yield b"".join(_export_record(row) + b"\n" for row in batch)
+
+
+def _gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _iter_export_batches(query: sql.Composable, params: tuple) -> Iterator[list]:
+    """Yield item rows in ``EXPORT_FETCH_SIZE`` batches from a server-side cursor.
+
+    The connection stays open while the response streams, so only one batch
+    is held in API memory regardless of org size.
+    """
+    with db_conn() as conn:
+        with conn.cursor(name="items_export") as cur:
+            cur.itersize = EXPORT_FETCH_SIZE
+            # nosemgrep: sqlalchemy-execute-raw-query
+            cur.execute(query, params)
+            while batch := cur.fetchmany(EXPORT_FETCH_SIZE):
+                yield batch
+
+
 def _validate_action_bucket(item: dict) -> None:
     types = _normalize_types(item.get("@type"))
     if not any(_is_action_type(t) for t in types):
@@ -264,8 +319,8 @@ def list_project_items(
     org_id = current_org["org_id"]
     with db_conn() as conn:
         with conn.cursor() as cur:
-            # Find items where projectRefs contains the project_id
-            # Also include the project item itself
+            # The project item itself plus every item whose app:projectRefs
+            # contains the project id (GIN index on item_projection.project_refs).
             cur.execute(
                 """
                 SELECT
@@ -273,25 +328,22 @@ def list_project_items(
                     canonical_id,
                     schema_jsonld
                 FROM items
-                WHERE org_id = %s
-                  AND archived_at IS NULL
-                  AND (
-                    canonical_id = %s
-                    OR schema_jsonld @> %s::jsonb
-                  )
+                WHERE item_id IN (
+                    SELECT item_id
+                    FROM item_projection
+                    WHERE org_id = %s
+                      AND archived_at IS NULL
+                      AND project_refs @> ARRAY[%s]::text[]
+                    UNION
+                    SELECT item_id
+                    FROM items
+                    WHERE org_id = %s
+                      AND canonical_id = %s
+                      AND archived_at IS NULL
+                )
                 ORDER BY created_at ASC
                 """,
-                (
-                    org_id,
-                    project_id,
-                    json.dumps(
-                        {
-                            "additionalProperty": [
-                                {"propertyID": "app:projectRefs", "value": [project_id]}
-                            ]
-                        }
-                    ),
-                ),
+                (org_id, project_id, org_id, project_id),
             )
             rows = cur.fetchall()
 
@@ -332,6 +384,12 @@ def list_project_items(
 def export_items(
     include_archived: bool = False,
     include_completed: bool = False,
+    export_format: Literal["json", "ndjson"] = Query(
+        default="json",
+        alias="format",
+        description="`json` (one array) or `ndjson` (one item per line).",
+    ),
+    gzip: bool = Query(default=False, description="Gzip-compress the download."),
     current_org=Depends(get_current_org),
 ):
     org_id = current_org["org_id"]
@@ -350,37 +408,37 @@ def export_items(
     params.append(ORG_KNOWLEDGE_CANONICAL_PATTERN)
 
     where_clause = sql.SQL(" AND ").join(conditions)
-
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            # nosemgrep: sqlalchemy-execute-raw-query
-            cur.execute(
-                sql.SQL("""
-                SELECT
-                    item_id,
-                    canonical_id,
-                    source,
-                    schema_jsonld,
-                    content_hash,
-                    created_at,
-                    updated_at
-                FROM items
-                WHERE {where}
-                ORDER BY created_at ASC, item_id ASC
-                """).format(where=where_clause),
-                tuple(params),
-            )
-            rows = cur.fetchall()
+    query = sql.SQL("""
+        SELECT
+            item_id,
+            canonical_id,
+            source,
+            schema_jsonld,
+            content_hash,
+            created_at,
+            updated_at
+        FROM items
+        WHERE {where}
+        ORDER BY created_at ASC, item_id ASC
+        """).format(where=where_clause)
+
+    batches = _iter_export_batches(query, tuple(params))
+    if export_format == "ndjson":
+        body = _stream_export_ndjson(batches)
+        media_type = "application/x-ndjson"
+    else:
+        body = _stream_export_json(batches)
+        media_type = "application/json"
 
     timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-    filename = f"items-export-{timestamp}.json"
+    filename = f"items-export-{timestamp}.{export_format}"
+    if gzip:
+        body = _gzip_stream(body)
+        media_type = "application/gzip"
+        filename += ".gz"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
 
-    return StreamingResponse(
-        _stream_export_json(rows),
-        media_type="application/json",
-        headers=headers,
-    )
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 
 @router.get(
@@ -507,11 +565,11 @@ def sync_items(
     # Validate and build completed filter clause
     completed_value = (completed or "false").lower()
     if completed_value == "false":
-        endtime_clause = sql.SQL("AND (schema_jsonld->>'endTime') IS NULL")
+        completed_clause = sql.SQL("AND NOT p.is_completed")
     elif completed_value == "true":
-        endtime_clause = sql.SQL("AND (schema_jsonld->>'endTime') IS NOT NULL")
+        completed_clause = sql.SQL("AND p.is_completed")
     elif completed_value == "all":
-        endtime_clause = sql.SQL("")
+        completed_clause = sql.SQL("")
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -522,80 +580,40 @@ def sync_items(
     cursor_filter = _decode_cursor(cursor) if cursor else None
     org_id = current_org["org_id"]
 
+    conditions = [sql.SQL("p.archived_at IS NULL AND p.org_id = %s AND i.canonical_id NOT LIKE %s")]
+    params: list = [org_id, ORG_KNOWLEDGE_CANONICAL_PATTERN]
+    if cursor_filter:
+        conditions.append(sql.SQL("(p.item_created_at, p.item_id) > (%s, %s)"))
+        params.extend(cursor_filter)
+    elif since_filter:
+        conditions.append(sql.SQL("i.updated_at > %s"))
+        params.append(since_filter)
+
     with db_conn() as conn:
         with conn.cursor() as cur:
-            if cursor_filter:
-                # nosemgrep: sqlalchemy-execute-raw-query
-                cur.execute(
-                    sql.SQL("""
-                    SELECT
-                        item_id,
-                        canonical_id,
-                        source,
-                        schema_jsonld,
-                        content_hash,
-                        created_at,
-                        updated_at
-                    FROM items
-                    WHERE archived_at IS NULL AND org_id = %s
-                      AND canonical_id NOT LIKE %s
-                      {endtime}
-                      AND (created_at, item_id) > (%s, %s)
-                    ORDER BY created_at ASC, item_id ASC
-                    LIMIT %s
-                    """).format(endtime=endtime_clause),
-                    (
-                        org_id,
-                        ORG_KNOWLEDGE_CANONICAL_PATTERN,
-                        cursor_filter[0],
-                        cursor_filter[1],
-                        limit,
-                    ),
-                )
-            elif since_filter:
-                # nosemgrep: sqlalchemy-execute-raw-query
-                cur.execute(
-                    sql.SQL("""
-                    SELECT
-                        item_id,
-                        canonical_id,
-                        source,
-                        schema_jsonld,
-                        content_hash,
-                        created_at,
-                        updated_at
-                    FROM items
-                    WHERE archived_at IS NULL
-                      AND org_id = %s
-                      AND updated_at > %s
-                      AND canonical_id NOT LIKE %s
-                      {endtime}
-                    ORDER BY created_at ASC, item_id ASC
-                    LIMIT %s
-                    """).format(endtime=endtime_clause),
-                    (org_id, since_filter, ORG_KNOWLEDGE_CANONICAL_PATTERN, limit),
-                )
-            else:
-                # nosemgrep: sqlalchemy-execute-raw-query
-                cur.execute(
-                    sql.SQL("""
-                    SELECT
-                        item_id,
-                        canonical_id,
-                        source,
-                        schema_jsonld,
-                        content_hash,
-                        created_at,
-                        updated_at
-                    FROM items
-                    WHERE archived_at IS NULL AND org_id = %s
-                      AND canonical_id NOT LIKE %s
-                      {endtime}
-                    ORDER BY created_at ASC, item_id ASC
-                    LIMIT %s
-                    """).format(endtime=endtime_clause),
-                    (org_id, ORG_KNOWLEDGE_CANONICAL_PATTERN, limit),
-                )
+            # nosemgrep: sqlalchemy-execute-raw-query
+            cur.execute(
+                sql.SQL("""
+                SELECT
+                    i.item_id,
+                    i.canonical_id,
+                    i.source,
+                    i.schema_jsonld,
+                    i.content_hash,
+                    i.created_at,
+                    i.updated_at
+                FROM item_projection p
+                JOIN items i ON i.item_id = p.item_id
+                WHERE {where}
+                  {completed}
+                ORDER BY p.item_created_at ASC, p.item_id ASC
+                LIMIT %s
+                """).format(
+                    where=sql.SQL(" AND ").join(conditions),
+                    completed=completed_clause,
+                ),
+                (*params, limit),
+            )
             rows = cur.fetchall()
 
     items = [_build_item_response(row) for row in rows]
@@ -813,6 +831,7 @@ def patch_item_file_content(
                 "UPDATE items SET schema_jsonld = %s, updated_at = %s WHERE item_id = %s",
                 (jsonb(jsonld), now, row["item_id"]),
             )
+            refresh_item_projection(cur, [row["item_id"]])
         conn.commit()
     return {"ok": True}
 
@@ -853,6 +872,7 @@ def append_item_content(
                 "UPDATE items SET schema_jsonld = %s, updated_at = %s WHERE item_id = %s",
                 (jsonb(jsonld), now_iso, row["item_id"]),
             )
+            refresh_item_projection(cur, [row["item_id"]])
         conn.commit()
     return {"ok": True}
 
@@ -901,123 +921,134 @@ def update_item(
             f"/items/{item_id}",
             request_payload,
         )
-        cached = get_idempotent_response(org_id, idempotency_key, request_hash)
-        if cached:
-            return JSONResponse(
-                content=cached["response"],
-                status_code=cached["status_code"],
-            )
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    item_id,
-                    canonical_id,
-                    source,
-                    schema_jsonld,
-                    content_hash,
-                    created_at,
-                    updated_at
-                FROM items
-                WHERE item_id = %s AND org_id = %s AND archived_at IS NULL
-                """,
-                (item_id, org_id),
-            )
-            existing = cur.fetchone()
+    with unit_of_work() as cur:
+        if idempotency_key:
+            cached = get_idempotent_response(org_id, idempotency_key, request_hash, cur=cur)
+            if cached:
+                return JSONResponse(
+                    content=cached["response"],
+                    status_code=cached["status_code"],
+                )
 
-    if existing is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+        # Lock the row so the If-Match check and the update see the same version.
+        cur.execute(
+            """
+            SELECT
+                item_id,
+                canonical_id,
+                source,
+                schema_jsonld,
+                content_hash,
+                created_at,
+                updated_at
+            FROM items
+            WHERE item_id = %s AND org_id = %s AND archived_at IS NULL
+            FOR UPDATE
+            """,
+            (item_id, org_id),
+        )
+        existing = cur.fetchone()
+
+        if existing is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+
+        if if_match and existing["content_hash"]:
+            current_etag = _build_etag([existing["content_hash"]])
+            if if_match.strip('"') != current_etag.strip('"'):
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail={
+                        "code": "PRECONDITION_FAILED",
+                        "message": "Resource has been modified since last read",
+                    },
+                )
+
+        patch_payload = payload.item.model_dump(mode="json", by_alias=True, exclude_unset=True)
 
-    if if_match and existing["content_hash"]:
-        current_etag = _build_etag([existing["content_hash"]])
-        if if_match.strip('"') != current_etag.strip('"'):
+        if "@id" in patch_payload and patch_payload["@id"] != existing["canonical_id"]:
             raise HTTPException(
-                status_code=status.HTTP_412_PRECONDITION_FAILED,
-                detail={
-                    "code": "PRECONDITION_FAILED",
-                    "message": "Resource has been modified since last read",
-                },
+                status_code=status.HTTP_400_BAD_REQUEST, detail="@id cannot be changed"
             )
 
-    patch_payload = payload.item.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        merged = _deep_merge(existing["schema_jsonld"], patch_payload)
 
-    if "@id" in patch_payload and patch_payload["@id"] != existing["canonical_id"]:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@id cannot be changed")
+        if _detect_name_change(existing["schema_jsonld"], patch_payload):
+            merged = _apply_rename_provenance(
+                merged,
+                existing["schema_jsonld"].get("name"),
+                patch_payload.get("name"),
+                payload.source,
+                payload.name_source,
+            )
 
-    merged = _deep_merge(existing["schema_jsonld"], patch_payload)
+        merged_id = merged.get("@id")
+        if merged_id is None:
+            merged["@id"] = existing["canonical_id"]
+        elif merged_id != existing["canonical_id"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="@id cannot be changed"
+            )
 
-    if _detect_name_change(existing["schema_jsonld"], patch_payload):
-        merged = _apply_rename_provenance(
-            merged,
-            existing["schema_jsonld"].get("name"),
-            patch_payload.get("name"),
-            payload.source,
-            payload.name_source,
+        if not merged.get("@type"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@type is required")
+        content_hash = _hash_payload(merged)
+        raise_if_invalid(
+            validate_item_update(
+                existing["schema_jsonld"], merged, content_hash=content_hash, cur=cur
+            )
         )
 
-    merged_id = merged.get("@id")
-    if merged_id is None:
-        merged["@id"] = existing["canonical_id"]
-    elif merged_id != existing["canonical_id"]:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@id cannot be changed")
-
-    if not merged.get("@type"):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@type is required")
-    raise_if_invalid(validate_item_update(existing["schema_jsonld"], merged))
-
-    content_hash = _hash_payload(merged)
-    source = payload.source or existing["source"]
-    updated_at = datetime.now(UTC)
+        source = payload.source or existing["source"]
+        updated_at = datetime.now(UTC)
+
+        cur.execute(
+            """
+            UPDATE items
+            SET schema_jsonld = %s,
+                source = %s,
+                content_hash = %s,
+                updated_at = %s
+            WHERE item_id = %s AND org_id = %s
+            RETURNING
+                item_id,
+                canonical_id,
+                source,
+                schema_jsonld,
+                content_hash,
+                created_at,
+                updated_at
+            """,
+            (jsonb(merged), source, content_hash, updated_at, item_id, org_id),
+        )
+        row = cur.fetchone()
+        refresh_item_projection(cur, [row["item_id"]])
+        enqueue_event(
+            "item_upserted",
+            {"item_id": str(row["item_id"]), "org_id": org_id},
+            cur=cur,
+        )
+        enqueue_job(
+            org_id=org_id,
+            entity_type="item",
+            entity_id=str(row["item_id"]),
+            action="upsert",
+            requested_by_user_id=str(current_user["id"]),
+            cur=cur,
+        )
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE items
-                SET schema_jsonld = %s,
-                    source = %s,
-                    content_hash = %s,
-                    updated_at = %s
-                WHERE item_id = %s AND org_id = %s AND archived_at IS NULL
-                RETURNING
-                    item_id,
-                    canonical_id,
-                    source,
-                    schema_jsonld,
-                    content_hash,
-                    created_at,
-                    updated_at
-                """,
-                (jsonb(merged), source, content_hash, updated_at, item_id, org_id),
+        response = _build_item_response(row)
+        if idempotency_key:
+            store_idempotent_response(
+                org_id,
+                idempotency_key,
+                request_hash,
+                _dump_response_model(response),
+                status.HTTP_200_OK,
+                cur=cur,
             )
-            row = cur.fetchone()
-        conn.commit()
-
-    if row is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
     APP_ITEMS_UPDATED_TOTAL.inc()
-    enqueue_event("item_upserted", {"item_id": str(row["item_id"]), "org_id": org_id})
-    enqueue_job(
-        org_id=org_id,
-        entity_type="item",
-        entity_id=str(row["item_id"]),
-        action="upsert",
-        requested_by_user_id=str(current_user["id"]),
-    )
-
-    response = _build_item_response(row)
-    if idempotency_key:
-        store_idempotent_response(
-            org_id,
-            idempotency_key,
-            request_hash,
-            _dump_response_model(response),
-            status.HTTP_200_OK,
-        )
-
     return JSONResponse(
         content=_dump_response_model(response),
         status_code=status.HTTP_200_OK,
@@ -1040,53 +1071,53 @@ def archive_item(
     org_id = current_org["org_id"]
     archived_at = datetime.now(UTC)
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
+    with unit_of_work() as cur:
+        cur.execute(
+            """
+            UPDATE items
+            SET archived_at = %s,
+                updated_at = %s
+            WHERE item_id = %s AND org_id = %s AND archived_at IS NULL
+            RETURNING item_id, archived_at
+            """,
+            (archived_at, archived_at, item_id, org_id),
+        )
+        row = cur.fetchone()
+
+        if row is None:
             cur.execute(
                 """
-                UPDATE items
-                SET archived_at = %s,
-                    updated_at = %s
-                WHERE item_id = %s AND org_id = %s AND archived_at IS NULL
-                RETURNING item_id, archived_at
+                SELECT item_id, archived_at
+                FROM items
+                WHERE item_id = %s AND org_id = %s
                 """,
-                (archived_at, archived_at, item_id, org_id),
+                (item_id, org_id),
             )
-            row = cur.fetchone()
-
-            if row is None:
-                cur.execute(
-                    """
-                    SELECT item_id, archived_at
-                    FROM items
-                    WHERE item_id = %s AND org_id = %s
-                    """,
-                    (item_id, org_id),
-                )
-                existing = cur.fetchone()
-            else:
-                existing = None
-        conn.commit()
+            existing = cur.fetchone()
+            if existing is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+            return {
+                "item_id": str(existing["item_id"]),
+                "archived_at": existing["archived_at"].isoformat(),
+                "ok": True,
+            }
 
-    if row is None:
-        if existing is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
-        return {
-            "item_id": str(existing["item_id"]),
-            "archived_at": existing["archived_at"].isoformat(),
-            "ok": True,
-        }
+        refresh_item_projection(cur, [row["item_id"]])
+        enqueue_event(
+            "item_archived",
+            {"item_id": str(row["item_id"]), "org_id": org_id},
+            cur=cur,
+        )
+        enqueue_job(
+            org_id=org_id,
+            entity_type="item",
+            entity_id=str(row["item_id"]),
+            action="delete",
+            requested_by_user_id=str(current_user["id"]),
+            cur=cur,
+        )
 
     APP_ITEMS_ARCHIVED_TOTAL.inc()
-    enqueue_event("item_archived", {"item_id": str(row["item_id"]), "org_id": org_id})
-    enqueue_job(
-        org_id=org_id,
-        entity_type="item",
-        entity_id=str(row["item_id"]),
-        action="delete",
-        requested_by_user_id=str(current_user["id"]),
-    )
-
     return {
         "item_id": str(row["item_id"]),
         "archived_at": row["archived_at"].isoformat(),
@@ -1112,12 +1143,6 @@ def create_item(
             "/items",
             payload.model_dump(mode="json", by_alias=True),
         )
-        cached = get_idempotent_response(org_id, idempotency_key, request_hash)
-        if cached:
-            return JSONResponse(
-                content=cached["response"],
-                status_code=cached["status_code"],
-            )
 
     item_data = payload.item.model_dump(mode="json", by_alias=True)
     canonical_id = item_data.get("@id")
@@ -1125,25 +1150,54 @@ def create_item(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@id is required")
     if not item_data.get("@type"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="@type is required")
-    raise_if_invalid(validate_item_create(item_data))
-
     content_hash = _hash_payload(item_data)
 
-    with db_conn() as conn:
-        with conn.cursor() as cur:
+    with unit_of_work() as cur:
+        raise_if_invalid(validate_item_create(item_data, content_hash=content_hash, cur=cur))
+        if idempotency_key:
+            cached = get_idempotent_response(org_id, idempotency_key, request_hash, cur=cur)
+            if cached:
+                return JSONResponse(
+                    content=cached["response"],
+                    status_code=cached["status_code"],
+                )
+
+        cur.execute(
+            """
+            INSERT INTO items (
+                org_id,
+                created_by_user_id,
+                canonical_id,
+                schema_jsonld,
+                source,
+                content_hash
+            )
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (org_id, canonical_id) DO NOTHING
+            RETURNING
+                item_id,
+                canonical_id,
+                source,
+                schema_jsonld,
+                content_hash,
+                created_at,
+                updated_at
+            """,
+            (
+                org_id,
+                current_user["id"],
+                canonical_id,
+                jsonb(item_data),
+                payload.source,
+                content_hash,
+            ),
+        )
+        row = cur.fetchone()
+
+        if row is None:
             cur.execute(
                 """
-                INSERT INTO items (
-                    org_id,
-                    created_by_user_id,
-                    canonical_id,
-                    schema_jsonld,
-                    source,
-                    content_hash
-                )
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (org_id, canonical_id) DO NOTHING
-                RETURNING
+                SELECT
                     item_id,
                     canonical_id,
                     source,
@@ -1151,97 +1205,80 @@ def create_item(
                     content_hash,
                     created_at,
                     updated_at
+                FROM items
+                WHERE canonical_id = %s AND org_id = %s
                 """,
-                (
-                    org_id,
-                    current_user["id"],
-                    canonical_id,
-                    jsonb(item_data),
-                    payload.source,
-                    content_hash,
-                ),
+                (canonical_id, org_id),
             )
-            row = cur.fetchone()
-
-            if row is None:
-                cur.execute(
-                    """
-                    SELECT
-                        item_id,
-                        canonical_id,
-                        source,
-                        schema_jsonld,
-                        content_hash,
-                        created_at,
-                        updated_at
-                    FROM items
-                    WHERE canonical_id = %s AND org_id = %s
-                    """,
-                    (canonical_id, org_id),
+            existing = cur.fetchone()
+            if existing is None:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to create item",
                 )
-                existing = cur.fetchone()
-                if existing is None:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to create item",
-                    )
 
-                if existing["content_hash"] == content_hash:
-                    response = _build_item_response(existing)
-                    if idempotency_key:
-                        store_idempotent_response(
-                            org_id,
-                            idempotency_key,
-                            request_hash,
-                            _dump_response_model(response),
-                            status.HTTP_200_OK,
-                        )
-                    return JSONResponse(
-                        content=_dump_response_model(response),
-                        status_code=status.HTTP_200_OK,
-                        headers={
-                            "ETag": _build_etag([existing["content_hash"]]),
-                            "Last-Modified": existing["updated_at"].isoformat(),
-                        },
-                    )
-
-                conflict_payload = {
-                    "detail": "Conflict: canonical_id already exists",
-                    "existing": _dump_response_model(_build_item_response(existing)),
-                }
+            if existing["content_hash"] == content_hash:
+                response = _build_item_response(existing)
                 if idempotency_key:
                     store_idempotent_response(
                         org_id,
                         idempotency_key,
                         request_hash,
-                        conflict_payload,
-                        status.HTTP_409_CONFLICT,
+                        _dump_response_model(response),
+                        status.HTTP_200_OK,
+                        cur=cur,
                     )
                 return JSONResponse(
-                    content=conflict_payload,
-                    status_code=status.HTTP_409_CONFLICT,
+                    content=_dump_response_model(response),
+                    status_code=status.HTTP_200_OK,
                     headers={
                         "ETag": _build_etag([existing["content_hash"]]),
                         "Last-Modified": existing["updated_at"].isoformat(),
                     },
                 )
 
-        conn.commit()
-
-    bucket = _get_additional_property(item_data, "app:bucket") or "unknown"
-    APP_ITEMS_CREATED_TOTAL.labels(bucket=bucket).inc()
-    enqueue_event("item_upserted", {"item_id": str(row["item_id"]), "org_id": org_id})
+            conflict_payload = {
+                "detail": "Conflict: canonical_id already exists",
+                "existing": _dump_response_model(_build_item_response(existing)),
+            }
+            if idempotency_key:
+                store_idempotent_response(
+                    org_id,
+                    idempotency_key,
+                    request_hash,
+                    conflict_payload,
+                    status.HTTP_409_CONFLICT,
+                    cur=cur,
+                )
+            return JSONResponse(
+                content=conflict_payload,
+                status_code=status.HTTP_409_CONFLICT,
+                headers={
+                    "ETag": _build_etag([existing["content_hash"]]),
+                    "Last-Modified": existing["updated_at"].isoformat(),
+                },
+            )
 
-    response = _build_item_response(row)
-    if idempotency_key:
-        store_idempotent_response(
-            org_id,
-            idempotency_key,
-            request_hash,
-            _dump_response_model(response),
-            status.HTTP_201_CREATED,
+        refresh_item_projection(cur, [row["item_id"]])
+        enqueue_event(
+            "item_upserted",
+            {"item_id": str(row["item_id"]), "org_id": org_id},
+            cur=cur,
         )
 
+        response = _build_item_response(row)
+        if idempotency_key:
+            store_idempotent_response(
+                org_id,
+                idempotency_key,
+                request_hash,
+                _dump_response_model(response),
+                status.HTTP_201_CREATED,
+                cur=cur,
+            )
+
+    bucket = _get_additional_property(item_data, "app:bucket") or "unknown"
+    APP_ITEMS_CREATED_TOTAL.labels(bucket=bucket).inc()
     return JSONResponse(
         content=_dump_response_model(response),
         status_code=status.HTTP_201_CREATED,
@@ -1250,3 +1287,340 @@ def create_item(
             "Last-Modified": row["updated_at"].isoformat(),
         },
     )
+
+
+_BATCH_ITEM_COLUMNS = """
+    item_id,
+    canonical_id,
+    source,
+    schema_jsonld,
+    content_hash,
+    created_at,
+    updated_at"""
+
+# New items only: a row created concurrently since the lock scan is left alone
+# and checked like any other existing item.
+_BATCH_INSERT_SQL = f"""
+INSERT INTO items (org_id, created_by_user_id, canonical_id, schema_jsonld, source, content_hash)
+SELECT %s, %s, t.canonical_id, t.schema_jsonld, t.source, t.content_hash
+FROM unnest(%s::text[], %s::jsonb[], %s::text[], %s::text[])
+    AS t(canonical_id, schema_jsonld, source, content_hash)
+ON CONFLICT (org_id, canonical_id) DO NOTHING
+RETURNING {_BATCH_ITEM_COLUMNS},
+    TRUE AS inserted
+"""
+
+_BATCH_UPSERT_SQL = f"""
+INSERT INTO items (org_id, created_by_user_id, canonical_id, schema_jsonld, source, content_hash)
+SELECT %s, %s, t.canonical_id, t.schema_jsonld, t.source, t.content_hash
+FROM unnest(%s::text[], %s::jsonb[], %s::text[], %s::text[])
+    AS t(canonical_id, schema_jsonld, source, content_hash)
+ON CONFLICT (org_id, canonical_id) DO UPDATE
+SET schema_jsonld = EXCLUDED.schema_jsonld,
+    source = EXCLUDED.source,
+    content_hash = EXCLUDED.content_hash,
+    updated_at = now()
+WHERE items.archived_at IS NULL
+RETURNING {_BATCH_ITEM_COLUMNS},
+    (xmax = 0) AS inserted
+"""
+
+
+def _lock_batch_items(cur, org_id: str, canonical_ids: list[str]) -> dict[str, dict]:  # noqa: ANN001
+    # Lock in a stable order so concurrent batches cannot deadlock.
+    cur.execute(
+        f"""
+        SELECT {_BATCH_ITEM_COLUMNS},
+            archived_at
+        FROM items
+        WHERE org_id = %s AND canonical_id = ANY(%s)
+        ORDER BY canonical_id
+        FOR UPDATE
+        """,
+        (org_id, canonical_ids),
+    )
+    return {row["canonical_id"]: row for row in cur.fetchall()}
+
+
+def _existing_item_result(index: int, item: dict, content_hash: str, row: dict) -> dict | None:
+    """Result for an entry whose item exists, or ``None`` when it may be replaced."""
+    canonical_id = item["@id"]
+    if row["archived_at"] is not None:
+        return _batch_result(
+            index,
+            canonical_id,
+            "error",
+            status.HTTP_409_CONFLICT,
+            error={"message": "Item is archived"},
+        )
+    if row["content_hash"] == content_hash:
+        return _batch_result(
+            index,
+            canonical_id,
+            "unchanged",
+            status.HTTP_200_OK,
+            item=_build_item_response(row),
+        )
+    if issues := validate_item_transition(row["schema_jsonld"], item):
+        return _batch_result(
+            index,
+            canonical_id,
+            "error",
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error={"message": str(issues[0].get("message")), "issues": issues},
+        )
+    return None
+
+
+def _batch_result(
+    index: int,
+    canonical_id: str | None,
+    outcome: str,
+    status_code: int,
+    *,
+    item: ItemResponse | None = None,
+    error: dict | None = None,
+) -> dict:
+    return _dump_response_model(
+        ItemBatchResult(
+            index=index,
+            canonical_id=canonical_id,
+            status=outcome,
+            status_code=status_code,
+            item=item,
+            error=error,
+        )
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=ItemBatchResponse,
+    summary="Create or replace several items with per-item results",
+)
+def upsert_items_batch(
+    payload: ItemBatchRequest,
+    current_user=Depends(get_current_user),
+    current_org=Depends(get_current_org),
+):
+    """Upsert up to ``ITEMS_BATCH_MAX_ITEMS`` items in one request.
+
+    Entries are validated together, then the valid ones are written with one
+    multi-row upsert, one outbox batch and one idempotency insert, committed
+    as a unit. A failing entry only fails itself: its result carries the
+    status code and error it would get on its own, and the rest are written.
+    Existing items are replaced (subject to the update transition rules);
+    entries whose content is unchanged are reported as ``unchanged``.
+    """
+    org_id = current_org["org_id"]
+    if len(payload.items) > settings.items_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.items_batch_max_items} items per batch",
+        )
+
+    entries = payload.items
+    items = [entry.item.model_dump(mode="json", by_alias=True) for entry in entries]
+    results: list[dict | None] = [None] * len(entries)
+
+    seen_ids: set[str] = set()
+    seen_keys: set[str] = set()
+    for index, (entry, item) in enumerate(zip(entries, items, strict=True)):
+        canonical_id = item.get("@id")
+        if not canonical_id:
+            message = "@id is required"
+        elif not item.get("@type"):
+            message = "@type is required"
+        elif canonical_id in seen_ids:
+            message = "Duplicate @id in batch"
+        elif entry.idempotency_key and entry.idempotency_key in seen_keys:
+            message = "Duplicate idempotency_key in batch"
+        else:
+            seen_ids.add(canonical_id)
+            if entry.idempotency_key:
+                seen_keys.add(entry.idempotency_key)
+            continue
+        results[index] = _batch_result(
+            index, canonical_id, "error", status.HTTP_400_BAD_REQUEST, error={"message": message}
+        )
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    content_hashes = {index: _hash_payload(items[index]) for index in pending}
+    with unit_of_work() as cur:
+        create_issues = validate_items_create(
+            [items[index] for index in pending],
+            content_hashes=[content_hashes[index] for index in pending],
+            cur=cur,
+        )
+    for index, issues in zip(pending, create_issues, strict=True):
+        if issues:
+            results[index] = _batch_result(
+                index,
+                items[index]["@id"],
+                "error",
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                error={"message": str(issues[0].get("message")), "issues": issues},
+            )
+
+    request_hashes = [
+        compute_request_hash(
+            "POST",
+            "/items/batch",
+            entry.model_dump(mode="json", by_alias=True, exclude={"idempotency_key"}),
+        )
+        for entry in entries
+    ]
+    keyed = {
+        index: entries[index].idempotency_key
+        for index, result in enumerate(results)
+        if result is None and entries[index].idempotency_key
+    }
+    replayed: set[int] = set()
+    created_buckets: list[str] = []
+    updated_count = 0
+
+    with unit_of_work() as cur:
+        stored = get_idempotent_responses(org_id, list(keyed.values()), cur=cur)
+        for index, key in keyed.items():
+            row = stored.get(key)
+            if row is None:
+                continue
+            replayed.add(index)
+            if row["request_hash"] != request_hashes[index]:
+                results[index] = _batch_result(
+                    index,
+                    items[index]["@id"],
+                    "error",
+                    status.HTTP_409_CONFLICT,
+                    error={"message": "Idempotency key reuse with different payload"},
+                )
+            else:
+                results[index] = {**row["response_json"], "index": index}
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        existing = _lock_batch_items(cur, org_id, [items[index]["@id"] for index in pending])
+
+        def _classify(indexes: list[int], rows: dict[str, dict]) -> list[int]:
+            replace: list[int] = []
+            for index in indexes:
+                result = _existing_item_result(
+                    index, items[index], content_hashes[index], rows[items[index]["@id"]]
+                )
+                if result is None:
+                    replace.append(index)
+                else:
+                    results[index] = result
+            return replace
+
+        def _write(query: str, indexes: list[int]) -> dict[str, dict]:
+            cur.execute(
+                query,
+                (
+                    org_id,
+                    current_user["id"],
+                    [items[index]["@id"] for index in indexes],
+                    [jsonb(items[index]) for index in indexes],
+                    [entries[index].source for index in indexes],
+                    [content_hashes[index] for index in indexes],
+                ),
+            )
+            return {row["canonical_id"]: row for row in cur.fetchall()}
+
+        inserts = [index for index in pending if items[index]["@id"] not in existing]
+        updates = _classify(
+            [index for index in pending if items[index]["@id"] in existing], existing
+        )
+
+        written: dict[str, dict] = {}
+        if inserts:
+            written = _write(_BATCH_INSERT_SQL, inserts)
+            raced = [index for index in inserts if items[index]["@id"] not in written]
+            if raced:
+                # Created by a concurrent request after the lock scan: the
+                # insert waited for it to commit, so lock and check it now.
+                rows = _lock_batch_items(cur, org_id, [items[index]["@id"] for index in raced])
+                inserts = [index for index in inserts if items[index]["@id"] in written]
+                updates += _classify(
+                    [index for index in raced if items[index]["@id"] in rows], rows
+                )
+                for index in raced:
+                    if items[index]["@id"] not in rows:
+                        results[index] = _batch_result(
+                            index,
+                            items[index]["@id"],
+                            "error",
+                            status.HTTP_409_CONFLICT,
+                            error={"message": "Item changed concurrently"},
+                        )
+        if updates:
+            written.update(_write(_BATCH_UPSERT_SQL, updates))
+
+        writes = sorted(inserts + updates)
+        for index in writes:
+            canonical_id = items[index]["@id"]
+            row = written.get(canonical_id)
+            if row is None:
+                # Archived by a concurrent request after the lock scan.
+                results[index] = _batch_result(
+                    index,
+                    canonical_id,
+                    "error",
+                    status.HTTP_409_CONFLICT,
+                    error={"message": "Item is archived"},
+                )
+            elif row["inserted"]:
+                created_buckets.append(
+                    _get_additional_property(items[index], "app:bucket") or "unknown"
+                )
+                results[index] = _batch_result(
+                    index,
+                    canonical_id,
+                    "created",
+                    status.HTTP_201_CREATED,
+                    item=_build_item_response(row),
+                )
+            else:
+                updated_count += 1
+                results[index] = _batch_result(
+                    index,
+                    canonical_id,
+                    "updated",
+                    status.HTTP_200_OK,
+                    item=_build_item_response(row),
+                )
+
+        if written:
+            refresh_item_projection(cur, [row["item_id"] for row in written.values()])
+            enqueue_events(
+                "item_upserted",
+                [{"item_id": str(row["item_id"]), "org_id": org_id} for row in written.values()],
+                cur=cur,
+            )
+            enqueue_jobs(
+                org_id,
+                "item",
+                [str(row["item_id"]) for row in written.values() if not row["inserted"]],
+                "upsert",
+                requested_by_user_id=str(current_user["id"]),
+                cur=cur,
+            )
+
+        # Like POST /items, validation failures are not remembered.
+        store_idempotent_responses(
+            org_id,
+            [
+                (key, request_hashes[index], results[index], results[index]["status_code"])
+                for index, key in keyed.items()
+                if index not in replayed
+                and results[index]["status_code"]
+                not in (status.HTTP_400_BAD_REQUEST, status.HTTP_422_UNPROCESSABLE_ENTITY)
+            ],
+            cur=cur,
+        )
+
+    for bucket in created_buckets:
+        APP_ITEMS_CREATED_TOTAL.labels(bucket=bucket).inc()
+    if updated_count:
+        APP_ITEMS_UPDATED_TOTAL.inc(updated_count)
+
+    return JSONResponse(content={"results": results}, status_code=status.HTTP_200_OK)
@@ -5,21 +5,20 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-import psycopg
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from psycopg import sql
 from pydantic import BaseModel, Field
 
-from ..config import settings
 from ..deps import get_current_org, get_current_user
+from ..notification_hub import RESYNC, get_notification_hub
 from ..notifications import (
-    NOTIFICATION_NOTIFY_CHANNEL,
     create_notification_event,
     list_notification_events,
+    list_notification_events_async,
     parse_notification_cursor,
 )
 from ..observability import get_logger
@@ -27,7 +26,9 @@ from ..observability import get_logger
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 logger = get_logger("routes.notifications")
 
-_NOTIFICATION_WAIT_STOP_AFTER = 100
+_HEARTBEAT_SECONDS = 15.0
+_REPLAY_PAGE_SIZE = 200
+_SENT_IDS_WINDOW = 1000
 
 
 class NotificationSendRequest(BaseModel):
@@ -50,68 +51,23 @@ class NotificationResponse(BaseModel):
     read_at: str | None = None
 
 
-def _notification_matches_scope(payload: str | None, *, org_id: str, user_id: str) -> bool:
-    if not payload:
-        return True
-    try:
-        parsed = json.loads(payload)
-    except json.JSONDecodeError:
-        return True
-    if not isinstance(parsed, dict):
-        return True
-    return str(parsed.get("org_id")) == org_id and str(parsed.get("user_id")) == user_id
-
-
-async def _open_notification_listener() -> psycopg.AsyncConnection | None:
-    channel = NOTIFICATION_NOTIFY_CHANNEL
-    try:
-        listener_conn = await psycopg.AsyncConnection.connect(
-            settings.database_url,
-            autocommit=True,
+def _format_sse_event(event: dict[str, Any]) -> str:
+    payload = json.dumps(event, separators=(",", ":"))
+    # The id doubles as the replay cursor EventSource sends back as Last-Event-ID.
+    return f"id: {event.get('created_at') or ''}\nevent: notification\ndata: {payload}\n\n"
+
+
+def _resolve_stream_cursor(cursor: str | None, last_event_id: str | None) -> datetime | None:
+    """Pick the later of ``cursor`` and ``Last-Event-ID`` (sent on reconnect)."""
+    candidates = [
+        parsed
+        for parsed in (
+            parse_notification_cursor(cursor),
+            parse_notification_cursor(last_event_id),
         )
-        async with listener_conn.cursor() as cur:
-            # nosemgrep: sqlalchemy-execute-raw-query
-            await cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
-        logger.info("notifications.listen_ready", channel=channel)
-        return listener_conn
-    except Exception:  # noqa: BLE001
-        logger.warning("notifications.listen_start_failed", channel=channel, exc_info=True)
-        return None
-
-
-async def _close_notification_listener(listener_conn: psycopg.AsyncConnection | None) -> None:
-    if listener_conn is None:
-        return
-    try:
-        await listener_conn.close()
-    except Exception:  # noqa: BLE001
-        logger.debug("notifications.listen_close_failed", exc_info=True)
-
-
-async def _wait_for_notification_signal(
-    listener_conn: psycopg.AsyncConnection,
-    *,
-    timeout: float,
-    org_id: str,
-    user_id: str,
-) -> bool | None:
-    timeout_seconds = max(0.1, float(timeout))
-    try:
-        async for notification in listener_conn.notifies(
-            timeout=timeout_seconds,
-            stop_after=_NOTIFICATION_WAIT_STOP_AFTER,
-        ):
-            if _notification_matches_scope(notification.payload, org_id=org_id, user_id=user_id):
-                logger.debug(
-                    "notifications.notified",
-                    channel=notification.channel,
-                    payload=notification.payload,
-                )
-                return True
-        return False
-    except Exception:  # noqa: BLE001
-        logger.warning("notifications.listen_wait_failed", exc_info=True)
-        return None
+        if parsed is not None
+    ]
+    return max(candidates) if candidates else None
 
 
 @router.post("/send", response_model=NotificationResponse, summary="Create a notification event")
@@ -162,7 +118,7 @@ async def stream_notifications(
         default=1.0,
         ge=0.01,
         le=10.0,
-        description="Fallback poll interval when LISTEN/NOTIFY is unavailable.",
+        description="Fallback poll interval when the notification hub is unavailable.",
     ),
     idle_wait_seconds: float = Query(
         default=30.0,
@@ -171,12 +127,18 @@ async def stream_notifications(
         description="Maximum LISTEN/NOTIFY wait before running a fallback poll.",
     ),
     max_events: int | None = Query(default=None, ge=1, le=1000),
+    last_event_id: str | None = Header(
+        default=None,
+        alias="Last-Event-ID",
+        description="Replay cursor sent by EventSource on reconnect.",
+    ),
     current_user=Depends(get_current_user),
     org=Depends(get_current_org),
 ):
     since = parse_notification_cursor(cursor)
     if cursor and since is None:
         raise HTTPException(status_code=400, detail="Invalid cursor")
+    since = _resolve_stream_cursor(cursor, last_event_id)
     if since is None:
         since = datetime.now(UTC) - timedelta(minutes=10)
 
@@ -186,49 +148,73 @@ async def stream_notifications(
     async def event_stream():
         emitted = 0
         last_seen = since
-        heartbeat_deadline = time.monotonic() + 15.0
-        listener_conn = await _open_notification_listener()
+        # Hub events can overlap a replay page; remember what was already sent.
+        sent_ids: deque[str] = deque(maxlen=_SENT_IDS_WINDOW)
+        heartbeat_deadline = time.monotonic() + _HEARTBEAT_SECONDS
+        idle_deadline = time.monotonic() + idle_wait_seconds
+        hub = get_notification_hub()
+        # Subscribe before the first replay so nothing lands between the two.
+        subscription = hub.subscribe(org_id=org_id, user_id=user_id) if hub else None
+        replay = True
         try:
             while True:
-                events = list_notification_events(
-                    org_id=org_id,
-                    user_id=user_id,
-                    since=last_seen,
-                    limit=200,
-                )
-                if events:
-                    for event in events:
-                        created_at = parse_notification_cursor(event.get("created_at"))
-                        if created_at:
-                            last_seen = created_at
-                        payload = json.dumps(event, separators=(",", ":"))
-                        yield f"event: notification\ndata: {payload}\n\n"
-                        emitted += 1
-                        if max_events is not None and emitted >= max_events:
-                            return
-                    heartbeat_deadline = time.monotonic() + 15.0
-                    continue
-
-                if time.monotonic() >= heartbeat_deadline:
-                    yield ": keepalive\n\n"
-                    heartbeat_deadline = time.monotonic() + 15.0
-
-                if listener_conn is None:
+                pending: list[dict[str, Any]] = []
+                if replay:
+                    pending = await list_notification_events_async(
+                        org_id=org_id,
+                        user_id=user_id,
+                        since=last_seen,
+                        limit=_REPLAY_PAGE_SIZE,
+                    )
+                    # A full page means there may be more to replay.
+                    replay = len(pending) >= _REPLAY_PAGE_SIZE
+                    idle_deadline = time.monotonic() + idle_wait_seconds
+                elif subscription is None:
+                    if time.monotonic() >= heartbeat_deadline:
+                        yield ": keepalive\n\n"
+                        heartbeat_deadline = time.monotonic() + _HEARTBEAT_SECONDS
                     await asyncio.sleep(poll_seconds)
+                    replay = True
                     continue
-
-                wait_result = await _wait_for_notification_signal(
-                    listener_conn,
-                    timeout=idle_wait_seconds,
-                    org_id=org_id,
-                    user_id=user_id,
-                )
-                if wait_result is None:
-                    await _close_notification_listener(listener_conn)
-                    listener_conn = None
-                    await asyncio.sleep(poll_seconds)
+                else:
+                    now = time.monotonic()
+                    item = await subscription.get(
+                        timeout=min(heartbeat_deadline, idle_deadline) - now,
+                    )
+                    if item is RESYNC:
+                        replay = True
+                        continue
+                    if item is None:
+                        if subscription.evicted:
+                            logger.info("notifications.stream_evicted", org_id=org_id)
+                            return
+                        now = time.monotonic()
+                        if now >= heartbeat_deadline:
+                            yield ": keepalive\n\n"
+                            heartbeat_deadline = now + _HEARTBEAT_SECONDS
+                        if now >= idle_deadline:
+                            replay = True
+                        continue
+                    pending = [item]
+
+                for event in pending:
+                    event_id = str(event.get("event_id") or "")
+                    if event_id and event_id in sent_ids:
+                        continue
+                    created_at = parse_notification_cursor(event.get("created_at"))
+                    if created_at and created_at > last_seen:
+                        last_seen = created_at
+                    if event_id:
+                        sent_ids.append(event_id)
+                    yield _format_sse_event(event)
+                    emitted += 1
+                    if max_events is not None and emitted >= max_events:
+                        return
+                if pending:
+                    heartbeat_deadline = time.monotonic() + _HEARTBEAT_SECONDS
         finally:
-            await _close_notification_listener(listener_conn)
+            if hub is not None and subscription is not None:
+                hub.unsubscribe(subscription)
 
     return StreamingResponse(
         event_stream(),
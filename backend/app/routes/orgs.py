@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from ..auth_cache import invalidate_memberships, invalidate_user
 from ..db import db_conn
 from ..deps import get_current_org, get_current_user
 from ..models import OrgCreateRequest, OrgMemberAddRequest, OrgMemberResponse, OrgResponse
@@ -83,7 +84,12 @@ def create_org(payload: OrgCreateRequest, current_user=Depends(get_current_user)
                     "UPDATE users SET default_org_id = %s WHERE id = %s",
                     (org["id"], current_user["id"]),
                 )
+                invalidate_user(current_user["id"], cur=cur)
+            invalidate_memberships(current_user["id"], cur=cur)
         conn.commit()
+    if not current_user.get("default_org_id"):
+        invalidate_user(current_user["id"])
+    invalidate_memberships(current_user["id"])
 
     return OrgResponse(
         id=str(org["id"]),
@@ -146,7 +152,9 @@ def add_member(
                 (org_id, user["id"], role),
             )
             membership = cur.fetchone()
+            invalidate_memberships(user["id"], cur=cur)
         conn.commit()
+    invalidate_memberships(user["id"])
 
     return OrgMemberResponse(
         org_id=str(membership["org_id"]),
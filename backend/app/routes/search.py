@@ -1,3 +1,4 @@
+import math
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -5,13 +6,13 @@ from fastapi.responses import JSONResponse
 
 from ..config import settings
 from ..deps import get_current_org, get_current_user
-from ..search.meili import is_enabled, search
+from ..search.meili import MeiliUnavailableError, circuit_retry_after, is_enabled, search_async
 
 router = APIRouter(prefix="/search", tags=["search"], dependencies=[Depends(get_current_user)])
 
 
 @router.get("", summary="Search indexed documents")
-def search_index(
+async def search_index(
     q: str = "",
     index: Literal["items", "files"] = "items",
     limit: int = 20,
@@ -45,13 +46,19 @@ def search_index(
     index_uid = settings.meili_index_items if index == "items" else settings.meili_index_files
 
     try:
-        result = search(
+        result = await search_async(
             index_uid,
             q,
             org_id=current_org["org_id"],
             limit=limit,
             offset=offset,
         )
+    except MeiliUnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable",
+            headers={"Retry-After": str(max(1, math.ceil(circuit_retry_after())))},
+        ) from exc
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -12,6 +12,7 @@ from ..text_extractor import extract_pdf_text
 from .meili import (
     add_documents,
     delete_document,
+    delete_documents,
     ensure_files_index,
     ensure_items_index,
     is_enabled,
@@ -191,6 +192,29 @@ def delete_item(item_id: str) -> None:
     delete_document(settings.meili_index_items, item_id)
 
 
+def _chunked(values: list[Any], size: int) -> list[list[Any]]:
+    step = max(1, size)
+    return [values[start : start + step] for start in range(0, len(values), step)]
+
+
+def index_items(rows: list[dict[str, Any]]) -> None:
+    """Index many items with one documents call per ``MEILI_BATCH_SIZE`` chunk."""
+    if not is_enabled() or not rows:
+        return
+    ensure_items_index()
+    documents = [build_item_document(row) for row in rows]
+    for chunk in _chunked(documents, settings.meili_batch_size):
+        add_documents(settings.meili_index_items, chunk)
+
+
+def delete_items(item_ids: list[str]) -> None:
+    if not is_enabled() or not item_ids:
+        return
+    ensure_items_index()
+    for chunk in _chunked(item_ids, settings.meili_batch_size):
+        delete_documents(settings.meili_index_items, chunk)
+
+
 def index_file(row: dict[str, Any]) -> None:
     if not is_enabled() or not settings.meili_index_files_enabled:
         return
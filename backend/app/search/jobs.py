@@ -43,69 +43,81 @@ def _fallback_job(
     }
 
 
+_ENQUEUE_JOB_SQL = """
+INSERT INTO search_index_jobs (
+    org_id,
+    entity_type,
+    entity_id,
+    action,
+    status,
+    attempts,
+    queued_at,
+    updated_at,
+    requested_by_user_id
+)
+VALUES (%s, %s, %s, %s, %s, 0, %s, %s, %s)
+ON CONFLICT (org_id, entity_type, entity_id) DO UPDATE
+SET action = EXCLUDED.action,
+    status = EXCLUDED.status,
+    attempts = 0,
+    last_error = NULL,
+    queued_at = EXCLUDED.queued_at,
+    started_at = NULL,
+    finished_at = NULL,
+    updated_at = EXCLUDED.updated_at,
+    requested_by_user_id = EXCLUDED.requested_by_user_id
+RETURNING
+    job_id,
+    org_id,
+    entity_type,
+    entity_id,
+    action,
+    status,
+    attempts,
+    last_error,
+    queued_at,
+    started_at,
+    finished_at,
+    updated_at,
+    requested_by_user_id
+"""
+
+
 def enqueue_job(
     org_id: str,
     entity_type: str,
     entity_id: str,
     action: str,
     requested_by_user_id: str | None = None,
+    *,
+    cur=None,  # noqa: ANN001
 ) -> dict[str, Any]:
+    """Queue (or re-queue) indexing of one entity.
+
+    With ``cur`` the job row is written in the caller's transaction; the
+    table is then required, since a missing-table error aborts that
+    transaction instead of falling back.
+    """
     entity_type = _normalize_entity(entity_type)
     now = _now()
+    params = (
+        org_id,
+        entity_type,
+        entity_id,
+        action,
+        "queued",
+        now,
+        now,
+        requested_by_user_id,
+    )
+    if cur is not None:
+        cur.execute(_ENQUEUE_JOB_SQL, params)
+        return cur.fetchone()
     try:
         with db_conn() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO search_index_jobs (
-                        org_id,
-                        entity_type,
-                        entity_id,
-                        action,
-                        status,
-                        attempts,
-                        queued_at,
-                        updated_at,
-                        requested_by_user_id
-                    )
-                    VALUES (%s, %s, %s, %s, %s, 0, %s, %s, %s)
-                    ON CONFLICT (org_id, entity_type, entity_id) DO UPDATE
-                    SET action = EXCLUDED.action,
-                        status = EXCLUDED.status,
-                        attempts = 0,
-                        last_error = NULL,
-                        queued_at = EXCLUDED.queued_at,
-                        started_at = NULL,
-                        finished_at = NULL,
-                        updated_at = EXCLUDED.updated_at,
-                        requested_by_user_id = EXCLUDED.requested_by_user_id
-                    RETURNING
-                        job_id,
-                        org_id,
-                        entity_type,
-                        entity_id,
-                        action,
-                        status,
-                        attempts,
-                        last_error,
-                        queued_at,
-                        started_at,
-                        finished_at,
-                        updated_at,
-                        requested_by_user_id
-                    """,
-                    (
-                        org_id,
-                        entity_type,
-                        entity_id,
-                        action,
-                        "queued",
-                        now,
-                        now,
-                        requested_by_user_id,
-                    ),
-                )
-                row = cur.fetchone()
+            with conn.cursor() as c:
+                c.execute(_ENQUEUE_JOB_SQL, params)
+                row = c.fetchone()
             conn.commit()
     except psycopg_errors.UndefinedTable:
         return _fallback_job(org_id, entity_type, entity_id, action)
@@ -113,6 +125,29 @@ def enqueue_job(
     return row
 
 
+def enqueue_jobs(
+    org_id: str,
+    entity_type: str,
+    entity_ids: list[str],
+    action: str,
+    requested_by_user_id: str | None = None,
+    *,
+    cur,  # noqa: ANN001
+) -> None:
+    """Bulk variant of :func:`enqueue_job` on the caller's cursor (pipelined)."""
+    if not entity_ids:
+        return
+    entity_type = _normalize_entity(entity_type)
+    now = _now()
+    cur.executemany(
+        _ENQUEUE_JOB_SQL,
+        [
+            (org_id, entity_type, entity_id, action, "queued", now, now, requested_by_user_id)
+            for entity_id in entity_ids
+        ],
+    )
+
+
 def mark_processing(
     org_id: str,
     entity_type: str,
@@ -318,6 +353,110 @@ def mark_skipped(
     return row
 
 
+IndexJobKey = tuple[str, str, str, str]
+"""``(org_id, entity_type, entity_id, action)`` of a search index job."""
+
+
+def mark_processing_many(jobs: list[IndexJobKey]) -> None:
+    """Bulk variant of :func:`mark_processing` (one connection, pipelined)."""
+    if not jobs:
+        return
+    now = _now()
+    params = [
+        (org_id, _normalize_entity(entity_type), entity_id, action, "processing", now, now, now)
+        for org_id, entity_type, entity_id, action in jobs
+    ]
+    try:
+        with db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO search_index_jobs (
+                        org_id,
+                        entity_type,
+                        entity_id,
+                        action,
+                        status,
+                        attempts,
+                        queued_at,
+                        started_at,
+                        updated_at
+                    )
+                    VALUES (%s, %s, %s, %s, %s, 0, %s, %s, %s)
+                    ON CONFLICT (org_id, entity_type, entity_id) DO UPDATE
+                    SET action = EXCLUDED.action,
+                        status = EXCLUDED.status,
+                        started_at = EXCLUDED.started_at,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    params,
+                )
+            conn.commit()
+    except psycopg_errors.UndefinedTable:
+        return
+
+
+def mark_finished_many(
+    jobs: list[IndexJobKey],
+    status: str,
+    reason: str | None = None,
+) -> None:
+    """Bulk variant of :func:`mark_succeeded` / :func:`mark_skipped`.
+
+    Upserts so that a job row is created when none exists yet, matching the
+    single-row helpers that fall back to :func:`enqueue_job`.
+    """
+    if status not in {"succeeded", "skipped"}:
+        raise ValueError(f"Invalid bulk job status: {status}")
+    if not jobs:
+        return
+    now = _now()
+    last_error = reason[:500] if reason else None
+    params = [
+        (
+            org_id,
+            _normalize_entity(entity_type),
+            entity_id,
+            action,
+            status,
+            last_error,
+            now,
+            now,
+            now,
+        )
+        for org_id, entity_type, entity_id, action in jobs
+    ]
+    try:
+        with db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO search_index_jobs (
+                        org_id,
+                        entity_type,
+                        entity_id,
+                        action,
+                        status,
+                        attempts,
+                        last_error,
+                        queued_at,
+                        finished_at,
+                        updated_at
+                    )
+                    VALUES (%s, %s, %s, %s, %s, 0, %s, %s, %s, %s)
+                    ON CONFLICT (org_id, entity_type, entity_id) DO UPDATE
+                    SET status = EXCLUDED.status,
+                        last_error = EXCLUDED.last_error,
+                        finished_at = EXCLUDED.finished_at,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    params,
+                )
+            conn.commit()
+    except psycopg_errors.UndefinedTable:
+        return
+
+
 def get_job(org_id: str, entity_type: str, entity_id: str) -> dict[str, Any] | None:
     entity_type = _normalize_entity(entity_type)
     try:
@@ -1,10 +1,30 @@
+"""Meilisearch HTTP access.
+
+Requests share one keep-alive connection pool per process: a thread-safe
+``httpx.Client`` for the worker and sync callers, and an ``httpx.AsyncClient``
+for the API's async ``/search`` path. Every call is timed per endpoint and
+goes through a process-wide circuit breaker: after repeated transport errors
+or 5xx responses it fails fast with :class:`MeiliUnavailableError` until a
+probe request succeeds again, so a slow Meilisearch cannot tie up API threads.
+"""
+
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import os
+import threading
+import time
 from typing import Any
 
 import httpx
 
 from ..config import settings
+from ..metrics import (
+    APP_MEILI_CIRCUIT_OPEN,
+    APP_MEILI_REJECTED_TOTAL,
+    APP_MEILI_REQUEST_DURATION_SECONDS,
+)
 from ..observability import get_logger, request_context_headers
 
 logger = get_logger("meilisearch")
@@ -43,17 +63,192 @@ def _headers() -> dict[str, str]:
     return headers
 
 
-def _client() -> httpx.Client:
-    if not settings.meili_url:
-        raise RuntimeError("Meilisearch is not configured")
-    return httpx.Client(base_url=settings.meili_url, timeout=settings.meili_timeout_seconds)
+class MeiliUnavailableError(RuntimeError):
+    """Meilisearch is unreachable or the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed -> open after ``failure_threshold`` consecutive failures.
+
+    While open, calls are rejected until ``reset_seconds`` have passed; then a
+    single probe is let through (half-open) and its outcome closes or re-opens
+    the circuit.
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self._reset_seconds - time.monotonic())
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or time.monotonic() - self._opened_at < self._reset_seconds:
+                APP_MEILI_REJECTED_TOTAL.inc()
+                raise MeiliUnavailableError("Meilisearch circuit breaker is open")
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("meili.circuit_closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+        APP_MEILI_CIRCUIT_OPEN.set(0.0)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            reopen = self._probing
+            self._probing = False
+            if not reopen and (
+                self._opened_at is not None or self._failures < self._failure_threshold
+            ):
+                return
+            self._opened_at = time.monotonic()
+        APP_MEILI_CIRCUIT_OPEN.set(1.0)
+        logger.warning(
+            "meili.circuit_opened",
+            failures=self._failures,
+            reset_seconds=self._reset_seconds,
+        )
 
+    def release_probe(self) -> None:
+        """Forget an in-flight probe whose outcome is unknown (e.g. cancelled)."""
+        with self._lock:
+            self._probing = False
 
-def _request(method: str, path: str, *, json: Any | None = None, params: dict | None = None):
+
+_breaker = CircuitBreaker(
+    failure_threshold=settings.meili_circuit_failure_threshold,
+    reset_seconds=settings.meili_circuit_reset_seconds,
+)
+
+_client_lock = threading.Lock()
+_sync_client: httpx.Client | None = None
+_sync_client_pid: int | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _client_options() -> dict[str, Any]:
     if not settings.meili_url:
         raise RuntimeError("Meilisearch is not configured")
-    with _client() as client:
-        response = client.request(method, path, headers=_headers(), json=json, params=params)
+    return {
+        "base_url": settings.meili_url,
+        "timeout": settings.meili_timeout_seconds,
+        "limits": httpx.Limits(
+            max_connections=settings.meili_max_connections,
+            max_keepalive_connections=settings.meili_max_keepalive_connections,
+            keepalive_expiry=settings.meili_keepalive_expiry_seconds,
+        ),
+        # HTTP/2 needs the optional h2 package and a TLS endpoint (ALPN).
+        "http2": settings.meili_http2 and importlib.util.find_spec("h2") is not None,
+    }
+
+
+def _client() -> httpx.Client:
+    """Return this process's pooled client (re-created after a fork)."""
+    global _sync_client, _sync_client_pid
+    client = _sync_client
+    if client is not None and _sync_client_pid == os.getpid():
+        return client
+    with _client_lock:
+        if _sync_client is None or _sync_client_pid != os.getpid():
+            _sync_client = httpx.Client(**_client_options())
+            _sync_client_pid = os.getpid()
+        return _sync_client
+
+
+def _async_client_for_loop() -> httpx.AsyncClient:
+    """Return the pooled async client bound to the running event loop."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(**_client_options())
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_clients() -> None:
+    """Close the pooled clients; called from the API lifespan."""
+    global _sync_client, _sync_client_pid, _async_client, _async_client_loop
+    with _client_lock:
+        sync_client, _sync_client, _sync_client_pid = _sync_client, None, None
+    async_client, _async_client = _async_client, None
+    loop, _async_client_loop = _async_client_loop, None
+    if sync_client is not None:
+        sync_client.close()
+    if async_client is not None and loop is asyncio.get_running_loop():
+        await async_client.aclose()
+
+
+def _finish(endpoint: str, started: float, outcome: str) -> None:
+    APP_MEILI_REQUEST_DURATION_SECONDS.labels(endpoint=endpoint, outcome=outcome).observe(
+        time.perf_counter() - started
+    )
+    if outcome in {"transport_error", "server_error"}:
+        _breaker.record_failure()
+    elif outcome == "cancelled":
+        _breaker.release_probe()
+    else:
+        _breaker.record_success()
+
+
+def _outcome(response: httpx.Response) -> str:
+    if response.status_code >= 500:
+        return "server_error"
+    return "client_error" if response.status_code >= 400 else "ok"
+
+
+def _send(endpoint: str, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    client = _client()
+    _breaker.before_call()
+    started = time.perf_counter()
+    outcome = "cancelled"
+    try:
+        response = client.request(method, path, headers=_headers(), **kwargs)
+        outcome = _outcome(response)
+        return response
+    except httpx.TransportError as exc:
+        outcome = "transport_error"
+        raise MeiliUnavailableError(f"Meilisearch unreachable on {path}: {exc}") from exc
+    finally:
+        _finish(endpoint, started, outcome)
+
+
+async def _send_async(endpoint: str, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    client = _async_client_for_loop()
+    _breaker.before_call()
+    started = time.perf_counter()
+    outcome = "cancelled"
+    try:
+        response = await client.request(method, path, headers=_headers(), **kwargs)
+        outcome = _outcome(response)
+        return response
+    except httpx.TransportError as exc:
+        outcome = "transport_error"
+        raise MeiliUnavailableError(f"Meilisearch unreachable on {path}: {exc}") from exc
+    finally:
+        _finish(endpoint, started, outcome)
+
+
+def _parse_response(path: str, response: httpx.Response):
     if response.status_code >= 400:
         raise RuntimeError(
             f"Meilisearch error {response.status_code} on {path}: {response.text[:500]}"
@@ -66,6 +261,29 @@ def _request(method: str, path: str, *, json: Any | None = None, params: dict |
         return {}
 
 
+def _request(
+    endpoint: str,
+    method: str,
+    path: str,
+    *,
+    json: Any | None = None,
+    params: dict | None = None,
+):
+    return _parse_response(path, _send(endpoint, method, path, json=json, params=params))
+
+
+async def _request_async(
+    endpoint: str,
+    method: str,
+    path: str,
+    *,
+    json: Any | None = None,
+    params: dict | None = None,
+):
+    response = await _send_async(endpoint, method, path, json=json, params=params)
+    return _parse_response(path, response)
+
+
 def _update_settings(index_uid: str, payload: dict[str, Any]) -> None:
     if not payload:
         return
@@ -73,11 +291,11 @@ def _update_settings(index_uid: str, payload: dict[str, Any]) -> None:
         return
 
     try:
-        _request("PATCH", f"/indexes/{index_uid}/settings", json=payload)
+        _request("settings.update", "PATCH", f"/indexes/{index_uid}/settings", json=payload)
     except RuntimeError as exc:
         if "405" not in str(exc):
             raise
-        _request("PUT", f"/indexes/{index_uid}/settings", json=payload)
+        _request("settings.update", "PUT", f"/indexes/{index_uid}/settings", json=payload)
 
     _INDEX_CONFIGURED.add(index_uid)
 
@@ -91,22 +309,22 @@ def ensure_index(
         return
 
     if index_uid not in _INDEX_READY:
-        with _client() as client:
-            response = client.get(f"/indexes/{index_uid}", headers=_headers())
-            if response.status_code == 404:
-                create = client.post(
-                    "/indexes",
-                    headers=_headers(),
-                    json={"uid": index_uid, "primaryKey": primary_key},
-                )
-                if create.status_code >= 400:
-                    raise RuntimeError(
-                        f"Meilisearch index create failed {create.status_code}: {create.text[:500]}"
-                    )
-            elif response.status_code >= 400:
+        response = _send("index.get", "GET", f"/indexes/{index_uid}")
+        if response.status_code == 404:
+            create = _send(
+                "index.create",
+                "POST",
+                "/indexes",
+                json={"uid": index_uid, "primaryKey": primary_key},
+            )
+            if create.status_code >= 400:
                 raise RuntimeError(
-                    f"Meilisearch index fetch failed {response.status_code}: {response.text[:500]}"
+                    f"Meilisearch index create failed {create.status_code}: {create.text[:500]}"
                 )
+        elif response.status_code >= 400:
+            raise RuntimeError(
+                f"Meilisearch index fetch failed {response.status_code}: {response.text[:500]}"
+            )
 
         _INDEX_READY.add(index_uid)
 
@@ -125,7 +343,7 @@ def ensure_files_index() -> None:
 def add_documents(index_uid: str, documents: list[dict[str, Any]]) -> dict[str, Any]:
     if not documents:
         return {}
-    return _request("POST", f"/indexes/{index_uid}/documents", json=documents)
+    return _request("documents.add", "POST", f"/indexes/{index_uid}/documents", json=documents)
 
 
 def delete_document(index_uid: str, doc_id: str) -> None:
@@ -133,21 +351,43 @@ def delete_document(index_uid: str, doc_id: str) -> None:
         return
     if not is_enabled():
         return
-    with _client() as client:
-        response = client.delete(f"/indexes/{index_uid}/documents/{doc_id}", headers=_headers())
-        if response.status_code in {200, 202, 204, 404}:
-            return
-        if response.status_code >= 400:
-            raise RuntimeError(
-                f"Meilisearch delete failed {response.status_code}: {response.text[:500]}"
-            )
+    response = _send("documents.delete", "DELETE", f"/indexes/{index_uid}/documents/{doc_id}")
+    if response.status_code in {200, 202, 204, 404}:
+        return
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f"Meilisearch delete failed {response.status_code}: {response.text[:500]}"
+        )
 
 
-def search(index_uid: str, query: str, *, org_id: str, limit: int, offset: int):
-    payload = {
+def delete_documents(index_uid: str, doc_ids: list[str]) -> dict[str, Any]:
+    ids = [doc_id for doc_id in doc_ids if doc_id]
+    if not ids or not is_enabled():
+        return {}
+    return _request(
+        "documents.delete_batch", "POST", f"/indexes/{index_uid}/documents/delete-batch", json=ids
+    )
+
+
+def _search_payload(query: str, *, org_id: str, limit: int, offset: int) -> dict[str, Any]:
+    return {
         "q": query,
         "limit": limit,
         "offset": offset,
         "filter": f'org_id = "{org_id}"',
     }
-    return _request("POST", f"/indexes/{index_uid}/search", json=payload)
+
+
+def search(index_uid: str, query: str, *, org_id: str, limit: int, offset: int):
+    payload = _search_payload(query, org_id=org_id, limit=limit, offset=offset)
+    return _request("search", "POST", f"/indexes/{index_uid}/search", json=payload)
+
+
+async def search_async(index_uid: str, query: str, *, org_id: str, limit: int, offset: int):
+    payload = _search_payload(query, org_id=org_id, limit=limit, offset=offset)
+    return await _request_async("search", "POST", f"/indexes/{index_uid}/search", json=payload)
+
+
+def circuit_retry_after() -> float:
+    """Seconds until the breaker lets a probe through (0 when closed)."""
+    return _breaker.retry_after()
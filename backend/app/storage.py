@@ -10,7 +10,7 @@ import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import BinaryIO, Protocol, runtime_checkable
 
 from fastapi import Response
 from fastapi.responses import FileResponse
@@ -33,6 +33,10 @@ class StorageBackend(Protocol):
 
     def read_text(self, key: str, encoding: str = "utf-8") -> str: ...
 
+    def open(self, key: str) -> BinaryIO:
+        """Open *key* for streaming reads; the caller closes the handle."""
+        ...
+
     def exists(self, key: str) -> bool: ...
 
     def delete(self, key: str) -> None: ...
@@ -95,6 +99,9 @@ class LocalStorage:
     def read_text(self, key: str, encoding: str = "utf-8") -> str:
         return self._resolve(key).read_text(encoding=encoding)
 
+    def open(self, key: str) -> BinaryIO:
+        return self._resolve(key).open("rb")
+
     def exists(self, key: str) -> bool:
         return self._resolve(key).exists()
 
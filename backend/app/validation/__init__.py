@@ -1,19 +1,47 @@
 """Validation package for SHACL + CEL and item-level validation."""
 
 
-def validate_item_create(item: dict) -> list[dict[str, object]]:
+def validate_item_create(
+    item: dict,
+    content_hash: str | None = None,
+    *,
+    cur=None,
+) -> list[dict[str, object]]:
     from .item_validator import validate_item_create as _validate_item_create
 
-    return _validate_item_create(item)
+    return _validate_item_create(item, content_hash, cur=cur)
+
+
+def validate_items_create(
+    items: list[dict],
+    content_hashes: list[str] | None = None,
+    *,
+    cur=None,
+) -> list[list[dict[str, object]]]:
+    from .item_validator import validate_items_create as _validate_items_create
+
+    return _validate_items_create(items, content_hashes, cur=cur)
+
+
+def validate_item_transition(
+    existing_item: dict,
+    next_item: dict,
+) -> list[dict[str, object]]:
+    from .item_validator import validate_item_transition as _validate_item_transition
+
+    return _validate_item_transition(existing_item, next_item)
 
 
 def validate_item_update(
     existing_item: dict,
     next_item: dict,
+    content_hash: str | None = None,
+    *,
+    cur=None,
 ) -> list[dict[str, object]]:
     from .item_validator import validate_item_update as _validate_item_update
 
-    return _validate_item_update(existing_item, next_item)
+    return _validate_item_update(existing_item, next_item, content_hash, cur=cur)
 
 
 def raise_if_invalid(
@@ -25,4 +53,10 @@ def raise_if_invalid(
     _raise_if_invalid(issues, default_message)
 
 
-__all__ = ["raise_if_invalid", "validate_item_create", "validate_item_update"]
+__all__ = [
+    "raise_if_invalid",
+    "validate_item_create",
+    "validate_item_transition",
+    "validate_item_update",
+    "validate_items_create",
+]
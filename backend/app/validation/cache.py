@@ -0,0 +1,265 @@
+"""Memoized validation outcomes.
+
+Imports, Gmail sync and the copilot often re-submit identical JSON-LD, so
+item validation results are kept in a bounded LRU keyed by
+``(shapes version, rules version, content hash)`` and CEL rule results by
+``(rules version, evaluation context)``. The content hash is the items'
+``content_hash`` (``_hash_payload``), so routes pass the hash they store
+anyway.
+
+The versions are SHA-256 digests of ``shapes/entities.ttl`` and
+``rules/business_rules.json``. Every lookup compares the files' stat
+signature with the last one seen; when a file's content changes, the shapes
+or rules are reloaded and both caches emptied, so no process (API worker or
+background worker) keeps serving outcomes of superseded definitions.
+
+Item outcomes are cached in two tiers. Each process keeps up to
+``VALIDATION_CACHE_MAX_ENTRIES`` in memory (0 disables); behind it, the
+``validation_results`` table shares them between API and background worker
+processes. The shared tier is read and written on the caller's cursor
+(``cur=``), inside the transaction the route already holds, so it needs no
+extra connection; outcomes become visible to other processes when that
+transaction commits. Rows of superseded shapes or rules versions are never
+read, and :func:`prune_shared_results` (worker housekeeping) deletes them and
+trims the table to ``VALIDATION_CACHE_SHARED_MAX_ROWS`` (0 disables the
+tier). CEL rule results are cheap and stay in memory only. Lookups are
+exported as ``app_validation_cache_lookups_total{cache,result}``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, Final
+
+from ..config import settings
+from ..db import db_conn, jsonb
+from ..metrics import APP_VALIDATION_CACHE_INVALIDATIONS_TOTAL, APP_VALIDATION_CACHE_LOOKUPS_TOTAL
+
+Issues = list[dict[str, Any]]
+
+_MISSING: Final = object()
+
+_SHARED_SELECT_SQL = """
+SELECT content_hash, issues
+FROM validation_results
+WHERE content_hash = ANY(%s) AND shapes_version = %s AND rules_version = %s
+"""
+_SHARED_INSERT_SQL = """
+INSERT INTO validation_results (content_hash, shapes_version, rules_version, issues)
+SELECT content_hash, %s, %s, issues
+FROM unnest(%s::text[], %s::jsonb[]) AS t(content_hash, issues)
+ON CONFLICT DO NOTHING
+"""
+_SHARED_PRUNE_SQL = """
+DELETE FROM validation_results
+WHERE shapes_version <> %s OR rules_version <> %s
+"""
+_SHARED_TRIM_SQL = """
+DELETE FROM validation_results
+WHERE created_at < (
+    SELECT created_at FROM validation_results
+    ORDER BY created_at DESC
+    OFFSET %s LIMIT 1
+)
+"""
+
+
+class _LRUCache:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[dict[str, Any], ...]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        if settings.validation_cache_max_entries <= 0:
+            return _MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        result = "miss" if entry is None else "hit"
+        APP_VALIDATION_CACHE_LOOKUPS_TOTAL.labels(cache=self._name, result=result).inc()
+        # Callers may annotate the returned issues; never hand out the cached dicts.
+        return _MISSING if entry is None else [dict(issue) for issue in entry]
+
+    def put(self, key: Hashable, issues: Issues) -> None:
+        max_entries = settings.validation_cache_max_entries
+        if max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = tuple(dict(issue) for issue in issues)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _SourceFile:
+    """A definitions file whose content digest versions the cached outcomes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.digest = ""
+        self._signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """Re-hash the file if its stat signature moved; ``True`` if its content changed."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            # The loaders report a missing file; keep the last known version.
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        with self._lock:
+            if signature == self._signature:
+                return False
+            digest = hashlib.sha256(self.path.read_bytes()).hexdigest()
+            changed = bool(self.digest) and digest != self.digest
+            self.digest, self._signature = digest, signature
+        return changed
+
+
+_item_cache = _LRUCache("item")
+_rule_cache = _LRUCache("rules")
+_sources: tuple[_SourceFile, _SourceFile] | None = None
+_sources_lock = threading.Lock()
+
+
+def _source_files() -> tuple[_SourceFile, _SourceFile]:
+    global _sources
+    if _sources is None:
+        from .cel_evaluator import _RULES_PATH
+        from .shacl_validator import _SHAPES_PATH
+
+        with _sources_lock:
+            if _sources is None:
+                _sources = (_SourceFile(_SHAPES_PATH), _SourceFile(_RULES_PATH))
+    return _sources
+
+
+def clear() -> None:
+    _item_cache.clear()
+    _rule_cache.clear()
+
+
+def source_versions() -> tuple[str, str]:
+    """Current ``(shapes, rules)`` digests, reloading whichever file changed."""
+    shapes, rules = _source_files()
+    shapes_changed = shapes.refresh()
+    rules_changed = rules.refresh()
+    if shapes_changed:
+        from .shacl_validator import reset_shapes
+
+        reset_shapes()
+        APP_VALIDATION_CACHE_INVALIDATIONS_TOTAL.labels(source="shapes").inc()
+    if rules_changed:
+        from .cel_evaluator import reset_rules
+
+        reset_rules()
+        APP_VALIDATION_CACHE_INVALIDATIONS_TOTAL.labels(source="rules").inc()
+    if shapes_changed or rules_changed:
+        clear()
+    return shapes.digest, rules.digest
+
+
+def _shared_get(cur, shapes_version: str, rules_version: str, digests: list[str]) -> dict:
+    cur.execute(_SHARED_SELECT_SQL, (sorted(set(digests)), shapes_version, rules_version))
+    found = {row["content_hash"]: row["issues"] for row in cur.fetchall()}
+    for digest in digests:
+        result = "hit" if digest in found else "miss"
+        APP_VALIDATION_CACHE_LOOKUPS_TOTAL.labels(cache="shared", result=result).inc()
+    return found
+
+
+def _shared_put(cur, shapes_version: str, rules_version: str, outcomes: dict) -> None:
+    # Sorted so concurrent transactions inserting the same hashes lock them in order.
+    digests = sorted(outcomes)
+    cur.execute(
+        _SHARED_INSERT_SQL,
+        (shapes_version, rules_version, digests, [jsonb(outcomes[d]) for d in digests]),
+    )
+
+
+def memoized_item_issues(
+    content_hashes: list[str],
+    validate_missing: Callable[[list[int]], list[Issues]],
+    *,
+    cur=None,
+) -> list[Issues]:
+    """Issues per content hash, calling ``validate_missing(indexes)`` for cache misses.
+
+    With ``cur``, misses of the in-memory cache are looked up in (and new
+    outcomes written to) the shared ``validation_results`` table.
+    """
+    shapes_version, rules_version = source_versions()
+    keys = [(shapes_version, rules_version, digest) for digest in content_hashes]
+    results = [_item_cache.get(key) for key in keys]
+    missing = [index for index, result in enumerate(results) if result is _MISSING]
+    shared = cur is not None and settings.validation_cache_shared_max_rows > 0
+    if missing and shared:
+        found = _shared_get(
+            cur, shapes_version, rules_version, [content_hashes[index] for index in missing]
+        )
+        for index in missing:
+            issues = found.get(content_hashes[index])
+            if issues is not None:
+                _item_cache.put(keys[index], issues)
+                results[index] = issues
+        missing = [index for index in missing if results[index] is _MISSING]
+    if missing:
+        outcomes = dict(zip(missing, validate_missing(missing), strict=True))
+        for index, issues in outcomes.items():
+            _item_cache.put(keys[index], issues)
+            results[index] = issues
+        if shared:
+            _shared_put(
+                cur,
+                shapes_version,
+                rules_version,
+                {content_hashes[index]: issues for index, issues in outcomes.items()},
+            )
+    return results
+
+
+def prune_shared_results() -> int:
+    """Delete shared outcomes of superseded versions and trim the table to its cap."""
+    max_rows = settings.validation_cache_shared_max_rows
+    if max_rows <= 0:
+        return 0
+    shapes_version, rules_version = source_versions()
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_SHARED_PRUNE_SQL, (shapes_version, rules_version))
+            deleted = cur.rowcount
+            cur.execute(_SHARED_TRIM_SQL, (max_rows - 1,))
+            deleted += cur.rowcount
+        conn.commit()
+    return deleted
+
+
+def memoized_rule_violations(
+    context: dict[str, Any],
+    evaluate: Callable[[dict[str, Any]], Issues],
+) -> Issues:
+    """CEL violations for ``context``, calling ``evaluate(context)`` on a cache miss."""
+    _, rules_version = source_versions()
+    key = (rules_version, json.dumps(context, sort_keys=True, default=str))
+    violations = _rule_cache.get(key)
+    if violations is _MISSING:
+        violations = evaluate(context)
+        _rule_cache.put(key, violations)
+    return violations
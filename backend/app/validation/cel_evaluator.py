@@ -10,6 +10,8 @@ from typing import Any
 import celpy
 from celpy.adapter import json_to_cel
 
+from .cache import memoized_rule_violations
+
 logger = logging.getLogger(__name__)
 
 # Load CEL rules at module initialization
@@ -77,9 +79,17 @@ def _load_rules() -> list[dict[str, Any]]:
         raise RuntimeError(f"CEL rules loading failed: {e}") from e
 
 
+def reset_rules() -> None:
+    """Drop the compiled rules so the next evaluation re-reads business_rules.json."""
+    global _compiled_rules
+    _compiled_rules = None
+
+
 def evaluate_rules(context: dict[str, Any]) -> list[dict[str, Any]]:
     """Evaluate CEL business rules against provided context.
 
+    Results are memoized per context and rules version (see :mod:`.cache`).
+
     Args:
         context: Evaluation context dictionary such as source/target, operation,
             and bucket values.
@@ -91,6 +101,10 @@ def evaluate_rules(context: dict[str, Any]) -> list[dict[str, Any]]:
     Raises:
         RuntimeError: If rules cannot be loaded
     """
+    return memoized_rule_violations(context, _evaluate_rules)
+
+
+def _evaluate_rules(context: dict[str, Any]) -> list[dict[str, Any]]:
     rules = _load_rules()
     violations: list[dict[str, Any]] = []
     normalized_context = dict(context)
@@ -7,6 +7,9 @@ import logging
 from fastapi import HTTPException, status
 from rdflib import Graph, Literal, Namespace, URIRef
 
+from ..imports.shared import _hash_payload
+from .cache import memoized_item_issues
+
 logger = logging.getLogger(__name__)
 
 ACTION_BUCKETS = {
@@ -37,6 +40,12 @@ def _normalize_type(raw: object) -> str:
 
 
 RDF_TYPE = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+_DEFAULT_SUBJECT = URIRef("urn:item:1")
+
+# Prefixes for rendering nodes in SHACL messages.
+_NAMESPACES = Graph()
+_NAMESPACES.bind("schema", SCHEMA)
+_NAMESPACES.bind("app", APP)
 
 
 def _as_text(value: object) -> str:
@@ -65,41 +74,29 @@ def _is_action_type(item_type: str) -> bool:
     return local_type == "EmailMessage" or local_type.endswith("Action")
 
 
-def _item_to_rdf_graph(item: dict) -> Graph:
-    """Convert item dict to RDF graph for SHACL validation.
-
-    Args:
-        item: Item dictionary with @type, name, additionalProperty, etc.
-
-    Returns:
-        RDF Graph representing the item
-    """
-    g = Graph()
-    g.bind("schema", SCHEMA)
-    g.bind("app", APP)
-
-    # Create a subject node for the item
-    subject = URIRef("urn:item:1")
+def _item_triples(item: dict, subject: URIRef = _DEFAULT_SUBJECT) -> list[tuple]:
+    """RDF triples describing the parts of an item the SHACL shapes constrain."""
+    triples: list[tuple] = []
 
     # Add @type as rdf:type
     item_type = _normalize_type(item.get("@type"))
     if item_type:
         # Map action-like types to schema:Action so SHACL action constraints apply.
         if _is_action_type(item_type):
-            g.add((subject, RDF_TYPE, SCHEMA.Action))
+            triples.append((subject, RDF_TYPE, SCHEMA.Action))
         elif item_type == "Project":
-            g.add((subject, RDF_TYPE, SCHEMA.Project))
+            triples.append((subject, RDF_TYPE, SCHEMA.Project))
         elif item_type == "Person":
-            g.add((subject, RDF_TYPE, SCHEMA.Person))
+            triples.append((subject, RDF_TYPE, SCHEMA.Person))
         elif item_type == "CreativeWork":
-            g.add((subject, RDF_TYPE, SCHEMA.CreativeWork))
+            triples.append((subject, RDF_TYPE, SCHEMA.CreativeWork))
         elif item_type == "DigitalDocument":
-            g.add((subject, RDF_TYPE, SCHEMA.DigitalDocument))
+            triples.append((subject, RDF_TYPE, SCHEMA.DigitalDocument))
 
     # Add schema:name if present
     name = item.get("name")
     if name and isinstance(name, str) and name.strip():
-        g.add((subject, SCHEMA.name, Literal(name.strip())))
+        triples.append((subject, SCHEMA.name, Literal(name.strip())))
 
     # Add additionalProperty values as direct properties
     props = item.get("additionalProperty")
@@ -110,164 +107,131 @@ def _item_to_rdf_graph(item: dict) -> Graph:
                 value = entry.get("value")
 
                 if prop_id == "app:bucket" and isinstance(value, str):
-                    g.add((subject, APP.bucket, Literal(value)))
+                    triples.append((subject, APP.bucket, Literal(value)))
                 elif prop_id == "app:rawCapture" and isinstance(value, str):
-                    g.add((subject, APP.rawCapture, Literal(value)))
+                    triples.append((subject, APP.rawCapture, Literal(value)))
                 elif prop_id == "app:orgRef" and value is not None:
-                    g.add((subject, APP.orgRef, Literal(str(value))))
+                    triples.append((subject, APP.orgRef, Literal(str(value))))
                 elif prop_id == "app:orgRole" and isinstance(value, str):
-                    g.add((subject, APP.orgRole, Literal(value)))
-
-    return g
-
-
-def validate_item_create(item: dict) -> list[dict[str, object]]:
-    """Validate item creation using SHACL shapes and CEL rules.
-
-    SHACL validation is now performed using pyshacl library.
-    CEL rules remain hardcoded (to be replaced in phase 4).
-
-    Args:
-        item: Item dictionary to validate
-
-    Returns:
-        List of validation issues (empty if valid)
-    """
+                    triples.append((subject, APP.orgRole, Literal(value)))
+
+    return triples
+
+
+def _map_shacl_violation(violation: dict, item_type: str) -> dict[str, object]:
+    """Map a raw SHACL violation to the item-level field and error code."""
+    field = violation.get("field", "item")
+    code = violation.get("code", "VALIDATION_ERROR")
+
+    # Map generic SHACL field names to our field format
+    if field == "bucket":
+        field = "additionalProperty.app:bucket"
+    elif field == "name":
+        field = "name"
+    elif field == "orgRef":
+        field = "additionalProperty.app:orgRef"
+    elif field == "orgRole":
+        field = "additionalProperty.app:orgRole"
+    elif field == "rawCapture":
+        field = "additionalProperty.app:rawCapture"
+
+    # Generate domain-specific error codes based on field and type
+    if "name" in field and item_type == "Project":
+        code = "PROJECT_NAME_REQUIRED"
+    elif "name" in field and item_type in {"CreativeWork", "DigitalDocument"}:
+        code = "REFERENCE_NAME_REQUIRED"
+    elif "name" in field and item_type == "Person":
+        code = "PERSON_NAME_REQUIRED"
+    elif "bucket" in field:
+        code = "ACTION_BUCKET_INVALID"
+    elif "orgRef" in field:
+        code = "PERSON_ORGREF_REQUIRED"
+    elif "orgRole" in field:
+        code = "PERSON_ORGROLE_INVALID"
+    elif "@type" in field or field == "item":
+        code = "TYPE_REQUIRED"
+
+    return {
+        "source": "shacl",
+        "code": code,
+        "field": field,
+        "message": violation.get("message", "Validation constraint violated"),
+    }
+
+
+def _fallback_shape_issues(item: dict, item_type: str, bucket: str) -> list[dict[str, object]]:
+    """Hardcoded equivalents of the SHACL shapes, used when pyshacl is missing."""
     issues: list[dict[str, object]] = []
-    bucket = _bucket(item)
-    item_type = _normalize_type(item.get("@type"))
+    if _is_action_type(item_type):
+        if bucket not in ACTION_BUCKETS:
+            issues.append(
+                {
+                    "source": "shacl",
+                    "code": "ACTION_BUCKET_INVALID",
+                    "field": "additionalProperty.app:bucket",
+                    "message": (
+                        "Action bucket must be one of "
+                        "inbox,next,waiting,someday,calendar,reference,completed"
+                    ),
+                }
+            )
 
-    # SHACL shapes target concrete classes, so we must enforce @type first.
-    if not item_type:
+    if item_type == "Project" and not _as_text(item.get("name")):
         issues.append(
             {
                 "source": "shacl",
-                "code": "TYPE_REQUIRED",
-                "field": "@type",
-                "message": "@type is required.",
+                "code": "PROJECT_NAME_REQUIRED",
+                "field": "name",
+                "message": "Project items require a non-empty name.",
             }
         )
-        return issues
 
-    # SHACL validation using pyshacl
-    try:
-        from .shacl_validator import validate_shacl
-
-        data_graph = _item_to_rdf_graph(item)
-        shacl_violations = validate_shacl(data_graph, abort_on_first=False)
-
-        # Map SHACL violations to expected format with custom codes
-        for violation in shacl_violations:
-            field = violation.get("field", "item")
-            code = violation.get("code", "VALIDATION_ERROR")
-
-            # Map generic SHACL field names to our field format
-            if field == "bucket":
-                field = "additionalProperty.app:bucket"
-            elif field == "name":
-                field = "name"
-            elif field == "orgRef":
-                field = "additionalProperty.app:orgRef"
-            elif field == "orgRole":
-                field = "additionalProperty.app:orgRole"
-            elif field == "rawCapture":
-                field = "additionalProperty.app:rawCapture"
-
-            # Generate domain-specific error codes based on field and type
-            if "name" in field and item_type == "Project":
-                code = "PROJECT_NAME_REQUIRED"
-            elif "name" in field and item_type in {"CreativeWork", "DigitalDocument"}:
-                code = "REFERENCE_NAME_REQUIRED"
-            elif "name" in field and item_type == "Person":
-                code = "PERSON_NAME_REQUIRED"
-            elif "bucket" in field:
-                code = "ACTION_BUCKET_INVALID"
-            elif "orgRef" in field:
-                code = "PERSON_ORGREF_REQUIRED"
-            elif "orgRole" in field:
-                code = "PERSON_ORGROLE_INVALID"
-            elif "@type" in field or field == "item":
-                code = "TYPE_REQUIRED"
+    if item_type in {"CreativeWork", "DigitalDocument"} and not _as_text(item.get("name")):
+        issues.append(
+            {
+                "source": "shacl",
+                "code": "REFERENCE_NAME_REQUIRED",
+                "field": "name",
+                "message": "Reference items require a non-empty name.",
+            }
+        )
 
+    if item_type == "Person":
+        if not _as_text(item.get("name")):
             issues.append(
                 {
                     "source": "shacl",
-                    "code": code,
-                    "field": field,
-                    "message": violation.get("message", "Validation constraint violated"),
+                    "code": "PERSON_NAME_REQUIRED",
+                    "field": "name",
+                    "message": "Person items require a non-empty name.",
                 }
             )
-    except ImportError:
-        # Fallback to hardcoded validation if pyshacl not available
-        logger.warning("pyshacl not available, using hardcoded validation")
-
-        if _is_action_type(item_type):
-            if bucket not in ACTION_BUCKETS:
-                issues.append(
-                    {
-                        "source": "shacl",
-                        "code": "ACTION_BUCKET_INVALID",
-                        "field": "additionalProperty.app:bucket",
-                        "message": (
-                            "Action bucket must be one of "
-                            "inbox,next,waiting,someday,calendar,reference,completed"
-                        ),
-                    }
-                )
-
-        if item_type == "Project" and not _as_text(item.get("name")):
+        if _get_additional_property(item, "app:orgRef") is None:
             issues.append(
                 {
                     "source": "shacl",
-                    "code": "PROJECT_NAME_REQUIRED",
-                    "field": "name",
-                    "message": "Project items require a non-empty name.",
+                    "code": "PERSON_ORGREF_REQUIRED",
+                    "field": "additionalProperty.app:orgRef",
+                    "message": "Person items require app:orgRef.",
                 }
             )
-
-        if item_type in {"CreativeWork", "DigitalDocument"} and not _as_text(item.get("name")):
+        role = _as_text(_get_additional_property(item, "app:orgRole"))
+        if role not in PERSON_ROLES:
             issues.append(
                 {
                     "source": "shacl",
-                    "code": "REFERENCE_NAME_REQUIRED",
-                    "field": "name",
-                    "message": "Reference items require a non-empty name.",
+                    "code": "PERSON_ORGROLE_INVALID",
+                    "field": "additionalProperty.app:orgRole",
+                    "message": (
+                        "Person app:orgRole must be one of "
+                        "member,founder,accountant,advisor,interest."
+                    ),
                 }
             )
+    return issues
 
-        if item_type == "Person":
-            if not _as_text(item.get("name")):
-                issues.append(
-                    {
-                        "source": "shacl",
-                        "code": "PERSON_NAME_REQUIRED",
-                        "field": "name",
-                        "message": "Person items require a non-empty name.",
-                    }
-                )
-            if _get_additional_property(item, "app:orgRef") is None:
-                issues.append(
-                    {
-                        "source": "shacl",
-                        "code": "PERSON_ORGREF_REQUIRED",
-                        "field": "additionalProperty.app:orgRef",
-                        "message": "Person items require app:orgRef.",
-                    }
-                )
-            role = _as_text(_get_additional_property(item, "app:orgRole"))
-            if role not in PERSON_ROLES:
-                issues.append(
-                    {
-                        "source": "shacl",
-                        "code": "PERSON_ORGROLE_INVALID",
-                        "field": "additionalProperty.app:orgRole",
-                        "message": (
-                            "Person app:orgRole must be one of "
-                            "member,founder,accountant,advisor,interest."
-                        ),
-                    }
-                )
 
+def _create_rule_issues(bucket: str) -> list[dict[str, object]]:
     # CEL rules using cel-python
     try:
         from .cel_evaluator import evaluate_rules
@@ -276,13 +240,12 @@ def validate_item_create(item: dict) -> list[dict[str, object]]:
             "operation": "create",
             "bucket": bucket,
         }
-        cel_violations = evaluate_rules(cel_context)
-        issues.extend(cel_violations)
+        return evaluate_rules(cel_context)
     except ImportError:
         # Fallback to hardcoded CEL if cel-python not available
         logger.warning("cel-python not available, using hardcoded CEL validation")
         if bucket and bucket not in ACTION_BUCKETS:
-            issues.append(
+            return [
                 {
                     "source": "cel",
                     "code": "BUCKET_ENUM",
@@ -293,13 +256,134 @@ def validate_item_create(item: dict) -> list[dict[str, object]]:
                         "inbox,next,waiting,someday,calendar,reference,project,completed."
                     ),
                 }
+            ]
+        return []
+
+
+def validate_item_create(
+    item: dict,
+    content_hash: str | None = None,
+    *,
+    cur=None,
+) -> list[dict[str, object]]:
+    """Validate item creation using SHACL shapes and CEL rules.
+
+    SHACL validation uses the engine selected by ``SHACL_ENGINE``
+    (compiled shapes by default, pyshacl as the reference).
+
+    Args:
+        item: Item dictionary to validate
+        content_hash: The item's ``content_hash`` if already computed
+        cur: The caller's transaction cursor, to use the shared result cache
+
+    Returns:
+        List of validation issues (empty if valid)
+    """
+    hashes = [content_hash] if content_hash is not None else None
+    return validate_items_create([item], content_hashes=hashes, cur=cur)[0]
+
+
+def validate_items_create(
+    items: list[dict],
+    content_hashes: list[str] | None = None,
+    *,
+    cur=None,
+) -> list[list[dict[str, object]]]:
+    """Validate several items for creation with a single SHACL run.
+
+    Outcomes are memoized by content hash (see :mod:`.cache`); only items
+    not seen with the current shapes and rules are validated. Each of those
+    gets its own subject node in one data graph; violations are mapped back
+    to their item through the report's focus node.
+
+    Args:
+        items: Item dictionaries to validate
+        content_hashes: The items' ``content_hash`` values if already computed
+        cur: The caller's transaction cursor, to use the shared result cache
+
+    Returns:
+        One list of validation issues per item, in input order
+    """
+    if content_hashes is None:
+        content_hashes = [_hash_payload(item) for item in items]
+    return memoized_item_issues(
+        content_hashes,
+        lambda indexes: _validate_items_create([items[index] for index in indexes]),
+        cur=cur,
+    )
+
+
+def _validate_items_create(items: list[dict]) -> list[list[dict[str, object]]]:
+    issues: list[list[dict[str, object]]] = [[] for _ in items]
+    item_types = [_normalize_type(item.get("@type")) for item in items]
+
+    # SHACL shapes target concrete classes, so we must enforce @type first.
+    typed: dict[str, int] = {}
+    for index, item_type in enumerate(item_types):
+        if item_type:
+            typed[str(URIRef(f"urn:item:{index + 1}"))] = index
+        else:
+            issues[index].append(
+                {
+                    "source": "shacl",
+                    "code": "TYPE_REQUIRED",
+                    "field": "@type",
+                    "message": "@type is required.",
+                }
+            )
+    if not typed:
+        return issues
+
+    # SHACL validation (compiled shapes, or pyshacl with SHACL_ENGINE=pyshacl)
+    try:
+        from .shacl_validator import validate_shacl_triples
+
+        triples = [
+            triple
+            for subject, index in typed.items()
+            for triple in _item_triples(items[index], URIRef(subject))
+        ]
+        for violation in validate_shacl_triples(triples, _NAMESPACES, abort_on_first=False):
+            focus_node = violation.get("focus_node")
+            # Report-level failures carry no focus node and apply to every item.
+            targets = [typed[focus_node]] if focus_node in typed else typed.values()
+            for index in targets:
+                issue = _map_shacl_violation(violation, item_types[index])
+                if focus_node in typed:
+                    # Generic SHACL messages name the node; keep single-item wording.
+                    issue["message"] = str(issue["message"]).replace(
+                        focus_node, str(_DEFAULT_SUBJECT)
+                    )
+                issues[index].append(issue)
+    except ImportError:
+        # Fallback to hardcoded validation if pyshacl not available
+        logger.warning("pyshacl not available, using hardcoded validation")
+        for index in typed.values():
+            issues[index].extend(
+                _fallback_shape_issues(items[index], item_types[index], _bucket(items[index]))
             )
 
+    for index in typed.values():
+        issues[index].extend(_create_rule_issues(_bucket(items[index])))
+
     return issues
 
 
-def validate_item_update(existing_item: dict, next_item: dict) -> list[dict[str, object]]:
-    issues = validate_item_create(next_item)
+def validate_item_update(
+    existing_item: dict,
+    next_item: dict,
+    content_hash: str | None = None,
+    *,
+    cur=None,
+) -> list[dict[str, object]]:
+    return validate_item_create(next_item, content_hash, cur=cur) + validate_item_transition(
+        existing_item, next_item
+    )
+
+
+def validate_item_transition(existing_item: dict, next_item: dict) -> list[dict[str, object]]:
+    """CEL rules for moving ``existing_item`` to ``next_item`` (triage, immutability)."""
+    issues: list[dict[str, object]] = []
     source_bucket = _bucket(existing_item)
     target_bucket = _bucket(next_item)
 
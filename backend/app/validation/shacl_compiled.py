@@ -0,0 +1,306 @@
+"""SHACL shapes compiled into plain Python checks.
+
+:func:`compile_shapes` turns ``shapes/entities.ttl`` into per-class lists of
+property checks once per process; :meth:`CompiledShapes.validate` then runs
+them over a data graph (or a bare iterable of triples) without pyshacl's
+per-call shape parsing, RDFS inference and SPARQL report round trip.
+
+Only the subset of SHACL the entity shapes use is compiled: node shapes with
+``sh:targetClass`` whose property shapes have an IRI ``sh:path`` and any of
+``sh:minCount``, ``sh:datatype``, ``sh:in`` and ``sh:pattern``/``sh:flags``.
+Anything else raises :class:`UnsupportedShapesError` so callers fall back to
+pyshacl, which stays the reference implementation. Violation dicts and
+messages match what :mod:`.shacl_validator` produces from a pyshacl report.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import RDF, SH, XSD, NamespaceManager
+
+Triple = tuple[Any, Any, Any]
+
+
+class UnsupportedShapesError(ValueError):
+    """The shapes use SHACL features the compiled engine does not implement."""
+
+
+_NODE_SHAPE_PREDICATES = frozenset({RDF.type, SH.targetClass, SH.property, SH.name, SH.description})
+_PROPERTY_SHAPE_PREDICATES = frozenset(
+    {
+        RDF.type,
+        SH.path,
+        SH.minCount,
+        SH.datatype,
+        SH["in"],
+        SH.pattern,
+        SH.flags,
+        SH.name,
+        SH.description,
+        SH.order,
+        SH.group,
+    }
+)
+_SUPPORTED_SH_PREDICATES = _NODE_SHAPE_PREDICATES | _PROPERTY_SHAPE_PREDICATES
+
+# Python value types a well-typed literal of each datatype parses to (as pyshacl checks).
+_DATATYPE_VALUE_TYPES: dict[URIRef, type | tuple[type, ...]] = {
+    XSD.string: (str, bytes),
+    RDF.langString: (str, bytes),
+    XSD.integer: int,
+    XSD.float: float,
+    XSD.decimal: Decimal,
+    XSD.boolean: bool,
+    XSD.date: date,
+    XSD.time: time,
+    XSD.dateTime: datetime,
+}
+_PLAIN_STRING_DATATYPES = (None, XSD.string, RDF.langString)
+
+
+def field_for_path(path: object) -> str:
+    """Local name of a result path, as used for violation ``field`` and ``code``."""
+    path_str = str(path) if path else "item"
+    if "#" in path_str:
+        return path_str.split("#")[-1]
+    if "/" in path_str:
+        return path_str.split("/")[-1]
+    return path_str
+
+
+def violation_code(field: str) -> str:
+    return f"SHACL_{field.upper()}_CONSTRAINT" if field != "item" else "SHACL_CONSTRAINT"
+
+
+def _literal_text(node: Literal, namespaces: NamespaceManager) -> str:
+    """pyshacl's rendering of a literal in generic messages."""
+    lexical = str(node)
+    value = None if node.value is None else str(node.value)
+    text = f'"{lexical}" = {value}' if value is not None and value != lexical else f'"{lexical}"'
+    if node.language:
+        text += f", lang={node.language}"
+    if node.datatype:
+        text += f", datatype={node.datatype.n3(namespace_manager=namespaces)}"
+    return f"Literal({text})"
+
+
+def _node_text(node: object, namespaces: NamespaceManager) -> str:
+    if isinstance(node, Literal):
+        return _literal_text(node, namespaces)
+    if isinstance(node, URIRef):
+        return node.n3(namespace_manager=namespaces)
+    return str(node)
+
+
+def _datatype_matches(value: object, datatype: URIRef) -> bool:
+    if not isinstance(value, Literal):
+        return False
+    if value.datatype == datatype:
+        if getattr(value, "ill_typed", None) is True:
+            return False
+    elif not (
+        (value.datatype is None and value.language is None and datatype == XSD.string)
+        or (datatype == RDF.langString and value.language)
+    ):
+        return False
+    return isinstance(value.value, _DATATYPE_VALUE_TYPES[datatype])
+
+
+def _pattern_text(value: object) -> str:
+    if isinstance(value, Literal) and value.datatype in _PLAIN_STRING_DATATYPES:
+        return str(value.value)
+    return str(value)
+
+
+@dataclass(frozen=True)
+class PropertyCheck:
+    """Constraints of one property shape, with their messages pre-rendered."""
+
+    path: URIRef
+    path_text: str
+    field: str
+    code: str
+    min_count: int | None = None
+    datatype: URIRef | None = None
+    datatype_message: str = ""
+    allowed: frozenset[Any] | None = None
+    allowed_text: str = ""
+    patterns: tuple[re.Pattern[str], ...] = ()
+    pattern_message: str = ""
+
+
+class CompiledShapes:
+    """Property checks per target class, ready to run against instance data."""
+
+    def __init__(self, shapes_by_class: dict[URIRef, list[tuple[PropertyCheck, ...]]]) -> None:
+        self._shapes_by_class = shapes_by_class
+
+    @property
+    def target_classes(self) -> frozenset[URIRef]:
+        return frozenset(self._shapes_by_class)
+
+    def validate(
+        self,
+        triples: Iterable[Triple],
+        namespaces: NamespaceManager,
+        abort_on_first: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Check every focus node of the target classes in ``triples``.
+
+        Args:
+            triples: Instance data, e.g. a :class:`rdflib.Graph`
+            namespaces: Prefixes used to render nodes in messages
+            abort_on_first: Stop at the first violation
+
+        Returns:
+            Violation dicts with keys: source, code, field, message, focus_node
+        """
+        types: dict[Any, dict[Any, None]] = defaultdict(dict)
+        values: dict[Any, dict[Any, dict[Any, None]]] = defaultdict(lambda: defaultdict(dict))
+        for subject, predicate, obj in triples:
+            if predicate == RDF.type:
+                types[subject][obj] = None
+            # Dicts keep first-seen order and collapse duplicate triples like a graph.
+            values[subject][predicate][obj] = None
+
+        violations: list[dict[str, Any]] = []
+        for focus, classes in types.items():
+            shapes: dict[int, tuple[PropertyCheck, ...]] = {}
+            for cls in classes:
+                for checks in self._shapes_by_class.get(cls, ()):
+                    shapes.setdefault(id(checks), checks)
+            if not shapes:
+                continue
+            focus_values = values[focus]
+            focus_text = _node_text(focus, namespaces)
+            for checks in shapes.values():
+                for check in checks:
+                    for message in self._check(
+                        check, focus_values.get(check.path, {}), focus_text, namespaces
+                    ):
+                        violations.append(
+                            {
+                                "source": "shacl",
+                                "code": check.code,
+                                "field": check.field,
+                                "message": message,
+                                "focus_node": str(focus),
+                            }
+                        )
+                        if abort_on_first:
+                            return violations
+        return violations
+
+    @staticmethod
+    def _check(
+        check: PropertyCheck,
+        value_nodes: dict[Any, None],
+        focus_text: str,
+        namespaces: NamespaceManager,
+    ) -> Iterable[str]:
+        if check.min_count is not None and len(value_nodes) < check.min_count:
+            yield f"Less than {check.min_count} values on {focus_text}->{check.path_text}"
+        for value in value_nodes:
+            if check.datatype is not None and not _datatype_matches(value, check.datatype):
+                yield check.datatype_message
+            if check.allowed is not None and value not in check.allowed:
+                yield f"Value {_node_text(value, namespaces)} not in list {check.allowed_text}"
+            for pattern in check.patterns:
+                if isinstance(value, BNode) or not pattern.search(_pattern_text(value)):
+                    yield check.pattern_message
+
+
+def _single(shapes: Graph, node: object, predicate: URIRef) -> Any:
+    objects = list(shapes.objects(node, predicate))
+    if len(objects) > 1:
+        raise UnsupportedShapesError(f"{node} has several {predicate} values")
+    return objects[0] if objects else None
+
+
+def _compile_property(shapes: Graph, node: object) -> PropertyCheck:
+    namespaces = shapes.namespace_manager
+    extra = set(shapes.predicates(node, None)) - _PROPERTY_SHAPE_PREDICATES
+    if extra:
+        raise UnsupportedShapesError(f"property shape uses {sorted(map(str, extra))}")
+    path = _single(shapes, node, SH.path)
+    if not isinstance(path, URIRef):
+        raise UnsupportedShapesError(f"only IRI paths are compiled, got {path!r}")
+    field = field_for_path(path)
+    check: dict[str, Any] = {
+        "path": path,
+        "path_text": _node_text(path, namespaces),
+        "field": field,
+        "code": violation_code(field),
+    }
+
+    min_count = _single(shapes, node, SH.minCount)
+    if min_count is not None:
+        check["min_count"] = int(min_count)
+
+    datatype = _single(shapes, node, SH.datatype)
+    if datatype is not None:
+        if datatype not in _DATATYPE_VALUE_TYPES:
+            raise UnsupportedShapesError(f"sh:datatype {datatype} is not compiled")
+        check["datatype"] = datatype
+        check["datatype_message"] = (
+            f"Value is not Literal with datatype {_node_text(datatype, namespaces)}"
+        )
+
+    members = _single(shapes, node, SH["in"])
+    if members is not None:
+        allowed = list(Collection(shapes, members))
+        check["allowed"] = frozenset(allowed)
+        check["allowed_text"] = str([_node_text(value, namespaces) for value in allowed])
+
+    patterns = list(shapes.objects(node, SH.pattern))
+    if patterns:
+        flags_value = next(iter(shapes.objects(node, SH.flags)), None)
+        flags = str(flags_value).lower() if flags_value is not None else ""
+        re_flags = (re.I if "i" in flags else 0) | (re.M if "m" in flags else 0)
+        check["patterns"] = tuple(re.compile(str(pattern), re_flags) for pattern in patterns)
+        if len(patterns) == 1:
+            check["pattern_message"] = f"Value does not match pattern '{patterns[0]}'"
+        else:
+            joined = "', '".join(str(pattern) for pattern in patterns)
+            check["pattern_message"] = f"Value does not match every pattern in ('{joined}')"
+
+    return PropertyCheck(**check)
+
+
+def compile_shapes(shapes: Graph) -> CompiledShapes:
+    """Compile a shapes graph, or raise :class:`UnsupportedShapesError`."""
+    used = {predicate for predicate in shapes.predicates() if str(predicate).startswith(str(SH))}
+    unsupported = used - _SUPPORTED_SH_PREDICATES
+    if unsupported:
+        raise UnsupportedShapesError(f"shapes use {sorted(map(str, unsupported))}")
+
+    node_shapes = set(shapes.subjects(RDF.type, SH.NodeShape))
+    declared = set(shapes.subjects(SH.targetClass, None)) | set(shapes.subjects(SH.property, None))
+    if declared - node_shapes:
+        raise UnsupportedShapesError("only sh:NodeShape declarations are compiled")
+    if set(shapes.subjects(RDF.type, SH.PropertyShape)) - set(shapes.objects(None, SH.property)):
+        raise UnsupportedShapesError("standalone property shapes are not compiled")
+
+    shapes_by_class: dict[URIRef, list[tuple[PropertyCheck, ...]]] = defaultdict(list)
+    for shape in sorted(node_shapes, key=str):
+        extra = set(shapes.predicates(shape, None)) - _NODE_SHAPE_PREDICATES
+        if extra:
+            raise UnsupportedShapesError(f"{shape} uses {sorted(map(str, extra))}")
+        checks = tuple(
+            sorted(
+                (_compile_property(shapes, node) for node in shapes.objects(shape, SH.property)),
+                key=lambda check: str(check.path),
+            )
+        )
+        for target in shapes.objects(shape, SH.targetClass):
+            shapes_by_class[target].append(checks)
+    return CompiledShapes(dict(shapes_by_class))
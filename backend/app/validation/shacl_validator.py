@@ -1,13 +1,35 @@
-"""SHACL validation wrapper using pyshacl library."""
+"""SHACL validation against ``shapes/entities.ttl``.
+
+Two engines produce the same violation dicts:
+
+- ``compiled`` (default, ``SHACL_ENGINE``): the shapes compiled once into
+  Python checks (:mod:`.shacl_compiled`).
+- ``pyshacl``: full pyshacl validation with RDFS inference, the reference
+  implementation. The compiled engine also falls back to it for data it
+  cannot judge without inference (RDFS schema triples, blank focus nodes) and
+  for shapes using constraints it does not compile.
+"""
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, cast
 
-from pyshacl import validate
-from rdflib import Graph
+from rdflib import BNode, Graph
+from rdflib.namespace import RDF, RDFS
+
+from ..config import ShaclEngine, settings
+from .shacl_compiled import (
+    CompiledShapes,
+    Triple,
+    UnsupportedShapesError,
+    compile_shapes,
+    field_for_path,
+    violation_code,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +37,13 @@ logger = logging.getLogger(__name__)
 _SHAPES_PATH = Path(__file__).parent / "shapes" / "entities.ttl"
 _shapes_graph: Graph | None = None
 
+_compile_lock = threading.Lock()
+_compiled_shapes: CompiledShapes | None = None
+_compile_failed = False
+
+# Data triples that change what RDFS inference derives; only pyshacl handles them.
+_INFERENCE_PREDICATES = frozenset({RDFS.subClassOf, RDFS.subPropertyOf, RDFS.domain, RDFS.range})
+
 
 def _load_shapes() -> Graph:
     """Load SHACL shapes from entities.ttl file."""
@@ -33,6 +62,15 @@ def _load_shapes() -> Graph:
         raise RuntimeError(f"SHACL shapes loading failed: {e}") from e
 
 
+def reset_shapes() -> None:
+    """Drop the loaded and compiled shapes so the next validation re-reads entities.ttl."""
+    global _shapes_graph, _compiled_shapes, _compile_failed
+    with _compile_lock:
+        _shapes_graph = None
+        _compiled_shapes = None
+        _compile_failed = False
+
+
 def _parse_violation_report(report_graph: Graph, report_text: str) -> list[dict[str, Any]]:
     """Parse SHACL validation report into structured violations list.
 
@@ -41,7 +79,8 @@ def _parse_violation_report(report_graph: Graph, report_text: str) -> list[dict[
         report_text: Human-readable report text
 
     Returns:
-        List of violation dicts with keys: source, code, field, message
+        List of violation dicts with keys: source, code, field, message,
+        focus_node
     """
     violations: list[dict[str, Any]] = []
 
@@ -66,28 +105,19 @@ def _parse_violation_report(report_graph: Graph, report_text: str) -> list[dict[
 
         for row in results:
             result_row = cast(Any, row)
-            path_value = getattr(result_row, "path", None)
-            path_str = str(path_value) if path_value else "item"
             # Extract local name from URI for cleaner field names
-            if "#" in path_str:
-                path_str = path_str.split("#")[-1]
-            elif "/" in path_str:
-                path_str = path_str.split("/")[-1]
+            path_str = field_for_path(getattr(result_row, "path", None))
 
             message_value = getattr(result_row, "message", None)
             message = str(message_value) if message_value else "Validation constraint violated"
 
-            # Generate code from path or use generic code
-            code = (
-                f"SHACL_{path_str.upper()}_CONSTRAINT" if path_str != "item" else "SHACL_CONSTRAINT"
-            )
-
             violations.append(
                 {
                     "source": "shacl",
-                    "code": code,
+                    "code": violation_code(path_str),
                     "field": path_str,
                     "message": message,
+                    "focus_node": str(result_row.focusNode),
                 }
             )
     except Exception as e:
@@ -106,9 +136,89 @@ def _parse_violation_report(report_graph: Graph, report_text: str) -> list[dict[
     return violations
 
 
+def _load_compiled_shapes() -> CompiledShapes | None:
+    """Compile the shapes once; ``None`` when they need pyshacl."""
+    global _compiled_shapes, _compile_failed
+    if _compiled_shapes is not None or _compile_failed:
+        return _compiled_shapes
+    shapes = _load_shapes()
+    with _compile_lock:
+        if _compiled_shapes is None and not _compile_failed:
+            try:
+                _compiled_shapes = compile_shapes(shapes)
+            except UnsupportedShapesError as e:
+                logger.warning(f"SHACL shapes not compilable, using pyshacl: {e}")
+                _compile_failed = True
+    return _compiled_shapes
+
+
+def _needs_inference(triples: Iterable[Triple]) -> bool:
+    return any(
+        predicate in _INFERENCE_PREDICATES or (predicate == RDF.type and isinstance(subject, BNode))
+        for subject, predicate, _ in triples
+    )
+
+
+def _validation_error(e: Exception) -> list[dict[str, Any]]:
+    logger.error(f"SHACL validation error: {e}")
+    # Return a generic validation error rather than raising
+    return [
+        {
+            "source": "shacl",
+            "code": "SHACL_VALIDATION_ERROR",
+            "field": "item",
+            "message": f"SHACL validation failed: {str(e)}",
+        }
+    ]
+
+
+def _validate_compiled(
+    triples: Iterable[Triple],
+    namespaces: Graph,
+    abort_on_first: bool,
+    engine: ShaclEngine | None,
+) -> list[dict[str, Any]] | None:
+    """Violations from the compiled shapes, or ``None`` when pyshacl must decide."""
+    if (engine or settings.shacl_engine) != "compiled" or _needs_inference(triples):
+        return None
+    compiled = _load_compiled_shapes()
+    if compiled is None:
+        return None
+    try:
+        return compiled.validate(
+            triples, namespaces.namespace_manager, abort_on_first=abort_on_first
+        )
+    except Exception as e:
+        return _validation_error(e)
+
+
+def _validate_pyshacl(data_graph: Graph, abort_on_first: bool) -> list[dict[str, Any]]:
+    from pyshacl import validate
+
+    shapes = _load_shapes()
+
+    try:
+        conforms, report_graph, report_text = validate(
+            data_graph,
+            shacl_graph=shapes,
+            inference="rdfs",
+            abort_on_first=abort_on_first,
+        )
+
+        if conforms:
+            return []
+
+        violations = _parse_violation_report(report_graph, report_text)
+        return violations
+
+    except Exception as e:
+        return _validation_error(e)
+
+
 def validate_shacl(
     data_graph: Graph,
     abort_on_first: bool = False,
+    engine: ShaclEngine | None = None,
 ) -> list[dict[str, Any]]:
     """Validate RDF data graph against SHACL shapes.
 
@@ -116,38 +226,42 @@ def validate_shacl(
         data_graph: RDF graph containing data to validate
         abort_on_first: If True, stop on first violation (CLI fail-fast).
                        If False, collect all violations (backend behavior).
+        engine: ``compiled`` or ``pyshacl``; defaults to ``SHACL_ENGINE``
 
     Returns:
         List of violation dicts. Empty list if validation passes.
-        Each violation has keys: source, code, field, message
+        Each violation has keys: source, code, field, message, focus_node
 
     Raises:
         RuntimeError: If shapes cannot be loaded
     """
-    shapes = _load_shapes()
+    violations = _validate_compiled(data_graph, data_graph, abort_on_first, engine)
+    if violations is not None:
+        return violations
+    return _validate_pyshacl(data_graph, abort_on_first)
 
-    try:
-        conforms, report_graph, report_text = validate(
-            data_graph,
-            shacl_graph=shapes,
-            inference="rdfs",
-            abort_on_first=abort_on_first,
-        )
 
-        if conforms:
-            return []
+def validate_shacl_triples(
+    triples: list[Triple],
+    namespaces: Graph,
+    abort_on_first: bool = False,
+    engine: ShaclEngine | None = None,
+) -> list[dict[str, Any]]:
+    """Like :func:`validate_shacl` for bare triples, skipping graph construction when compiled.
 
-        violations = _parse_violation_report(report_graph, report_text)
+    Args:
+        triples: Instance data triples
+        namespaces: Graph whose prefix bindings render nodes in messages
+        abort_on_first: If True, stop on first violation
+        engine: ``compiled`` or ``pyshacl``; defaults to ``SHACL_ENGINE``
+    """
+    violations = _validate_compiled(triples, namespaces, abort_on_first, engine)
+    if violations is not None:
         return violations
 
-    except Exception as e:
-        logger.error(f"SHACL validation error: {e}")
-        # Return a generic validation error rather than raising
-        return [
-            {
-                "source": "shacl",
-                "code": "SHACL_VALIDATION_ERROR",
-                "field": "item",
-                "message": f"SHACL validation failed: {str(e)}",
-            }
-        ]
+    data_graph = Graph()
+    for prefix, namespace in namespaces.namespaces():
+        data_graph.bind(prefix, namespace)
+    for triple in triples:
+        data_graph.add(triple)
+    return _validate_pyshacl(data_graph, abort_on_first)
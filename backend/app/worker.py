@@ -1,6 +1,11 @@
 import argparse
+import threading
 import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 
 import psycopg
 from psycopg import sql
@@ -14,16 +19,27 @@ from .email.sync import (
     run_email_sync,
     sync_email_archive,
 )
+from .email.sync_executor import EMAIL_SYNC_EVENT_TYPE, EmailSyncExecutor
 from .metrics import APP_IMPORTS_COMPLETED_TOTAL, APP_IMPORTS_FAILED_TOTAL
 from .observability import configure_logging, get_logger
 from .outbox import OUTBOX_NOTIFY_CHANNEL
+from .projection.items import refresh_item_projection
 from .push_events import enqueue_push_payload
-from .search.indexer import delete_item, index_file, index_item
-from .search.jobs import mark_failed, mark_processing, mark_skipped, mark_succeeded
+from .search.indexer import delete_item, delete_items, index_file, index_item, index_items
+from .search.jobs import (
+    IndexJobKey,
+    mark_failed,
+    mark_finished_many,
+    mark_processing,
+    mark_processing_many,
+    mark_skipped,
+    mark_succeeded,
+)
 from .search.meili import is_enabled
 from .worker_health import (
     WORKER_BATCH_DURATION_SECONDS,
     WORKER_BATCHES_TOTAL,
+    WORKER_ERRORS_TOTAL,
     WORKER_EVENTS_TOTAL,
     WorkerHealthState,
     start_health_server,
@@ -32,6 +48,12 @@ from .worker_health import (
 configure_logging()
 logger = get_logger("projection-worker")
 
+_EMAIL_SYNC_INTERVAL_SECONDS = 300.0
+_CONTAINER_REAP_INTERVAL_SECONDS = 60.0
+_MEMORY_COMPACT_INTERVAL_SECONDS = 3600.0
+_VALIDATION_PRUNE_INTERVAL_SECONDS = 3600.0
+_PARTITION_LAG_REFRESH_SECONDS = 5.0
+
 
 def _mark_processed(conn, event_id: str) -> None:
     with conn.cursor() as cur:
@@ -307,297 +329,712 @@ def _mark_import_failed(job_id: str | None, error: str) -> None:
         logger.exception("import_job.mark_failed", job_id=job_id)
 
 
-def process_batch(limit: int = 25) -> int:
+def _handle_event_failure(
+    conn,
+    event: dict,
+    exc: Exception,
+    *,
+    org_id: str | None,
+    entity_type: str | None,
+    entity_id: str | None,
+    action: str,
+    target_user_id: str | None,
+    started_at: float,
+    after_commit: list[Callable[[], None]] | None = None,
+) -> None:
+    """Count a failed attempt (or dead-letter the event) and report the search job.
+
+    With ``after_commit``, the search job update and push are deferred to it.
+    """
+    event_id = event["event_id"]
+    event_type = event["event_type"]
+    payload = event["payload"] or {}
+    if event_type in ("nirvana_import_job", "native_import_job"):
+        source = "nirvana" if event_type == "nirvana_import_job" else "native"
+        APP_IMPORTS_FAILED_TOTAL.labels(source=source).inc()
+        _mark_import_failed(payload.get("job_id"), str(exc))
+    if org_id and entity_type and entity_id:
+
+        def _report_failure() -> None:
+            try:
+                mark_failed(
+                    org_id,
+                    entity_type,
+                    entity_id,
+                    str(exc),
+                    action=action,
+                )
+                _emit_index_event(
+                    status="failed",
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    org_id=org_id,
+                    action=action,
+                    title="Search indexing failed",
+                    body=f"Indexing failed for {entity_type} {entity_id}.",
+                    target_user_id=target_user_id,
+                )
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    "outbox.search_job_update_failed",
+                    event_id=str(event_id),
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                )
+
+        if after_commit is None:
+            _report_failure()
+        else:
+            after_commit.append(_report_failure)
+    new_attempts = _get_attempts(conn, event_id) + 1
+    if new_attempts >= settings.outbox_max_attempts:
+        _mark_dead_letter(conn, event_id, str(exc))
+        logger.warning(
+            "outbox.event_dead_lettered",
+            event_id=str(event_id),
+            event_type=event_type,
+            attempts=new_attempts,
+            error=str(exc)[:500],
+        )
+    else:
+        _mark_failed(conn, event_id, str(exc))
+        logger.error(
+            "outbox.event_failed",
+            event_id=str(event_id),
+            event_type=event_type,
+            duration_ms=int((time.monotonic() - started_at) * 1000),
+            error=str(exc)[:500],
+        )
+
+
+def _process_event(conn, event: dict) -> bool:
+    """Project a single outbox event; returns ``True`` when it was processed."""
+    event_id = event["event_id"]
+    event_type = event["event_type"]
+    payload = event["payload"] or {}
+    started_at = time.monotonic()
+    logger.debug("outbox.event_start", event_id=str(event_id), event_type=event_type)
+
+    entity_type = None
+    entity_id = None
+    org_id = payload.get("org_id") if isinstance(payload, dict) else None
+    action = "upsert"
+    target_user_id = None
+
+    try:
+        if event_type == "item_upserted":
+            entity_type = "item"
+            if not org_id:
+                raise ValueError("missing org_id")
+            if not payload.get("item_id"):
+                raise ValueError("missing item_id")
+            entity_id = str(payload.get("item_id"))
+            action = "upsert"
+            if org_id and entity_id:
+                mark_processing(org_id, entity_type, entity_id, action=action)
+            with conn.cursor() as cur:
+                refresh_item_projection(cur, [entity_id])
+                cur.execute(
+                    """
+                    SELECT
+                        item_id,
+                        org_id,
+                        canonical_id,
+                        source,
+                        schema_jsonld,
+                        created_at,
+                        updated_at,
+                        created_by_user_id
+                    FROM items
+                    WHERE item_id = %s
+                    """,
+                    (payload["item_id"],),
+                )
+                row = cur.fetchone()
+            if row is None:
+                raise ValueError("item not found for indexing")
+            target_user_id = payload.get("_context", {}).get("user_id")
+            if not target_user_id:
+                target_user_id = (
+                    str(row.get("created_by_user_id")) if row.get("created_by_user_id") else None
+                )
+            if is_enabled():
+                index_item(row)
+                mark_succeeded(org_id, entity_type, entity_id, action=action)
+                _emit_index_event(
+                    status="succeeded",
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    org_id=org_id,
+                    action=action,
+                    title="Item indexed",
+                    body=f"{row.get('canonical_id') or entity_id} indexed.",
+                    target_user_id=target_user_id,
+                )
+            else:
+                mark_skipped(
+                    org_id,
+                    entity_type,
+                    entity_id,
+                    reason="Search disabled",
+                    action=action,
+                )
+        elif event_type == "item_archived":
+            entity_type = "item"
+            if not org_id:
+                raise ValueError("missing org_id")
+            if not payload.get("item_id"):
+                raise ValueError("missing item_id")
+            entity_id = str(payload.get("item_id"))
+            action = "delete"
+            if org_id and entity_id:
+                mark_processing(org_id, entity_type, entity_id, action=action)
+            with conn.cursor() as cur:
+                refresh_item_projection(cur, [entity_id])
+            if is_enabled():
+                delete_item(payload.get("item_id", ""))
+                mark_succeeded(org_id, entity_type, entity_id, action=action)
+                _emit_index_event(
+                    status="succeeded",
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    org_id=org_id,
+                    action=action,
+                    title="Item removed from search",
+                    body=f"Item {entity_id} removed from search.",
+                    target_user_id=payload.get("_context", {}).get("user_id"),
+                )
+            else:
+                mark_skipped(
+                    org_id,
+                    entity_type,
+                    entity_id,
+                    reason="Search disabled",
+                    action=action,
+                )
+            # Mark email as read in Gmail if this was a gmail-sourced item
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT item_id, org_id, source, schema_jsonld,
+                           created_by_user_id
+                    FROM items
+                    WHERE item_id = %s
+                    """,
+                    (entity_id,),
+                )
+                archived_row = cur.fetchone()
+            if archived_row and archived_row.get("source") == "gmail":
+                try:
+                    sync_email_archive(archived_row, org_id)
+                except Exception:
+                    logger.warning(
+                        "email.archive_sync_failed",
+                        item_id=entity_id,
+                        exc_info=True,
+                    )
+        elif event_type == "file_uploaded":
+            entity_type = "file"
+            if not org_id:
+                raise ValueError("missing org_id")
+            if not payload.get("file_id"):
+                raise ValueError("missing file_id")
+            entity_id = str(payload.get("file_id"))
+            action = "upsert"
+            if org_id and entity_id:
+                mark_processing(org_id, entity_type, entity_id, action=action)
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        file_id,
+                        org_id,
+                        owner_id,
+                        original_name,
+                        content_type,
+                        size_bytes,
+                        sha256,
+                        storage_path,
+                        created_at
+                    FROM files
+                    WHERE file_id = %s
+                    """,
+                    (payload["file_id"],),
+                )
+                row = cur.fetchone()
+            if row is None:
+                raise ValueError("file not found for indexing")
+            target_user_id = str(row.get("owner_id")) if row.get("owner_id") else None
+            if is_enabled() and settings.meili_index_files_enabled:
+                index_file(row)
+                mark_succeeded(org_id, entity_type, entity_id, action=action)
+                _emit_index_event(
+                    status="succeeded",
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    org_id=org_id,
+                    action=action,
+                    title="File indexed",
+                    body=f"{row.get('original_name') or entity_id} indexed.",
+                    target_user_id=target_user_id,
+                )
+            else:
+                mark_skipped(
+                    org_id,
+                    entity_type,
+                    entity_id,
+                    reason="File indexing disabled",
+                    action=action,
+                )
+        elif event_type in ("nirvana_import_job", "native_import_job"):
+            _process_import_job(payload)
+            source = "nirvana" if event_type == "nirvana_import_job" else "native"
+            APP_IMPORTS_COMPLETED_TOTAL.labels(source=source).inc()
+        elif event_type == "email_sync_job":
+            sync_conn_id = payload.get("connection_id")
+            sync_org_id = payload.get("org_id")
+            sync_user_id = payload.get("user_id")
+            if not sync_conn_id or not sync_org_id or not sync_user_id:
+                raise ValueError("email_sync_job missing required fields")
+            result = run_email_sync(
+                connection_id=sync_conn_id,
+                org_id=sync_org_id,
+                user_id=sync_user_id,
+            )
+            logger.info(
+                "email_sync.completed",
+                connection_id=sync_conn_id,
+                synced=result.synced,
+                created=result.created,
+            )
+        elif event_type == "email_watch_renew":
+            renew_conn_id = payload.get("connection_id")
+            renew_org_id = payload.get("org_id")
+            if not renew_conn_id or not renew_org_id:
+                raise ValueError("email_watch_renew missing required fields")
+            register_watch(renew_conn_id, renew_org_id)
+            logger.info(
+                "email_watch.renewed",
+                connection_id=renew_conn_id,
+            )
+
+        _mark_processed(conn, event_id)
+        logger.debug(
+            "outbox.event_processed",
+            event_id=str(event_id),
+            event_type=event_type,
+            duration_ms=int((time.monotonic() - started_at) * 1000),
+        )
+        return True
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("outbox.process_failed", event_id=str(event_id))
+        _handle_event_failure(
+            conn,
+            event,
+            exc,
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            target_user_id=target_user_id,
+            started_at=started_at,
+        )
+        return False
+
+
+_PROJECTION_EVENT_TYPES = frozenset({"item_upserted", "item_archived"})
+
+
+@dataclass
+class _ItemProjection:
+    """Coalesced search projection for one item within a fetched batch."""
+
+    org_id: str
+    item_id: str
+    action: str
+    target_user_id: str | None
+    events: list[dict] = field(default_factory=list)
+
+    @property
+    def job_key(self) -> IndexJobKey:
+        return (self.org_id, "item", self.item_id, self.action)
+
+
+def _mark_processed_many(conn, event_ids: list) -> None:
+    if not event_ids:
+        return
+    with conn.cursor() as cur:
+        cur.execute(
+            "UPDATE outbox_events SET processed_at = %s WHERE event_id = ANY(%s)",
+            (datetime.now(UTC), event_ids),
+        )
+
+
+def _coalesce_item_events(
+    conn,
+    events: list[dict],
+    started_at: float,
+) -> dict[str, _ItemProjection]:
+    """Group item events by item id; the latest event decides upsert vs delete."""
+    projections: dict[str, _ItemProjection] = {}
+    for event in events:
+        payload = event["payload"] or {}
+        org_id = payload.get("org_id") if isinstance(payload, dict) else None
+        item_id = payload.get("item_id") if isinstance(payload, dict) else None
+        action = "delete" if event["event_type"] == "item_archived" else "upsert"
+        exc = None
+        if not org_id or not item_id:
+            exc = ValueError("missing org_id" if not org_id else "missing item_id")
+        else:
+            try:
+                key = str(uuid.UUID(str(item_id)))
+            except ValueError:
+                exc = ValueError("invalid item_id")
+        if exc is not None:
+            logger.warning("outbox.process_failed", event_id=str(event["event_id"]))
+            _handle_event_failure(
+                conn,
+                event,
+                exc,
+                org_id=org_id,
+                entity_type="item",
+                entity_id=None,
+                action=action,
+                target_user_id=None,
+                started_at=started_at,
+            )
+            continue
+        context_user_id = (payload.get("_context") or {}).get("user_id")
+        projection = projections.get(key)
+        if projection is None:
+            projection = _ItemProjection(
+                org_id=str(org_id),
+                item_id=key,
+                action=action,
+                target_user_id=context_user_id,
+            )
+            projections[key] = projection
+        else:
+            projection.org_id = str(org_id)
+            projection.action = action
+            projection.target_user_id = context_user_id
+        projection.events.append(event)
+    return projections
+
+
+def _load_items_for_indexing(conn, item_ids: list[str]) -> dict[str, dict]:
+    if not item_ids:
+        return {}
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                item_id,
+                org_id,
+                canonical_id,
+                source,
+                schema_jsonld,
+                created_at,
+                updated_at,
+                created_by_user_id
+            FROM items
+            WHERE item_id = ANY(%s::uuid[])
+            """,
+            (item_ids,),
+        )
+        return {str(row["item_id"]): row for row in cur.fetchall()}
+
+
+def _sync_archived_gmail_items(conn, projections: list[_ItemProjection]) -> None:
+    if not projections:
+        return
+    org_by_item = {projection.item_id: projection.org_id for projection in projections}
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT item_id, org_id, source, schema_jsonld,
+                   created_by_user_id
+            FROM items
+            WHERE item_id = ANY(%s::uuid[]) AND source = 'gmail'
+            """,
+            (list(org_by_item),),
+        )
+        archived_rows = cur.fetchall()
+    for archived_row in archived_rows:
+        item_id = str(archived_row["item_id"])
+        try:
+            sync_email_archive(archived_row, org_by_item[item_id])
+        except Exception:
+            logger.warning("email.archive_sync_failed", item_id=item_id, exc_info=True)
+
+
+@dataclass
+class _ProjectionPlan:
+    """A coalesced batch and its outcome, carried from the DB step to the search step."""
+
+    projections: dict[str, _ItemProjection]
+    rows: dict[str, dict]
+    indexable: list[_ItemProjection] = field(default_factory=list)
+    deletes: list[_ItemProjection] = field(default_factory=list)
+    done: list[_ItemProjection] = field(default_factory=list)
+    failures: list[tuple[_ItemProjection, Exception]] = field(default_factory=list)
+    search_enabled: bool = True
+
+
+def _prepare_item_projection_batch(
+    conn, events: list[dict], started_at: float
+) -> _ProjectionPlan | None:
+    """Database-only step: coalesce events, refresh projections and load the items."""
+    projections = _coalesce_item_events(conn, events, started_at)
+    if not projections:
+        return None
+
+    with conn.cursor() as cur:
+        refresh_item_projection(cur, list(projections))
+
+    upserts = [p for p in projections.values() if p.action == "upsert"]
+    plan = _ProjectionPlan(
+        projections=projections,
+        rows=_load_items_for_indexing(conn, [p.item_id for p in upserts]),
+        deletes=[p for p in projections.values() if p.action == "delete"],
+    )
+    for projection in upserts:
+        row = plan.rows.get(projection.item_id)
+        if row is None:
+            plan.failures.append((projection, ValueError("item not found for indexing")))
+            continue
+        if not projection.target_user_id and row.get("created_by_user_id"):
+            projection.target_user_id = str(row["created_by_user_id"])
+        plan.indexable.append(projection)
+    return plan
+
+
+def _apply_item_projection_batch(plan: _ProjectionPlan) -> None:
+    """Search step: one Meilisearch documents call and one delete-batch call."""
+    mark_processing_many([p.job_key for p in plan.projections.values()])
+    plan.search_enabled = is_enabled()
+    if not plan.search_enabled:
+        plan.done = plan.indexable + plan.deletes
+        return
+    rows = plan.rows
+    for group, apply in (
+        (plan.indexable, lambda: index_items([rows[p.item_id] for p in plan.indexable])),
+        (plan.deletes, lambda: delete_items([p.item_id for p in plan.deletes])),
+    ):
+        if not group:
+            continue
+        try:
+            apply()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("outbox.projection_batch_failed", count=len(group), error=str(exc))
+            plan.failures.extend((projection, exc) for projection in group)
+        else:
+            plan.done.extend(group)
+
+
+def _report_item_projection_batch(conn, plan: _ProjectionPlan) -> None:
+    """Job statuses, push notifications and Gmail archive sync for a committed batch."""
+    if not plan.search_enabled:
+        mark_finished_many([p.job_key for p in plan.done], "skipped", reason="Search disabled")
+    else:
+        mark_finished_many([p.job_key for p in plan.done], "succeeded")
+        for projection in plan.done:
+            if projection.action == "upsert":
+                row = plan.rows[projection.item_id]
+                title = "Item indexed"
+                body = f"{row.get('canonical_id') or projection.item_id} indexed."
+            else:
+                title = "Item removed from search"
+                body = f"Item {projection.item_id} removed from search."
+            _emit_index_event(
+                status="succeeded",
+                entity_type="item",
+                entity_id=projection.item_id,
+                org_id=projection.org_id,
+                action=projection.action,
+                title=title,
+                body=body,
+                target_user_id=projection.target_user_id,
+            )
+
+    # Mark emails as read in Gmail for archived gmail-sourced items
+    _sync_archived_gmail_items(conn, [p for p in plan.done if p.action == "delete"])
+
+
+def _process_item_projection_batch(
+    conn,
+    events: list[dict],
+    after_commit: list[Callable[[], None]],
+) -> int | None:
+    """Project item upserts/deletes for a whole batch at once.
+
+    Repeated events for the same item collapse into one search operation,
+    ``item_projection`` rows are re-derived for all of them, referenced items
+    load with a single query, Meilisearch receives one
+    documents (and one delete-batch) call per index, and job status plus
+    ``processed_at`` are written in bulk. Per-item failures keep the regular
+    retry/dead-letter handling for every event that was coalesced.
+
+    Only the database step runs in a savepoint. If it fails, ``None`` is
+    returned before anything external happened, and the caller processes the
+    events one by one. Job statuses, pushes and Gmail syncs are appended to
+    ``after_commit`` so they only run once the batch is committed.
+    """
+    started_at = time.monotonic()
+    try:
+        with conn.transaction():
+            plan = _prepare_item_projection_batch(conn, events, started_at)
+    except Exception:  # noqa: BLE001
+        logger.exception("outbox.projection_batch_fallback", count=len(events))
+        return None
+    if plan is None:
+        return 0
+
+    _apply_item_projection_batch(plan)
+
+    _mark_processed_many(conn, [event["event_id"] for p in plan.done for event in p.events])
+    for projection, exc in plan.failures:
+        for event in projection.events:
+            _handle_event_failure(
+                conn,
+                event,
+                exc,
+                org_id=projection.org_id,
+                entity_type="item",
+                entity_id=projection.item_id,
+                action=projection.action,
+                target_user_id=projection.target_user_id,
+                started_at=started_at,
+                after_commit=after_commit,
+            )
+    after_commit.append(partial(_report_item_projection_batch, conn, plan))
+
+    processed = sum(len(p.events) for p in plan.done)
+    logger.debug(
+        "outbox.projection_batch_done",
+        events=len(events),
+        entities=len(plan.projections),
+        processed=processed,
+        failed=len(plan.failures),
+        duration_ms=int((time.monotonic() - started_at) * 1000),
+    )
+    return processed
+
+
+# Events of one org always hash to the same partition, so a single consumer
+# sees them in created_at order while other orgs proceed in parallel.
+_PARTITION_KEY_SQL = sql.SQL(
+    "mod(hashtext(COALESCE(payload->>'org_id', event_id::text))::bigint + 2147483648, {}) = {}"
+)
+
+
+def _pending_filter(
+    partition: int | None,
+    partitions: int,
+    exclude_event_types: tuple[str, ...] = (),
+) -> sql.Composable:
+    pending = sql.SQL("processed_at IS NULL AND dead_lettered_at IS NULL")
+    if exclude_event_types:
+        pending = sql.SQL("{} AND event_type NOT IN ({})").format(
+            pending,
+            sql.SQL(", ").join(sql.Literal(event_type) for event_type in exclude_event_types),
+        )
+    if partition is None or partitions <= 1:
+        return pending
+    return sql.SQL("{} AND {}").format(
+        pending,
+        _PARTITION_KEY_SQL.format(sql.Literal(partitions), sql.Literal(partition)),
+    )
+
+
+def _validate_partition(partition: int | None, partitions: int) -> None:
+    if partition is not None and not 0 <= partition < max(1, partitions):
+        raise ValueError(f"partition {partition} out of range for {partitions} partitions")
+
+
+def partition_backlog(
+    partition: int | None = None,
+    partitions: int = 1,
+    *,
+    exclude_event_types: tuple[str, ...] = (),
+) -> tuple[int, float]:
+    """Return ``(pending events, age in seconds of the oldest one)`` for a partition."""
+    _validate_partition(partition, partitions)
     with db_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """
-                SELECT event_id, event_type, payload
-                FROM outbox_events
-                WHERE processed_at IS NULL AND dead_lettered_at IS NULL
-                ORDER BY created_at ASC
-                LIMIT %s
-                FOR UPDATE SKIP LOCKED
-                """,
+                sql.SQL(
+                    """
+                    SELECT
+                        count(*) AS pending,
+                        COALESCE(EXTRACT(EPOCH FROM now() - min(created_at)), 0) AS lag_seconds
+                    FROM outbox_events
+                    WHERE {}
+                    """
+                ).format(_pending_filter(partition, partitions, exclude_event_types))
+            )
+            row = cur.fetchone()
+    return int(row["pending"]), max(0.0, float(row["lag_seconds"]))
+
+
+def process_batch(
+    limit: int = 25,
+    *,
+    batched: bool | None = None,
+    partition: int | None = None,
+    partitions: int = 1,
+    exclude_event_types: tuple[str, ...] = (),
+) -> int:
+    """Claim and process up to ``limit`` pending outbox events.
+
+    With ``partition``/``partitions`` set, only events whose ``org_id`` hashes
+    to that partition are claimed; see :func:`main` ``--consumers``. Events of
+    ``exclude_event_types`` are left for another consumer (the email sync
+    executor claims ``email_sync_job``).
+    """
+    _validate_partition(partition, partitions)
+    use_batched = settings.outbox_worker_batched_projection if batched is None else batched
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                sql.SQL(
+                    """
+                    SELECT event_id, event_type, payload
+                    FROM outbox_events
+                    WHERE {}
+                    ORDER BY created_at ASC
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                    """
+                ).format(_pending_filter(partition, partitions, exclude_event_types)),
                 (limit,),
             )
             events = cur.fetchall()
         if not events:
-            logger.debug("outbox.idle")
+            logger.debug("outbox.idle", partition=partition)
             return 0
-        logger.debug("outbox.batch_fetched", fetched=len(events), limit=limit)
+        logger.debug("outbox.batch_fetched", fetched=len(events), limit=limit, partition=partition)
 
         processed = 0
-        for event in events:
-            event_id = event["event_id"]
-            event_type = event["event_type"]
-            payload = event["payload"] or {}
-            started_at = time.monotonic()
-            logger.debug("outbox.event_start", event_id=str(event_id), event_type=event_type)
-
-            entity_type = None
-            entity_id = None
-            org_id = payload.get("org_id") if isinstance(payload, dict) else None
-            action = "upsert"
-            target_user_id = None
-
-            try:
-                if event_type == "item_upserted":
-                    entity_type = "item"
-                    if not org_id:
-                        raise ValueError("missing org_id")
-                    if not payload.get("item_id"):
-                        raise ValueError("missing item_id")
-                    entity_id = str(payload.get("item_id"))
-                    action = "upsert"
-                    if org_id and entity_id:
-                        mark_processing(org_id, entity_type, entity_id, action=action)
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            SELECT
-                                item_id,
-                                org_id,
-                                canonical_id,
-                                source,
-                                schema_jsonld,
-                                created_at,
-                                updated_at,
-                                created_by_user_id
-                            FROM items
-                            WHERE item_id = %s
-                            """,
-                            (payload["item_id"],),
-                        )
-                        row = cur.fetchone()
-                    if row is None:
-                        raise ValueError("item not found for indexing")
-                    target_user_id = payload.get("_context", {}).get("user_id")
-                    if not target_user_id:
-                        target_user_id = (
-                            str(row.get("created_by_user_id"))
-                            if row.get("created_by_user_id")
-                            else None
-                        )
-                    if is_enabled():
-                        index_item(row)
-                        mark_succeeded(org_id, entity_type, entity_id, action=action)
-                        _emit_index_event(
-                            status="succeeded",
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            org_id=org_id,
-                            action=action,
-                            title="Item indexed",
-                            body=f"{row.get('canonical_id') or entity_id} indexed.",
-                            target_user_id=target_user_id,
-                        )
-                    else:
-                        mark_skipped(
-                            org_id,
-                            entity_type,
-                            entity_id,
-                            reason="Search disabled",
-                            action=action,
-                        )
-                elif event_type == "item_archived":
-                    entity_type = "item"
-                    if not org_id:
-                        raise ValueError("missing org_id")
-                    if not payload.get("item_id"):
-                        raise ValueError("missing item_id")
-                    entity_id = str(payload.get("item_id"))
-                    action = "delete"
-                    if org_id and entity_id:
-                        mark_processing(org_id, entity_type, entity_id, action=action)
-                    if is_enabled():
-                        delete_item(payload.get("item_id", ""))
-                        mark_succeeded(org_id, entity_type, entity_id, action=action)
-                        _emit_index_event(
-                            status="succeeded",
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            org_id=org_id,
-                            action=action,
-                            title="Item removed from search",
-                            body=f"Item {entity_id} removed from search.",
-                            target_user_id=payload.get("_context", {}).get("user_id"),
-                        )
-                    else:
-                        mark_skipped(
-                            org_id,
-                            entity_type,
-                            entity_id,
-                            reason="Search disabled",
-                            action=action,
-                        )
-                    # Mark email as read in Gmail if this was a gmail-sourced item
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            SELECT item_id, org_id, source, schema_jsonld,
-                                   created_by_user_id
-                            FROM items
-                            WHERE item_id = %s
-                            """,
-                            (entity_id,),
-                        )
-                        archived_row = cur.fetchone()
-                    if archived_row and archived_row.get("source") == "gmail":
-                        try:
-                            sync_email_archive(archived_row, org_id)
-                        except Exception:
-                            logger.warning(
-                                "email.archive_sync_failed",
-                                item_id=entity_id,
-                                exc_info=True,
-                            )
-                elif event_type == "file_uploaded":
-                    entity_type = "file"
-                    if not org_id:
-                        raise ValueError("missing org_id")
-                    if not payload.get("file_id"):
-                        raise ValueError("missing file_id")
-                    entity_id = str(payload.get("file_id"))
-                    action = "upsert"
-                    if org_id and entity_id:
-                        mark_processing(org_id, entity_type, entity_id, action=action)
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            SELECT
-                                file_id,
-                                org_id,
-                                owner_id,
-                                original_name,
-                                content_type,
-                                size_bytes,
-                                sha256,
-                                storage_path,
-                                created_at
-                            FROM files
-                            WHERE file_id = %s
-                            """,
-                            (payload["file_id"],),
-                        )
-                        row = cur.fetchone()
-                    if row is None:
-                        raise ValueError("file not found for indexing")
-                    target_user_id = str(row.get("owner_id")) if row.get("owner_id") else None
-                    if is_enabled() and settings.meili_index_files_enabled:
-                        index_file(row)
-                        mark_succeeded(org_id, entity_type, entity_id, action=action)
-                        _emit_index_event(
-                            status="succeeded",
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            org_id=org_id,
-                            action=action,
-                            title="File indexed",
-                            body=f"{row.get('original_name') or entity_id} indexed.",
-                            target_user_id=target_user_id,
-                        )
-                    else:
-                        mark_skipped(
-                            org_id,
-                            entity_type,
-                            entity_id,
-                            reason="File indexing disabled",
-                            action=action,
-                        )
-                elif event_type in ("nirvana_import_job", "native_import_job"):
-                    _process_import_job(payload)
-                    source = "nirvana" if event_type == "nirvana_import_job" else "native"
-                    APP_IMPORTS_COMPLETED_TOTAL.labels(source=source).inc()
-                elif event_type == "email_sync_job":
-                    sync_conn_id = payload.get("connection_id")
-                    sync_org_id = payload.get("org_id")
-                    sync_user_id = payload.get("user_id")
-                    if not sync_conn_id or not sync_org_id or not sync_user_id:
-                        raise ValueError("email_sync_job missing required fields")
-                    result = run_email_sync(
-                        connection_id=sync_conn_id,
-                        org_id=sync_org_id,
-                        user_id=sync_user_id,
-                    )
-                    logger.info(
-                        "email_sync.completed",
-                        connection_id=sync_conn_id,
-                        synced=result.synced,
-                        created=result.created,
-                    )
-                elif event_type == "email_watch_renew":
-                    renew_conn_id = payload.get("connection_id")
-                    renew_org_id = payload.get("org_id")
-                    if not renew_conn_id or not renew_org_id:
-                        raise ValueError("email_watch_renew missing required fields")
-                    register_watch(renew_conn_id, renew_org_id)
-                    logger.info(
-                        "email_watch.renewed",
-                        connection_id=renew_conn_id,
-                    )
-
-                _mark_processed(conn, event_id)
+        sequential = events
+        after_commit: list[Callable[[], None]] = []
+        if use_batched:
+            projection_events = [e for e in events if e["event_type"] in _PROJECTION_EVENT_TYPES]
+            batch_processed = _process_item_projection_batch(conn, projection_events, after_commit)
+            if batch_processed is not None:
+                processed += batch_processed
+                sequential = [e for e in events if e["event_type"] not in _PROJECTION_EVENT_TYPES]
+
+        for event in sequential:
+            if _process_event(conn, event):
                 processed += 1
-                logger.debug(
-                    "outbox.event_processed",
-                    event_id=str(event_id),
-                    event_type=event_type,
-                    duration_ms=int((time.monotonic() - started_at) * 1000),
-                )
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("outbox.process_failed", event_id=str(event_id))
-                if event_type in ("nirvana_import_job", "native_import_job"):
-                    source = "nirvana" if event_type == "nirvana_import_job" else "native"
-                    APP_IMPORTS_FAILED_TOTAL.labels(source=source).inc()
-                    _mark_import_failed(payload.get("job_id"), str(exc))
-                if org_id and entity_type and entity_id:
-                    try:
-                        mark_failed(
-                            org_id,
-                            entity_type,
-                            entity_id,
-                            str(exc),
-                            action=action,
-                        )
-                        _emit_index_event(
-                            status="failed",
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            org_id=org_id,
-                            action=action,
-                            title="Search indexing failed",
-                            body=f"Indexing failed for {entity_type} {entity_id}.",
-                            target_user_id=target_user_id,
-                        )
-                    except Exception:  # noqa: BLE001
-                        logger.warning(
-                            "outbox.search_job_update_failed",
-                            event_id=str(event_id),
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                        )
-                new_attempts = _get_attempts(conn, event_id) + 1
-                if new_attempts >= settings.outbox_max_attempts:
-                    _mark_dead_letter(conn, event_id, str(exc))
-                    logger.warning(
-                        "outbox.event_dead_lettered",
-                        event_id=str(event_id),
-                        event_type=event_type,
-                        attempts=new_attempts,
-                        error=str(exc)[:500],
-                    )
-                else:
-                    _mark_failed(conn, event_id, str(exc))
-                    logger.error(
-                        "outbox.event_failed",
-                        event_id=str(event_id),
-                        event_type=event_type,
-                        duration_ms=int((time.monotonic() - started_at) * 1000),
-                        error=str(exc)[:500],
-                    )
 
         conn.commit()
+        for callback in after_commit:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                logger.warning("outbox.after_commit_failed", exc_info=True)
         logger.debug("outbox.batch_done", fetched=len(events), processed=processed, limit=limit)
         return processed
 
@@ -674,109 +1111,173 @@ def _parse_args() -> argparse.Namespace:
         default=settings.outbox_worker_listen_notify,
         help="Use Postgres LISTEN/NOTIFY wakeups for near-zero idle polling.",
     )
+    parser.add_argument(
+        "--consumers",
+        type=int,
+        default=settings.outbox_worker_consumers,
+        help=(
+            "Number of consumer threads. Events are partitioned by org_id so each org "
+            "is handled in order by one consumer while other orgs run in parallel."
+        ),
+    )
+    parser.add_argument(
+        "--batched-projection",
+        action=argparse.BooleanOptionalAction,
+        default=settings.outbox_worker_batched_projection,
+        help=(
+            "Project item_upserted/item_archived events per batch: coalesce repeats, "
+            "load items with one query and send one Meilisearch call per index."
+        ),
+    )
+    parser.add_argument(
+        "--email-sync-concurrency",
+        type=int,
+        default=settings.email_sync_concurrency,
+        help=(
+            "Email connections synced in parallel by the email sync executor. "
+            "0 runs email_sync_job events inline on the outbox consumers."
+        ),
+    )
     return parser.parse_args()
 
 
-def main() -> None:
-    args = _parse_args()
+def _run_housekeeping(last_runs: dict[str, float]) -> None:
+    """Periodic email sync, container reaping, memory compaction and cache pruning."""
+    now = time.monotonic()
+    if now - last_runs.get("email_sync", 0.0) >= _EMAIL_SYNC_INTERVAL_SECONDS:
+        try:
+            enqueued = enqueue_due_syncs()
+            if enqueued:
+                logger.info("email.enqueue_due_syncs", count=enqueued)
+        except Exception:
+            logger.warning("email.enqueue_due_syncs_failed", exc_info=True)
+        last_runs["email_sync"] = now
+
+    if now - last_runs.get("container_reap", 0.0) >= _CONTAINER_REAP_INTERVAL_SECONDS:
+        try:
+            from .container.manager import (
+                reap_idle,
+                reap_orphaned_k8s_resources,
+                reconcile_stale_errors,
+            )
+
+            reaped = reap_idle()
+            if reaped:
+                logger.info("container.idle_reaped_batch", count=reaped)
+            orphaned = reap_orphaned_k8s_resources()
+            if orphaned["pods"] or orphaned["services"]:
+                logger.info(
+                    "container.k8s_orphans_reaped_batch",
+                    pods=orphaned["pods"],
+                    services=orphaned["services"],
+                )
+            reconciled = reconcile_stale_errors()
+            if reconciled:
+                logger.info(
+                    "container.stale_errors_reconciled_batch",
+                    count=reconciled,
+                )
+        except Exception:
+            logger.warning("container.reap_failed", exc_info=True)
+        last_runs["container_reap"] = now
+
+    if now - last_runs.get("memory_compact", 0.0) >= _MEMORY_COMPACT_INTERVAL_SECONDS:
+        try:
+            from .container.memory_store import compact_memory_versions
+
+            compact_memory_versions()
+        except Exception:
+            logger.warning("memory.compact_failed", exc_info=True)
+        last_runs["memory_compact"] = now
+
+    if now - last_runs.get("validation_prune", 0.0) >= _VALIDATION_PRUNE_INTERVAL_SECONDS:
+        try:
+            from .validation.cache import prune_shared_results
+
+            pruned = prune_shared_results()
+            if pruned:
+                logger.info("validation.shared_results_pruned", count=pruned)
+        except Exception:
+            logger.warning("validation.prune_failed", exc_info=True)
+        last_runs["validation_prune"] = now
+
+
+def _refresh_partition_lag(
+    health_state: WorkerHealthState,
+    partition: int | None,
+    partitions: int,
+    exclude_event_types: tuple[str, ...] = (),
+) -> None:
+    try:
+        pending, lag_seconds = partition_backlog(
+            partition, partitions, exclude_event_types=exclude_event_types
+        )
+    except Exception:  # noqa: BLE001
+        logger.warning("outbox.partition_lag_failed", partition=partition, exc_info=True)
+        return
+    health_state.record_partition_lag(str(partition or 0), pending, lag_seconds)
+
+
+def _consume_loop(
+    args: argparse.Namespace,
+    health_state: WorkerHealthState,
+    *,
+    partition: int | None = None,
+    partitions: int = 1,
+    housekeeping: bool = True,
+    exclude_event_types: tuple[str, ...] = (),
+) -> None:
+    """Poll one partition until interrupted.
+
+    Each consumer owns its LISTEN connection; a NOTIFY wakes every consumer
+    and the ones whose partition has nothing pending go back to waiting.
+    """
     batch_size = max(1, args.batch_size)
     interval = max(0.1, float(args.interval))
     idle_wait = max(0.1, float(args.idle_wait))
     use_listen_notify = bool(args.listen_notify)
-
-    if not args.loop:
-        count = process_batch(limit=batch_size)
-        logger.info("outbox.processed", count=count, batch_size=batch_size)
-        return
+    partition_label = str(partition or 0)
+    last_runs: dict[str, float] = {}
+    last_lag_refresh = 0.0
 
     listener_conn: psycopg.Connection | None = None
     if use_listen_notify:
         listener_conn = _open_outbox_listener()
 
-    health_poll_interval = idle_wait if use_listen_notify else interval
-    _name = "projection-worker"
-    health_state = WorkerHealthState(
-        _name,
-        poll_interval=health_poll_interval,
-        staleness_multiplier=settings.worker_health_staleness_multiplier,
-    )
-    start_health_server(health_state, settings.worker_health_port)
-
-    # Periodic email sync reconciliation (every 5 min)
-    email_sync_interval = 300.0  # 5 minutes
-    last_email_sync_check = 0.0
-
-    # Periodic idle container reaping (every 60s)
-    container_reap_interval = 60.0
-    last_container_reap = 0.0
-
-    # Sync all active email connections immediately on startup
-    try:
-        enqueue_all_active_syncs()
-    except Exception:
-        logger.warning("outbox.startup_sync_failed", exc_info=True)
-
-    logger.info(
-        "outbox.loop_started",
-        batch_size=batch_size,
-        interval_seconds=interval,
-        idle_wait_seconds=idle_wait,
-        listen_notify=use_listen_notify,
-        notify_channel=_outbox_notify_channel(),
-    )
     try:
         while True:
             batch_start = time.monotonic()
-            count = process_batch(limit=batch_size)
+            count = process_batch(
+                limit=batch_size,
+                batched=args.batched_projection,
+                partition=partition,
+                partitions=partitions,
+                exclude_event_types=exclude_event_types,
+            )
             batch_duration = time.monotonic() - batch_start
 
-            WORKER_BATCHES_TOTAL.labels(worker=_name).inc()
-            WORKER_EVENTS_TOTAL.labels(worker=_name).inc(count)
-            WORKER_BATCH_DURATION_SECONDS.labels(worker=_name).observe(batch_duration)
-            health_state.touch()
+            WORKER_BATCHES_TOTAL.labels(worker=health_state.worker_name).inc()
+            WORKER_EVENTS_TOTAL.labels(worker=health_state.worker_name).inc(count)
+            WORKER_BATCH_DURATION_SECONDS.labels(worker=health_state.worker_name).observe(
+                batch_duration
+            )
+            health_state.touch(partition_label)
 
             if count:
-                logger.info("outbox.processed", count=count, batch_size=batch_size)
+                logger.info(
+                    "outbox.processed",
+                    count=count,
+                    batch_size=batch_size,
+                    partition=partition,
+                )
 
-            # Periodic email sync reconciliation
             now = time.monotonic()
-            if now - last_email_sync_check >= email_sync_interval:
-                try:
-                    enqueued = enqueue_due_syncs()
-                    if enqueued:
-                        logger.info("email.enqueue_due_syncs", count=enqueued)
-                except Exception:
-                    logger.warning("email.enqueue_due_syncs_failed", exc_info=True)
-                last_email_sync_check = now
+            if now - last_lag_refresh >= _PARTITION_LAG_REFRESH_SECONDS:
+                _refresh_partition_lag(health_state, partition, partitions, exclude_event_types)
+                last_lag_refresh = now
 
-            # Periodic idle container reaping
-            if now - last_container_reap >= container_reap_interval:
-                try:
-                    from .container.manager import (
-                        reap_idle,
-                        reap_orphaned_k8s_resources,
-                        reconcile_stale_errors,
-                    )
-
-                    reaped = reap_idle()
-                    if reaped:
-                        logger.info("container.idle_reaped_batch", count=reaped)
-                    orphaned = reap_orphaned_k8s_resources()
-                    if orphaned["pods"] or orphaned["services"]:
-                        logger.info(
-                            "container.k8s_orphans_reaped_batch",
-                            pods=orphaned["pods"],
-                            services=orphaned["services"],
-                        )
-                    reconciled = reconcile_stale_errors()
-                    if reconciled:
-                        logger.info(
-                            "container.stale_errors_reconciled_batch",
-                            count=reconciled,
-                        )
-                except Exception:
-                    logger.warning("container.reap_failed", exc_info=True)
-                last_container_reap = now
+            if housekeeping:
+                _run_housekeeping(last_runs)
 
             # When we don't fill the entire batch, either block on LISTEN/NOTIFY
             # (plus periodic fallback polling) or sleep before polling again.
@@ -797,8 +1298,6 @@ def main() -> None:
                         time.sleep(interval)
                 else:
                     time.sleep(interval)
-    except KeyboardInterrupt:
-        logger.info("outbox.loop_stopped")
     finally:
         if listener_conn is not None:
             try:
@@ -807,5 +1306,105 @@ def main() -> None:
                 logger.debug("outbox.listen_close_failed", exc_info=True)
 
 
+def _supervise_consumer(
+    args: argparse.Namespace,
+    health_state: WorkerHealthState,
+    partition: int,
+    partitions: int,
+    exclude_event_types: tuple[str, ...] = (),
+) -> None:
+    """Keep a partition consumer thread alive; errors back off and restart it."""
+    backoff = max(0.1, float(args.interval))
+    while True:
+        try:
+            _consume_loop(
+                args,
+                health_state,
+                partition=partition,
+                partitions=partitions,
+                housekeeping=False,
+                exclude_event_types=exclude_event_types,
+            )
+        except Exception:  # noqa: BLE001
+            WORKER_ERRORS_TOTAL.labels(worker=health_state.worker_name).inc()
+            logger.exception("outbox.consumer_crashed", partition=partition)
+            time.sleep(backoff)
+
+
+def main() -> None:
+    args = _parse_args()
+    batch_size = max(1, args.batch_size)
+    consumers = max(1, int(args.consumers))
+
+    if not args.loop:
+        count = process_batch(limit=batch_size, batched=args.batched_projection)
+        logger.info("outbox.processed", count=count, batch_size=batch_size)
+        return
+
+    use_listen_notify = bool(args.listen_notify)
+    health_poll_interval = (
+        max(0.1, float(args.idle_wait)) if use_listen_notify else max(0.1, float(args.interval))
+    )
+    health_state = WorkerHealthState(
+        "projection-worker",
+        poll_interval=health_poll_interval,
+        staleness_multiplier=settings.worker_health_staleness_multiplier,
+    )
+    start_health_server(health_state, settings.worker_health_port)
+
+    # Sync all active email connections immediately on startup
+    try:
+        enqueue_all_active_syncs()
+    except Exception:
+        logger.warning("outbox.startup_sync_failed", exc_info=True)
+
+    # Email syncs run on their own executor so a slow mailbox does not hold
+    # up the partition consumer of its org; the consumers skip those events.
+    email_sync_executor: EmailSyncExecutor | None = None
+    exclude_event_types: tuple[str, ...] = ()
+    if args.email_sync_concurrency > 0:
+        email_sync_executor = EmailSyncExecutor(
+            concurrency=args.email_sync_concurrency,
+            worker_name=health_state.worker_name,
+        )
+        email_sync_executor.start()
+        exclude_event_types = (EMAIL_SYNC_EVENT_TYPE,)
+
+    logger.info(
+        "outbox.loop_started",
+        batch_size=batch_size,
+        interval_seconds=args.interval,
+        idle_wait_seconds=args.idle_wait,
+        listen_notify=use_listen_notify,
+        batched_projection=bool(args.batched_projection),
+        consumers=consumers,
+        email_sync_concurrency=max(0, args.email_sync_concurrency),
+        notify_channel=_outbox_notify_channel(),
+    )
+
+    # Partition 0 runs on the main thread together with housekeeping; the
+    # remaining partitions each get a daemon consumer thread.
+    for partition in range(1, consumers):
+        threading.Thread(
+            target=_supervise_consumer,
+            args=(args, health_state, partition, consumers, exclude_event_types),
+            name=f"outbox-consumer-{partition}",
+            daemon=True,
+        ).start()
+    try:
+        _consume_loop(
+            args,
+            health_state,
+            partition=0 if consumers > 1 else None,
+            partitions=consumers,
+            exclude_event_types=exclude_event_types,
+        )
+    except KeyboardInterrupt:
+        logger.info("outbox.loop_stopped")
+    finally:
+        if email_sync_executor is not None:
+            email_sync_executor.stop(timeout=5.0)
+
+
 if __name__ == "__main__":
     main()
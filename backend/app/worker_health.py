@@ -76,6 +76,64 @@ WORKER_UP = Gauge(
     ["worker"],
 )
 
+WORKER_PARTITION_LAG_SECONDS = Gauge(
+    "worker_partition_lag_seconds",
+    "Age of the oldest pending event in a worker partition (0 when drained).",
+    ["worker", "partition"],
+)
+
+WORKER_PARTITION_PENDING = Gauge(
+    "worker_partition_pending_events",
+    "Number of pending events in a worker partition.",
+    ["worker", "partition"],
+)
+
+WORKER_PUSH_SENDS_TOTAL = Counter(
+    "worker_push_sends_total",
+    "Web-push sends by outcome (sent, expired, failed).",
+    ["worker", "outcome"],
+)
+
+WORKER_PUSH_RETRIES_TOTAL = Counter(
+    "worker_push_retries_total",
+    "Web-push sends retried after a 429/5xx from the push service.",
+    ["worker", "status_code"],
+)
+
+WORKER_PUSH_SEND_DURATION_SECONDS = Histogram(
+    "worker_push_send_duration_seconds",
+    "Latency of one web-push delivery, including retries and backoff.",
+    ["worker", "outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+WORKER_PUSH_THROUGHPUT = Histogram(
+    "worker_push_throughput_sends_per_second",
+    "Web-push sends per second achieved by one delivery batch.",
+    ["worker"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+WORKER_EMAIL_SYNC_LAG_SECONDS = Histogram(
+    "worker_email_sync_lag_seconds",
+    "Time from the oldest pending sync request of a connection to the start of its sync.",
+    ["worker", "trigger"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+
+WORKER_EMAIL_SYNC_DURATION_SECONDS = Histogram(
+    "worker_email_sync_duration_seconds",
+    "Duration of one connection's email sync run.",
+    ["worker", "outcome"],
+    buckets=(0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+
+WORKER_EMAIL_SYNC_ACTIVE = Gauge(
+    "worker_email_sync_active",
+    "Email syncs currently running in this worker process.",
+    ["worker"],
+)
+
 # ---------------------------------------------------------------------------
 # Health state tracker
 # ---------------------------------------------------------------------------
@@ -95,15 +153,55 @@ class WorkerHealthState:
         self._staleness_threshold = poll_interval * staleness_multiplier
         self._last_poll: float = time.monotonic()
         self._started_at: float = time.monotonic()
+        self._partition_polls: dict[str, float] = {}
+        self._partition_lag: dict[str, dict[str, float]] = {}
+
+    def touch(self, partition: str | None = None) -> None:
+        """Called by the polling loop after each iteration.
 
-    def touch(self) -> None:
-        """Called by the polling loop after each iteration."""
+        Partitioned consumers pass their partition so that one stuck consumer
+        makes the whole worker unhealthy even while the others keep polling.
+        """
         with self._lock:
-            self._last_poll = time.monotonic()
+            now = time.monotonic()
+            self._last_poll = now
+            if partition is not None:
+                self._partition_polls[partition] = now
+
+    def record_partition_lag(self, partition: str, pending: int, lag_seconds: float) -> None:
+        """Publish backlog size and oldest-event age for one partition."""
+        WORKER_PARTITION_PENDING.labels(worker=self._worker_name, partition=partition).set(
+            float(pending)
+        )
+        WORKER_PARTITION_LAG_SECONDS.labels(worker=self._worker_name, partition=partition).set(
+            float(lag_seconds)
+        )
+        with self._lock:
+            self._partition_lag[partition] = {
+                "pending": pending,
+                "lag_seconds": round(float(lag_seconds), 2),
+            }
+
+    def partitions(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                partition: {
+                    **self._partition_lag.get(partition, {}),
+                    "seconds_since_last_poll": round(now - last_poll, 2),
+                }
+                for partition, last_poll in sorted(self._partition_polls.items())
+            }
 
     def is_healthy(self) -> bool:
         with self._lock:
-            return (time.monotonic() - self._last_poll) < self._staleness_threshold
+            now = time.monotonic()
+            if now - self._last_poll >= self._staleness_threshold:
+                return False
+            return all(
+                now - last_poll < self._staleness_threshold
+                for last_poll in self._partition_polls.values()
+            )
 
     @property
     def worker_name(self) -> str:
@@ -142,14 +240,16 @@ class _HealthRequestHandler(BaseHTTPRequestHandler):
             return
 
         healthy = state.is_healthy()
-        body = json.dumps(
-            {
-                "status": "ok" if healthy else "stuck",
-                "worker": state.worker_name,
-                "seconds_since_last_poll": round(state.seconds_since_last_poll(), 2),
-                "uptime_seconds": round(state.uptime_seconds(), 2),
-            }
-        ).encode("utf-8")
+        payload: dict[str, object] = {
+            "status": "ok" if healthy else "stuck",
+            "worker": state.worker_name,
+            "seconds_since_last_poll": round(state.seconds_since_last_poll(), 2),
+            "uptime_seconds": round(state.uptime_seconds(), 2),
+        }
+        partitions = state.partitions()
+        if partitions:
+            payload["partitions"] = partitions
+        body = json.dumps(payload).encode("utf-8")
 
         self.send_response(200 if healthy else 503)
         self.send_header("Content-Type", "application/json")
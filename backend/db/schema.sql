@@ -194,6 +194,7 @@ CREATE TABLE IF NOT EXISTS files (
   created_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 ALTER TABLE files ADD COLUMN IF NOT EXISTS org_id UUID;
+ALTER TABLE files ADD COLUMN IF NOT EXISTS render_cache_key TEXT;
 
 CREATE TABLE IF NOT EXISTS search_index_jobs (
   job_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -322,9 +323,17 @@ WHERE storage_path LIKE '/%';
 ALTER TABLE outbox_events ADD COLUMN IF NOT EXISTS dead_lettered_at TIMESTAMPTZ;
 CREATE INDEX IF NOT EXISTS idx_outbox_events_processed ON outbox_events (processed_at, created_at);
 CREATE INDEX IF NOT EXISTS idx_outbox_events_dead_lettered ON outbox_events (dead_lettered_at) WHERE dead_lettered_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_outbox_events_email_sync_pending
+  ON outbox_events ((payload->>'connection_id'), created_at)
+  WHERE event_type = 'email_sync_job'
+    AND processed_at IS NULL
+    AND dead_lettered_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_push_outbox_processed ON push_outbox (processed_at, created_at);
 CREATE INDEX IF NOT EXISTS idx_files_owner ON files (owner_id);
 CREATE INDEX IF NOT EXISTS idx_files_org ON files (org_id);
+CREATE INDEX IF NOT EXISTS idx_files_render_cache_key
+  ON files (org_id, render_cache_key)
+  WHERE render_cache_key IS NOT NULL;
 CREATE UNIQUE INDEX IF NOT EXISTS idx_search_index_jobs_entity ON search_index_jobs (org_id, entity_type, entity_id);
 CREATE INDEX IF NOT EXISTS idx_search_index_jobs_status ON search_index_jobs (org_id, status);
 
@@ -390,6 +399,8 @@ ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS calendar_selected_ids JSO
 ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS last_calendar_sync_at TIMESTAMPTZ;
 ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS last_calendar_sync_error TEXT;
 ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS last_calendar_sync_event_count INTEGER;
+ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS sync_lease_owner TEXT;
+ALTER TABLE email_connections ADD COLUMN IF NOT EXISTS sync_lease_expires_at TIMESTAMPTZ;
 
 UPDATE email_connections
 SET calendar_sync_tokens = '{}'::jsonb
@@ -661,6 +672,16 @@ CREATE INDEX IF NOT EXISTS idx_project_action_due_at
 CREATE INDEX IF NOT EXISTS idx_project_action_tags_gin
   ON project_action USING gin (tags)
   WHERE archived_at IS NULL;
+ALTER TABLE project_action
+  ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+CREATE INDEX IF NOT EXISTS idx_project_action_keyset
+  ON project_action (
+    project_item_id,
+    (COALESCE(due_at, 'infinity'::timestamptz)),
+    created_at,
+    id
+  )
+  WHERE archived_at IS NULL;
 
 CREATE TABLE IF NOT EXISTS action_transition_event (
   id              BIGSERIAL PRIMARY KEY,
@@ -710,6 +731,8 @@ CREATE TABLE IF NOT EXISTS action_revision (
 
 CREATE INDEX IF NOT EXISTS idx_action_revision_action_created
   ON action_revision (action_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_action_revision_action_id
+  ON action_revision (action_id, id);
 
 -- OpenClaw memory persistence
 CREATE TABLE IF NOT EXISTS openclaw_memory_versions (
@@ -738,3 +761,70 @@ CREATE TABLE IF NOT EXISTS openclaw_memory_heads (
   updated_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
   PRIMARY KEY (user_id, filename)
 );
+
+-- Delta storage: only full rows carry content; delta rows point at a newer base_version.
+ALTER TABLE openclaw_memory_versions ALTER COLUMN content DROP NOT NULL;
+ALTER TABLE openclaw_memory_versions
+  ADD COLUMN IF NOT EXISTS storage_kind TEXT NOT NULL DEFAULT 'full'
+  CHECK (storage_kind IN ('full', 'delta'));
+ALTER TABLE openclaw_memory_versions ADD COLUMN IF NOT EXISTS base_version INTEGER;
+ALTER TABLE openclaw_memory_versions ADD COLUMN IF NOT EXISTS delta BYTEA;
+ALTER TABLE openclaw_memory_heads ADD COLUMN IF NOT EXISTS next_version INTEGER;
+
+-- Typed projection of items.schema_jsonld for hot filters (app/projection/items.py).
+CREATE TABLE IF NOT EXISTS item_projection (
+  item_id            UUID PRIMARY KEY REFERENCES items(item_id) ON DELETE CASCADE,
+  org_id             UUID NOT NULL,
+  created_by_user_id UUID,
+  source             TEXT,
+  bucket             TEXT,
+  primary_type       TEXT,
+  project_refs       TEXT[] NOT NULL DEFAULT '{}',
+  start_time         TIMESTAMPTZ,
+  end_time           TIMESTAMPTZ,
+  source_message_ids TEXT[] NOT NULL DEFAULT '{}',
+  is_completed       BOOLEAN NOT NULL DEFAULT false,
+  archived_at        TIMESTAMPTZ,
+  item_created_at    TIMESTAMPTZ NOT NULL,
+  item_updated_at    TIMESTAMPTZ NOT NULL,
+  projected_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_item_projection_bucket
+  ON item_projection (org_id, bucket, item_created_at)
+  WHERE archived_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_item_projection_completed
+  ON item_projection (org_id, is_completed, item_created_at, item_id)
+  WHERE archived_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_item_projection_project_refs
+  ON item_projection USING gin (project_refs)
+  WHERE archived_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_item_projection_source_message_ids
+  ON item_projection USING gin (source_message_ids);
+CREATE INDEX IF NOT EXISTS idx_item_projection_owner_source
+  ON item_projection (org_id, created_by_user_id, source, archived_at);
+
+-- Calendar time-range lookups (app/projection/calendar.py).
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+ALTER TABLE item_projection ADD COLUMN IF NOT EXISTS event_id TEXT;
+ALTER TABLE item_projection ADD COLUMN IF NOT EXISTS event_range TSTZRANGE
+  GENERATED ALWAYS AS (
+    CASE WHEN start_time IS NOT NULL
+      THEN tstzrange(start_time, GREATEST(start_time, end_time), '[]')
+    END
+  ) STORED;
+CREATE INDEX IF NOT EXISTS idx_item_projection_event_range
+  ON item_projection USING gist (org_id, event_range)
+  WHERE archived_at IS NULL AND event_range IS NOT NULL;
+
+-- Shared item validation outcomes (app/validation/cache.py).
+CREATE TABLE IF NOT EXISTS validation_results (
+  content_hash   TEXT NOT NULL,
+  shapes_version TEXT NOT NULL,
+  rules_version  TEXT NOT NULL,
+  issues         JSONB NOT NULL,
+  created_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (content_hash, shapes_version, rules_version)
+);
+CREATE INDEX IF NOT EXISTS idx_validation_results_created_at
+  ON validation_results (created_at);
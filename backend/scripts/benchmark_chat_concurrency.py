@@ -0,0 +1,182 @@
+"""Measure how many simultaneous streaming chats one API worker can hold.
+
+Starts a fake agents service on localhost that streams ``--deltas`` NDJSON
+events per turn, one every ``--interval-ms``, and runs N chat turns at once on
+one event loop. ``async`` is the chat proxy (:func:`app.chat.routes._run_haystack`
+on the pooled agents client, feeding an ``_EventChannel``); ``threaded`` is the
+previous design, one blocking ``httpx.stream`` per turn in the default
+executor, handing lines to the loop. Reported per run: turns completed, wall
+time, time to first event (p50/p95) and peak thread count. A turn holds its
+stream for about ``deltas * interval`` seconds, so the wall time shows how many
+turns were in flight at once. The fake service runs in the same process, so it
+shares the worker's CPU. No database is needed; persistence is skipped.
+
+    cd backend
+    uv run python scripts/benchmark_chat_concurrency.py --concurrency 50 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.chat import routes, upstream  # noqa: E402
+
+
+async def _serve_agents(deltas: int, interval: float) -> asyncio.Server:
+    """Minimal HTTP/1.1 keep-alive server streaming chunked NDJSON turns."""
+    events = [{"type": "text_delta", "content": f"token{index} "} for index in range(deltas)]
+    events.append({"type": "done", "text": ""})
+    chunks = [(json.dumps(event) + "\n").encode() for event in events]
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for header in head.decode("latin-1").split("\r\n"):
+                    name, _, value = header.partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/x-ndjson\r\n"
+                    b"transfer-encoding: chunked\r\n\r\n"
+                )
+                for chunk in chunks:
+                    await asyncio.sleep(interval)
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    await writer.drain()
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(_handle, "127.0.0.1", 0, backlog=4096)
+
+
+async def _async_turn(agents_url: str, on_event: Callable[[], None]) -> None:
+    channel = routes._EventChannel()
+    routes._start_background(
+        routes._run_haystack(channel, agents_url, {"messages": []}, "bench", None)
+    )
+    async for _chunk in channel.stream():
+        on_event()
+
+
+def _threaded_worker(loop, queue: asyncio.Queue, agents_url: str) -> None:
+    try:
+        with httpx.stream(
+            "POST", f"{agents_url}/chat/completions", json={"messages": []}, timeout=60.0
+        ) as resp:
+            for line in resp.iter_lines():
+                if line:
+                    loop.call_soon_threadsafe(queue.put_nowait, line)
+    finally:
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+
+
+async def _threaded_turn(agents_url: str, on_event: Callable[[], None]) -> None:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    loop.run_in_executor(None, _threaded_worker, loop, queue, agents_url)
+    while await queue.get() is not None:
+        on_event()
+
+
+_MODES: dict[str, Callable[[str, Callable[[], None]], Awaitable[None]]] = {
+    "async": _async_turn,
+    "threaded": _threaded_turn,
+}
+
+
+async def _run(mode: str, concurrency: int, deltas: int, interval: float) -> None:
+    server = await _serve_agents(deltas, interval)
+    port = server.sockets[0].getsockname()[1]
+    agents_url = f"http://127.0.0.1:{port}"
+    turn = _MODES[mode]
+    first_event: list[float] = []
+    events = 0
+    peak_threads = threading.active_count()
+
+    async def _one() -> None:
+        nonlocal events, peak_threads
+        started = time.perf_counter()
+        seen_first = False
+
+        def _on_event() -> None:
+            nonlocal events, seen_first, peak_threads
+            events += 1
+            peak_threads = max(peak_threads, threading.active_count())
+            if not seen_first:
+                seen_first = True
+                first_event.append(time.perf_counter() - started)
+
+        await turn(agents_url, _on_event)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_one() for _ in range(concurrency)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    await upstream.close_clients()
+    server.close()
+    await server.wait_closed()
+
+    failed = sum(isinstance(result, BaseException) for result in results)
+    first_event.sort()
+    p50 = statistics.median(first_event) * 1000 if first_event else float("nan")
+    p95 = first_event[int(len(first_event) * 0.95) - 1] * 1000 if first_event else float("nan")
+    print(
+        f"{mode:>8} {concurrency:>6} {concurrency - failed:>6} {elapsed:>8.2f} "
+        f"{events / elapsed:>9.0f} {p50:>9.1f} {p95:>9.1f} {peak_threads:>7}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--deltas", type=int, default=20)
+    parser.add_argument("--interval-ms", type=float, default=50.0)
+    parser.add_argument("--modes", nargs="+", choices=sorted(_MODES), default=list(_MODES))
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="CHAT_UPSTREAM_MAX_CONNECTIONS for the run (default: highest --concurrency)",
+    )
+    args = parser.parse_args()
+
+    connections = args.max_connections or max(args.concurrency)
+    upstream.settings = dataclasses.replace(
+        upstream.settings, chat_upstream_max_connections=connections
+    )
+    # No database: the proxy's persistence steps become no-ops.
+    routes.save_message = lambda *args, **kwargs: None
+    routes._safe_update_request_status = lambda *args, **kwargs: None
+
+    hold = args.deltas * args.interval_ms / 1000
+    print(f"each turn streams ~{hold:.1f}s; upstream pool {connections} connections")
+    print(
+        f"{'mode':>8} {'turns':>6} {'done':>6} {'wall s':>8} {'events/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'threads':>7}"
+    )
+    for mode in args.modes:
+        for concurrency in args.concurrency:
+            asyncio.run(_run(mode, concurrency, args.deltas, args.interval_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
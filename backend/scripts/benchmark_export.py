@@ -0,0 +1,156 @@
+"""Measure peak RSS of ``GET /items/export`` against org size.
+
+Seeds a throwaway org with N items per run, then exports it in a fresh
+subprocess so ``ru_maxrss`` reflects only that export. ``streaming`` is the
+server-side cursor path used by the endpoint; ``buffered`` reproduces the
+previous ``fetchall()`` behaviour for comparison.
+
+    cd backend
+    uv run python scripts/benchmark_export.py --counts 1000 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from psycopg import sql  # noqa: E402
+
+from app.db import db_conn  # noqa: E402
+from app.routes.items import (  # noqa: E402
+    _iter_export_batches,
+    _stream_export_json,
+)
+
+_EXPORT_QUERY = sql.SQL("""
+    SELECT item_id, canonical_id, source, schema_jsonld, content_hash, created_at, updated_at
+    FROM items
+    WHERE org_id = %s AND archived_at IS NULL
+    ORDER BY created_at ASC, item_id ASC
+""")
+
+
+def _peak_rss_mb() -> float:
+    # Linux reports ru_maxrss in KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _seed_org(count: int, description_chars: int) -> str:
+    org_id = str(uuid.uuid4())
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO organizations (id, name) VALUES (%s, %s)",
+                (org_id, f"export-benchmark-{count}"),
+            )
+            cur.execute(
+                """
+                INSERT INTO items (org_id, canonical_id, schema_jsonld, source, content_hash)
+                SELECT
+                    %(org_id)s,
+                    'urn:app:action:' || gen_random_uuid(),
+                    jsonb_build_object(
+                        '@id', 'urn:app:action:' || n,
+                        '@type', 'Action',
+                        '_schemaVersion', 2,
+                        'name', 'Benchmark action ' || n,
+                        'description', repeat('x', %(chars)s),
+                        'additionalProperty', jsonb_build_array(
+                            jsonb_build_object(
+                                '@type', 'PropertyValue',
+                                'propertyID', 'app:bucket',
+                                'value', 'next'
+                            )
+                        )
+                    ),
+                    'benchmark',
+                    md5(n::text)
+                FROM generate_series(1, %(count)s) AS n
+                """,
+                {"org_id": org_id, "count": count, "chars": description_chars},
+            )
+        conn.commit()
+    return org_id
+
+
+def _drop_org(org_id: str) -> None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM items WHERE org_id = %s", (org_id,))
+            cur.execute("DELETE FROM organizations WHERE id = %s", (org_id,))
+        conn.commit()
+
+
+def _run_one(org_id: str, mode: str) -> None:
+    baseline = _peak_rss_mb()
+    started = time.monotonic()
+    if mode == "buffered":
+        with db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_EXPORT_QUERY, (org_id,))
+                rows = cur.fetchall()
+        batches = iter([rows])
+    else:
+        batches = _iter_export_batches(_EXPORT_QUERY, (org_id,))
+
+    exported_bytes = 0
+    for chunk in _stream_export_json(batches):
+        exported_bytes += len(chunk)
+
+    print(
+        json.dumps(
+            {
+                "baseline_rss_mb": round(baseline, 1),
+                "peak_rss_mb": round(_peak_rss_mb(), 1),
+                "exported_mb": round(exported_bytes / 1024 / 1024, 1),
+                "seconds": round(time.monotonic() - started, 2),
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--description-chars", type=int, default=1000)
+    parser.add_argument("--modes", nargs="+", default=["streaming", "buffered"])
+    parser.add_argument("--run-one", nargs=2, metavar=("ORG_ID", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        _run_one(*args.run_one)
+        return
+
+    print(
+        f"{'items':>8} {'mode':>10} {'baseline MB':>12} {'peak MB':>9} {'export MB':>10} {'s':>7}"
+    )
+    for count in args.counts:
+        org_id = _seed_org(count, args.description_chars)
+        try:
+            for mode in args.modes:
+                output = subprocess.run(  # noqa: S603
+                    [sys.executable, __file__, "--run-one", org_id, mode],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                print(
+                    f"{count:>8} {mode:>10} {result['baseline_rss_mb']:>12} "
+                    f"{result['peak_rss_mb']:>9} {result['exported_mb']:>10} "
+                    f"{result['seconds']:>7}"
+                )
+        finally:
+            _drop_org(org_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure Gmail message fetch and mark-read throughput against the mock harness.
+
+Seeds N messages into the in-process mock Google Workspace harness (with an
+artificial per-request latency approximating Gmail round trips) and compares
+per-message calls (``message_get`` / ``message_modify``) with the sync
+pipeline (concurrent ``messages_get``, ``messages_batch_modify``).
+
+    cd backend
+    uv run python scripts/benchmark_gmail_fetch.py --messages 500 --latency-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.devtools.mock_google_workspace_harness import (  # noqa: E402
+    MockGoogleWorkspaceHarness,
+)
+from app.email import gmail_api, google_client  # noqa: E402
+
+_TOKEN = "benchmark-token"
+
+
+def _seed(harness: MockGoogleWorkspaceHarness, count: int) -> list[str]:
+    ids = [f"bench-{index:06d}" for index in range(count)]
+    for index, message_id in enumerate(ids):
+        harness.seed_gmail_message(
+            message_id=message_id,
+            subject=f"Benchmark message {index}",
+            body_text="Lorem ipsum dolor sit amet. " * 40,
+            sender="Sender <sender@example.com>",
+            to="me@example.com",
+            history_id=str(20_000 + index),
+        )
+    return ids
+
+
+def _timed(label: str, count: int, run: Callable[[], None]) -> float:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{label:<28} {elapsed:8.2f}s {rate:10.1f} msg/s")
+    return rate
+
+
+def _sequential_fetch(ids: list[str]) -> None:
+    for message_id in ids:
+        gmail_api.message_get(_TOKEN, message_id)
+
+
+def _pipelined_fetch(ids: list[str], concurrency: int) -> None:
+    for message_id, fetched in gmail_api.messages_get(_TOKEN, ids, concurrency=concurrency):
+        if isinstance(fetched, Exception):
+            raise RuntimeError(f"fetch failed for {message_id}") from fetched
+
+
+def _sequential_mark_read(ids: list[str]) -> None:
+    for message_id in ids:
+        gmail_api.message_modify(_TOKEN, message_id, remove_label_ids=["UNREAD"])
+
+
+def _batch_mark_read(ids: list[str]) -> None:
+    gmail_api.messages_batch_modify(_TOKEN, ids, remove_label_ids=["UNREAD"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    harness = MockGoogleWorkspaceHarness.start()
+    gmail_api.GMAIL_API_BASE = harness.gmail_api_base
+    try:
+        ids = _seed(harness, args.messages)
+        harness.set_latency(args.latency_ms / 1000)
+        print(f"{args.messages} messages, {args.latency_ms:g} ms simulated latency\n")
+
+        baseline = _timed("fetch sequential", len(ids), lambda: _sequential_fetch(ids))
+        for concurrency in args.concurrency:
+            rate = _timed(
+                f"fetch pipelined x{concurrency}",
+                len(ids),
+                lambda concurrency=concurrency: _pipelined_fetch(ids, concurrency),
+            )
+            print(f"{'':<28} speed-up {rate / baseline:.1f}x")
+
+        _timed("mark-read per message", len(ids), lambda: _sequential_mark_read(ids))
+        _timed("mark-read batchModify", len(ids), lambda: _batch_mark_read(ids))
+    finally:
+        google_client.close_client()
+        harness.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Measure item write throughput and latency for the items write path.
+
+Seeds a throwaway org and runs the statements ``POST /items`` issues for an
+idempotent create: idempotency lookup, item insert, projection refresh,
+outbox event, search job and idempotency record. ``unit`` runs them in one
+transaction on one connection (:func:`app.db.unit_of_work`, as the handlers
+do); ``separate`` gives each step its own connection and commit, as the
+handlers did before.
+
+    cd backend
+    uv run python scripts/benchmark_item_writes.py --items 2000 --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.db import db_conn, jsonb, unit_of_work  # noqa: E402
+from app.idempotency import (  # noqa: E402
+    compute_request_hash,
+    get_idempotent_response,
+    store_idempotent_response,
+)
+from app.outbox import enqueue_event  # noqa: E402
+from app.projection.items import refresh_item_projection  # noqa: E402
+from app.search.jobs import enqueue_job  # noqa: E402
+
+_INSERT_ITEM_SQL = """
+INSERT INTO items (org_id, canonical_id, schema_jsonld, source, content_hash)
+VALUES (%s, %s, %s, 'benchmark', md5(%s))
+RETURNING item_id
+"""
+
+
+def _item(index: int) -> dict:
+    return {
+        "@id": f"urn:app:action:{uuid.uuid4()}",
+        "@type": "Action",
+        "_schemaVersion": 2,
+        "name": f"Benchmark action {index}",
+        "additionalProperty": [
+            {"@type": "PropertyValue", "propertyID": "app:bucket", "value": "next"}
+        ],
+    }
+
+
+def _write_unit(org_id: str, index: int) -> None:
+    item = _item(index)
+    key = f"bench-{uuid.uuid4()}"
+    request_hash = compute_request_hash("POST", "/items", item)
+    with unit_of_work() as cur:
+        get_idempotent_response(org_id, key, request_hash, cur=cur)
+        cur.execute(_INSERT_ITEM_SQL, (org_id, item["@id"], jsonb(item), item["@id"]))
+        item_id = str(cur.fetchone()["item_id"])
+        refresh_item_projection(cur, [item_id])
+        enqueue_event("item_upserted", {"item_id": item_id, "org_id": org_id}, cur=cur)
+        enqueue_job(org_id, "item", item_id, "upsert", cur=cur)
+        store_idempotent_response(org_id, key, request_hash, {"item_id": item_id}, 201, cur=cur)
+
+
+def _write_separate(org_id: str, index: int) -> None:
+    item = _item(index)
+    key = f"bench-{uuid.uuid4()}"
+    request_hash = compute_request_hash("POST", "/items", item)
+    get_idempotent_response(org_id, key, request_hash)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_INSERT_ITEM_SQL, (org_id, item["@id"], jsonb(item), item["@id"]))
+            item_id = str(cur.fetchone()["item_id"])
+            refresh_item_projection(cur, [item_id])
+        conn.commit()
+    enqueue_event("item_upserted", {"item_id": item_id, "org_id": org_id})
+    enqueue_job(org_id, "item", item_id, "upsert")
+    store_idempotent_response(org_id, key, request_hash, {"item_id": item_id}, 201)
+
+
+_MODES: dict[str, Callable[[str, int], None]] = {
+    "unit": _write_unit,
+    "separate": _write_separate,
+}
+
+
+def _create_org() -> str:
+    org_id = str(uuid.uuid4())
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO organizations (id, name) VALUES (%s, %s)",
+                (org_id, "item-write-benchmark"),
+            )
+        conn.commit()
+    return org_id
+
+
+def _drop_org(org_id: str) -> None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM outbox_events WHERE payload->>'org_id' = %s", (org_id,))
+            cur.execute("DELETE FROM search_index_jobs WHERE org_id = %s", (org_id,))
+            cur.execute("DELETE FROM idempotency_keys WHERE org_id = %s", (org_id,))
+            cur.execute("DELETE FROM items WHERE org_id = %s", (org_id,))
+            cur.execute("DELETE FROM organizations WHERE id = %s", (org_id,))
+        conn.commit()
+
+
+def _run(mode: str, count: int, threads: int) -> None:
+    write = _MODES[mode]
+    org_id = _create_org()
+
+    def _timed_write(index: int) -> float:
+        started = time.perf_counter()
+        write(org_id, index)
+        return time.perf_counter() - started
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = sorted(pool.map(_timed_write, range(count)))
+        elapsed = time.perf_counter() - started
+    finally:
+        _drop_org(org_id)
+
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"{mode:>9} {count:>7} {threads:>8} {count / elapsed:>10.1f} {p50:>8.2f} {p99:>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--modes", nargs="+", choices=sorted(_MODES), default=["unit", "separate"])
+    args = parser.parse_args()
+
+    print(f"{'mode':>9} {'items':>7} {'threads':>8} {'items/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for threads in args.threads:
+        for mode in args.modes:
+            _run(mode, args.items, threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure item validation throughput per SHACL engine.
+
+Validates the export fixtures and a few invalid variants once with the
+compiled shapes and once with pyshacl, and reports validations per second.
+``shacl`` times the SHACL step alone; ``item`` times
+:func:`app.validation.validate_item_create` (SHACL plus CEL rules, as
+``POST /items`` does) with the validation cache emptied before every call,
+and ``cached`` the same calls answered from the cache. No database is needed.
+
+    cd backend
+    uv run python scripts/benchmark_validation.py --seconds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.validation import cache, shacl_validator, validate_item_create  # noqa: E402
+from app.validation.item_validator import _NAMESPACES, _item_triples  # noqa: E402
+
+_FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+
+def _items() -> list[dict]:
+    items = [
+        record["item"]
+        for record in json.loads((_FIXTURES / "native_export.sample.json").read_text())
+    ]
+    return items + [
+        {"@type": "Action", "name": "No bucket"},
+        {"@type": "Project", "name": " "},
+        {"@type": "Person", "name": "Ada", "additionalProperty": []},
+    ]
+
+
+def _validate_shacl(item: dict) -> None:
+    shacl_validator.validate_shacl_triples(_item_triples(item), _NAMESPACES)
+
+
+def _validate_uncached(item: dict) -> None:
+    cache.clear()
+    validate_item_create(item)
+
+
+_SCOPES = {"shacl": _validate_shacl, "item": _validate_uncached, "cached": validate_item_create}
+
+
+def _run(scope: str, engine: str, items: list[dict], seconds: float) -> None:
+    validate = _SCOPES[scope]
+    shacl_validator.settings = dataclasses.replace(shacl_validator.settings, shacl_engine=engine)
+    validate(items[0])  # load and compile the shapes outside the timing
+
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for item in items:
+            validate(item)
+        count += len(items)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{scope:>6} {engine:>9} {count:>9} {count / elapsed:>14.1f} {elapsed / count * 1e6:>10.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument(
+        "--engines", nargs="+", choices=["compiled", "pyshacl"], default=["compiled", "pyshacl"]
+    )
+    parser.add_argument("--scopes", nargs="+", choices=sorted(_SCOPES), default=list(_SCOPES))
+    args = parser.parse_args()
+
+    items = _items()
+    print(f"{'scope':>6} {'engine':>9} {'items':>9} {'validations/s':>14} {'us/item':>10}")
+    for scope in args.scopes:
+        for engine in args.engines:
+            _run(scope, engine, items, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -311,3 +311,43 @@ def _block_external_http(request):
         router.route(host="127.0.0.1").pass_through()
         router.route(host="postgres").pass_through()
         yield router
+
+
+@pytest.fixture(autouse=True)
+def _clear_google_token_cache():
+    """Keep cached Google access tokens from leaking between tests."""
+    from app.email.google_client import token_cache
+
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture()
+def google_transport(monkeypatch):
+    """Route the shared Google API client through a handler.
+
+    Yields ``(seen, responses)``: every request sent, and per-URL-path queues of
+    canned responses. Unqueued paths answer 200 ``{"id": <last path segment>}``
+    (404 for ``missing``). Retry back-off sleeps are skipped.
+    """
+    from app.email import google_client
+
+    seen: list[httpx.Request] = []
+    responses: dict[str, list[httpx.Response]] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        queued = responses.get(request.url.path)
+        if queued:
+            return queued.pop(0)
+        resource_id = request.url.path.rsplit("/", 1)[-1]
+        if resource_id == "missing":
+            return httpx.Response(404, json={"error": {"code": 404}})
+        return httpx.Response(200, json={"id": resource_id})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(google_client, "_client", lambda: client)
+    monkeypatch.setattr(google_client.time, "sleep", lambda _seconds: None)
+    yield seen, responses
+    client.close()
@@ -0,0 +1,159 @@
+"""Tests for the in-process session/membership cache."""
+
+import dataclasses
+import json
+
+import pytest
+
+from app import auth_cache
+from app.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(
+        auth_cache,
+        "settings",
+        dataclasses.replace(settings, auth_cache_ttl_seconds=30.0, auth_cache_max_entries=3),
+    )
+    monkeypatch.setattr(auth_cache, "_receives_invalidations", lambda: True)
+    auth_cache.clear()
+    monkeypatch.setattr(auth_cache, "_pending_touches", {})
+    monkeypatch.setattr(auth_cache, "_ensure_flusher", lambda: None)
+    yield
+    auth_cache.clear()
+
+
+def _session_row(user_id: str = "u1", session_id: str = "s1") -> dict:
+    return {"id": user_id, "session_id": session_id, "ip_address": None}
+
+
+def test_session_roundtrip_returns_copies():
+    auth_cache.put_session("tok", _session_row())
+
+    row = auth_cache.get_session("tok")
+    row["ip_address"] = "10.0.0.1"
+
+    assert auth_cache.get_session("tok")["ip_address"] is None
+    assert auth_cache.get_session("other") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(auth_cache.time, "monotonic", lambda: clock[0])
+    auth_cache.put_session("tok", _session_row())
+
+    clock[0] += 29.0
+    assert auth_cache.get_session("tok") is not None
+    clock[0] += 1.0
+    assert auth_cache.get_session("tok") is None
+
+
+def test_cache_is_bounded_lru():
+    for idx in range(4):
+        auth_cache.put_session(f"tok{idx}", _session_row(session_id=f"s{idx}"))
+
+    assert auth_cache.get_session("tok0") is None
+    assert auth_cache.get_session("tok3") is not None
+
+
+def test_invalidation_by_session_user_and_membership():
+    auth_cache.put_session("a", _session_row("u1", "s1"))
+    auth_cache.put_session("b", _session_row("u1", "s2"))
+    auth_cache.put_membership("u1", "o1", {"org_id": "o1", "role": "owner", "status": "active"})
+    auth_cache.put_default_orgs("u1", ["o1"])
+
+    auth_cache.invalidate_session("s1")
+    assert auth_cache.get_session("a") is None
+    assert auth_cache.get_session("b") is not None
+
+    auth_cache.invalidate_user("u1")
+    assert auth_cache.get_session("b") is None
+
+    auth_cache.invalidate_memberships("u1")
+    assert auth_cache.get_membership("u1", "o1") is None
+    assert auth_cache.get_default_orgs("u1") is None
+
+
+def test_inactive_memberships_are_not_cached():
+    auth_cache.put_membership("u1", "o1", {"org_id": "o1", "role": "member", "status": "pending"})
+    auth_cache.put_default_orgs("u1", [])
+
+    assert auth_cache.get_membership("u1", "o1") is None
+    assert auth_cache.get_default_orgs("u1") is None
+
+
+def test_row_loaded_before_an_invalidation_is_not_cached():
+    loaded_at = auth_cache.generation()
+    # Another request revokes a session while this one reads the old row.
+    auth_cache.invalidate_session("s9")
+
+    auth_cache.put_session("tok", _session_row(), loaded_at=loaded_at)
+    assert auth_cache.get_session("tok") is None
+
+    auth_cache.put_session("tok", _session_row(), loaded_at=auth_cache.generation())
+    assert auth_cache.get_session("tok") is not None
+
+
+def test_cache_is_bypassed_without_the_invalidation_listener(monkeypatch):
+    auth_cache.put_session("tok", _session_row())
+    monkeypatch.setattr(auth_cache, "_receives_invalidations", lambda: False)
+
+    assert auth_cache.get_session("tok") is None
+    auth_cache.put_membership("u1", "o1", {"org_id": "o1", "role": "owner", "status": "active"})
+    monkeypatch.setattr(auth_cache, "_receives_invalidations", lambda: True)
+    assert auth_cache.get_membership("u1", "o1") is None
+
+
+def test_invalidation_publishes_notify_on_cursor():
+    class _Cursor:
+        def __init__(self):
+            self.calls = []
+
+        def execute(self, query, params):
+            self.calls.append(params)
+
+    cur = _Cursor()
+    auth_cache.invalidate_memberships("u1", cur=cur)
+
+    [(channel, payload)] = cur.calls
+    assert channel == auth_cache.AUTH_CACHE_NOTIFY_CHANNEL
+    assert json.loads(payload) == {"kind": "membership", "user_id": "u1"}
+
+
+def test_notify_payloads_from_other_workers():
+    auth_cache.put_session("a", _session_row("u1", "s1"))
+    auth_cache.put_session("b", _session_row("u2", "s2"))
+
+    auth_cache.handle_notify(json.dumps({"kind": "session", "session_id": "s1"}))
+    assert auth_cache.get_session("a") is None
+    assert auth_cache.get_session("b") is not None
+
+    # Reconnect: invalidations may have been missed.
+    auth_cache.handle_notify(None)
+    assert auth_cache.get_session("b") is None
+
+
+def test_touches_are_coalesced_per_session(monkeypatch):
+    written = []
+    monkeypatch.setattr(auth_cache, "_write_touches", lambda touches: written.append(touches))
+
+    auth_cache.touch_session("s1", ip_address="10.0.0.1")
+    auth_cache.touch_session("s1", user_agent="ua")
+    auth_cache.touch_session("s2")
+
+    assert auth_cache.flush_last_seen() == 2
+    [touches] = written
+    assert touches["s1"][1:] == ("10.0.0.1", "ua")
+    assert auth_cache.flush_last_seen() == 0
+
+
+def test_failed_flush_keeps_touches_for_retry(monkeypatch):
+    def _fail(touches):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(auth_cache, "_write_touches", _fail)
+    auth_cache.touch_session("s1")
+
+    assert auth_cache.flush_last_seen() == 0
+    assert "s1" in auth_cache._pending_touches
@@ -6,6 +6,7 @@ import uuid
 from datetime import UTC, datetime
 
 from app.db import db_conn, jsonb
+from app.projection.items import refresh_item_projection
 
 
 def _seed_connection(*, org_id: str, user_id: str, email_address: str = "me@example.com") -> str:
@@ -85,6 +86,7 @@ def _seed_google_calendar_item(*, org_id: str, user_id: str, canonical_id: str)
                     f"hash-{item_id}",
                 ),
             )
+            refresh_item_projection(cur, [item_id])
         conn.commit()
     return item_id
 
@@ -676,6 +678,7 @@ def test_list_calendar_events_deduplicates_by_event_id(auth_client, monkeypatch)
                     (item_id, org_id, user_id, canonical_id, jsonb(schema),
                      "google_calendar", f"hash-{item_id}"),
                 )
+                refresh_item_projection(cur, [item_id])
             conn.commit()
         return item_id
 
@@ -750,3 +753,35 @@ def test_idempotency_key_duplicate_returns_cached_response(auth_client):
             )
             row = cur.fetchone()
             assert row["cnt"] == 1
+
+
+def test_list_calendar_events_filters_by_range_and_paginates(auth_client):
+    for name, start, end in (
+        ("Overnight", "2031-04-30T22:00:00Z", "2031-05-01T02:00:00Z"),
+        ("Review", "2031-05-01T09:00:00Z", "2031-05-01T10:00:00Z"),
+        ("Reminder", "2031-05-03T09:00:00Z", None),
+        ("Next week", "2031-05-10T09:00:00Z", None),
+    ):
+        payload = {"name": name, "start_date": start}
+        if end:
+            payload["end_date"] = end
+        assert auth_client.post("/calendar/events", json=payload).status_code == 201
+
+    params = {
+        "date_from": "2031-05-01T00:00:00Z",
+        "date_to": "2031-05-07T00:00:00Z",
+        "limit": 2,
+    }
+    first = auth_client.get("/calendar/events", params=params)
+    assert first.status_code == 200
+    # Overlap, not start: the overnight event started before date_from.
+    assert [ev["name"] for ev in first.json()] == ["Overnight", "Review"]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = auth_client.get("/calendar/events", params={**params, "cursor": cursor})
+    assert second.status_code == 200
+    assert [ev["name"] for ev in second.json()] == ["Reminder"]
+    assert "X-Next-Cursor" not in second.headers
+
+    invalid = auth_client.get("/calendar/events", params={"cursor": "not-a-cursor"})
+    assert invalid.status_code == 400
@@ -6,11 +6,11 @@ and streams NDJSON responses from the agents service.
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import json
 import uuid
-from contextlib import contextmanager
-from unittest.mock import MagicMock
+from collections.abc import Callable
 
 import httpx
 
@@ -32,19 +32,28 @@ def _patch_settings(monkeypatch, **overrides):
     return patched
 
 
-def _make_stream_response(events: list[dict]) -> MagicMock:
-    """Build a mock httpx streaming response that yields NDJSON lines."""
-    lines = [json.dumps(e) for e in events]
+def _mock_upstream(handler) -> Callable[[str], httpx.AsyncClient]:
+    """Stand-in for ``get_upstream_client`` whose requests are answered by ``handler``."""
 
-    @contextmanager
-    def mock_stream(*args, **kwargs):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.iter_lines = MagicMock(return_value=iter(lines))
-        yield mock_resp
+    def get_client(_upstream: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
-    return mock_stream
+    return get_client
+
+
+def _ndjson_response(events: list[dict]) -> httpx.Response:
+    body = "".join(json.dumps(e) + "\n" for e in events)
+    return httpx.Response(200, text=body, headers={"content-type": "application/x-ndjson"})
+
+
+def _sse_response(lines: list[str]) -> httpx.Response:
+    body = "".join(line + "\n\n" for line in lines)
+    return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+
+def _make_stream_response(events: list[dict]) -> Callable[[str], httpx.AsyncClient]:
+    """Mock agents service that streams ``events`` as NDJSON lines."""
+    return _mock_upstream(lambda _request: _ndjson_response(events))
 
 
 def _parse_ndjson(response) -> list[dict]:
@@ -91,7 +100,7 @@ class TestChatCompletions:
             {"type": "text_delta", "content": "Wie kann ich helfen?"},
             {"type": "done", "text": "Hallo! Wie kann ich helfen?"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         response = auth_client.post(
             "/chat/completions",
@@ -121,7 +130,7 @@ class TestChatCompletions:
             },
             {"type": "done", "text": "Hier:"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         response = auth_client.post(
             "/chat/completions",
@@ -141,7 +150,7 @@ class TestChatCompletions:
             {"type": "text_delta", "content": "Antwort"},
             {"type": "done", "text": "Antwort"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         # Capture the conversation_id by patching get_or_create_conversation
         from app.chat import queries as q
@@ -174,19 +183,16 @@ class TestChatCompletions:
 
         captured_payloads: list[dict] = []
 
-        def capturing_stream(*args, **kwargs):
-            payload = kwargs.get("json") or (args[1] if len(args) > 1 else {})
-            if isinstance(payload, str):
-                payload = json.loads(payload)
-            captured_payloads.append(payload)
-            return _make_stream_response(
+        def capturing_stream(request: httpx.Request) -> httpx.Response:
+            captured_payloads.append(json.loads(request.content))
+            return _ndjson_response(
                 [
                     {"type": "text_delta", "content": "ok"},
                     {"type": "done", "text": "ok"},
                 ]
-            )(*args, **kwargs)
+            )
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", capturing_stream)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(capturing_stream))
 
         conv_id = "conv-multi-turn"
 
@@ -226,19 +232,16 @@ class TestChatCompletions:
 
         captured_payloads: list[dict] = []
 
-        def capturing_stream(*args, **kwargs):
-            payload = kwargs.get("json") or (args[1] if len(args) > 1 else {})
-            if isinstance(payload, str):
-                payload = json.loads(payload)
-            captured_payloads.append(payload)
-            return _make_stream_response(
+        def capturing_stream(request: httpx.Request) -> httpx.Response:
+            captured_payloads.append(json.loads(request.content))
+            return _ndjson_response(
                 [
                     {"type": "text_delta", "content": "ok"},
                     {"type": "done", "text": "ok"},
                 ]
-            )(*args, **kwargs)
+            )
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", capturing_stream)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(capturing_stream))
 
         response = auth_client.post(
             "/chat/completions",
@@ -304,19 +307,16 @@ class TestChatCompletions:
 
         captured_payloads: list[dict] = []
 
-        def capturing_stream(*args, **kwargs):
-            payload = kwargs.get("json") or (args[1] if len(args) > 1 else {})
-            if isinstance(payload, str):
-                payload = json.loads(payload)
-            captured_payloads.append(payload)
-            return _make_stream_response(
+        def capturing_stream(request: httpx.Request) -> httpx.Response:
+            captured_payloads.append(json.loads(request.content))
+            return _ndjson_response(
                 [
                     {"type": "text_delta", "content": "ok"},
                     {"type": "done", "text": "ok"},
                 ]
-            )(*args, **kwargs)
+            )
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", capturing_stream)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(capturing_stream))
 
         response = auth_client.post(
             "/chat/completions",
@@ -346,11 +346,13 @@ class TestChatCompletions:
 
         called = {"stream": False}
 
-        def _unexpected_stream(*args, **kwargs):
+        def _unexpected_stream(request: httpx.Request) -> httpx.Response:
             called["stream"] = True
-            return _make_stream_response([])(*args, **kwargs)
+            return _ndjson_response([])
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _unexpected_stream)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client", _mock_upstream(_unexpected_stream)
+        )
 
         response = auth_client.post(
             "/chat/completions",
@@ -366,12 +368,12 @@ class TestChatCompletions:
     def test_streams_error_when_agents_down(self, auth_client, monkeypatch):
         _patch_settings(monkeypatch, agents_url="http://localhost:8002")
 
-        @contextmanager
-        def _raise_connection(*args, **kwargs):
+        def _raise_connection(request: httpx.Request) -> httpx.Response:
             raise httpx.ConnectError("Connection refused")
-            yield  # required for @contextmanager generator syntax
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _raise_connection)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client", _mock_upstream(_raise_connection)
+        )
 
         response = auth_client.post(
             "/chat/completions",
@@ -387,12 +389,10 @@ class TestChatCompletions:
     def test_streams_error_when_agents_timeout(self, auth_client, monkeypatch):
         _patch_settings(monkeypatch, agents_url="http://localhost:8002")
 
-        @contextmanager
-        def _raise_timeout(*args, **kwargs):
+        def _raise_timeout(request: httpx.Request) -> httpx.Response:
             raise httpx.ReadTimeout("Read timed out")
-            yield  # required for @contextmanager generator syntax
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _raise_timeout)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(_raise_timeout))
 
         response = auth_client.post(
             "/chat/completions",
@@ -428,7 +428,7 @@ class TestChatCompletions:
         )
 
         async def _fake_run_openclaw_background(
-            queue,
+            channel,
             openclaw_url,
             openclaw_token,
             messages,
@@ -445,8 +445,8 @@ class TestChatCompletions:
             assert org_id
             assert messages[-1]["role"] == "user"
             assert messages[-1]["content"] == "Hallo"
-            queue.put_nowait((json.dumps({"type": "done", "text": "Antwort"}) + "\n").encode())
-            queue.put_nowait(None)
+            await channel.send((json.dumps({"type": "done", "text": "Antwort"}) + "\n").encode())
+            await channel.close()
 
         monkeypatch.setattr(
             "app.chat.routes._run_openclaw_background", _fake_run_openclaw_background
@@ -1129,7 +1129,7 @@ class TestListConversations:
             {"type": "text_delta", "content": "Hallo"},
             {"type": "done", "text": "Hallo"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         auth_client.post(
             "/chat/completions",
@@ -1158,7 +1158,7 @@ class TestGetConversationMessages:
             {"type": "text_delta", "content": "Antwort"},
             {"type": "done", "text": "Antwort"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         # Create a conversation via chat
         auth_client.post(
@@ -1193,7 +1193,7 @@ class TestChatInstrumentationIntegration:
             {"type": "text_delta", "content": "Antwort"},
             {"type": "done", "text": "Antwort"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         # Fail only the second save_message call (the assistant persist)
         call_count = {"n": 0}
@@ -1228,12 +1228,12 @@ class TestChatInstrumentationIntegration:
         """Error events in NDJSON must include requestId and errorType."""
         _patch_settings(monkeypatch, agents_url="http://localhost:8002")
 
-        @contextmanager
-        def _raise_connection(*args, **kwargs):
+        def _raise_connection(request: httpx.Request) -> httpx.Response:
             raise httpx.ConnectError("Connection refused")
-            yield  # noqa: RUF027
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _raise_connection)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client", _mock_upstream(_raise_connection)
+        )
 
         response = auth_client.post(
             "/chat/completions",
@@ -1263,12 +1263,10 @@ class TestChatInstrumentationIntegration:
         """Timeout errors carry errorType=provider_timeout and a requestId."""
         _patch_settings(monkeypatch, agents_url="http://localhost:8002")
 
-        @contextmanager
-        def _raise_timeout(*args, **kwargs):
+        def _raise_timeout(request: httpx.Request) -> httpx.Response:
             raise httpx.ReadTimeout("Read timed out")
-            yield  # noqa: RUF027
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _raise_timeout)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(_raise_timeout))
 
         response = auth_client.post(
             "/chat/completions",
@@ -1293,7 +1291,7 @@ class TestChatInstrumentationIntegration:
             {"type": "text_delta", "content": "ok"},
             {"type": "done", "text": "ok"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         auth_client.post(
             "/chat/completions",
@@ -1325,7 +1323,7 @@ class TestArchiveConversation:
             {"type": "text_delta", "content": "ok"},
             {"type": "done", "text": "ok"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         # Create a conversation
         auth_client.post(
@@ -1358,8 +1356,6 @@ class TestSlowProviderResponse:
     """Slow but successful provider responses should complete normally."""
 
     def test_slow_provider_still_delivers_stream(self, auth_client, monkeypatch):
-        import time
-
         _patch_settings(monkeypatch, agents_url="http://localhost:8002")
 
         events = [
@@ -1368,17 +1364,11 @@ class TestSlowProviderResponse:
             {"type": "done", "text": "Thinking... Done."},
         ]
 
-        @contextmanager
-        def slow_stream(*args, **kwargs):
-            time.sleep(1)  # simulate slow first token
-            mock_resp = MagicMock()
-            mock_resp.status_code = 200
-            mock_resp.raise_for_status = MagicMock()
-            lines = [json.dumps(e) for e in events]
-            mock_resp.iter_lines = MagicMock(return_value=iter(lines))
-            yield mock_resp
+        async def slow_stream(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(1)  # simulate slow first token
+            return _ndjson_response(events)
 
-        monkeypatch.setattr("app.chat.routes.httpx.stream", slow_stream)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(slow_stream))
 
         response = auth_client.post(
             "/chat/completions",
@@ -1411,29 +1401,10 @@ class TestOpenclawMidStreamFailure:
             lambda **kw: "fake-delegated-token",
         )
 
-        import app.chat.routes as routes_mod
-
-        class FakeAsyncClient:
-            def __init__(self, **kw):
-                pass
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
-            def stream(self, *a, **kw):
-                from contextlib import asynccontextmanager
-
-                @asynccontextmanager
-                async def _raise():
-                    raise httpx.ConnectError("container restarted")
-                    yield  # noqa: RUF027
-
-                return _raise()
+        def _raise(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("container restarted")
 
-        monkeypatch.setattr(routes_mod.httpx, "AsyncClient", FakeAsyncClient)
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _mock_upstream(_raise))
 
         response = auth_client.post(
             "/chat/completions",
@@ -1453,8 +1424,6 @@ class TestOpenclawPersistenceFailure:
     """OpenClaw path: persistence failure after successful stream."""
 
     def test_openclaw_persist_failure_still_delivers_stream(self, auth_client, monkeypatch):
-        from contextlib import asynccontextmanager
-
         _patch_settings(monkeypatch, default_agent_backend="openclaw")
         monkeypatch.setattr("app.chat.routes.get_user_agent_backend", lambda uid: "openclaw")
         monkeypatch.setattr(
@@ -1479,34 +1448,10 @@ class TestOpenclawPersistenceFailure:
 
         import app.chat.routes as routes_mod
 
-        class FakeSSEResponse:
-            status_code = 200
-
-            def raise_for_status(self):
-                pass
-
-            async def aiter_lines(self):
-                for line in sse_lines:
-                    yield line
-
-        class FakeAsyncClient:
-            def __init__(self, **kw):
-                pass
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
-            def stream(self, *a, **kw):
-                @asynccontextmanager
-                async def _ctx():
-                    yield FakeSSEResponse()
-
-                return _ctx()
-
-        monkeypatch.setattr(routes_mod.httpx, "AsyncClient", FakeAsyncClient)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client",
+            _mock_upstream(lambda _request: _sse_response(sse_lines)),
+        )
 
         # Fail only the assistant persist (second save_message call)
         call_count = {"n": 0}
@@ -1544,7 +1489,7 @@ class TestAcceptedEvent:
             {"type": "text_delta", "content": "ok"},
             {"type": "done", "text": "ok"},
         ]
-        monkeypatch.setattr("app.chat.routes.httpx.stream", _make_stream_response(events))
+        monkeypatch.setattr("app.chat.routes.get_upstream_client", _make_stream_response(events))
 
         response = auth_client.post(
             "/chat/completions",
@@ -1564,8 +1509,6 @@ class TestOpenclawEmptyStreamFallback:
     """When OpenClaw returns an empty stream the user should see an error."""
 
     def test_empty_sse_stream_emits_fallback_error(self, auth_client, monkeypatch):
-        from contextlib import asynccontextmanager
-
         _patch_settings(monkeypatch, default_agent_backend="openclaw")
         monkeypatch.setattr("app.chat.routes.get_user_agent_backend", lambda uid: "openclaw")
         monkeypatch.setattr(
@@ -1582,37 +1525,11 @@ class TestOpenclawEmptyStreamFallback:
             lambda **kw: None,
         )
 
-        import app.chat.routes as routes_mod
-
         # Empty SSE stream — no content, no [DONE]
-        class FakeSSEResponse:
-            status_code = 200
-
-            def raise_for_status(self):
-                pass
-
-            async def aiter_lines(self):
-                return
-                yield  # noqa: RUF027 — makes this an async generator
-
-        class FakeAsyncClient:
-            def __init__(self, **kw):
-                pass
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
-            def stream(self, *a, **kw):
-                @asynccontextmanager
-                async def _ctx():
-                    yield FakeSSEResponse()
-
-                return _ctx()
-
-        monkeypatch.setattr(routes_mod.httpx, "AsyncClient", FakeAsyncClient)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client",
+            _mock_upstream(lambda _request: _sse_response([])),
+        )
 
         response = auth_client.post(
             "/chat/completions",
@@ -1629,8 +1546,6 @@ class TestOpenclawEmptyStreamFallback:
 
     def test_sse_error_payload_surfaces_to_user(self, auth_client, monkeypatch):
         """When OpenClaw forwards an upstream error (e.g. 402), it shows in chat."""
-        from contextlib import asynccontextmanager
-
         _patch_settings(monkeypatch, default_agent_backend="openclaw")
         monkeypatch.setattr("app.chat.routes.get_user_agent_backend", lambda uid: "openclaw")
         monkeypatch.setattr(
@@ -1647,41 +1562,15 @@ class TestOpenclawEmptyStreamFallback:
             lambda **kw: None,
         )
 
-        import app.chat.routes as routes_mod
-
         # SSE stream with an error payload (OpenRouter 402)
         sse_lines = [
             'data: {"error":{"message":"This request requires more credits","code":402}}',
         ]
 
-        class FakeSSEResponse:
-            status_code = 200
-
-            def raise_for_status(self):
-                pass
-
-            async def aiter_lines(self):
-                for line in sse_lines:
-                    yield line
-
-        class FakeAsyncClient:
-            def __init__(self, **kw):
-                pass
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                pass
-
-            def stream(self, *a, **kw):
-                @asynccontextmanager
-                async def _ctx():
-                    yield FakeSSEResponse()
-
-                return _ctx()
-
-        monkeypatch.setattr(routes_mod.httpx, "AsyncClient", FakeAsyncClient)
+        monkeypatch.setattr(
+            "app.chat.routes.get_upstream_client",
+            _mock_upstream(lambda _request: _sse_response(sse_lines)),
+        )
 
         response = auth_client.post(
             "/chat/completions",
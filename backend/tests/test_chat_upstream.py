@@ -0,0 +1,242 @@
+"""Tests for the async chat proxy: pooled upstream clients and the event channel."""
+
+import asyncio
+import dataclasses
+import json
+
+import httpx
+import pytest
+
+from app.chat import routes, upstream
+from app.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(monkeypatch):
+    monkeypatch.setattr(upstream, "_clients", {})
+    monkeypatch.setattr(upstream, "_clients_loop", None)
+
+
+@pytest.fixture()
+def persisted(monkeypatch) -> list[tuple]:
+    """Records assistant messages and request status updates instead of hitting the DB."""
+    calls: list[tuple] = []
+    monkeypatch.setattr(routes, "save_message", lambda *args: calls.append(("save", *args)))
+    monkeypatch.setattr(
+        routes,
+        "_safe_update_request_status",
+        lambda request_id, status, **kwargs: calls.append(("status", status)),
+    )
+    return calls
+
+
+def _mock_upstream(monkeypatch, handler) -> None:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(routes, "get_upstream_client", lambda _upstream: client)
+
+
+def _ndjson(*events: dict) -> str:
+    return "".join(json.dumps(event) + "\n" for event in events)
+
+
+def test_client_is_shared_per_upstream_and_loop():
+    async def _clients() -> tuple[httpx.AsyncClient, ...]:
+        clients = (
+            upstream.get_client("agents"),
+            upstream.get_client("agents"),
+            upstream.get_client("openclaw"),
+        )
+        await upstream.close_clients()
+        return clients
+
+    first, again, openclaw = asyncio.run(_clients())
+    assert first is again
+    assert openclaw is not first
+    assert first.is_closed and openclaw.is_closed
+    assert first.timeout.read == 60.0
+    assert openclaw.timeout.read == 120.0
+
+    async def _client() -> httpx.AsyncClient:
+        return upstream.get_client("agents")
+
+    assert asyncio.run(_client()) is not first
+
+
+def test_channel_pauses_producer_until_client_reads(monkeypatch):
+    monkeypatch.setattr(
+        routes, "settings", dataclasses.replace(settings, chat_stream_queue_max_events=2)
+    )
+
+    async def _run() -> list[bytes]:
+        channel = routes._EventChannel()
+        sent: list[int] = []
+
+        async def _produce() -> None:
+            for index in range(5):
+                await channel.send(b"%d" % index)
+                sent.append(index)
+            await channel.close()
+
+        producer = asyncio.create_task(_produce())
+        await asyncio.sleep(0.01)
+        assert sent == [0, 1]
+
+        received = [chunk async for chunk in channel.stream()]
+        await producer
+        return received
+
+    assert asyncio.run(_run()) == [b"0", b"1", b"2", b"3", b"4"]
+
+
+def test_channel_drops_events_after_client_disconnects(monkeypatch):
+    monkeypatch.setattr(
+        routes, "settings", dataclasses.replace(settings, chat_stream_queue_max_events=1)
+    )
+
+    async def _run() -> None:
+        channel = routes._EventChannel()
+        stream = channel.stream()
+        await channel.send(b"first")
+        assert await anext(stream) == b"first"
+
+        await channel.send(b"buffered")
+        blocked = asyncio.create_task(channel.send(b"blocked"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        await stream.aclose()
+        await asyncio.wait_for(blocked, timeout=1)
+        for _ in range(10):
+            await asyncio.wait_for(channel.send(b"dropped"), timeout=1)
+        await asyncio.wait_for(channel.close(), timeout=1)
+
+    asyncio.run(_run())
+
+
+def test_haystack_forwards_lines_and_persists_joined_text(monkeypatch, persisted):
+    captured: list[dict] = []
+
+    def _agents(request: httpx.Request) -> httpx.Response:
+        captured.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            text=_ndjson(
+                {"type": "text_delta", "content": "Hal"},
+                {"type": "text_delta", "content": "lo"},
+                {"type": "done", "text": "Hallo"},
+            ),
+        )
+
+    _mock_upstream(monkeypatch, _agents)
+
+    async def _run() -> list[dict]:
+        channel = routes._EventChannel()
+        routes._start_background(
+            routes._run_haystack(channel, "http://agents", {"messages": []}, "conv-1", "req-1")
+        )
+        return [json.loads(chunk) async for chunk in channel.stream()]
+
+    events = asyncio.run(_run())
+
+    assert [event["type"] for event in events] == ["text_delta", "text_delta", "done"]
+    assert captured == [{"messages": []}]
+    assert persisted == [
+        ("status", "running"),
+        ("save", "conv-1", "assistant", "Hallo", None),
+        ("status", "completed"),
+    ]
+
+
+def test_haystack_persists_reply_after_client_disconnects(monkeypatch, persisted):
+    monkeypatch.setattr(
+        routes, "settings", dataclasses.replace(settings, chat_stream_queue_max_events=1)
+    )
+    deltas = [{"type": "text_delta", "content": f"{index} "} for index in range(20)]
+    _mock_upstream(monkeypatch, lambda _request: httpx.Response(200, text=_ndjson(*deltas)))
+
+    async def _run() -> None:
+        channel = routes._EventChannel()
+        routes._start_background(
+            routes._run_haystack(channel, "http://agents", {}, "conv-1", "req-1")
+        )
+        stream = channel.stream()
+        await anext(stream)
+        await stream.aclose()
+        await asyncio.wait_for(asyncio.gather(*routes._background_tasks), timeout=5)
+
+    asyncio.run(_run())
+
+    expected = "".join(delta["content"] for delta in deltas)
+    assert ("save", "conv-1", "assistant", expected, None) in persisted
+    assert persisted[-1] == ("status", "completed")
+
+
+def test_openclaw_http_error_reports_upstream_detail(monkeypatch, persisted):
+    monkeypatch.setattr(routes, "write_token_file", lambda user_id, token: None)
+    monkeypatch.setattr(routes, "create_delegated_token", lambda **kwargs: "delegated")
+    _mock_upstream(
+        monkeypatch,
+        lambda _request: httpx.Response(402, json={"error": {"message": "Insufficient credits"}}),
+    )
+
+    async def _run() -> list[dict]:
+        channel = routes._EventChannel()
+        routes._start_background(
+            routes._run_openclaw_background(
+                channel, "http://openclaw", "tok", [], "conv-1", "user-1", "org-1", "req-1"
+            )
+        )
+        return [json.loads(chunk) async for chunk in channel.stream()]
+
+    events = asyncio.run(_run())
+
+    assert [event["type"] for event in events] == ["error"]
+    assert events[0]["detail"] == "Insufficient credits"
+    assert persisted == [("status", "failed")]
+
+
+def test_stalled_client_is_treated_as_disconnected(monkeypatch):
+    monkeypatch.setattr(
+        routes,
+        "settings",
+        dataclasses.replace(
+            settings, chat_stream_queue_max_events=1, chat_stream_send_timeout_seconds=0.05
+        ),
+    )
+
+    async def _run() -> list[bytes]:
+        channel = routes._EventChannel()
+        stream = channel.stream()
+        await channel.send(b"first")
+        # The client never reads: the second send gives up instead of waiting forever.
+        await asyncio.wait_for(channel.send(b"second"), timeout=1)
+        await asyncio.wait_for(channel.send(b"dropped"), timeout=1)
+        await asyncio.wait_for(channel.close(), timeout=1)
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(_run()) == []
+
+
+def test_shutdown_cancels_turns_that_outlive_the_grace_period():
+    async def _run() -> tuple[bool, bool]:
+        finished = asyncio.Event()
+
+        async def _quick() -> None:
+            await asyncio.sleep(0)
+            finished.set()
+
+        slow = asyncio.Event()
+
+        async def _stuck() -> None:
+            try:
+                await asyncio.sleep(60)
+            finally:
+                slow.set()
+
+        routes._start_background(_quick())
+        routes._start_background(_stuck())
+        await routes.stop_background_tasks(grace_seconds=0.05)
+        return finished.is_set(), slow.is_set()
+
+    assert asyncio.run(_run()) == (True, True)
+    assert not routes._background_tasks
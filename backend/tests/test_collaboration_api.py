@@ -197,6 +197,81 @@ def test_transition_rejects_stale_expected_event_id(app):
     assert stale_transition.json()["detail"]["code"] == "STALE_TRANSITION"
 
 
+def test_project_actions_page_by_due_date_with_cursor(app):
+    owner_client, _, _, _, project_id = _setup_shared_project(app)
+
+    due_dates = [None, "2026-03-03T09:00:00Z", None, "2026-03-01T09:00:00Z", "2026-03-02T09:00:00Z"]
+    for index, due_at in enumerate(due_dates):
+        created = owner_client.post(
+            f"/projects/{project_id}/actions",
+            json={"name": f"Action {index}", "due_at": due_at},
+        )
+        assert created.status_code == 201
+
+    unpaged = owner_client.get(f"/projects/{project_id}/actions")
+    assert unpaged.status_code == 200
+    assert "X-Next-Cursor" not in unpaged.headers
+    expected = [row["name"] for row in unpaged.json()]
+    assert expected == ["Action 3", "Action 4", "Action 1", "Action 0", "Action 2"]
+
+    names: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    for _ in range(len(due_dates)):
+        page = owner_client.get(f"/projects/{project_id}/actions", params=params)
+        assert page.status_code == 200
+        names.extend(row["name"] for row in page.json())
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor}
+    assert names == expected
+
+    invalid = owner_client.get(f"/projects/{project_id}/actions", params={"cursor": "bogus"})
+    assert invalid.status_code == 400
+
+
+def test_comment_count_and_history_pages(app):
+    owner_client, _, _, _, project_id = _setup_shared_project(app)
+
+    created = owner_client.post(f"/projects/{project_id}/actions", json={"name": "Review"})
+    assert created.status_code == 201
+    action_id = created.json()["id"]
+
+    for body in ("First", "Second", "Third"):
+        comment = owner_client.post(
+            f"/projects/{project_id}/actions/{action_id}/comments",
+            json={"body": body},
+        )
+        assert comment.status_code == 201
+    for tags in (["a"], ["b"], ["c"]):
+        updated = owner_client.patch(
+            f"/projects/{project_id}/actions/{action_id}",
+            json={"tags": tags},
+        )
+        assert updated.status_code == 200
+
+    listed = owner_client.get(f"/projects/{project_id}/actions")
+    assert [row["comment_count"] for row in listed.json()] == [3]
+
+    full = owner_client.get(f"/projects/{project_id}/actions/{action_id}/history").json()
+    assert full["revisions_next_cursor"] is None
+
+    revision_ids: list[int] = []
+    params: dict[str, int] = {"limit": 2}
+    while True:
+        page = owner_client.get(
+            f"/projects/{project_id}/actions/{action_id}/history", params=params
+        )
+        assert page.status_code == 200
+        payload = page.json()
+        assert len(payload["revisions"]) <= 2
+        revision_ids.extend(row["id"] for row in payload["revisions"])
+        if payload["revisions_next_cursor"] is None:
+            break
+        params = {"limit": 2, "revisions_cursor": payload["revisions_next_cursor"]}
+    assert revision_ids == [row["id"] for row in full["revisions"]]
+
+
 def test_non_project_member_cannot_access_project_actions(app):
     owner_client = TestClient(app)
     outsider_client = TestClient(app)
@@ -0,0 +1,128 @@
+"""Tests for the pooled connection mode behind ``app.db.db_conn``."""
+
+import asyncio
+import dataclasses
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app import db
+from app.config import settings
+
+
+@pytest.fixture()
+def pooled(monkeypatch, test_database_url):
+    patched = dataclasses.replace(
+        settings,
+        database_url=test_database_url,
+        db_pool_enabled=True,
+        db_pool_min_size=2,
+        db_pool_max_size=2,
+        db_pool_timeout_seconds=2.0,
+    )
+    monkeypatch.setattr("app.db.settings", patched)
+    db.close_pool()
+    pool = db.get_pool()
+    pool.wait(timeout=5.0)
+    try:
+        yield pool
+    finally:
+        db.close_pool()
+
+
+def _sample(name: str, pool: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"pool": pool})
+
+
+def test_db_conn_reuses_pooled_connections(pooled):
+    pids = set()
+    for _ in range(6):
+        with db.db_conn() as conn:
+            with conn.cursor() as cur:
+                assert isinstance(cur, db.InstrumentedCursor)
+                cur.execute("SELECT pg_backend_pid() AS pid")
+                pids.add(cur.fetchone()["pid"])
+
+    assert len(pids) <= 2
+
+
+def test_pooled_connection_is_reset_after_autocommit(pooled):
+    with db.db_conn() as conn:
+        conn.autocommit = True
+
+    with db.db_conn() as conn:
+        assert conn.autocommit is False
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 AS one")
+            assert cur.fetchone() == {"one": 1}
+
+
+def test_pooled_connection_rolls_back_on_error(pooled):
+    with pytest.raises(RuntimeError):
+        with db.db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute("CREATE TEMP TABLE pool_rollback_probe (id int)")
+            raise RuntimeError("boom")
+
+    with db.db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regclass('pg_temp.pool_rollback_probe') AS rel")
+            assert cur.fetchone()["rel"] is None
+
+
+def test_pool_metrics_report_wait_and_saturation(pooled):
+    before = _sample("db_pool_wait_seconds_count", db.SYNC_POOL_NAME) or 0.0
+    with db.db_conn():
+        db.refresh_pool_metrics()
+        assert _sample("db_pool_saturation_ratio", db.SYNC_POOL_NAME) == pytest.approx(0.5)
+
+    # The reset callback runs on a pool worker, so the return is asynchronous.
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        db.refresh_pool_metrics()
+        if _sample("db_pool_saturation_ratio", db.SYNC_POOL_NAME) == 0.0:
+            break
+        time.sleep(0.01)
+    assert _sample("db_pool_wait_seconds_count", db.SYNC_POOL_NAME) == before + 1
+    assert _sample("db_pool_saturation_ratio", db.SYNC_POOL_NAME) == 0.0
+    assert _sample("db_pool_size", db.SYNC_POOL_NAME) >= 1
+
+
+def test_async_db_conn_uses_async_pool(monkeypatch, test_database_url):
+    patched = dataclasses.replace(
+        settings,
+        database_url=test_database_url,
+        db_pool_enabled=True,
+        db_async_pool_min_size=1,
+        db_async_pool_max_size=1,
+    )
+    monkeypatch.setattr("app.db.settings", patched)
+
+    async def _run() -> list[int]:
+        pool = await db.open_async_pool()
+        assert pool is not None
+        pids = []
+        try:
+            for _ in range(2):
+                async with db.async_db_conn() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute("SELECT pg_backend_pid() AS pid")
+                        row = await cur.fetchone()
+                        pids.append(row["pid"])
+        finally:
+            await db.close_async_pool()
+        return pids
+
+    pids = asyncio.run(_run())
+    assert pids[0] == pids[1]
+
+
+def test_async_db_conn_without_pool_opens_dedicated_connection(test_database_url):
+    async def _run() -> dict:
+        async with db.async_db_conn() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT 1 AS one")
+                return await cur.fetchone()
+
+    assert asyncio.run(_run()) == {"one": 1}
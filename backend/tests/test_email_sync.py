@@ -15,9 +15,11 @@ from app.email.sync import (
     SyncResult,
     _parse_address,
     _parse_recipients,
+    _reconcile_archived,
     gmail_api_to_email_message,
     run_email_sync,
 )
+from app.projection.items import refresh_item_projection
 
 # ---------------------------------------------------------------------------
 # Gmail API message fixtures
@@ -171,6 +173,16 @@ class TestParseRecipients:
 # ---------------------------------------------------------------------------
 
 
+def _fetch_with_message_get(mock_gmail_api) -> None:
+    """Serve the mocked bulk fetch from the per-message ``message_get`` mock."""
+
+    def _messages_get(access_token, message_ids, **_kwargs):
+        for message_id in message_ids:
+            yield message_id, mock_gmail_api.message_get(access_token, message_id)
+
+    mock_gmail_api.messages_get.side_effect = _messages_get
+
+
 @pytest.fixture()
 def email_connection(auth_client):
     """Create a real email_connections row and return (connection_id, org_id, user_id)."""
@@ -238,6 +250,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_1", "msg_2"], history_id="10002"
@@ -283,6 +296,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_same_mid_1", "msg_same_mid_2"], history_id="10002"
@@ -336,6 +350,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_not_inbox"], history_id="10002"
@@ -371,6 +386,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         gmail_msg = _make_gmail_message(
             msg_id="msg_dedup",
@@ -404,6 +420,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_state"], history_id="50000"
@@ -438,6 +455,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = {
             "history": [],
@@ -459,6 +477,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_meta"], history_id="10001"
@@ -501,6 +520,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.side_effect = RuntimeError("Gmail API error")
 
@@ -527,6 +547,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Enable sync_mark_read on the connection
         with db_conn() as conn:
@@ -547,9 +568,9 @@ class TestRunEmailSync:
 
         run_email_sync(connection_id=conn_id, org_id=org_id, user_id=user_id)
 
-        mock_gmail_api.message_modify.assert_called_once_with(
+        mock_gmail_api.messages_batch_modify.assert_called_once_with(
             "fake-access-token",
-            "msg_read",
+            ["msg_read"],
             remove_label_ids=["UNREAD"],
         )
 
@@ -563,6 +584,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_jsonld"], history_id="10001"
@@ -602,6 +624,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # history_list returns 404 → fallback to messages_list
         mock_gmail_api.history_list.side_effect = httpx.HTTPStatusError(
@@ -638,6 +661,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # History exists but contains no new events.
         mock_gmail_api.history_list.return_value = {"history": [], "historyId": "10000"}
@@ -679,6 +703,7 @@ class TestRunEmailSync:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_meta_id"], history_id="10001"
@@ -774,6 +799,7 @@ def _seed_gmail_item(
                     now if archived else None,
                 ),
             )
+            refresh_item_projection(cur, [item_id])
         conn.commit()
     return item_id
 
@@ -793,6 +819,7 @@ class TestSyncArchivesFromGmail:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Seed an existing gmail item in TAY
         item_id = _seed_gmail_item(org_id, user_id, "msg_archive_me")
@@ -829,6 +856,7 @@ class TestSyncArchivesFromGmail:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Seed an already-archived item
         _seed_gmail_item(org_id, user_id, "msg_already_done", archived=True)
@@ -856,6 +884,7 @@ class TestSyncArchivesFromGmail:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Seed an item
         _seed_gmail_item(org_id, user_id, "msg_just_read")
@@ -884,6 +913,7 @@ class TestSyncArchivesFromGmail:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         item_id = _seed_gmail_item(org_id, user_id, "msg_emit_event")
 
@@ -893,11 +923,19 @@ class TestSyncArchivesFromGmail:
 
         run_email_sync(connection_id=conn_id, org_id=org_id, user_id=user_id)
 
-        # Find the item_archived call
-        archived_calls = [c for c in mock_enqueue.call_args_list if c[0][0] == "item_archived"]
-        assert len(archived_calls) == 1
-        assert archived_calls[0][0][1]["item_id"] == item_id
-        assert archived_calls[0][0][1]["org_id"] == org_id
+        # The outbox row commits with the archive
+        with db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT payload FROM outbox_events
+                    WHERE event_type = 'item_archived' AND payload->>'item_id' = %s
+                    """,
+                    (item_id,),
+                )
+                rows = cur.fetchall()
+        assert len(rows) == 1
+        assert rows[0]["payload"]["org_id"] == org_id
 
     @patch("app.email.sync.gmail_api")
     @patch("app.email.sync.get_valid_gmail_token")
@@ -909,6 +947,7 @@ class TestSyncArchivesFromGmail:
     ):
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         mock_gmail_api.history_list.return_value = _make_history_response(
             ["msg_local_archived"], history_id="10001"
@@ -948,6 +987,7 @@ class TestSyncArchivesFromGmail:
                     "UPDATE items SET archived_at = now(), updated_at = now() WHERE item_id = %s",
                     (item_id,),
                 )
+                refresh_item_projection(cur, [item_id])
             conn.commit()
 
         mock_gmail_api.history_list.return_value = {"history": [], "historyId": "10002"}
@@ -993,6 +1033,7 @@ class TestReconciliation:
         """Item exists in TAY but gmail message is no longer in inbox."""
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Seed a TAY item for a gmail message that's no longer in inbox
         item_id = _seed_gmail_item(org_id, user_id, "msg_stale")
@@ -1041,6 +1082,7 @@ class TestReconciliation:
         """Item exists in TAY and gmail message is still in inbox → keep it."""
         conn_id, org_id, user_id = email_connection
         mock_get_token.return_value = "fake-access-token"
+        _fetch_with_message_get(mock_gmail_api)
 
         # Seed a TAY item whose gmail message IS still in inbox
         item_id = _seed_gmail_item(org_id, user_id, "msg_still_there")
@@ -1073,3 +1115,38 @@ class TestReconciliation:
                 row = cur.fetchone()
                 assert row is not None
                 assert row["archived_at"] is None
+
+    def test_reconcile_archives_all_stale_items_in_one_pass(self, email_connection):
+        _, org_id, user_id = email_connection
+        stale = [_seed_gmail_item(org_id, user_id, f"msg_gone_{index}") for index in range(3)]
+        kept = _seed_gmail_item(org_id, user_id, "msg_kept")
+        done = _seed_gmail_item(org_id, user_id, "msg_done", archived=True)
+
+        archived = _reconcile_archived(
+            org_id=org_id,
+            user_id=user_id,
+            inbox_gmail_ids={"msg_kept", "msg_done", "msg_not_synced_yet"},
+        )
+
+        assert archived == 3
+        with db_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT i.item_id::text AS item_id, p.archived_at IS NOT NULL AS archived
+                    FROM items i JOIN item_projection p USING (item_id)
+                    WHERE i.item_id = ANY(%s::uuid[])
+                    """,
+                    ([*stale, kept, done],),
+                )
+                state = {row["item_id"]: row["archived"] for row in cur.fetchall()}
+                cur.execute(
+                    """
+                    SELECT payload->>'item_id' AS item_id FROM outbox_events
+                    WHERE event_type = 'item_archived' AND payload->>'item_id' = ANY(%s)
+                    """,
+                    ([*stale, kept, done],),
+                )
+                events = sorted(row["item_id"] for row in cur.fetchall())
+        assert state == {**dict.fromkeys(stale, True), kept: False, done: True}
+        assert events == sorted(stale)
@@ -0,0 +1,244 @@
+"""Tests for the email sync executor: leases, priority, fairness and settling."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.db import db_conn, jsonb
+from app.email.sync_executor import (
+    EmailSyncExecutor,
+    claim_connections,
+    dead_letter_orphaned_requests,
+    settle_claim,
+)
+
+
+def _drain_outbox() -> None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("UPDATE outbox_events SET processed_at = now() WHERE processed_at IS NULL")
+        conn.commit()
+
+
+def _create_org(owner_user_id: str) -> str:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO organizations (name, owner_user_id)
+                VALUES (%s, %s)
+                RETURNING id
+                """,
+                (f"Sync org {uuid.uuid4().hex[:6]}", owner_user_id),
+            )
+            org_id = str(cur.fetchone()["id"])
+        conn.commit()
+    return org_id
+
+
+def _create_connection(org_id: str, user_id: str, *, is_active: bool = True) -> str:
+    conn_id = str(uuid.uuid4())
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO email_connections
+                    (connection_id, org_id, user_id, email_address, display_name,
+                     encrypted_access_token, encrypted_refresh_token,
+                     token_expires_at, is_active)
+                VALUES (%s, %s, %s, %s, 'Gmail', 'gAAAAA-access', 'gAAAAA-refresh', %s, %s)
+                """,
+                (
+                    conn_id,
+                    org_id,
+                    user_id,
+                    f"{conn_id[:8]}@gmail.com",
+                    datetime(2026, 12, 31, tzinfo=UTC),
+                    is_active,
+                ),
+            )
+        conn.commit()
+    return conn_id
+
+
+def _request_sync(
+    conn_id: str,
+    org_id: str,
+    user_id: str,
+    *,
+    trigger: str = "interval",
+    age_seconds: float = 60.0,
+) -> None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO outbox_events (event_type, payload, created_at)
+                VALUES ('email_sync_job', %s, %s)
+                """,
+                (
+                    jsonb(
+                        {
+                            "connection_id": conn_id,
+                            "org_id": org_id,
+                            "user_id": user_id,
+                            "trigger": trigger,
+                        }
+                    ),
+                    datetime.now(UTC) - timedelta(seconds=age_seconds),
+                ),
+            )
+        conn.commit()
+
+
+def _sync_events(conn_id: str) -> list[dict]:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT processed_at, dead_lettered_at, attempts, last_error
+                FROM outbox_events
+                WHERE event_type = 'email_sync_job' AND payload->>'connection_id' = %s
+                ORDER BY created_at
+                """,
+                (conn_id,),
+            )
+            return cur.fetchall()
+
+
+def _lease(conn_id: str) -> dict:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT sync_lease_owner, sync_lease_expires_at
+                FROM email_connections
+                WHERE connection_id = %s
+                """,
+                (conn_id,),
+            )
+            return cur.fetchone()
+
+
+def _org_and_user(auth_client) -> tuple[str, str]:
+    return auth_client.headers["X-Org-Id"], auth_client.get("/auth/me").json()["id"]
+
+
+def test_claim_prefers_push_then_round_robins_orgs(auth_client):
+    _drain_outbox()
+    org_a, user_id = _org_and_user(auth_client)
+    org_b = _create_org(user_id)
+    busy = [_create_connection(org_a, user_id) for _ in range(3)]
+    pushed = _create_connection(org_a, user_id)
+    quiet = _create_connection(org_b, user_id)
+    for index, conn_id in enumerate(busy):
+        _request_sync(conn_id, org_a, user_id, age_seconds=300 - index)
+    _request_sync(pushed, org_a, user_id, trigger="push", age_seconds=5)
+    _request_sync(quiet, org_b, user_id, age_seconds=100)
+
+    claims = claim_connections("owner-1", 3)
+
+    # The push goes first; org B's only request then beats org A's older backlog.
+    assert [claim.connection_id for claim in claims] == [pushed, quiet, busy[0]]
+    assert [claim.trigger for claim in claims] == ["push", "scheduled", "scheduled"]
+
+
+def test_leased_connection_is_not_claimed_twice(auth_client):
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    conn_id = _create_connection(org_id, user_id)
+    _request_sync(conn_id, org_id, user_id)
+    _request_sync(conn_id, org_id, user_id, age_seconds=30)
+
+    first = claim_connections("owner-1", 5)
+    second = claim_connections("owner-2", 5)
+
+    assert [claim.connection_id for claim in first] == [conn_id]
+    assert second == []
+    assert _lease(conn_id)["sync_lease_owner"] == "owner-1"
+
+
+def test_settle_success_processes_requests_and_releases_lease(auth_client):
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    conn_id = _create_connection(org_id, user_id)
+    _request_sync(conn_id, org_id, user_id, age_seconds=120)
+    _request_sync(conn_id, org_id, user_id, age_seconds=60)
+
+    [claim] = claim_connections("owner-1", 1)
+    # Arrives while the sync runs: must trigger another run, not be swallowed.
+    _request_sync(conn_id, org_id, user_id, age_seconds=-1)
+    settle_claim(claim, "owner-1")
+
+    events = _sync_events(conn_id)
+    assert [event["processed_at"] is not None for event in events] == [True, True, False]
+    assert _lease(conn_id) == {"sync_lease_owner": None, "sync_lease_expires_at": None}
+    [again] = claim_connections("owner-1", 1)
+    assert again.connection_id == conn_id
+
+
+def test_settle_failure_counts_attempt_and_backs_off(auth_client):
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    conn_id = _create_connection(org_id, user_id)
+    _request_sync(conn_id, org_id, user_id)
+
+    [claim] = claim_connections("owner-1", 1)
+    settle_claim(claim, "owner-1", error="Gmail unavailable")
+
+    [event] = _sync_events(conn_id)
+    assert event["processed_at"] is None
+    assert event["attempts"] == 1
+    assert event["last_error"] == "Gmail unavailable"
+    lease = _lease(conn_id)
+    assert lease["sync_lease_owner"] is None
+    assert lease["sync_lease_expires_at"] > datetime.now(UTC)
+    assert claim_connections("owner-1", 1) == []
+
+
+def test_requests_for_inactive_connections_are_dead_lettered(auth_client):
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    inactive = _create_connection(org_id, user_id, is_active=False)
+    _request_sync(inactive, org_id, user_id)
+
+    assert claim_connections("owner-1", 5) == []
+    assert dead_letter_orphaned_requests() == 1
+    [event] = _sync_events(inactive)
+    assert event["dead_lettered_at"] is not None
+
+
+@patch("app.email.sync_executor.run_email_sync")
+def test_executor_runs_claimed_syncs(mock_run_sync, auth_client):
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    conn_ids = [_create_connection(org_id, user_id) for _ in range(2)]
+    for conn_id in conn_ids:
+        _request_sync(conn_id, org_id, user_id)
+    mock_run_sync.return_value = MagicMock(synced=1, created=1)
+
+    executor = EmailSyncExecutor(concurrency=4)
+    assert executor.dispatch_once() == 2
+    executor.stop()
+
+    synced = {call.kwargs["connection_id"] for call in mock_run_sync.call_args_list}
+    assert synced == set(conn_ids)
+    for conn_id in conn_ids:
+        assert all(event["processed_at"] is not None for event in _sync_events(conn_id))
+        assert _lease(conn_id)["sync_lease_owner"] is None
+    assert executor.running() == []
+
+
+def test_process_batch_skips_excluded_event_types(auth_client):
+    from app.worker import process_batch
+
+    _drain_outbox()
+    org_id, user_id = _org_and_user(auth_client)
+    conn_id = _create_connection(org_id, user_id)
+    _request_sync(conn_id, org_id, user_id)
+
+    assert process_batch(limit=10, exclude_event_types=("email_sync_job",)) == 0
+    [event] = _sync_events(conn_id)
+    assert event["processed_at"] is None
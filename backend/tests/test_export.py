@@ -1,3 +1,5 @@
+import gzip
+import json
 import re
 import uuid
 
@@ -147,3 +149,32 @@ def test_export_both_filters(auth_client):
     assert "Active" in names
     assert "Completed" in names
     assert "Archived" in names
+
+
+def test_export_streams_across_fetch_batches(auth_client, monkeypatch):
+    monkeypatch.setattr("app.routes.items.EXPORT_FETCH_SIZE", 2)
+    names = [f"Batch item {idx}" for idx in range(5)]
+    for name in names:
+        _create_item(auth_client, _action_item(name=name))
+
+    response = auth_client.get("/items/export")
+    assert response.status_code == 200
+    assert [row["item"]["name"] for row in response.json()] == names
+
+
+def test_export_ndjson_gzip(auth_client, monkeypatch):
+    monkeypatch.setattr("app.routes.items.EXPORT_FETCH_SIZE", 2)
+    names = [f"Line item {idx}" for idx in range(3)]
+    for name in names:
+        _create_item(auth_client, _action_item(name=name))
+
+    response = auth_client.get("/items/export?format=ndjson&gzip=true")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/gzip")
+    assert re.fullmatch(
+        r'attachment; filename="items-export-\d{8}T\d{6}Z\.ndjson\.gz"',
+        response.headers["content-disposition"],
+    )
+
+    lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+    assert [json.loads(line)["item"]["name"] for line in lines] == names
@@ -1,14 +1,17 @@
 """Tests for Gmail REST API client (gmail_api.py)."""
 
-from unittest.mock import patch
+import json
 
 import httpx
 import pytest
 
+from app.email import gmail_api
 from app.email.gmail_api import (
     history_list,
     message_get,
     message_modify,
+    messages_batch_modify,
+    messages_get,
     messages_list,
     stop_watch,
     watch,
@@ -16,111 +19,122 @@ from app.email.gmail_api import (
 
 pytestmark = pytest.mark.unit
 
+_BASE_PATH = "/gmail/v1/users/me"
+
 
 def _mock_response(status_code: int = 200, json_data: dict | None = None) -> httpx.Response:
-    return httpx.Response(
-        status_code=status_code,
-        json=json_data or {},
-        request=httpx.Request("GET", "https://example.com"),
-    )
+    return httpx.Response(status_code=status_code, json=json_data or {})
 
 
 class TestWatch:
-    def test_watch_success(self):
-        resp = _mock_response(200, {"historyId": "12345", "expiration": "1707836400000"})
-        with patch("app.email.gmail_api.httpx.post", return_value=resp) as mock_post:
-            result = watch("token123", "projects/my-project/topics/gmail-events")
+    def test_watch_success(self, google_transport):
+        seen, responses = google_transport
+        responses[f"{_BASE_PATH}/watch"] = [
+            _mock_response(200, {"historyId": "12345", "expiration": "1707836400000"})
+        ]
+        result = watch("token123", "projects/my-project/topics/gmail-events")
 
         assert result["historyId"] == "12345"
         assert result["expiration"] == "1707836400000"
-        mock_post.assert_called_once()
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"]["topicName"] == "projects/my-project/topics/gmail-events"
-        assert call_kwargs.kwargs["json"]["labelIds"] == ["INBOX"]
+        assert len(seen) == 1
+        body = json.loads(seen[0].content)
+        assert body["topicName"] == "projects/my-project/topics/gmail-events"
+        assert body["labelIds"] == ["INBOX"]
+        assert seen[0].headers["Authorization"] == "Bearer token123"
 
-    def test_watch_error_raises(self):
-        resp = _mock_response(403, {"error": {"message": "Insufficient permissions"}})
-        with patch("app.email.gmail_api.httpx.post", return_value=resp):
-            with pytest.raises(httpx.HTTPStatusError):
-                watch("token123", "projects/my-project/topics/gmail-events")
+    def test_watch_error_raises(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/watch"] = [
+            _mock_response(403, {"error": {"message": "Insufficient permissions"}})
+        ]
+        with pytest.raises(httpx.HTTPStatusError):
+            watch("token123", "projects/my-project/topics/gmail-events")
 
 
 class TestStopWatch:
-    def test_stop_watch_success(self):
-        resp = _mock_response(204)
-        with patch("app.email.gmail_api.httpx.post", return_value=resp):
+    def test_stop_watch_success(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/stop"] = [_mock_response(204)]
+        stop_watch("token123")
+
+    def test_stop_watch_404_is_ok(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/stop"] = [_mock_response(404)]
+        stop_watch("token123")  # Should not raise
+
+    def test_stop_watch_500_raises(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/stop"] = [_mock_response(500, {"error": "internal"})]
+        with pytest.raises(httpx.HTTPStatusError):
             stop_watch("token123")
 
-    def test_stop_watch_404_is_ok(self):
-        resp = _mock_response(404)
-        with patch("app.email.gmail_api.httpx.post", return_value=resp):
-            stop_watch("token123")  # Should not raise
-
-    def test_stop_watch_500_raises(self):
-        resp = _mock_response(500, {"error": "internal"})
-        with patch("app.email.gmail_api.httpx.post", return_value=resp):
-            with pytest.raises(httpx.HTTPStatusError):
-                stop_watch("token123")
-
 
 class TestHistoryList:
-    def test_history_list_single_page(self):
-        resp = _mock_response(
-            200,
-            {
-                "history": [
-                    {"id": "100", "messagesAdded": [{"message": {"id": "msg1"}}]},
-                    {"id": "101", "messagesAdded": [{"message": {"id": "msg2"}}]},
-                ],
-                "historyId": "102",
-            },
-        )
-        with patch("app.email.gmail_api.httpx.get", return_value=resp):
-            result = history_list("token123", 99)
+    def test_history_list_single_page(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/history"] = [
+            _mock_response(
+                200,
+                {
+                    "history": [
+                        {"id": "100", "messagesAdded": [{"message": {"id": "msg1"}}]},
+                        {"id": "101", "messagesAdded": [{"message": {"id": "msg2"}}]},
+                    ],
+                    "historyId": "102",
+                },
+            )
+        ]
+        result = history_list("token123", 99)
 
         assert len(result["history"]) == 2
         assert result["historyId"] == "102"
 
-    def test_history_list_pagination(self):
-        page1 = _mock_response(
-            200,
-            {
-                "history": [{"id": "100"}],
-                "historyId": "101",
-                "nextPageToken": "page2token",
-            },
-        )
-        page2 = _mock_response(
-            200,
-            {
-                "history": [{"id": "101"}],
-                "historyId": "102",
-            },
-        )
-        with patch("app.email.gmail_api.httpx.get", side_effect=[page1, page2]):
-            result = history_list("token123", 99)
+    def test_history_list_pagination(self, google_transport):
+        seen, responses = google_transport
+        responses[f"{_BASE_PATH}/history"] = [
+            _mock_response(
+                200,
+                {
+                    "history": [{"id": "100"}],
+                    "historyId": "101",
+                    "nextPageToken": "page2token",
+                },
+            ),
+            _mock_response(
+                200,
+                {
+                    "history": [{"id": "101"}],
+                    "historyId": "102",
+                },
+            ),
+        ]
+        result = history_list("token123", 99)
 
         assert len(result["history"]) == 2
         assert result["historyId"] == "102"
+        assert seen[1].url.params["pageToken"] == "page2token"
 
-    def test_history_list_empty(self):
-        resp = _mock_response(200, {"historyId": "99"})
-        with patch("app.email.gmail_api.httpx.get", return_value=resp):
-            result = history_list("token123", 99)
+    def test_history_list_empty(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/history"] = [_mock_response(200, {"historyId": "99"})]
+        result = history_list("token123", 99)
 
         assert result["history"] == []
         assert result["historyId"] == "99"
 
-    def test_history_list_expired_raises_404(self):
-        resp = _mock_response(404, {"error": {"message": "notFound"}})
-        with patch("app.email.gmail_api.httpx.get", return_value=resp):
-            with pytest.raises(httpx.HTTPStatusError) as exc_info:
-                history_list("token123", 1)
-            assert exc_info.value.response.status_code == 404
+    def test_history_list_expired_raises_404(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/history"] = [
+            _mock_response(404, {"error": {"message": "notFound"}})
+        ]
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            history_list("token123", 1)
+        assert exc_info.value.response.status_code == 404
 
 
 class TestMessageGet:
-    def test_message_get_full(self):
+    def test_message_get_full(self, google_transport):
+        seen, responses = google_transport
         msg = {
             "id": "msg1",
             "threadId": "thread1",
@@ -133,96 +147,152 @@ class TestMessageGet:
             },
             "internalDate": "1707836400000",
         }
-        resp = _mock_response(200, msg)
-        with patch("app.email.gmail_api.httpx.get", return_value=resp) as mock_get:
-            result = message_get("token123", "msg1")
+        responses[f"{_BASE_PATH}/messages/msg1"] = [_mock_response(200, msg)]
+        result = message_get("token123", "msg1")
 
         assert result["id"] == "msg1"
         assert result["payload"]["headers"][0]["value"] == "Test email"
-        call_kwargs = mock_get.call_args
-        assert call_kwargs.kwargs["params"]["format"] == "full"
+        assert seen[0].url.params["format"] == "full"
 
-    def test_message_get_metadata_format(self):
-        resp = _mock_response(200, {"id": "msg1"})
-        with patch("app.email.gmail_api.httpx.get", return_value=resp) as mock_get:
-            message_get("token123", "msg1", fmt="metadata")
+    def test_message_get_metadata_format(self, google_transport):
+        seen, _ = google_transport
+        message_get("token123", "msg1", fmt="metadata")
 
-        call_kwargs = mock_get.call_args
-        assert call_kwargs.kwargs["params"]["format"] == "metadata"
+        assert seen[0].url.params["format"] == "metadata"
 
 
 class TestMessageModify:
-    def test_mark_as_read(self):
-        resp = _mock_response(200, {"id": "msg1", "labelIds": ["INBOX"]})
-        with patch("app.email.gmail_api.httpx.post", return_value=resp) as mock_post:
-            result = message_modify("token123", "msg1", remove_label_ids=["UNREAD"])
+    def test_mark_as_read(self, google_transport):
+        seen, responses = google_transport
+        responses[f"{_BASE_PATH}/messages/msg1/modify"] = [
+            _mock_response(200, {"id": "msg1", "labelIds": ["INBOX"]})
+        ]
+        result = message_modify("token123", "msg1", remove_label_ids=["UNREAD"])
 
         assert "UNREAD" not in result.get("labelIds", [])
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"]["removeLabelIds"] == ["UNREAD"]
+        assert json.loads(seen[0].content)["removeLabelIds"] == ["UNREAD"]
 
-    def test_add_labels(self):
-        resp = _mock_response(200, {"id": "msg1"})
-        with patch("app.email.gmail_api.httpx.post", return_value=resp) as mock_post:
-            message_modify("token123", "msg1", add_label_ids=["STARRED"])
+    def test_add_labels(self, google_transport):
+        seen, _ = google_transport
+        message_modify("token123", "msg1", add_label_ids=["STARRED"])
 
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"]["addLabelIds"] == ["STARRED"]
+        assert json.loads(seen[0].content)["addLabelIds"] == ["STARRED"]
 
 
 class TestMessagesList:
-    def test_list_with_query(self):
-        resp = _mock_response(
-            200,
-            {
-                "messages": [
-                    {"id": "msg1", "threadId": "t1"},
-                    {"id": "msg2", "threadId": "t2"},
-                ],
-            },
-        )
-        with patch("app.email.gmail_api.httpx.get", return_value=resp) as mock_get:
-            result = messages_list("token123", query="in:inbox newer_than:7d")
+    def test_list_with_query(self, google_transport):
+        seen, responses = google_transport
+        responses[f"{_BASE_PATH}/messages"] = [
+            _mock_response(
+                200,
+                {
+                    "messages": [
+                        {"id": "msg1", "threadId": "t1"},
+                        {"id": "msg2", "threadId": "t2"},
+                    ],
+                },
+            )
+        ]
+        result = messages_list("token123", query="in:inbox newer_than:7d")
 
         assert len(result) == 2
-        call_kwargs = mock_get.call_args
-        assert call_kwargs.kwargs["params"]["q"] == "in:inbox newer_than:7d"
-
-    def test_list_pagination(self):
-        page1 = _mock_response(
-            200,
-            {
-                "messages": [{"id": "msg1", "threadId": "t1"}],
-                "nextPageToken": "page2",
-            },
-        )
-        page2 = _mock_response(
-            200,
-            {
-                "messages": [{"id": "msg2", "threadId": "t2"}],
-            },
-        )
-        with patch("app.email.gmail_api.httpx.get", side_effect=[page1, page2]):
-            result = messages_list("token123", max_results=10)
+        assert seen[0].url.params["q"] == "in:inbox newer_than:7d"
+
+    def test_list_pagination(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/messages"] = [
+            _mock_response(
+                200,
+                {
+                    "messages": [{"id": "msg1", "threadId": "t1"}],
+                    "nextPageToken": "page2",
+                },
+            ),
+            _mock_response(
+                200,
+                {
+                    "messages": [{"id": "msg2", "threadId": "t2"}],
+                },
+            ),
+        ]
+        result = messages_list("token123", max_results=10)
 
         assert len(result) == 2
 
-    def test_list_respects_max_results(self):
-        resp = _mock_response(
-            200,
-            {
-                "messages": [{"id": f"msg{i}", "threadId": f"t{i}"} for i in range(5)],
-                "nextPageToken": "more",
-            },
-        )
-        with patch("app.email.gmail_api.httpx.get", return_value=resp):
-            result = messages_list("token123", max_results=3)
+    def test_list_respects_max_results(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/messages"] = [
+            _mock_response(
+                200,
+                {
+                    "messages": [{"id": f"msg{i}", "threadId": f"t{i}"} for i in range(5)],
+                    "nextPageToken": "more",
+                },
+            )
+        ]
+        result = messages_list("token123", max_results=3)
 
         assert len(result) == 3
 
-    def test_list_empty(self):
-        resp = _mock_response(200, {})
-        with patch("app.email.gmail_api.httpx.get", return_value=resp):
-            result = messages_list("token123")
+    def test_list_empty(self, google_transport):
+        _, responses = google_transport
+        responses[f"{_BASE_PATH}/messages"] = [_mock_response(200, {})]
+        result = messages_list("token123")
 
         assert result == []
+
+
+class TestMessagesGet:
+    def test_yields_in_input_order_with_errors_inline(self, google_transport):
+        ids = [f"msg{i}" for i in range(20)] + ["missing", "msg20"]
+
+        results = list(messages_get("token123", ids, concurrency=4))
+
+        assert [message_id for message_id, _ in results] == ids
+        fetched = dict(results)
+        assert fetched["msg7"] == {"id": "msg7"}
+        assert isinstance(fetched["missing"], httpx.HTTPStatusError)
+        assert fetched["msg20"] == {"id": "msg20"}
+
+    def test_retries_rate_limited_requests(self, google_transport):
+        seen, responses = google_transport
+        path = "/gmail/v1/users/me/messages/msg1"
+        responses[path] = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(
+                403,
+                json={"error": {"errors": [{"reason": "userRateLimitExceeded"}]}},
+            ),
+        ]
+
+        results = list(messages_get("token123", ["msg1"]))
+
+        assert results == [("msg1", {"id": "msg1"})]
+        assert len(seen) == 3
+
+    def test_permission_errors_are_not_retried(self, google_transport):
+        seen, responses = google_transport
+        responses["/gmail/v1/users/me/messages/msg1"] = [
+            httpx.Response(403, json={"error": {"errors": [{"reason": "forbidden"}]}}),
+        ]
+
+        [(_, error)] = list(messages_get("token123", ["msg1"]))
+
+        assert isinstance(error, httpx.HTTPStatusError)
+        assert len(seen) == 1
+
+
+class TestMessagesBatchModify:
+    def test_chunks_ids_per_call(self, google_transport):
+        seen, _ = google_transport
+        ids = [f"msg{i}" for i in range(gmail_api.BATCH_MODIFY_MAX_IDS + 5)]
+
+        messages_batch_modify("token123", ids, remove_label_ids=["UNREAD"])
+
+        bodies = [json.loads(request.content) for request in seen]
+        assert [request.url.path for request in seen] == [
+            "/gmail/v1/users/me/messages/batchModify"
+        ] * 2
+        assert [len(body["ids"]) for body in bodies] == [gmail_api.BATCH_MODIFY_MAX_IDS, 5]
+        assert all(body["removeLabelIds"] == ["UNREAD"] for body in bodies)
+        assert all("addLabelIds" not in body for body in bodies)
@@ -1,5 +1,8 @@
 """Tests for Gmail OAuth helpers — URL building, token revocation, and refresh."""
 
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 from urllib.parse import parse_qs, urlparse
 
 import httpx
@@ -9,6 +12,7 @@ import respx
 from app.email.gmail_oauth import (
     GOOGLE_REVOKE_URL,
     build_gmail_auth_url,
+    get_valid_gmail_token,
     refresh_gmail_token,
     revoke_google_token,
 )
@@ -148,7 +152,8 @@ class TestRefreshGmailToken:
 
         monkeypatch.setattr("app.email.gmail_oauth.CryptoService", DummyCrypto)
         monkeypatch.setattr(
-            "app.email.gmail_oauth.httpx.post", lambda *_a, **_k: _DummyHttpResponse()
+            "app.email.gmail_oauth.google_client.request",
+            lambda *_a, **_k: _DummyHttpResponse(),
         )
 
         token = refresh_gmail_token("connection-1", "org-1")
@@ -162,3 +167,60 @@ class TestRefreshGmailToken:
         assert params[2] == 3
         assert params[3] == "connection-1"
         assert params[4] == "org-1"
+
+
+@pytest.mark.unit
+class TestGetValidGmailToken:
+    @pytest.fixture()
+    def decrypts(self, monkeypatch):
+        calls: list[str] = []
+
+        class CountingCrypto:
+            def decrypt(self, ciphertext: str) -> str:
+                calls.append(ciphertext)
+                return f"plain:{ciphertext}"
+
+        monkeypatch.setattr("app.email.gmail_oauth.CryptoService", CountingCrypto)
+        return calls
+
+    def test_valid_token_is_cached_until_row_changes(self, decrypts):
+        row = {
+            "connection_id": "connection-1",
+            "encrypted_access_token": "gAAAAA-one",
+            "token_expires_at": datetime.now(UTC) + timedelta(hours=1),
+        }
+
+        assert get_valid_gmail_token(row, "org-1") == "plain:gAAAAA-one"
+        assert get_valid_gmail_token(row, "org-1") == "plain:gAAAAA-one"
+        rotated = {**row, "encrypted_access_token": "gAAAAA-two"}
+        assert get_valid_gmail_token(rotated, "org-1") == "plain:gAAAAA-two"
+
+        assert decrypts == ["gAAAAA-one", "gAAAAA-two"]
+
+    def test_concurrent_callers_share_one_refresh(self, decrypts, monkeypatch):
+        refreshes: list[str] = []
+
+        def _refresh(connection_id: str, _org_id: str):
+            refreshes.append(connection_id)
+            time.sleep(0.05)
+            return "fresh-token", datetime.now(UTC) + timedelta(hours=1)
+
+        monkeypatch.setattr("app.email.gmail_oauth._refresh_gmail_token", _refresh)
+        row = {
+            "connection_id": "connection-1",
+            "encrypted_access_token": "gAAAAA-expired",
+            "token_expires_at": datetime.now(UTC) - timedelta(minutes=1),
+        }
+        tokens: list[str] = []
+        threads = [
+            threading.Thread(target=lambda: tokens.append(get_valid_gmail_token(row, "org-1")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert tokens == ["fresh-token"] * 4
+        assert refreshes == ["connection-1"]
+        assert decrypts == []
@@ -0,0 +1,136 @@
+"""Tests for the shared Google API client layer (google_client.py)."""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.email import google_client
+from app.email.google_client import TokenCache, token_cache_key
+
+pytestmark = pytest.mark.unit
+
+_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/msg1"
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRequest:
+    def test_sets_bearer_token_and_records_latency(self, google_transport):
+        seen, _ = google_transport
+        before = _sample(
+            "app_google_api_request_duration_seconds_count",
+            endpoint="test.request",
+            outcome="ok",
+        )
+
+        response = google_client.request("GET", _URL, endpoint="test.request", access_token="tok")
+
+        assert response.status_code == 200
+        assert seen[0].headers["Authorization"] == "Bearer tok"
+        assert (
+            _sample(
+                "app_google_api_request_duration_seconds_count",
+                endpoint="test.request",
+                outcome="ok",
+            )
+            == before + 1
+        )
+
+    def test_retries_quota_errors_only_when_asked(self, google_transport):
+        seen, responses = google_transport
+        path = httpx.URL(_URL).path
+        quota_before = _sample("app_google_api_quota_errors_total", endpoint="test.quota")
+
+        responses[path] = [httpx.Response(429, headers={"Retry-After": "1"})]
+        assert google_client.request("GET", _URL, endpoint="test.quota").status_code == 429
+        assert len(seen) == 1
+
+        responses[path] = [httpx.Response(429), httpx.Response(503)]
+        response = google_client.request("GET", _URL, endpoint="test.quota", retry=True)
+        assert response.status_code == 200
+        assert len(seen) == 4
+        assert _sample("app_google_api_quota_errors_total", endpoint="test.quota") == (
+            quota_before + 2
+        )
+
+
+class TestGetCoalescing:
+    def test_identical_concurrent_gets_share_one_request(self, monkeypatch):
+        entered = threading.Event()
+        release = threading.Event()
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            entered.set()
+            release.wait(5)
+            return httpx.Response(200, json={"id": "msg1"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(google_client, "_client", lambda: client)
+        coalesced_before = _sample("app_google_api_coalesced_total", endpoint="test.get")
+        results: list[httpx.Response] = []
+
+        def _get() -> None:
+            results.append(
+                google_client.get(
+                    _URL, endpoint="test.get", access_token="tok", params={"format": "full"}
+                )
+            )
+
+        first = threading.Thread(target=_get)
+        first.start()
+        assert entered.wait(5)
+        second = threading.Thread(target=_get)
+        second.start()
+        deadline = time.monotonic() + 5
+        while (
+            _sample("app_google_api_coalesced_total", endpoint="test.get") == coalesced_before
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        release.set()
+        first.join(5)
+        second.join(5)
+        client.close()
+
+        assert len(calls) == 1
+        assert [response.json() for response in results] == [{"id": "msg1"}] * 2
+
+    def test_different_tokens_are_not_shared(self, google_transport):
+        seen, _ = google_transport
+
+        google_client.get(_URL, endpoint="test.get", access_token="tok-a")
+        google_client.get(_URL, endpoint="test.get", access_token="tok-b")
+
+        assert [request.headers["Authorization"] for request in seen] == [
+            "Bearer tok-a",
+            "Bearer tok-b",
+        ]
+
+
+class TestTokenCache:
+    def test_round_trip_is_encrypted_at_rest(self):
+        cache = TokenCache()
+        cache.put("conn-1:abc", "ya29.secret", datetime.now(UTC) + timedelta(hours=1))
+
+        assert cache.get("conn-1:abc") == "ya29.secret"
+        assert all(b"ya29.secret" not in entry for entry, _ in cache._entries.values())
+
+    def test_tokens_near_expiry_or_without_expiry_are_misses(self):
+        cache = TokenCache()
+        cache.put("soon", "token", datetime.now(UTC) + timedelta(seconds=30))
+        cache.put("unknown", "token", None)
+
+        assert cache.get("soon") is None
+        assert cache.get("unknown") is None
+
+    def test_key_changes_with_stored_ciphertext(self):
+        assert token_cache_key("conn-1", "gAAAAA-one") != token_cache_key("conn-1", "gAAAAA-two")
+        assert token_cache_key("conn-1", "gAAAAA-one") == token_cache_key("conn-1", "gAAAAA-one")
@@ -7,6 +7,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 from app.db import db_conn, jsonb
+from app.projection.items import refresh_item_projection
 
 
 def _parse_iso_z(value: str) -> datetime:
@@ -120,6 +121,7 @@ def _seed_calendar_item(*, org_id: str, user_id: str, event_id: str = "evt-propo
                     f"hash-{event_id}",
                 ),
             )
+            refresh_item_projection(cur, [item_id])
         conn.commit()
     return item_id
 
@@ -207,6 +209,7 @@ def test_urgent_schedule_request_generates_15m_slot_and_confirms_provider_payloa
     busy_event_id = "evt-busy-slot"
     with db_conn() as conn:
         with conn.cursor() as cur:
+            busy_item_id = str(uuid.uuid4())
             cur.execute(
                 """
                 INSERT INTO items
@@ -215,7 +218,7 @@ def test_urgent_schedule_request_generates_15m_slot_and_confirms_provider_payloa
                 VALUES (%s, %s, %s, %s, %s, %s, %s, now(), now())
                 """,
                 (
-                    str(uuid.uuid4()),
+                    busy_item_id,
                     org_id,
                     user_id,
                     f"urn:app:event:gcal:{busy_event_id}",
@@ -237,6 +240,7 @@ def test_urgent_schedule_request_generates_15m_slot_and_confirms_provider_payloa
                     f"hash-{busy_event_id}",
                 ),
             )
+            refresh_item_projection(cur, [busy_item_id])
         conn.commit()
 
     # Force schedule intent (not pickup/reschedule) in the seeded email.
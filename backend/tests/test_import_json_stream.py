@@ -0,0 +1,129 @@
+"""Unit tests for the incremental import-file reader."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.imports import json_stream
+from app.imports.json_stream import (
+    ImportFileFormatError,
+    ImportFileItems,
+    scan_import_file,
+)
+from app.storage import LocalStorage
+
+
+@pytest.fixture()
+def storage(tmp_path: Path) -> LocalStorage:
+    return LocalStorage(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def _tiny_chunks(monkeypatch):
+    # Force values to straddle chunk boundaries.
+    monkeypatch.setattr(json_stream, "_CHUNK_CHARS", 7)
+
+
+def _items(storage: LocalStorage, text: str) -> ImportFileItems:
+    storage.write("files/export", text.encode("utf-8"))
+    return ImportFileItems(storage, "files/export", scan_import_file(storage, "files/export"))
+
+
+def test_top_level_array_matches_json_loads(storage: LocalStorage) -> None:
+    data = [
+        {"id": "A1", "name": "Ünïcode ✓", "nested": {"tags": [1, 2.5, None, True]}},
+        {"id": "A2", "note": 'quote " and , ] } inside', "n": 12345678901234},
+        12345,
+        "plain",
+    ]
+    items = _items(storage, json.dumps(data, indent=2))
+
+    assert len(items) == 4
+    assert list(items) == data
+    assert list(items) == data  # re-iterable
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"meta": {"v": 1}, "items": [{"id": 1}, {"id": 2}]}, [{"id": 1}, {"id": 2}]),
+        ({"data": [{"id": 3}], "items": []}, [{"id": 3}]),
+        ({"export": [{"id": 4}], "data": [{"id": 5}], "items": []}, [{"id": 5}]),
+    ],
+)
+def test_wrapper_keys_follow_loader_precedence(storage, payload, expected) -> None:
+    items = _items(storage, json.dumps(payload))
+
+    assert len(items) == len(expected)
+    assert list(items) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"items": []}', '{"items": {"id": 1}}', '{"other": [1]}', '"text"', "42"],
+)
+def test_files_without_item_array_are_rejected(storage, text) -> None:
+    storage.write("files/export", text.encode("utf-8"))
+    with pytest.raises(ImportFileFormatError):
+        scan_import_file(storage, "files/export")
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['[{"id": 1},]', '[{"id": 1}', '[{"id": 1}] []', '{"items": [1] "x": 2}', ""],
+)
+def test_malformed_json_is_rejected(storage, text) -> None:
+    storage.write("files/export", text.encode("utf-8"))
+    with pytest.raises(json.JSONDecodeError):
+        scan_import_file(storage, "files/export")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"id": tru}]',
+        '[{"id" 1}]',
+        '[{"id": 1,}]',
+        "[[1}]",
+        "[{'id': 1}]",
+        '{"meta": {"v": 01}, "items": [1]}',
+        '[{"note": "unterminated}]',
+    ],
+)
+def test_malformed_values_are_rejected_by_the_scan(storage, text) -> None:
+    storage.write("files/export", text.encode("utf-8"))
+    with pytest.raises(json.JSONDecodeError):
+        scan_import_file(storage, "files/export")
+
+
+def test_scan_counts_items_without_decoding_them(storage, monkeypatch) -> None:
+    text = (
+        '{"meta": {"exported": [1, -2.5e3, null, true, "a \\" ] b"]},'
+        ' "items": [{"id": "A1", "tags": ["x", {"y": []}]}, [], "plain", 1, NaN]}'
+    )
+    storage.write("files/export", text.encode("utf-8"))
+    decoded: list[object] = []
+
+    class _RecordingDecoder(json.JSONDecoder):
+        def raw_decode(self, s, idx=0):
+            value, end = super().raw_decode(s, idx)
+            decoded.append(value)
+            return value, end
+
+    monkeypatch.setattr(json_stream, "_decoder", _RecordingDecoder())
+
+    scan = scan_import_file(storage, "files/export")
+
+    assert scan == json_stream.ImportFileScan(count=5, member_index=1)
+    assert decoded == ["meta", "items"]  # only the top-level keys
+
+
+def test_oversized_value_is_rejected_instead_of_buffered(storage, monkeypatch) -> None:
+    monkeypatch.setattr(json_stream, "_MAX_VALUE_CHARS", 64)
+    storage.write("files/export", ('["' + "a" * 10_000).encode("utf-8"))
+
+    with pytest.raises(json.JSONDecodeError, match="longer than 64"):
+        scan_import_file(storage, "files/export")
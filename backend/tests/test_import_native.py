@@ -362,3 +362,87 @@ def test_native_import_dedupes_active_jobs(auth_client):
         conn.commit()
 
     assert active_jobs == 1
+
+
+# ---------------------------------------------------------------------------
+# Bulk engine batching
+# ---------------------------------------------------------------------------
+
+
+def _native_record(canonical_id: str, name: str, *, completed: bool = False) -> dict:
+    item = {
+        "@id": canonical_id,
+        "@type": "Action",
+        "_schemaVersion": 2,
+        "name": name,
+        "additionalProperty": [
+            {"@type": "PropertyValue", "propertyID": "app:bucket", "value": "next"},
+        ],
+    }
+    if completed:
+        item["endTime"] = "2026-01-01T00:00:00Z"
+    return {"canonical_id": canonical_id, "source": "native", "item": item}
+
+
+def test_native_import_batches_match_row_by_row_semantics(auth_client, monkeypatch):
+    """Small batches, repeated ids and invalid rows keep counts and progress in order."""
+    import dataclasses
+
+    from app.config import settings
+    from app.imports.native.orchestrator import run_native_import
+
+    monkeypatch.setattr(
+        "app.imports.bulk.settings", dataclasses.replace(settings, import_batch_size=2)
+    )
+    user_id = auth_client.get("/auth/me").json()["id"]
+    org_id = auth_client.headers["X-Org-Id"]
+    ids = [f"urn:app:action:{uuid.uuid4()}" for _ in range(3)]
+    items = [
+        _native_record(ids[0], "First"),
+        {"canonical_id": "", "item": {}},
+        _native_record(ids[1], "Second"),
+        _native_record(ids[0], "First, edited"),
+        _native_record(ids[2], "Done", completed=True),
+        _native_record(ids[1], "Second"),
+    ]
+    progress: list[tuple[int, dict[str, int]]] = []
+
+    summary = run_native_import(
+        items,
+        org_id=org_id,
+        user_id=user_id,
+        source="native",
+        dry_run=False,
+        update_existing=True,
+        include_completed=False,
+        emit_events=True,
+        on_progress=lambda processed, totals: progress.append((processed, totals)),
+    )
+
+    assert summary.created == 2
+    assert summary.updated == 1
+    assert summary.unchanged == 1
+    assert summary.skipped == 1
+    assert summary.errors == 1
+    assert summary.bucket_counts == {"next": 3}
+    assert summary.sample_errors == ["item[1] missing canonical_id"]
+    assert [processed for processed, _ in progress] == [1, 2, 3, 4, 5, 6]
+    assert progress[1][1] == {"created": 1, "errors": 1}
+
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT schema_jsonld->>'name' AS name FROM items "
+                "WHERE org_id = %s AND canonical_id = %s",
+                (org_id, ids[0]),
+            )
+            assert cur.fetchone()["name"] == "First, edited"
+            cur.execute(
+                """
+                SELECT count(*) AS n
+                FROM outbox_events
+                WHERE event_type = 'item_upserted' AND payload->>'org_id' = %s
+                """,
+                (org_id,),
+            )
+            assert cur.fetchone()["n"] == 3
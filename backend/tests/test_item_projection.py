@@ -0,0 +1,180 @@
+"""Tests for the typed item_projection table."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.db import db_conn
+from app.projection.items import project_item
+from app.projection.rebuild import rebuild_item_projection
+
+
+def _pv(property_id: str, value: object) -> dict:
+    return {"@type": "PropertyValue", "propertyID": property_id, "value": value}
+
+
+def _row(jsonld: dict, **overrides) -> dict:
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+    row = {
+        "item_id": uuid.uuid4(),
+        "org_id": uuid.uuid4(),
+        "created_by_user_id": None,
+        "source": "manual",
+        "schema_jsonld": jsonld,
+        "created_at": now,
+        "updated_at": now,
+        "archived_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.unit
+def test_project_item_extracts_typed_columns():
+    projection = project_item(
+        _row(
+            {
+                "@type": ["Event", "Thing"],
+                "startDate": "2026-03-02T09:30:00+01:00",
+                "endDate": "2026-03-02",
+                "endTime": "2026-03-03T00:00:00Z",
+                "additionalProperty": [
+                    _pv("app:bucket", "calendar"),
+                    _pv("app:projectRefs", ["urn:app:project:a", "urn:app:project:b"]),
+                    _pv("app:projectRefs", ["urn:app:project:a", 7]),
+                ],
+                "sourceMetadata": {"raw": {"gmailMessageId": "msg-1", "eventId": "evt-1"}},
+            },
+            source="gmail",
+        )
+    )
+
+    assert projection.bucket == "calendar"
+    assert projection.primary_type == "Event"
+    assert projection.project_refs == ["urn:app:project:a", "urn:app:project:b"]
+    assert projection.start_time == datetime(2026, 3, 2, 8, 30, tzinfo=UTC)
+    assert projection.end_time == datetime(2026, 3, 2, tzinfo=UTC)
+    assert projection.source_message_ids == ["msg-1"]
+    assert projection.event_id == "evt-1"
+    assert projection.is_completed is True
+
+
+@pytest.mark.unit
+def test_project_item_tolerates_missing_and_malformed_fields():
+    projection = project_item(
+        _row(
+            {
+                "@type": "Action",
+                "startTime": "not a date",
+                "endTime": None,
+                "additionalProperty": [{"propertyID": "app:bucket", "value": 3}, "junk"],
+                "sourceMetadata": {"raw": {"gmailMessageId": "  "}},
+            }
+        )
+    )
+
+    assert projection.bucket is None
+    assert projection.primary_type == "Action"
+    assert projection.project_refs == []
+    assert projection.start_time is None
+    assert projection.source_message_ids == []
+    # endTime: null means open, matching the former ->> 'endTime' IS NULL filter.
+    assert projection.is_completed is False
+
+
+def _create_item(auth_client, item: dict) -> dict:
+    resp = auth_client.post("/items", json={"item": item, "source": "manual"})
+    assert resp.status_code in (200, 201), resp.text
+    return resp.json()
+
+
+def _projection(item_id: str) -> dict | None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT * FROM item_projection WHERE item_id = %s", (item_id,))
+            return cur.fetchone()
+
+
+def test_item_writes_keep_projection_current(auth_client):
+    project = _create_item(
+        auth_client,
+        {
+            "@id": "urn:app:project:projection",
+            "@type": "Project",
+            "name": "Projection",
+            "endTime": None,
+            "additionalProperty": [
+                _pv("app:bucket", "project"),
+                _pv("app:projectStatus", "active"),
+                _pv("app:isFocused", False),
+                _pv("app:desiredOutcome", ""),
+                _pv("app:reviewDate", None),
+            ],
+        },
+    )
+    action = _create_item(
+        auth_client,
+        {
+            "@id": "urn:app:action:projection-step",
+            "@type": "Action",
+            "name": "Step",
+            "endTime": None,
+            "additionalProperty": [
+                _pv("app:bucket", "next"),
+                _pv("app:projectRefs", ["urn:app:project:projection"]),
+                _pv("app:isFocused", False),
+                _pv("app:contexts", []),
+            ],
+        },
+    )
+
+    row = _projection(action["item_id"])
+    assert row["bucket"] == "next"
+    assert row["project_refs"] == ["urn:app:project:projection"]
+    assert row["is_completed"] is False
+
+    listed = auth_client.get("/items/by-project/urn:app:project:projection").json()
+    assert {entry["item_id"] for entry in listed} == {project["item_id"], action["item_id"]}
+
+    resp = auth_client.patch(
+        f"/items/{action['item_id']}",
+        json={"item": {"endTime": "2026-03-01T10:00:00Z"}, "source": "manual"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert _projection(action["item_id"])["is_completed"] is True
+    open_ids = {i["item_id"] for i in auth_client.get("/items/sync").json()["items"]}
+    assert action["item_id"] not in open_ids
+
+    assert auth_client.delete(f"/items/{action['item_id']}").status_code == 200
+    assert _projection(action["item_id"])["archived_at"] is not None
+    listed = auth_client.get("/items/by-project/urn:app:project:projection").json()
+    assert [entry["item_id"] for entry in listed] == [project["item_id"]]
+
+
+def test_rebuild_restores_missing_rows(auth_client):
+    item = _create_item(
+        auth_client,
+        {
+            "@id": "urn:app:inbox:projection-rebuild",
+            "@type": "Action",
+            "name": "Rebuild me",
+            "startTime": None,
+            "endTime": None,
+            "additionalProperty": [
+                _pv("app:bucket", "inbox"),
+                _pv("app:rawCapture", "Rebuild me"),
+                _pv("app:isFocused", False),
+                _pv("app:contexts", []),
+            ],
+        },
+    )
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM item_projection WHERE item_id = %s", (item["item_id"],))
+        conn.commit()
+
+    assert rebuild_item_projection(missing_only=True, batch_size=2) >= 1
+    assert _projection(item["item_id"])["bucket"] == "inbox"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from app import validation
-from app.validation.item_validator import validate_item_create
+from app.validation.item_validator import validate_item_create, validate_items_create
 
 pytestmark = pytest.mark.unit
 
@@ -15,6 +15,8 @@ def test_validation_package_exports_item_validation_api():
     assert callable(validation.raise_if_invalid)
     assert callable(validation.validate_item_create)
     assert callable(validation.validate_item_update)
+    assert callable(validation.validate_items_create)
+    assert callable(validation.validate_item_transition)
 
 
 def test_validate_item_create_requires_type_before_shacl():
@@ -35,3 +37,29 @@ def test_validate_item_create_requires_type_before_shacl():
             "message": "@type is required.",
         }
     ]
+
+
+def test_validate_items_create_maps_issues_back_to_each_item():
+    """One SHACL run over a batch yields the same issues as validating items one by one."""
+    items = [
+        {
+            "@type": "Action",
+            "name": "Valid action",
+            "additionalProperty": [{"propertyID": "app:bucket", "value": "next"}],
+        },
+        {
+            "@type": "Action",
+            "name": "Bad bucket",
+            "additionalProperty": [{"propertyID": "app:bucket", "value": "nowhere"}],
+        },
+        {"name": "Untyped"},
+        {"@type": "Project", "additionalProperty": []},
+    ]
+
+    batched = validate_items_create(items)
+
+    assert batched == [validate_item_create(item) for item in items]
+    assert batched[0] == []
+    assert {issue["code"] for issue in batched[1]} >= {"ACTION_BUCKET_INVALID"}
+    assert [issue["code"] for issue in batched[2]] == ["TYPE_REQUIRED"]
+    assert {issue["code"] for issue in batched[3]} == {"PROJECT_NAME_REQUIRED"}
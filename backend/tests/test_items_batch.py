@@ -0,0 +1,146 @@
+import dataclasses
+import uuid
+
+from app.config import settings
+from app.db import db_conn
+
+
+def _action(name: str, bucket: str = "next") -> dict:
+    return {
+        "@id": f"urn:app:action:{uuid.uuid4()}",
+        "@type": "Action",
+        "_schemaVersion": 2,
+        "name": name,
+        "additionalProperty": [
+            {"@type": "PropertyValue", "propertyID": "app:bucket", "value": bucket},
+        ],
+    }
+
+
+def _outbox_count(item_ids: list[str]) -> int:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT count(*) AS n FROM outbox_events
+                WHERE event_type = 'item_upserted' AND payload->>'item_id' = ANY(%s)
+                """,
+                (item_ids,),
+            )
+            return cur.fetchone()["n"]
+
+
+def test_batch_creates_valid_items_and_reports_failures(auth_client):
+    first = _action("Batch one")
+    second = _action("Batch two")
+    invalid = _action("Bad bucket", bucket="nowhere")
+    untyped = {"@id": f"urn:app:action:{uuid.uuid4()}", "name": "No type"}
+
+    response = auth_client.post(
+        "/items/batch",
+        json={
+            "items": [
+                {"item": first, "source": "manual"},
+                {"item": invalid},
+                {"item": second, "source": "manual"},
+                {"item": untyped},
+                {"item": first},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["status"] for r in results] == ["created", "error", "created", "error", "error"]
+    assert [r["status_code"] for r in results] == [201, 422, 201, 400, 400]
+    assert results[1]["error"]["issues"]
+    assert results[0]["item"]["canonical_id"] == first["@id"]
+
+    created_ids = [results[0]["item"]["item_id"], results[2]["item"]["item_id"]]
+    assert _outbox_count(created_ids) == 2
+    assert auth_client.get(f"/items/{created_ids[1]}").json()["item"]["name"] == "Batch two"
+
+
+def test_batch_replaces_existing_items_and_skips_unchanged(auth_client):
+    item = _action("Original")
+    other = _action("Untouched")
+    created = auth_client.post(
+        "/items/batch", json={"items": [{"item": item}, {"item": other}]}
+    ).json()["results"]
+
+    renamed = {**item, "name": "Renamed"}
+    results = auth_client.post(
+        "/items/batch", json={"items": [{"item": renamed}, {"item": other}]}
+    ).json()["results"]
+
+    assert [r["status"] for r in results] == ["updated", "unchanged"]
+    assert results[0]["item"]["item_id"] == created[0]["item"]["item_id"]
+    assert results[0]["item"]["item"]["name"] == "Renamed"
+    assert _outbox_count([created[1]["item"]["item_id"]]) == 1
+
+
+def test_batch_applies_transition_rules_to_existing_items(auth_client):
+    item = _action("Done", bucket="completed")
+    auth_client.post("/items/batch", json={"items": [{"item": item}]})
+
+    results = auth_client.post(
+        "/items/batch", json={"items": [{"item": {**item, "name": "Reopened"}}]}
+    ).json()["results"]
+
+    assert results[0]["status_code"] == 422
+    assert results[0]["error"]["issues"][0]["rule"] == "item.completed.immutable"
+
+
+def test_batch_checks_items_created_concurrently_after_the_lock_scan(auth_client, monkeypatch):
+    from app.routes import items as items_routes
+
+    item = _action("Done", bucket="completed")
+    auth_client.post("/items/batch", json={"items": [{"item": item}]})
+    lock_batch_items = items_routes._lock_batch_items
+    scans = []
+
+    def _scan_before_concurrent_insert(cur, org_id, canonical_ids):
+        scans.append(canonical_ids)
+        # The first scan runs before the other batch's insert commits.
+        return {} if len(scans) == 1 else lock_batch_items(cur, org_id, canonical_ids)
+
+    monkeypatch.setattr(items_routes, "_lock_batch_items", _scan_before_concurrent_insert)
+
+    results = auth_client.post(
+        "/items/batch", json={"items": [{"item": {**item, "name": "Reopened"}}]}
+    ).json()["results"]
+
+    assert len(scans) == 2
+    assert results[0]["status_code"] == 422
+    assert results[0]["error"]["issues"][0]["rule"] == "item.completed.immutable"
+
+
+def test_batch_entries_replay_per_item_idempotency_keys(auth_client):
+    key = f"batch-{uuid.uuid4()}"
+    entry = {"item": _action("Once"), "idempotency_key": key}
+
+    first = auth_client.post("/items/batch", json={"items": [entry]}).json()["results"][0]
+    again = auth_client.post(
+        "/items/batch", json={"items": [{"item": _action("Other")}, entry]}
+    ).json()["results"]
+    reused = auth_client.post(
+        "/items/batch",
+        json={"items": [{"item": _action("Different"), "idempotency_key": key}]},
+    ).json()["results"][0]
+
+    assert first["status"] == "created"
+    assert again[1] == {**first, "index": 1}
+    assert reused["status_code"] == 409
+
+
+def test_batch_rejects_oversized_requests(auth_client, monkeypatch):
+    monkeypatch.setattr(
+        "app.routes.items.settings", dataclasses.replace(settings, items_batch_max_items=2)
+    )
+
+    response = auth_client.post(
+        "/items/batch", json={"items": [{"item": _action(f"Item {n}")} for n in range(3)]}
+    )
+
+    assert response.status_code == 413
@@ -1,5 +1,9 @@
 import uuid
 
+import pytest
+
+from app.db import db_conn
+
 
 def test_action_requires_bucket(auth_client):
     payload = {
@@ -499,3 +503,51 @@ def test_patch_no_name_field_skips_provenance(auth_client):
     assert "app:nameProvenance" not in props
     history = props.get("app:provenanceHistory", [])
     assert all(e["action"] != "renamed" for e in history)
+
+
+def _outbox_events(item_id: str) -> list[str]:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT event_type FROM outbox_events
+                WHERE payload->>'item_id' = %s
+                ORDER BY created_at
+                """,
+                (item_id,),
+            )
+            return [row["event_type"] for row in cur.fetchall()]
+
+
+def test_patch_rolls_back_item_and_outbox_when_side_write_fails(auth_client, monkeypatch):
+    """Item row, outbox event and search job commit together or not at all."""
+    resp = auth_client.post("/items", json={"item": _make_action("Before"), "source": "manual"})
+    assert resp.status_code == 201
+    item_id = resp.json()["item_id"]
+
+    def _fail(*_args, **_kwargs):
+        raise RuntimeError("search job insert failed")
+
+    monkeypatch.setattr("app.routes.items.enqueue_job", _fail)
+    with pytest.raises(RuntimeError):
+        auth_client.patch(f"/items/{item_id}", json={"item": {"name": "After"}})
+
+    assert auth_client.get(f"/items/{item_id}").json()["item"]["name"] == "Before"
+    assert _outbox_events(item_id) == ["item_upserted"]
+
+
+def test_idempotent_patch_replays_stored_response(auth_client):
+    resp = auth_client.post("/items", json={"item": _make_action("Before"), "source": "manual"})
+    item_id = resp.json()["item_id"]
+    headers = {"Idempotency-Key": f"patch-{uuid.uuid4()}"}
+
+    first = auth_client.patch(
+        f"/items/{item_id}", json={"item": {"name": "After"}}, headers=headers
+    )
+    second = auth_client.patch(
+        f"/items/{item_id}", json={"item": {"name": "After"}}, headers=headers
+    )
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert _outbox_events(item_id) == ["item_upserted", "item_upserted"]
@@ -0,0 +1,101 @@
+"""Tests for the pooled Meilisearch client and its circuit breaker."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.search import meili
+from app.search.meili import CircuitBreaker, MeiliUnavailableError
+
+
+@pytest.fixture()
+def meili_settings(monkeypatch):
+    monkeypatch.setattr(
+        meili,
+        "settings",
+        dataclasses.replace(settings, meili_url="http://meili.test", meili_api_key="k"),
+    )
+    monkeypatch.setattr(meili, "_sync_client", None)
+    monkeypatch.setattr(meili, "_sync_client_pid", None)
+    monkeypatch.setattr(meili, "_async_client", None)
+    monkeypatch.setattr(meili, "_async_client_loop", None)
+    monkeypatch.setattr(meili, "_breaker", CircuitBreaker(failure_threshold=2, reset_seconds=60.0))
+
+
+def _mock_client(monkeypatch, handler) -> list[httpx.Request]:
+    seen: list[httpx.Request] = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(request)
+
+    client = httpx.Client(base_url="http://meili.test", transport=httpx.MockTransport(_record))
+    monkeypatch.setattr(meili, "_client", lambda: client)
+    return seen
+
+
+def test_client_is_pooled_per_process(meili_settings):
+    first = meili._client()
+    try:
+        assert meili._client() is first
+        assert first.base_url == httpx.URL("http://meili.test")
+    finally:
+        asyncio.run(meili.close_clients())
+    assert meili._client() is not first
+
+
+def test_breaker_opens_after_server_errors_and_fails_fast(meili_settings, monkeypatch):
+    seen = _mock_client(monkeypatch, lambda request: httpx.Response(503, text="busy"))
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="503"):
+            meili.search("items", "q", org_id="o1", limit=5, offset=0)
+    with pytest.raises(MeiliUnavailableError):
+        meili.search("items", "q", org_id="o1", limit=5, offset=0)
+
+    assert len(seen) == 2
+    assert seen[0].headers["Authorization"] == "Bearer k"
+    assert 0 < meili.circuit_retry_after() <= 60.0
+
+
+def test_transport_errors_raise_unavailable(meili_settings, monkeypatch):
+    def _fail(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    _mock_client(monkeypatch, _fail)
+    with pytest.raises(MeiliUnavailableError, match="unreachable"):
+        meili.add_documents("items", [{"item_id": "i1"}])
+
+
+def test_half_open_probe_closes_circuit(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(meili.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10.0)
+
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(MeiliUnavailableError):
+        breaker.before_call()
+
+    clock[0] += 10.0
+    breaker.before_call()  # the probe
+    with pytest.raises(MeiliUnavailableError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_success()
+
+    assert not breaker.is_open
+    breaker.before_call()
+
+
+def test_search_route_returns_503_while_circuit_open(auth_client, meili_settings, monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30.0)
+    breaker.record_failure()
+    monkeypatch.setattr(meili, "_breaker", breaker)
+
+    response = auth_client.get("/search", params={"q": "report"})
+
+    assert response.status_code == 503
+    assert 1 <= int(response.headers["Retry-After"]) <= 30
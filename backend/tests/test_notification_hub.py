@@ -0,0 +1,98 @@
+"""Tests for the process-wide notification fan-out hub."""
+
+import asyncio
+import json
+
+from app.notification_hub import RESYNC, NotificationHub
+from app.notifications import _notify_payload
+
+
+def _payload(org_id: str, user_id: str, **extra) -> str:
+    return json.dumps({"org_id": org_id, "user_id": user_id, **extra})
+
+
+def test_dispatch_routes_inline_events_by_scope():
+    async def _run():
+        hub = NotificationHub(queue_size=4)
+        mine = hub.subscribe(org_id="o1", user_id="u1")
+        other_user = hub.subscribe(org_id="o1", user_id="u2")
+
+        event = {"event_id": "e1", "created_at": "2026-01-01T00:00:00Z"}
+        assert hub.dispatch(_payload("o1", "u1", event_id="e1", event=event)) == 1
+
+        assert await mine.get(timeout=0.1) == event
+        assert await other_user.get(timeout=0.01) is None
+        return hub.subscriber_count()
+
+    assert asyncio.run(_run()) == 2
+
+
+def test_dispatch_without_inline_event_requests_resync():
+    async def _run():
+        hub = NotificationHub(queue_size=4)
+        sub = hub.subscribe(org_id="o1", user_id="u1")
+        hub.dispatch(_payload("o1", "u1", event_id="e1"))
+        hub.dispatch("not-json")
+        return [await sub.get(timeout=0.1), await sub.get(timeout=0.1)]
+
+    assert asyncio.run(_run()) == [RESYNC, RESYNC]
+
+
+def test_slow_consumer_is_evicted_after_draining():
+    async def _run():
+        hub = NotificationHub(queue_size=2)
+        sub = hub.subscribe(org_id="o1", user_id="u1")
+        for idx in range(3):
+            hub.dispatch(_payload("o1", "u1", event={"event_id": f"e{idx}"}))
+
+        assert sub.evicted
+        assert hub.subscriber_count() == 0
+        drained = [await sub.get(timeout=0.1), await sub.get(timeout=0.1)]
+        return drained, await sub.get(timeout=1.0)
+
+    drained, last = asyncio.run(_run())
+    assert [item["event_id"] for item in drained] == ["e0", "e1"]
+    assert last is None
+
+
+def test_unsubscribe_drops_empty_scope():
+    async def _run():
+        hub = NotificationHub(queue_size=2)
+        sub = hub.subscribe(org_id="o1", user_id="u1")
+        hub.unsubscribe(sub)
+        return hub.dispatch(_payload("o1", "u1", event={"event_id": "e1"})), hub.queue_depth()
+
+    assert asyncio.run(_run()) == (0, 0)
+
+
+def test_notify_payload_inlines_small_events_only():
+    small = json.loads(
+        _notify_payload(org_id="o1", user_id="u1", event={"event_id": "e1", "body": "hi"})
+    )
+    assert small["event"]["body"] == "hi"
+
+    large = json.loads(
+        _notify_payload(org_id="o1", user_id="u1", event={"event_id": "e2", "body": "x" * 9000})
+    )
+    assert large == {"org_id": "o1", "user_id": "u1", "event_id": "e2"}
+
+
+def test_registered_channel_handlers_receive_payloads():
+    received = []
+    hub = NotificationHub(queue_size=2, channel_handlers={"other": received.append})
+
+    hub._call_handler("other", '{"kind": "user"}')
+    hub._call_handler("unknown", "ignored")
+    hub._call_handler("other", None)
+
+    assert received == ['{"kind": "user"}', None]
+
+
+def test_listening_requires_connection_and_registered_channel():
+    hub = NotificationHub(queue_size=2, channel_handlers={"other": lambda payload: None})
+    assert not hub.listening("other")
+
+    hub._set_connected(True)
+    assert hub.listening("other")
+    assert not hub.listening("unknown")
+    hub._set_connected(False)
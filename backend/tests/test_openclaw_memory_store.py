@@ -5,8 +5,13 @@ import json
 import shutil
 
 from app.config import settings
+from app.container import memory_store
 from app.container.memory_store import (
     OPENCLAW_CONFIG_SNAPSHOT_FILENAME,
+    _apply_delta,
+    _encode_delta,
+    compact_memory_versions,
+    load_memory_version,
     reconcile_workspace_memory,
     sync_workspace_memory_to_db,
 )
@@ -403,3 +408,102 @@ def test_reconcile_workspace_memory_applies_openclaw_config_overlay(auth_context
     assert reconciled["agents"]["defaults"]["imageModel"]["primary"] == "openrouter/model-new"
     assert reconciled["tools"]["exec"]["allowlist"] == ["project-cli"]
     assert reconciled["gateway"]["http"]["endpoints"]["chatCompletions"]["enabled"] is False
+
+
+def test_delta_round_trip():
+    base = "".join(f"line {idx}\n" for idx in range(200))
+    target = base.replace("line 50\n", "line fifty\n") + "appended without newline"
+
+    delta = _encode_delta(base, target)
+
+    assert _apply_delta(base, delta) == target
+    assert len(delta) < len(target.encode("utf-8")) // 10
+
+
+def _memory_body(revision: int) -> str:
+    lines = [f"- fact {idx}: remembered across sessions\n" for idx in range(100)]
+    lines[revision] = f"- fact {revision}: revised in revision {revision}\n"
+    return "".join(lines)
+
+
+def _memory_rows(user_id: str):
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT version, storage_kind, content, base_version
+                FROM openclaw_memory_versions
+                WHERE user_id = %s AND filename = 'MEMORY.md'
+                ORDER BY version ASC
+                """,
+                (user_id,),
+            )
+            rows = cur.fetchall()
+            cur.execute(
+                """
+                SELECT current_version, next_version
+                FROM openclaw_memory_heads
+                WHERE user_id = %s AND filename = 'MEMORY.md'
+                """,
+                (user_id,),
+            )
+            return rows, cur.fetchone()
+
+
+def test_older_versions_are_stored_as_deltas_and_rebuilt(auth_context):
+    org_id, user_id = auth_context
+    memory_path = _workspace_dir(user_id) / "MEMORY.md"
+    for revision in range(1, 5):
+        memory_path.write_text(_memory_body(revision))
+        assert sync_workspace_memory_to_db(user_id, org_id=org_id) == {"backed_up": 1}
+
+    rows, head = _memory_rows(user_id)
+
+    assert [row["storage_kind"] for row in rows] == ["delta", "delta", "delta", "full"]
+    assert [row["base_version"] for row in rows] == [2, 3, 4, None]
+    assert rows[-1]["content"] == _memory_body(4)
+    assert head == {"current_version": 4, "next_version": 5}
+    for version in range(1, 5):
+        assert load_memory_version(user_id, "MEMORY.md", version) == _memory_body(version)
+
+
+def test_compact_memory_versions_prunes_past_retention(auth_context):
+    org_id, user_id = auth_context
+    memory_path = _workspace_dir(user_id) / "MEMORY.md"
+    for revision in range(1, 6):
+        memory_path.write_text(_memory_body(revision))
+        sync_workspace_memory_to_db(user_id, org_id=org_id)
+
+    result = compact_memory_versions(retain_versions=2)
+
+    rows, _ = _memory_rows(user_id)
+    assert result["pruned"] >= 3
+    assert [row["version"] for row in rows] == [4, 5]
+    assert load_memory_version(user_id, "MEMORY.md", 4) == _memory_body(4)
+    assert load_memory_version(user_id, "MEMORY.md", 1) is None
+
+
+def test_compact_memory_versions_resumes_after_last_checked_file(auth_context, monkeypatch):
+    org_id, user_id = auth_context
+    memory_path = _workspace_dir(user_id) / "MEMORY.md"
+    for revision in range(1, 4):
+        memory_path.write_text(_memory_body(revision))
+        sync_workspace_memory_to_db(user_id, org_id=org_id)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            # A full row that would not shrink as a delta stays a candidate.
+            cur.execute(
+                """
+                UPDATE openclaw_memory_versions
+                SET storage_kind = 'full', content = 'x', base_version = NULL, delta = NULL
+                WHERE user_id = %s AND filename = 'MEMORY.md' AND version = 1
+                """,
+                (user_id,),
+            )
+        conn.commit()
+    monkeypatch.setattr(memory_store, "_compact_cursor", (user_id, "MEMORY.m"))
+
+    result = compact_memory_versions(max_files=1)
+
+    assert result["compacted"] == 0
+    assert memory_store._compact_cursor == (user_id, "MEMORY.md")
@@ -0,0 +1,122 @@
+"""Tests for the PDF render pool and its result cache."""
+
+import asyncio
+import dataclasses
+import threading
+
+import pytest
+
+from app import pdf_render
+from app.config import settings
+from app.db import db_conn
+
+
+@pytest.fixture()
+def inline_renderer(monkeypatch):
+    """Render on the in-process thread with a fake renderer; returns the call log."""
+    monkeypatch.setattr(
+        pdf_render,
+        "settings",
+        dataclasses.replace(settings, pdf_render_workers=0, pdf_render_max_queue=4),
+    )
+    pdf_render.shutdown_render_pool()
+    calls: list[tuple[str, object, str]] = []
+    release = threading.Event()
+    release.set()
+
+    def _fake_render(template, payload, css):
+        calls.append((template, payload, css))
+        release.wait(5)
+        return b"%PDF-1.7 fake"
+
+    monkeypatch.setattr(pdf_render, "_render_sync", _fake_render)
+    yield calls, release
+    pdf_render.shutdown_render_pool()
+
+
+@pytest.mark.unit
+def test_cache_key_is_stable_and_input_sensitive():
+    key = pdf_render.render_cache_key("cv", {"name": "A", "skills": ["x"]}, "h1 {}")
+
+    assert key == pdf_render.render_cache_key("cv", {"skills": ["x"], "name": "A"}, "h1 {}")
+    assert key != pdf_render.render_cache_key("cv", {"name": "A", "skills": ["x"]}, "h2 {}")
+    assert key != pdf_render.render_cache_key("markdown", {"name": "A", "skills": ["x"]}, "h1 {}")
+    assert key != pdf_render.render_cache_key("cv", {"name": "B", "skills": ["x"]}, "h1 {}")
+
+
+def test_concurrent_identical_renders_share_one_job(inline_renderer):
+    calls, release = inline_renderer
+    release.clear()
+
+    async def _run():
+        first = asyncio.create_task(pdf_render.render_pdf("markdown", "# CV", "body {}"))
+        second = asyncio.create_task(pdf_render.render_pdf("markdown", "# CV", "body {}"))
+        other = asyncio.create_task(pdf_render.render_pdf("markdown", "# Other", "body {}"))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(first, second, other)
+
+    results = asyncio.run(_run())
+
+    assert results == [b"%PDF-1.7 fake"] * 3
+    assert [payload for _, payload, _ in calls] == ["# CV", "# Other"]
+
+
+def test_render_rejected_when_queue_is_full(inline_renderer, monkeypatch):
+    monkeypatch.setattr(
+        pdf_render,
+        "settings",
+        dataclasses.replace(pdf_render.settings, pdf_render_max_queue=0),
+    )
+
+    with pytest.raises(pdf_render.RenderQueueFull):
+        asyncio.run(pdf_render.render_pdf("cv", {"name": "A"}, ""))
+
+
+def test_timed_out_render_stays_pending_until_it_finishes(inline_renderer, monkeypatch):
+    _, release = inline_renderer
+    monkeypatch.setattr(
+        pdf_render,
+        "settings",
+        dataclasses.replace(
+            pdf_render.settings, pdf_render_max_queue=1, pdf_render_timeout_seconds=0.05
+        ),
+    )
+    release.clear()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(pdf_render.render_pdf("cv", {"name": "A"}, ""))
+    # The abandoned render still occupies the worker.
+    with pytest.raises(pdf_render.RenderQueueFull):
+        asyncio.run(pdf_render.render_pdf("cv", {"name": "B"}, ""))
+
+    release.set()
+    pdf_render._get_executor().submit(lambda: None).result(timeout=5)
+    assert pdf_render._pending == 0
+    assert asyncio.run(pdf_render.render_pdf("cv", {"name": "B"}, "")) == b"%PDF-1.7 fake"
+
+
+def test_render_pdf_route_reuses_file_for_identical_input(auth_client, inline_renderer):
+    calls, _ = inline_renderer
+    body = {"markdown": "# Jane Doe", "css": "body { color: #111; }", "filename": "cv.pdf"}
+
+    first = auth_client.post("/files/render-pdf", json=body)
+    second = auth_client.post("/files/render-pdf", json=body)
+    restyled = auth_client.post("/files/render-pdf", json={**body, "css": "body {}"})
+
+    assert first.status_code == 201, first.text
+    assert second.json()["file_id"] == first.json()["file_id"]
+    assert restyled.json()["file_id"] != first.json()["file_id"]
+    assert len(calls) == 2
+
+    content = auth_client.get(f"/files/{first.json()['file_id']}")
+    assert content.content == b"%PDF-1.7 fake"
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT render_cache_key FROM files WHERE file_id = %s",
+                (first.json()["file_id"],),
+            )
+            assert cur.fetchone()["render_cache_key"] == pdf_render.render_cache_key(
+                "markdown", body["markdown"], body["css"]
+            )
@@ -0,0 +1,128 @@
+"""Tests for the concurrent web-push delivery engine."""
+
+import dataclasses
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from pywebpush import WebPushException
+
+from app import push_worker
+from app.config import settings
+from app.push_worker import PushDelivery, PushDeliveryEngine
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    monkeypatch.setattr(
+        "app.push_worker.settings",
+        dataclasses.replace(settings, push_worker_backoff_seconds=0.01),
+    )
+
+
+def _delivery(idx: int, host: str = "push.example.com") -> PushDelivery:
+    endpoint = f"https://{host}/send/{idx}"
+    return PushDelivery(
+        push_id="p1",
+        subscription_id=f"s{idx}",
+        endpoint=endpoint,
+        subscription={"endpoint": endpoint},
+        payload={"title": "hi"},
+    )
+
+
+def _push_error(status_code: int, headers: dict | None = None) -> WebPushException:
+    response = SimpleNamespace(status_code=status_code, headers=headers or {})
+    return WebPushException(f"HTTP {status_code}", response=response)
+
+
+def test_per_host_concurrency_is_bounded(monkeypatch):
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def fake_send(subscription, payload):
+        host = subscription["endpoint"].split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+
+    monkeypatch.setattr(push_worker, "_send", fake_send)
+    engine = PushDeliveryEngine(max_workers=8, per_host_limit=2, max_retries=0)
+    try:
+        deliveries = [_delivery(i, "a.example") for i in range(6)]
+        deliveries += [_delivery(i, "b.example") for i in range(6, 12)]
+        results = engine.deliver_all(deliveries)
+    finally:
+        engine.shutdown()
+
+    assert [r.outcome for r in results] == ["sent"] * 12
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+def test_rate_limited_send_is_retried(monkeypatch):
+    calls: list[str] = []
+
+    def fake_send(subscription, payload):
+        calls.append(subscription["endpoint"])
+        if len(calls) == 1:
+            raise _push_error(429, {"Retry-After": "0"})
+
+    monkeypatch.setattr(push_worker, "_send", fake_send)
+    engine = PushDeliveryEngine(max_workers=1, per_host_limit=1, max_retries=2)
+    try:
+        [result] = engine.deliver_all([_delivery(1)])
+    finally:
+        engine.shutdown()
+
+    assert result.outcome == "sent"
+    assert len(calls) == 2
+
+
+def test_expired_and_failed_outcomes(monkeypatch):
+    def fake_send(subscription, payload):
+        if subscription["endpoint"].endswith("/1"):
+            raise _push_error(410)
+        if subscription["endpoint"].endswith("/2"):
+            raise _push_error(503)
+        raise _push_error(400)
+
+    monkeypatch.setattr(push_worker, "_send", fake_send)
+    engine = PushDeliveryEngine(max_workers=2, per_host_limit=2, max_retries=1)
+    try:
+        results = engine.deliver_all([_delivery(1), _delivery(2), _delivery(3)])
+    finally:
+        engine.shutdown()
+
+    assert [r.outcome for r in results] == ["expired", "failed", "failed"]
+    assert results[1].error and "503" in results[1].error
+
+
+def test_busy_host_does_not_hold_every_thread(monkeypatch):
+    lock = threading.Lock()
+    order: list[str] = []
+
+    def fake_send(subscription, payload):
+        host = subscription["endpoint"].split("/")[2]
+        if host == "busy.example":
+            time.sleep(0.02)
+        with lock:
+            order.append(host)
+
+    monkeypatch.setattr(push_worker, "_send", fake_send)
+    engine = PushDeliveryEngine(max_workers=2, per_host_limit=1, max_retries=0)
+    try:
+        deliveries = [_delivery(i, "busy.example") for i in range(8)]
+        deliveries.append(_delivery(8, "quiet.example"))
+        results = engine.deliver_all(deliveries)
+    finally:
+        engine.shutdown()
+
+    assert [r.outcome for r in results] == ["sent"] * 9
+    assert order.index("quiet.example") <= 1
@@ -0,0 +1,208 @@
+"""Differential tests: compiled SHACL shapes against pyshacl."""
+
+from __future__ import annotations
+
+import ast
+import copy
+import json
+import re
+from pathlib import Path
+
+import pytest
+from pyshacl import validate
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, RDFS, XSD
+
+from app.validation.item_validator import APP, SCHEMA, _item_triples
+from app.validation.shacl_compiled import UnsupportedShapesError, compile_shapes
+from app.validation.shacl_validator import _parse_violation_report, validate_shacl
+
+pytestmark = pytest.mark.unit
+
+FIXTURES = Path(__file__).parent / "fixtures"
+EX = Namespace("urn:example:")
+_IN_LIST = re.compile(r"not in list (\[.*\])$")
+
+
+def _fixture_items() -> list[dict]:
+    items = [
+        record["item"]
+        for record in json.loads((FIXTURES / "native_export.sample.json").read_text())
+    ]
+    legacy = json.loads((FIXTURES / "native_export_legacy.sample.json").read_text())
+    return items + [record["thing"] for record in legacy]
+
+
+def _person(**overrides: object) -> dict:
+    person = {
+        "@type": "Person",
+        "name": "Ada Lovelace",
+        "additionalProperty": [
+            {"@type": "PropertyValue", "propertyID": "app:orgRef", "value": "org-1"},
+            {"@type": "PropertyValue", "propertyID": "app:orgRole", "value": "founder"},
+        ],
+    }
+    person.update(overrides)
+    return person
+
+
+def _with_property(item: dict, property_id: str, *values: object) -> dict:
+    mutated = copy.deepcopy(item)
+    props = [
+        entry
+        for entry in mutated.get("additionalProperty") or []
+        if entry.get("propertyID") != property_id
+    ]
+    props += [{"propertyID": property_id, "value": value} for value in values]
+    mutated["additionalProperty"] = props
+    return mutated
+
+
+def _corpus() -> list[dict]:
+    items = _fixture_items() + [_person()]
+    corpus = list(items)
+    for item in items:
+        corpus.append({**item, "name": "  "})
+        corpus.append({key: value for key, value in item.items() if key != "name"})
+        corpus.append({**item, "@type": "DigitalDocument"})
+        corpus.append({**item, "@type": "Person"})
+        corpus.append(_with_property(item, "app:bucket"))
+        corpus.append(_with_property(item, "app:bucket", "Next"))
+        corpus.append(_with_property(item, "app:bucket", "next", "archived"))
+        corpus.append(_with_property(item, "app:rawCapture", "buy milk"))
+        corpus.append(_with_property(item, "app:orgRef", 42))
+        corpus.append(_with_property(item, "app:orgRole", "owner"))
+        corpus.append(_with_property(item, "app:orgRole"))
+    return corpus
+
+
+def _normalize(violations: list[dict]) -> list[tuple]:
+    """Sort results and the ``sh:in`` list, which pyshacl renders in set order."""
+    normalized = []
+    for violation in violations:
+        message = _IN_LIST.sub(
+            lambda match: f"not in list {sorted(ast.literal_eval(match.group(1)))}",
+            violation["message"],
+        )
+        normalized.append(
+            (violation.get("focus_node"), violation["code"], violation["field"], message)
+        )
+    return sorted(normalized)
+
+
+def _graph(triples) -> Graph:
+    graph = Graph()
+    graph.bind("schema", SCHEMA)
+    graph.bind("app", APP)
+    for triple in triples:
+        graph.add(triple)
+    return graph
+
+
+def _assert_same(graph: Graph) -> list[dict]:
+    compiled = validate_shacl(graph, engine="compiled")
+    assert _normalize(compiled) == _normalize(validate_shacl(graph, engine="pyshacl"))
+    return compiled
+
+
+class TestDifferential:
+    @pytest.mark.parametrize("index", range(len(_corpus())))
+    def test_item_matches_pyshacl(self, index):
+        _assert_same(_graph(_item_triples(_corpus()[index])))
+
+    def test_corpus_in_one_graph_matches_pyshacl(self):
+        triples = [
+            triple
+            for index, item in enumerate(_corpus())
+            for triple in _item_triples(item, URIRef(f"urn:item:{index + 1}"))
+        ]
+
+        violations = _assert_same(_graph(triples))
+
+        assert {violation["field"] for violation in violations} == {
+            "name",
+            "urn:app:property:bucket",
+            "urn:app:property:orgRef",
+            "urn:app:property:orgRole",
+        }
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Literal(5),
+            Literal("next", lang="en"),
+            Literal("next", datatype=XSD.string),
+            Literal("2026-01-01", datatype=XSD.date),
+            URIRef("urn:app:bucket:next"),
+        ],
+    )
+    def test_non_plain_values_match_pyshacl(self, value):
+        subject = URIRef("urn:item:1")
+        violations = _assert_same(
+            _graph([(subject, RDF.type, SCHEMA.Action), (subject, APP.bucket, value)])
+        )
+
+        # sh:in compares RDF terms, so even "next"^^xsd:string is not the listed "next".
+        assert violations
+
+    def test_pattern_and_flags_match_pyshacl(self):
+        shapes = Graph().parse(
+            data="""
+            @prefix sh: <http://www.w3.org/ns/shacl#> .
+            @prefix ex: <urn:example:> .
+            ex:CodeShape a sh:NodeShape ;
+              sh:targetClass ex:Thing ;
+              sh:property [ sh:path ex:code ; sh:pattern "^ab-[0-9]+$" ; sh:flags "i" ] ;
+              sh:property [ sh:path ex:tag ; sh:pattern "^x" ; sh:pattern "y$" ] .
+            """,
+            format="turtle",
+        )
+        data = Graph()
+        data.bind("ex", EX)
+        for index, (code, tag) in enumerate(
+            [("AB-12", "xy"), ("ab-x", "xz"), ("zz", "ay"), ("ab-1", "ab")], start=1
+        ):
+            subject = EX[f"thing{index}"]
+            data.add((subject, RDF.type, EX.Thing))
+            data.add((subject, EX.code, Literal(code)))
+            data.add((subject, EX.tag, Literal(tag)))
+
+        compiled = compile_shapes(shapes).validate(data, data.namespace_manager)
+        conforms, report_graph, report_text = validate(data, shacl_graph=shapes)
+
+        assert not conforms
+        assert _normalize(compiled) == _normalize(
+            _parse_violation_report(report_graph, report_text)
+        )
+
+
+class TestEngineSelection:
+    def test_rdfs_schema_in_data_uses_pyshacl(self):
+        subject = URIRef("urn:item:1")
+        graph = _graph([(EX.Task, RDFS.subClassOf, SCHEMA.Action), (subject, RDF.type, EX.Task)])
+
+        violations = validate_shacl(graph)
+
+        # Only RDFS inference makes the node a schema:Action missing its bucket.
+        assert [violation["field"] for violation in violations] == ["urn:app:property:bucket"]
+
+    def test_unsupported_constraints_are_rejected(self):
+        shapes = Graph().parse(
+            data="""
+            @prefix sh: <http://www.w3.org/ns/shacl#> .
+            @prefix ex: <urn:example:> .
+            ex:Shape a sh:NodeShape ;
+              sh:targetClass ex:Thing ;
+              sh:property [ sh:path ex:code ; sh:maxCount 1 ] .
+            """,
+            format="turtle",
+        )
+
+        with pytest.raises(UnsupportedShapesError, match="maxCount"):
+            compile_shapes(shapes)
+
+    def test_abort_on_first_stops_after_one_violation(self):
+        graph = _graph(_item_triples(_person(name=None, additionalProperty=[])))
+
+        assert len(validate_shacl(graph, engine="compiled")) == 3
+        assert len(validate_shacl(graph, abort_on_first=True, engine="compiled")) == 1
@@ -36,6 +36,13 @@ def test_read_text(storage: LocalStorage) -> None:
     assert storage.read_text("files/abc") == "hallo welt"
 
 
+def test_open_streams_bytes(storage: LocalStorage) -> None:
+    storage.write("files/abc", b"hello world")
+    with storage.open("files/abc") as fh:
+        assert fh.read(5) == b"hello"
+        assert fh.read() == b" world"
+
+
 def test_write_creates_parent_dirs(storage: LocalStorage) -> None:
     storage.write("a/b/c/deep", b"data")
     assert storage.read("a/b/c/deep") == b"data"
@@ -0,0 +1,206 @@
+"""Tests for memoized item validation and CEL rule results."""
+
+import dataclasses
+import os
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.config import settings
+from app.imports.shared import _hash_payload
+from app.validation import cache, cel_evaluator, item_validator, shacl_validator
+from app.validation.item_validator import validate_item_create, validate_items_create
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(
+        cache, "settings", dataclasses.replace(settings, validation_cache_max_entries=100)
+    )
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def validated(monkeypatch) -> list[list[dict]]:
+    """Records the items that actually reach SHACL/CEL validation."""
+    calls: list[list[dict]] = []
+    validate = item_validator._validate_items_create
+
+    def _spy(items: list[dict]) -> list[list[dict[str, object]]]:
+        calls.append(items)
+        return validate(items)
+
+    monkeypatch.setattr(item_validator, "_validate_items_create", _spy)
+    return calls
+
+
+def _lookups(cache_name: str, result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "app_validation_cache_lookups_total", {"cache": cache_name, "result": result}
+        )
+        or 0.0
+    )
+
+
+def _action(name: str, bucket: str = "next") -> dict:
+    return {
+        "@type": "Action",
+        "name": name,
+        "additionalProperty": [{"propertyID": "app:bucket", "value": bucket}],
+    }
+
+
+def test_identical_items_are_validated_once(validated):
+    hits_before = _lookups("item", "hit")
+
+    first = validate_item_create(_action("Invalid", bucket="later"))
+    first[0]["message"] = "changed by caller"
+    second = validate_item_create(_action("Invalid", bucket="later"))
+
+    assert len(validated) == 1
+    assert second == validate_item_create(_action("Invalid", bucket="later"))
+    assert second[0]["message"] != "changed by caller"
+    assert _lookups("item", "hit") == hits_before + 2
+
+
+def test_batch_validates_only_unseen_items(validated):
+    seen = _action("Seen")
+    validate_item_create(seen)
+
+    results = validate_items_create([seen, _action("New"), _action("Bad", bucket="later")])
+
+    assert validated[-1] == [_action("New"), _action("Bad", bucket="later")]
+    assert [bool(issues) for issues in results] == [False, False, True]
+
+
+def test_given_content_hash_is_the_cache_key(validated):
+    item = _action("Hashed")
+
+    validate_item_create(item, content_hash=_hash_payload(item))
+    validate_item_create(item)
+
+    assert len(validated) == 1
+
+
+def test_zero_max_entries_disables_the_cache(monkeypatch, validated):
+    monkeypatch.setattr(
+        cache, "settings", dataclasses.replace(settings, validation_cache_max_entries=0)
+    )
+
+    validate_item_create(_action("Uncached"))
+    validate_item_create(_action("Uncached"))
+
+    assert len(validated) == 2
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setattr(
+        cache, "settings", dataclasses.replace(settings, validation_cache_max_entries=2)
+    )
+
+    for name in ("a", "b", "c"):
+        validate_item_create(_action(name))
+
+    assert len(cache._item_cache) == 2
+
+
+def test_rule_results_are_memoized_per_context():
+    context = {"operation": "create", "bucket": "later"}
+    hits_before = _lookups("rules", "hit")
+
+    first = cel_evaluator.evaluate_rules(context)
+    second = cel_evaluator.evaluate_rules(dict(context))
+
+    assert first == second
+    assert first
+    assert _lookups("rules", "hit") == hits_before + 1
+
+
+def test_changed_shapes_file_invalidates_and_reloads(monkeypatch, tmp_path, validated):
+    shapes_path = tmp_path / "entities.ttl"
+    shapes_path.write_text(shacl_validator._SHAPES_PATH.read_text())
+    monkeypatch.setattr(shacl_validator, "_SHAPES_PATH", shapes_path)
+    monkeypatch.setattr(
+        cache,
+        "_sources",
+        (cache._SourceFile(shapes_path), cache._SourceFile(cel_evaluator._RULES_PATH)),
+    )
+    shacl_validator.reset_shapes()
+    project = {"@type": "Project", "additionalProperty": []}
+
+    assert validate_item_create(project)[0]["code"] == "PROJECT_NAME_REQUIRED"
+
+    shapes_path.write_text(
+        shapes_path.read_text().replace(
+            "app:ProjectShape a sh:NodeShape ;\n  sh:targetClass schema:Project ;",
+            "app:ProjectShape a sh:NodeShape ;\n  sh:targetClass app:Nothing ;",
+        )
+    )
+    stat = shapes_path.stat()
+    os.utime(shapes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    try:
+        assert validate_item_create(project) == []
+        assert len(validated) == 2
+    finally:
+        monkeypatch.undo()
+        shacl_validator.reset_shapes()
+
+
+class _SharedResults:
+    """Stands in for the caller's cursor over the ``validation_results`` table."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, list[dict]] = {}
+        self._fetched: list[dict] = []
+
+    def execute(self, query: str, params: tuple) -> None:
+        if query is cache._SHARED_SELECT_SQL:
+            digests = params[0]
+            self._fetched = [
+                {"content_hash": digest, "issues": self.rows[digest]}
+                for digest in digests
+                if digest in self.rows
+            ]
+        else:
+            assert query is cache._SHARED_INSERT_SQL
+            _, _, digests, issues = params
+            for digest, value in zip(digests, issues, strict=True):
+                self.rows.setdefault(digest, value.obj)
+
+    def fetchall(self) -> list[dict]:
+        return self._fetched
+
+
+def test_outcomes_are_shared_through_the_callers_cursor(validated):
+    shared = _SharedResults()
+    item = _action("Shared", bucket="later")
+
+    first = validate_item_create(item, cur=shared)
+    assert list(shared.rows) == [_hash_payload(item)]
+
+    # Another process: empty in-memory cache, same table.
+    cache.clear()
+    hits_before = _lookups("shared", "hit")
+    assert validate_item_create(item, cur=shared) == first
+    assert len(validated) == 1
+    assert _lookups("shared", "hit") == hits_before + 1
+
+
+def test_zero_shared_max_rows_skips_the_table(monkeypatch, validated):
+    monkeypatch.setattr(
+        cache,
+        "settings",
+        dataclasses.replace(
+            settings, validation_cache_max_entries=100, validation_cache_shared_max_rows=0
+        ),
+    )
+    shared = _SharedResults()
+
+    validate_item_create(_action("Local"), cur=shared)
+
+    assert shared.rows == {}
@@ -0,0 +1,76 @@
+"""Tests for the shared ``validation_results`` tier of the validation cache."""
+
+import dataclasses
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.db import db_conn
+from app.imports.shared import _hash_payload
+from app.validation import cache, item_validator
+from app.validation.item_validator import validate_item_create
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(app, monkeypatch):
+    monkeypatch.setattr(
+        cache, "settings", dataclasses.replace(settings, validation_cache_max_entries=100)
+    )
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _action(name: str) -> dict:
+    return {
+        "@type": "Action",
+        "name": f"{name} {uuid.uuid4()}",
+        "additionalProperty": [{"propertyID": "app:bucket", "value": "later"}],
+    }
+
+
+def _shared_rows(digest: str) -> list[dict]:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT shapes_version, issues FROM validation_results WHERE content_hash = %s",
+                (digest,),
+            )
+            return cur.fetchall()
+
+
+def test_committed_outcomes_are_reused_by_other_processes(monkeypatch):
+    item = _action("Shared")
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            issues = validate_item_create(item, cur=cur)
+        conn.commit()
+    assert issues
+    assert [row["issues"] for row in _shared_rows(_hash_payload(item))] == [issues]
+
+    cache.clear()
+    monkeypatch.setattr(
+        item_validator,
+        "_validate_items_create",
+        lambda items: pytest.fail("validated again despite a shared outcome"),
+    )
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            assert validate_item_create(item, cur=cur) == issues
+
+
+def test_prune_drops_outcomes_of_superseded_versions():
+    item = _action("Stale")
+    digest = _hash_payload(item)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            validate_item_create(item, cur=cur)
+            cur.execute(
+                "UPDATE validation_results SET shapes_version = 'old' WHERE content_hash = %s",
+                (digest,),
+            )
+        conn.commit()
+
+    assert cache.prune_shared_results() >= 1
+    assert _shared_rows(digest) == []
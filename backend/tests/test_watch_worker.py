@@ -54,6 +54,7 @@ class TestProcessNotifications:
                 "connection_id": "conn-1",
                 "org_id": "org-1",
                 "user_id": "user-1",
+                "trigger": "push",
             },
         )
         client.acknowledge.assert_called_once_with(["ack_1"])
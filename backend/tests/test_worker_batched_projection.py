@@ -0,0 +1,259 @@
+"""Tests for batched item search projection in the outbox worker."""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app import worker
+from app.db import db_conn, jsonb
+from app.worker import process_batch
+
+
+@pytest.fixture(autouse=True)
+def _clean_outbox(app):
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM outbox_events WHERE processed_at IS NULL")
+        conn.commit()
+    yield
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM outbox_events WHERE processed_at IS NULL")
+        conn.commit()
+
+
+@pytest.fixture()
+def search_calls(monkeypatch):
+    calls: dict[str, list] = {"index": [], "delete": []}
+    monkeypatch.setattr("app.worker.is_enabled", lambda: True)
+    monkeypatch.setattr(
+        "app.worker.index_items",
+        lambda rows: calls["index"].append([str(row["item_id"]) for row in rows]),
+    )
+    monkeypatch.setattr(
+        "app.worker.delete_items",
+        lambda item_ids: calls["delete"].append(list(item_ids)),
+    )
+    return calls
+
+
+def _insert_item(org_id: str, user_id: str) -> str:
+    item_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO items
+                    (item_id, org_id, created_by_user_id, canonical_id,
+                     schema_jsonld, source, content_hash,
+                     created_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    item_id,
+                    org_id,
+                    user_id,
+                    f"urn:app:action:{uuid.uuid4().hex[:16]}",
+                    jsonb({"@type": "Action", "name": "Batched item"}),
+                    "manual",
+                    uuid.uuid4().hex,
+                    now,
+                    now,
+                ),
+            )
+        conn.commit()
+    return item_id
+
+
+def _insert_event(event_type: str, payload: dict) -> str:
+    event_id = str(uuid.uuid4())
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO outbox_events (event_id, event_type, payload)
+                VALUES (%s, %s, %s)
+                """,
+                (event_id, event_type, jsonb(payload)),
+            )
+        conn.commit()
+    return event_id
+
+
+def _event(event_id: str) -> dict:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT * FROM outbox_events WHERE event_id = %s", (event_id,))
+            return cur.fetchone()
+
+
+def _job(org_id: str, item_id: str) -> dict | None:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT status, action, last_error
+                FROM search_index_jobs
+                WHERE org_id = %s AND entity_type = 'item' AND entity_id = %s
+                """,
+                (org_id, item_id),
+            )
+            return cur.fetchone()
+
+
+def test_upserts_are_indexed_with_one_call(auth_context, search_calls):
+    org_id, user_id = auth_context
+    item_ids = [_insert_item(org_id, user_id) for _ in range(3)]
+    event_ids = [
+        _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+        for item_id in item_ids
+    ]
+
+    assert process_batch(limit=10, batched=True) == 3
+
+    assert len(search_calls["index"]) == 1
+    assert sorted(search_calls["index"][0]) == sorted(item_ids)
+    assert search_calls["delete"] == []
+    assert all(_event(event_id)["processed_at"] is not None for event_id in event_ids)
+    assert all(_job(org_id, item_id)["status"] == "succeeded" for item_id in item_ids)
+
+
+def test_repeated_events_for_one_item_are_coalesced(auth_context, search_calls):
+    org_id, user_id = auth_context
+    item_id = _insert_item(org_id, user_id)
+    payload = {"org_id": org_id, "item_id": item_id}
+    event_ids = [
+        _insert_event("item_upserted", payload),
+        _insert_event("item_upserted", payload),
+        _insert_event("item_archived", payload),
+    ]
+
+    assert process_batch(limit=10, batched=True) == 3
+
+    assert search_calls["index"] == []
+    assert search_calls["delete"] == [[item_id]]
+    assert all(_event(event_id)["processed_at"] is not None for event_id in event_ids)
+    job = _job(org_id, item_id)
+    assert job["status"] == "succeeded"
+    assert job["action"] == "delete"
+
+
+def test_missing_item_fails_only_its_events(auth_context, search_calls):
+    org_id, user_id = auth_context
+    present = _insert_item(org_id, user_id)
+    missing = str(uuid.uuid4())
+    ok_event = _insert_event("item_upserted", {"org_id": org_id, "item_id": present})
+    bad_event = _insert_event("item_upserted", {"org_id": org_id, "item_id": missing})
+
+    assert process_batch(limit=10, batched=True) == 1
+
+    assert search_calls["index"] == [[present]]
+    assert _event(ok_event)["processed_at"] is not None
+    bad = _event(bad_event)
+    assert bad["processed_at"] is None
+    assert bad["attempts"] == 1
+    assert "item not found" in bad["last_error"]
+    assert _job(org_id, missing)["status"] == "failed"
+
+
+def test_meili_failure_keeps_events_retryable(auth_context, search_calls, monkeypatch):
+    org_id, user_id = auth_context
+    item_id = _insert_item(org_id, user_id)
+    event_id = _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+
+    def _boom(rows):
+        raise RuntimeError("meili down")
+
+    monkeypatch.setattr("app.worker.index_items", _boom)
+
+    assert process_batch(limit=10, batched=True) == 0
+
+    row = _event(event_id)
+    assert row["processed_at"] is None
+    assert row["attempts"] == 1
+    assert _job(org_id, item_id)["status"] == "failed"
+
+
+def test_search_disabled_marks_jobs_skipped(auth_context, monkeypatch):
+    org_id, user_id = auth_context
+    monkeypatch.setattr("app.worker.is_enabled", lambda: False)
+    item_id = _insert_item(org_id, user_id)
+    event_id = _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+
+    assert process_batch(limit=10, batched=True) == 1
+
+    assert _event(event_id)["processed_at"] is not None
+    job = _job(org_id, item_id)
+    assert job["status"] == "skipped"
+    assert job["last_error"] == "Search disabled"
+
+
+def test_invalid_item_id_fails_only_its_event(auth_context, search_calls):
+    org_id, user_id = auth_context
+    item_id = _insert_item(org_id, user_id)
+    ok_event = _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+    bad_event = _insert_event("item_upserted", {"org_id": org_id, "item_id": "not-a-uuid"})
+
+    assert process_batch(limit=10, batched=True) == 1
+
+    assert search_calls["index"] == [[item_id]]
+    assert _event(ok_event)["processed_at"] is not None
+    bad = _event(bad_event)
+    assert bad["processed_at"] is None
+    assert bad["attempts"] == 1
+    assert bad["last_error"] == "invalid item_id"
+
+
+def test_unbatched_mode_processes_events_one_by_one(auth_context, monkeypatch):
+    org_id, user_id = auth_context
+    indexed: list[str] = []
+    monkeypatch.setattr("app.worker.is_enabled", lambda: True)
+    monkeypatch.setattr("app.worker.index_item", lambda row: indexed.append(str(row["item_id"])))
+    item_ids = [_insert_item(org_id, user_id) for _ in range(2)]
+    for item_id in item_ids:
+        _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+
+    assert process_batch(limit=10, batched=False) == 2
+
+    assert indexed == item_ids
+
+
+def test_failed_db_step_falls_back_before_any_search_call(auth_context, search_calls, monkeypatch):
+    org_id, user_id = auth_context
+    item_id = _insert_item(org_id, user_id)
+    event_id = _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+    refresh = worker.refresh_item_projection
+    refreshes: list[list[str]] = []
+
+    def _fail_first(cur, item_ids):
+        refreshes.append(list(item_ids))
+        if len(refreshes) == 1:
+            raise RuntimeError("projection failed")
+        return refresh(cur, item_ids)
+
+    indexed: list[str] = []
+    monkeypatch.setattr("app.worker.refresh_item_projection", _fail_first)
+    monkeypatch.setattr("app.worker.index_item", lambda row: indexed.append(str(row["item_id"])))
+
+    assert process_batch(limit=10, batched=True) == 1
+
+    assert search_calls["index"] == []
+    assert indexed == [item_id]
+    assert _event(event_id)["processed_at"] is not None
+
+
+def test_pushes_are_sent_after_the_batch_commits(auth_context, search_calls, monkeypatch):
+    org_id, user_id = auth_context
+    item_id = _insert_item(org_id, user_id)
+    event_id = _insert_event("item_upserted", {"org_id": org_id, "item_id": item_id})
+    committed_at_push: list[bool] = []
+    monkeypatch.setattr(
+        "app.worker._emit_index_event",
+        lambda **kwargs: committed_at_push.append(_event(event_id)["processed_at"] is not None),
+    )
+
+    assert process_batch(limit=10, batched=True) == 1
+
+    assert committed_at_push == [True]
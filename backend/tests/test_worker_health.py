@@ -115,3 +115,34 @@ class TestHealthServer:
             body = resp.read().decode("utf-8")
             assert "worker_batches_total" in body
             assert "worker_events_total" in body
+
+
+class TestPartitionHealth:
+    def test_stale_partition_makes_worker_unhealthy(self):
+        state = WorkerHealthState("test", poll_interval=0.05, staleness_multiplier=2.0)
+        state.touch("0")
+        state.touch("1")
+        time.sleep(0.15)
+        state.touch("0")
+        assert state.is_healthy() is False
+        state.touch("1")
+        assert state.is_healthy() is True
+
+    def test_health_reports_partition_lag(self):
+        port = _free_port()
+        state = WorkerHealthState("partitioned-worker", poll_interval=10.0)
+        state.touch("0")
+        state.record_partition_lag("0", pending=4, lag_seconds=1.5)
+        start_health_server(state, port)
+        time.sleep(0.1)
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health") as resp:
+            body = json.loads(resp.read())
+        assert body["partitions"]["0"]["pending"] == 4
+        assert body["partitions"]["0"]["lag_seconds"] == 1.5
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+            metrics = resp.read().decode("utf-8")
+        assert 'worker_partition_lag_seconds{partition="0",worker="partitioned-worker"} 1.5' in (
+            metrics
+        )
@@ -0,0 +1,90 @@
+"""Tests for org-partitioned outbox consumers."""
+
+import uuid
+
+import pytest
+
+from app.db import db_conn, jsonb
+from app.worker import partition_backlog, process_batch
+
+
+@pytest.fixture(autouse=True)
+def _clean_outbox(app):
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM outbox_events WHERE processed_at IS NULL")
+        conn.commit()
+    yield
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM outbox_events WHERE processed_at IS NULL")
+        conn.commit()
+
+
+def _insert_event(org_id: str) -> str:
+    # Unknown event types are acknowledged without side effects.
+    event_id = str(uuid.uuid4())
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO outbox_events (event_id, event_type, payload)
+                VALUES (%s, %s, %s)
+                """,
+                (event_id, "partition_probe", jsonb({"org_id": org_id})),
+            )
+        conn.commit()
+    return event_id
+
+
+def _processed(event_ids: list[str]) -> set[str]:
+    with db_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT event_id FROM outbox_events
+                WHERE event_id = ANY(%s::uuid[]) AND processed_at IS NOT NULL
+                """,
+                (event_ids,),
+            )
+            return {str(row["event_id"]) for row in cur.fetchall()}
+
+
+def test_partitions_split_events_by_org():
+    events_by_org = {str(uuid.uuid4()): [] for _ in range(8)}
+    for org_id, event_ids in events_by_org.items():
+        event_ids.extend(_insert_event(org_id) for _ in range(3))
+
+    claimed_by_partition = []
+    for partition in range(3):
+        before = _processed([e for ids in events_by_org.values() for e in ids])
+        process_batch(limit=100, partition=partition, partitions=3)
+        after = _processed([e for ids in events_by_org.values() for e in ids])
+        claimed_by_partition.append(after - before)
+
+    all_ids = {e for ids in events_by_org.values() for e in ids}
+    assert set().union(*claimed_by_partition) == all_ids
+    for org_ids in events_by_org.values():
+        owners = [i for i, claimed in enumerate(claimed_by_partition) if claimed & set(org_ids)]
+        # Every event of an org lands in exactly one partition.
+        assert len(owners) == 1
+        assert set(org_ids) <= claimed_by_partition[owners[0]]
+
+
+def test_partition_backlog_reports_pending_and_lag():
+    org_id = str(uuid.uuid4())
+    _insert_event(org_id)
+    _insert_event(org_id)
+
+    totals = [partition_backlog(partition, 2) for partition in range(2)]
+
+    assert sum(pending for pending, _ in totals) == 2
+    assert partition_backlog() == (2, pytest.approx(max(lag for _, lag in totals), abs=1.0))
+
+    process_batch(limit=10)
+    assert partition_backlog() == (0, 0.0)
+
+
+def test_partition_out_of_range_is_rejected():
+    with pytest.raises(ValueError):
+        process_batch(limit=10, partition=2, partitions=2)
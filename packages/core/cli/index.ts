@@ -1,6 +1,6 @@
 #!/usr/bin/env node
 
-import { Command } from "commander";
+import { Command, CommanderError } from "commander";
 
 import { ApiError } from "../client/http.js";
 import { registerAuthCommands } from "./auth.js";
@@ -15,14 +15,21 @@ import { registerNotificationsCommands } from "./notifications.js";
 import { registerOrgsCommands } from "./orgs.js";
 import { registerProjectsCommands } from "./projects.js";
 import { registerProposalsCommands } from "./proposals.js";
+import { serveWorker } from "./worker.js";
 import { ValidationError } from "../validation/index.js";
 
+const WORKER_FLAG = "--worker";
+
 function wantsJson(argv: string[]): boolean {
   return argv.includes("--json");
 }
 
-async function main(argv: string[]): Promise<void> {
+function buildProgram(options: { exitOverride?: boolean } = {}): Command {
   const program = new Command();
+  if (options.exitOverride) {
+    // Set before registering commands so subcommands inherit it.
+    program.exitOverride();
+  }
 
   program
     .name("project-cli")
@@ -51,12 +58,15 @@ async function main(argv: string[]): Promise<void> {
   registerNotificationsCommands(program);
   registerProposalsCommands(program);
 
-  await program.parseAsync(argv);
+  return program;
 }
 
-main(process.argv).catch((error) => {
-  const json = wantsJson(process.argv);
+async function main(argv: string[]): Promise<void> {
+  await buildProgram().parseAsync(argv);
+}
 
+/** Print a failed command's error and return its exit code. */
+function reportError(error: unknown, json: boolean): number {
   if (error instanceof ApiError) {
     const exitCode = mapHttpStatusToExitCode(error.status);
     if (json) {
@@ -70,7 +80,7 @@ main(process.argv).catch((error) => {
         `${errorCodeFromStatus(error.status)} (${error.status}): ${error.message}\n`,
       );
     }
-    process.exit(exitCode);
+    return exitCode;
   }
 
   if (error instanceof ValidationError) {
@@ -84,7 +94,7 @@ main(process.argv).catch((error) => {
     } else {
       process.stderr.write(`VALIDATION_FAILED: ${error.message}\n`);
     }
-    process.exit(4);
+    return 4;
   }
 
   const message = error instanceof Error ? error.message : String(error);
@@ -96,5 +106,31 @@ main(process.argv).catch((error) => {
   } else {
     process.stderr.write(`REQUEST_FAILED: ${message}\n`);
   }
-  process.exit(2);
-});
+  return 2;
+}
+
+/** Run one command inside a worker process without exiting it. */
+async function runInWorker(args: string[]): Promise<number> {
+  const program = buildProgram({ exitOverride: true });
+  try {
+    await program.parseAsync([process.argv[0], process.argv[1], ...args]);
+    return 0;
+  } catch (error) {
+    if (error instanceof CommanderError) {
+      // Commander already printed usage/help output.
+      return error.exitCode;
+    }
+    return reportError(error, wantsJson(args));
+  }
+}
+
+if (process.argv[2] === WORKER_FLAG) {
+  serveWorker(runInWorker).catch((error) => {
+    process.stderr.write(`worker failed: ${error instanceof Error ? error.message : error}\n`);
+    process.exit(1);
+  });
+} else {
+  main(process.argv).catch((error) => {
+    process.exit(reportError(error, wantsJson(process.argv)));
+  });
+}
@@ -0,0 +1,66 @@
+import { afterEach, describe, expect, it } from "vitest";
+
+import { handleRequest } from "./worker.js";
+
+describe("handleRequest", () => {
+  const originalToken = process.env.COPILOT_TOKEN;
+
+  afterEach(() => {
+    if (originalToken === undefined) {
+      delete process.env.COPILOT_TOKEN;
+    } else {
+      process.env.COPILOT_TOKEN = originalToken;
+    }
+  });
+
+  it("captures output and exit code per request", async () => {
+    const response = await handleRequest(
+      async (argv) => {
+        process.stdout.write(`ran ${argv.join(" ")}\n`);
+        process.stderr.write("warning\n");
+        return 5;
+      },
+      { id: "r1", argv: ["items", "list"] },
+    );
+
+    expect(response).toEqual({
+      id: "r1",
+      exit_code: 5,
+      stdout: "ran items list\n",
+      stderr: "warning\n",
+    });
+  });
+
+  it("scopes COPILOT_* env to the request", async () => {
+    process.env.COPILOT_TOKEN = "worker-token";
+    const seen: (string | undefined)[] = [];
+    const run = async () => {
+      seen.push(process.env.COPILOT_TOKEN);
+      seen.push(process.env.PATH_FROM_REQUEST);
+      return 0;
+    };
+
+    await handleRequest(run, {
+      id: "r1",
+      argv: [],
+      env: { COPILOT_TOKEN: "user-token", PATH_FROM_REQUEST: "ignored" },
+    });
+    await handleRequest(run, { id: "r2", argv: [] });
+
+    expect(seen).toEqual(["user-token", undefined, undefined, undefined]);
+    expect(process.env.COPILOT_TOKEN).toBe("worker-token");
+  });
+
+  it("reports process.exitCode set by a command", async () => {
+    const response = await handleRequest(
+      async () => {
+        process.exitCode = 3;
+        return 0;
+      },
+      { id: "r1", argv: [] },
+    );
+
+    expect(response.exit_code).toBe(3);
+    expect(process.exitCode).toBeUndefined();
+  });
+});
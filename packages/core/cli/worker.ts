@@ -0,0 +1,161 @@
+import { createInterface } from "node:readline";
+
+/**
+ * Long-lived worker mode (`project-cli --worker`).
+ *
+ * Reads one JSON request per line from stdin, runs it like a one-shot CLI
+ * invocation and answers with one JSON line on stdout:
+ *
+ *   -> {"id": "...", "argv": ["items", "list", "--json"], "env": {"COPILOT_TOKEN": "..."}}
+ *   <- {"id": "...", "exit_code": 0, "stdout": "...", "stderr": "..."}
+ *
+ * Requests run one at a time. Only COPILOT_* variables are taken from a
+ * request, and they are restored afterwards, so credentials never carry over
+ * from one request to the next.
+ */
+
+export type WorkerRequest = {
+  id: string;
+  argv: string[];
+  env?: Record<string, string>;
+};
+
+export type WorkerResponse = {
+  id: string;
+  exit_code: number;
+  stdout: string;
+  stderr: string;
+};
+
+export type RunCli = (argv: string[]) => Promise<number>;
+
+const REQUEST_ENV_PREFIX = "COPILOT_";
+// Cleared before every request so a request without auth never inherits
+// the previous caller's.
+const AUTH_ENV_KEYS = ["COPILOT_TOKEN", "COPILOT_ORG_ID"];
+
+type Write = typeof process.stdout.write;
+
+function chunkToString(chunk: unknown): string {
+  if (typeof chunk === "string") return chunk;
+  if (chunk instanceof Uint8Array) return Buffer.from(chunk).toString("utf8");
+  return String(chunk);
+}
+
+function capture(target: string[]): Write {
+  return ((chunk: unknown, ...rest: unknown[]) => {
+    target.push(chunkToString(chunk));
+    const callback = rest.find((arg) => typeof arg === "function");
+    if (callback) (callback as () => void)();
+    return true;
+  }) as Write;
+}
+
+function applyRequestEnv(
+  env: Record<string, string> | undefined,
+): Map<string, string | undefined> {
+  const saved = new Map<string, string | undefined>();
+  const remember = (key: string) => {
+    if (!saved.has(key)) saved.set(key, process.env[key]);
+  };
+
+  for (const key of AUTH_ENV_KEYS) {
+    remember(key);
+    delete process.env[key];
+  }
+  for (const [key, value] of Object.entries(env ?? {})) {
+    if (!key.startsWith(REQUEST_ENV_PREFIX) || typeof value !== "string") continue;
+    remember(key);
+    process.env[key] = value;
+  }
+  return saved;
+}
+
+function restoreEnv(saved: Map<string, string | undefined>): void {
+  for (const [key, value] of saved) {
+    if (value === undefined) {
+      delete process.env[key];
+    } else {
+      process.env[key] = value;
+    }
+  }
+}
+
+function parseRequest(line: string): WorkerRequest | string {
+  let parsed: unknown;
+  try {
+    parsed = JSON.parse(line);
+  } catch {
+    return "request is not valid JSON";
+  }
+  if (typeof parsed !== "object" || parsed === null) {
+    return "request must be a JSON object";
+  }
+  const request = parsed as Partial<WorkerRequest>;
+  if (typeof request.id !== "string" || !request.id) {
+    return "request.id must be a non-empty string";
+  }
+  if (!Array.isArray(request.argv) || !request.argv.every((arg) => typeof arg === "string")) {
+    return "request.argv must be a string[]";
+  }
+  return request as WorkerRequest;
+}
+
+export async function handleRequest(
+  runCli: RunCli,
+  request: WorkerRequest,
+): Promise<WorkerResponse> {
+  const stdout: string[] = [];
+  const stderr: string[] = [];
+  const originalStdout = process.stdout.write;
+  const originalStderr = process.stderr.write;
+  const savedEnv = applyRequestEnv(request.env);
+
+  process.exitCode = undefined;
+  process.stdout.write = capture(stdout);
+  process.stderr.write = capture(stderr);
+  let exitCode: number;
+  try {
+    exitCode = await runCli(request.argv);
+  } catch (error) {
+    stderr.push(`${error instanceof Error ? error.message : String(error)}\n`);
+    exitCode = 2;
+  } finally {
+    process.stdout.write = originalStdout;
+    process.stderr.write = originalStderr;
+    restoreEnv(savedEnv);
+  }
+
+  // Commands that report failure without throwing set process.exitCode.
+  const commandExitCode = Number(process.exitCode ?? 0);
+  process.exitCode = undefined;
+  if (exitCode === 0 && commandExitCode !== 0) {
+    exitCode = commandExitCode;
+  }
+
+  return {
+    id: request.id,
+    exit_code: exitCode,
+    stdout: stdout.join(""),
+    stderr: stderr.join(""),
+  };
+}
+
+export async function serveWorker(runCli: RunCli): Promise<void> {
+  const respond = (value: unknown) => {
+    process.stdout.write(`${JSON.stringify(value)}\n`);
+  };
+
+  respond({ ready: true, pid: process.pid });
+
+  const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+    const request = parseRequest(line);
+    if (typeof request === "string") {
+      respond({ id: null, exit_code: 2, stdout: "", stderr: `${request}\n` });
+      continue;
+    }
+    respond(await handleRequest(runCli, request));
+  }
+}